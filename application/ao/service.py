@@ -1,5 +1,6 @@
 from application.ao import AoData
 from application.ao.repository import AoRepository
+from application.reference_data.cache import RegionReferenceCache, get_region_reference_cache
 
 
 class AoService:
@@ -8,11 +9,13 @@ class AoService:
 
     Data access is delegated to an ``AoRepository`` injected by the caller
     (composition root), keeping the application layer independent of
-    infrastructure details.
+    infrastructure details. Writes invalidate the affected region snapshots
+    in the ``RegionReferenceCache``.
     """
 
-    def __init__(self, repository: AoRepository) -> None:
+    def __init__(self, repository: AoRepository, reference_cache: RegionReferenceCache | None = None) -> None:
         self._repository: AoRepository = repository
+        self._reference_cache = reference_cache if reference_cache is not None else get_region_reference_cache()
 
     def get_region_aos(self, parent_org_id: int | str) -> list[AoData]:
         """Return active AOs for the given parent org (region)."""
@@ -31,13 +34,15 @@ class AoService:
         default_location_id: int | str | None,
     ) -> AoData:
         """Create a new AO and return the created record."""
-        return self._repository.create(
+        ao = self._repository.create(
             parent_id=int(parent_id),
             name=name,
             description=description,
             slack_channel_id=slack_channel_id,
             default_location_id=int(default_location_id) if default_location_id is not None else None,
         )
+        self._reference_cache.invalidate(org_id=int(parent_id))
+        return ao
 
     def update_ao(
         self,
@@ -59,7 +64,11 @@ class AoService:
             default_location_id=int(default_location_id) if default_location_id is not None else None,
             logo_url=logo_url,
         )
+        # parent_id may have changed, so drop both the old (via ao_id) and new region
+        self._reference_cache.invalidate(org_id=ao_id)
+        self._reference_cache.invalidate(org_id=int(parent_id))
 
     def delete_ao(self, ao_id: int) -> None:
         """Soft-delete an AO and cascade to associated events/instances."""
         self._repository.delete(ao_id)
+        self._reference_cache.invalidate(org_id=ao_id)
@@ -24,3 +24,9 @@ class EventInstanceData(BaseModel):
     preblast_rich: Any | None = None
     preblast: str | None = None
     series_exception: str | None = None  # "closed" | "different-time" | "miscellaneous" | None
+
+
+class EventInstancePage(BaseModel):
+    items: list[EventInstanceData] = []
+    next_cursor: str | None = None  # opaque; pass back as ``cursor`` to fetch the following page
+    total_count: int | None = None
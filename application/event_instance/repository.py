@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
-from application.event_instance import EventInstanceData
+from application.event_instance import EventInstanceData, EventInstancePage
 
 
 class EventInstanceRepository(Protocol):
@@ -19,8 +19,39 @@ class EventInstanceRepository(Protocol):
         region_org_id: int,
         start_date: date,
         ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int | None = None,
     ) -> list[EventInstanceData]:
-        """Return active instances on or after *start_date* for the region (or specific AO)."""
+        """Return active instances between *start_date* and *end_date* for the region (or specific AO).
+
+        With *limit*, pages are fetched lazily and only until *limit* rows have been read.
+        """
+        ...
+
+    def get_page(
+        self,
+        region_org_id: int,
+        start_date: date,
+        ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int = 25,
+        cursor: str | None = None,
+    ) -> EventInstancePage:
+        """Return one page of at most *limit* instances, starting at *cursor* (the first page when None).
+
+        Pages are cut from the whole result ordered by start date and time, so consecutive pages never overlap.
+        """
+        ...
+
+    def iter_pages(
+        self,
+        region_org_id: int,
+        start_date: date,
+        ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int = 25,
+    ) -> Iterator[EventInstancePage]:
+        """Yield pages of *limit* instances, fetching each only when the caller asks for it."""
         ...
 
     def get_by_id(self, instance_id: int) -> EventInstanceData | None:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from application.event_instance import EventInstanceData
+from application.event_instance import EventInstanceData, EventInstancePage
 from application.event_instance.repository import EventInstanceRepository
 
 
@@ -13,11 +13,25 @@ class EventInstanceService:
 
     Data access is delegated to an ``EventInstanceRepository`` injected by the
     caller (composition root), keeping the application layer independent of
-    infrastructure details.
+    infrastructure details. ``on_write``, when given, is called with the
+    ``event_instance_ids`` and ``org_ids`` touched by every successful write so
+    the caller can drop cached copies of them.
     """
 
-    def __init__(self, repository: EventInstanceRepository) -> None:
+    def __init__(
+        self,
+        repository: EventInstanceRepository,
+        on_write: Callable[..., None] | None = None,
+    ) -> None:
         self._repository: EventInstanceRepository = repository
+        self._on_write = on_write
+
+    def _written(self, event_instance_ids: Iterable[int | None], org_ids: Iterable[int | None] = ()) -> None:
+        if self._on_write is not None:
+            self._on_write(
+                event_instance_ids=[i for i in event_instance_ids if i is not None],
+                org_ids=[o for o in org_ids if o is not None],
+            )
 
     def get_region_instances(
         self,
@@ -32,10 +46,30 @@ class EventInstanceService:
             start_date=start_date,
             ao_org_id=int(ao_org_id) if ao_org_id is not None else None,
         )
-        # Sort by date, time, name then cap at limit
-        records.sort(key=lambda x: (x.start_date or date.min, x.start_time or "", x.name or ""))
+        records.sort(key=_instance_sort_key)
         return records[:limit]
 
+    def get_region_instances_page(
+        self,
+        region_org_id: int | str,
+        start_date: date,
+        ao_org_id: int | str | None = None,
+        end_date: date | None = None,
+        limit: int = 25,
+        cursor: str | None = None,
+    ) -> EventInstancePage:
+        """Return one page of upcoming instances; pass ``page.next_cursor`` back in to get the next one."""
+        page = self._repository.get_page(
+            region_org_id=int(region_org_id),
+            start_date=start_date,
+            ao_org_id=int(ao_org_id) if ao_org_id is not None else None,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor,
+        )
+        page.items.sort(key=_instance_sort_key)  # pages arrive in date/time order; this only orders ties by name
+        return page
+
     def get_by_id(self, instance_id: int) -> EventInstanceData | None:
         """Return a single event instance, or *None* if not found."""
         return self._repository.get_by_id(instance_id)
@@ -59,7 +93,7 @@ class EventInstanceService:
         preblast: str | None = None,
     ) -> EventInstanceData:
         """Create a new event instance and return the created record."""
-        return self._repository.create(
+        created = self._repository.create(
             name=name,
             org_id=int(org_id),
             start_date=start_date,
@@ -76,6 +110,8 @@ class EventInstanceService:
             preblast_rich=preblast_rich,
             preblast=preblast,
         )
+        self._written([created.id], [int(org_id)])
+        return created
 
     def update_instance(
         self,
@@ -97,7 +133,7 @@ class EventInstanceService:
         preblast: str | None = None,
     ) -> EventInstanceData:
         """Update an existing event instance and return the updated record."""
-        return self._repository.update(
+        updated = self._repository.update(
             instance_id=instance_id,
             name=name,
             org_id=int(org_id),
@@ -115,6 +151,9 @@ class EventInstanceService:
             preblast_rich=preblast_rich,
             preblast=preblast,
         )
+        # the instance id covers feeds holding the old AO; the org id covers a move to another one
+        self._written([instance_id], [int(org_id)])
+        return updated
 
     def _get_existing_instance_for_state_change(self, instance_id: int) -> EventInstanceData:
         """Return an existing instance for close/reopen operations."""
@@ -130,12 +169,19 @@ class EventInstanceService:
         if close_reason:
             meta["series_exception_reason"] = close_reason
         self._repository.close(instance=existing, meta=meta)
+        self._written([instance_id], [existing.org_id])
 
     def reopen_instance(self, instance_id: int) -> None:
         """Remove the closed status from an event instance."""
         existing = self._get_existing_instance_for_state_change(instance_id)
         self._repository.reopen(instance=existing)
+        self._written([instance_id], [existing.org_id])
 
     def delete_instance(self, instance_id: int) -> None:
         """Hard-delete an event instance."""
         self._repository.delete(instance_id)
+        self._written([instance_id])
+
+
+def _instance_sort_key(instance: EventInstanceData) -> tuple:
+    return (instance.start_date or date.min, instance.start_time or "", instance.name or "")
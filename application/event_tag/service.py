@@ -1,5 +1,6 @@
 from application.event_tag import EventTagData
 from application.event_tag.repository import EventTagRepository
+from application.reference_data.cache import RegionReferenceCache, get_region_reference_cache
 
 
 class EventTagService:
@@ -8,11 +9,13 @@ class EventTagService:
 
     Data access is delegated to an ``EventTagRepository`` and is injected by the
     caller (composition root), which keeps the application layer independent of
-    infrastructure details.
+    infrastructure details. Writes invalidate the affected region snapshots
+    in the ``RegionReferenceCache``.
     """
 
-    def __init__(self, repository: EventTagRepository) -> None:
+    def __init__(self, repository: EventTagRepository, reference_cache: RegionReferenceCache | None = None) -> None:
         self._repository: EventTagRepository = repository
+        self._reference_cache = reference_cache if reference_cache is not None else get_region_reference_cache()
 
     def get_org_event_tags(self, org_id: int | str) -> list[EventTagData]:
         """Return org-specific event tags for *org_id*."""
@@ -29,11 +32,14 @@ class EventTagService:
     def create_org_specific_tag(self, name: str, color: str, org_id: int | str) -> None:
         """Create a new org-specific event tag."""
         self._repository.create(name, color, int(org_id))
+        self._reference_cache.invalidate(org_id=int(org_id))
 
     def update_org_specific_tag(self, tag_id: int, name: str, color: str) -> None:
         """Update the name and colour of an existing event tag."""
         self._repository.update(tag_id, name, color)
+        self._reference_cache.invalidate(event_tag_id=tag_id)
 
     def delete_org_specific_tag(self, tag_id: int) -> None:
         """Soft-delete an event tag."""
         self._repository.delete(tag_id)
+        self._reference_cache.invalidate(event_tag_id=tag_id)
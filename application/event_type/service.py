@@ -1,5 +1,6 @@
 from application.event_type import EventTypeData
 from application.event_type.repository import EventTypeRepository
+from application.reference_data.cache import RegionReferenceCache, get_region_reference_cache
 
 
 class EventTypeService:
@@ -8,11 +9,13 @@ class EventTypeService:
 
     Data access is delegated to an ``EventTypeRepository`` injected by the
     caller (composition root), keeping the application layer independent of
-    infrastructure details.
+    infrastructure details. Writes invalidate the affected region snapshots
+    in the ``RegionReferenceCache``.
     """
 
-    def __init__(self, repository: EventTypeRepository) -> None:
+    def __init__(self, repository: EventTypeRepository, reference_cache: RegionReferenceCache | None = None) -> None:
         self._repository: EventTypeRepository = repository
+        self._reference_cache = reference_cache if reference_cache is not None else get_region_reference_cache()
 
     def get_org_specific_event_types(self, org_id: int | str) -> list[EventTypeData]:
         """Return only org-specific event types for *org_id*."""
@@ -29,11 +32,14 @@ class EventTypeService:
     def create_org_specific_type(self, name: str, acronym: str, event_category: str, org_id: int | str) -> None:
         """Create a new org-specific event type."""
         self._repository.create(name, acronym, event_category, int(org_id))
+        self._reference_cache.invalidate(org_id=int(org_id))
 
     def update_org_specific_type(self, event_type_id: int, name: str, acronym: str, event_category: str) -> None:
         """Update the name, acronym, and category of an existing event type."""
         self._repository.update(event_type_id, name, acronym, event_category)
+        self._reference_cache.invalidate(event_type_id=event_type_id)
 
     def delete_org_specific_type(self, event_type_id: int) -> None:
         """Soft-delete an event type."""
         self._repository.delete(event_type_id)
+        self._reference_cache.invalidate(event_type_id=event_type_id)
@@ -1,5 +1,6 @@
 from application.location import LocationData
 from application.location.repository import LocationRepository
+from application.reference_data.cache import RegionReferenceCache, get_region_reference_cache
 
 
 class LocationService:
@@ -8,11 +9,13 @@ class LocationService:
 
     Data access is delegated to a ``LocationRepository`` injected by the
     caller (composition root), keeping the application layer independent of
-    infrastructure details.
+    infrastructure details. Writes invalidate the affected region snapshots
+    in the ``RegionReferenceCache``.
     """
 
-    def __init__(self, repository: LocationRepository) -> None:
+    def __init__(self, repository: LocationRepository, reference_cache: RegionReferenceCache | None = None) -> None:
         self._repository: LocationRepository = repository
+        self._reference_cache = reference_cache if reference_cache is not None else get_region_reference_cache()
 
     def get_org_locations(self, org_id: int | str) -> list[LocationData]:
         """Return active locations for *org_id*."""
@@ -38,7 +41,7 @@ class LocationService:
         address_country: str | None = None,
     ) -> LocationData:
         """Create a new location and return the created record."""
-        return self._repository.create(
+        location = self._repository.create(
             name=name,
             org_id=int(org_id),
             description=description,
@@ -51,6 +54,8 @@ class LocationService:
             address_zip=address_zip,
             address_country=address_country,
         )
+        self._reference_cache.invalidate(org_id=int(org_id))
+        return location
 
     def update_location(
         self,
@@ -84,7 +89,10 @@ class LocationService:
             address_zip=address_zip,
             address_country=address_country,
         )
+        self._reference_cache.invalidate(location_id=location_id)
+        self._reference_cache.invalidate(org_id=int(org_id))
 
     def delete_location(self, location_id: int) -> None:
         """Soft-delete a location."""
         self._repository.delete(location_id)
+        self._reference_cache.invalidate(location_id=location_id)
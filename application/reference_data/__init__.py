@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+
+from application.ao import AoData
+from application.event_tag import EventTagData
+from application.event_type import EventTypeData
+from application.location import LocationData
+
+
+class RegionReferenceData(BaseModel):
+    """Snapshot of a region's slowly changing reference data, shared by every modal that needs it.
+
+    Treat it as read-only: the same instance is handed to every caller until it is invalidated.
+    """
+
+    region_org_id: int
+    aos: list[AoData] = []
+    locations: list[LocationData] = []
+    event_types: list[EventTypeData] = []
+    event_tags: list[EventTagData] = []
+
+    @property
+    def org_ids(self) -> set[int]:
+        """The region and its AOs; locations may belong to either."""
+        return {self.region_org_id, *(ao.id for ao in self.aos)}
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from application.reference_data import RegionReferenceData
+
+MAX_REGIONS = int(os.environ.get("REFERENCE_DATA_MAX_REGIONS", "500"))
+TTL_SECONDS = float(os.environ.get("REFERENCE_DATA_TTL_SECONDS", "300"))
+
+
+class RegionReferenceCache:
+    """
+    Bounded LRU of ``RegionReferenceData`` snapshots keyed by region org id.
+
+    The AO, location, event type and event tag services invalidate the
+    affected snapshots after every write. Snapshots also expire after
+    ``ttl_seconds``, which bounds staleness from writes made by other
+    instances or directly against the API.
+    """
+
+    def __init__(self, max_regions: int = MAX_REGIONS, ttl_seconds: float = TTL_SECONDS) -> None:
+        self.max_regions = max(1, max_regions)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple[RegionReferenceData, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, region_org_id: int, loader: Callable[[int], RegionReferenceData]) -> RegionReferenceData:
+        """Return the cached snapshot for *region_org_id*, loading it with *loader* on a miss."""
+        with self._lock:
+            entry = self._entries.get(region_org_id)
+            if entry and entry[1] > time.monotonic():
+                self._entries.move_to_end(region_org_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # Load outside the lock so one slow region doesn't block the others
+        snapshot = loader(region_org_id)
+        self.put(snapshot)
+        return snapshot
+
+    def put(self, snapshot: RegionReferenceData) -> None:
+        with self._lock:
+            self._entries[snapshot.region_org_id] = (snapshot, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(snapshot.region_org_id)
+            while len(self._entries) > self.max_regions:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        org_id: int | None = None,
+        location_id: int | None = None,
+        event_type_id: int | None = None,
+        event_tag_id: int | None = None,
+    ) -> None:
+        """Drop every snapshot that contains the given org (region or AO), location, event type or tag."""
+        with self._lock:
+            for region_org_id, (snapshot, _) in list(self._entries.items()):
+                if (
+                    (org_id is not None and org_id in snapshot.org_ids)
+                    or (location_id is not None and any(loc.id == location_id for loc in snapshot.locations))
+                    or (event_type_id is not None and any(t.id == event_type_id for t in snapshot.event_types))
+                    or (event_tag_id is not None and any(t.id == event_tag_id for t in snapshot.event_tags))
+                ):
+                    del self._entries[region_org_id]
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "regions": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_cache: RegionReferenceCache | None = None
+
+
+def get_region_reference_cache() -> RegionReferenceCache:
+    """Return the shared ``RegionReferenceCache`` instance, creating it on first call."""
+    global _cache
+    if _cache is None:
+        _cache = RegionReferenceCache()
+    return _cache
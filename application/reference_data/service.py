@@ -0,0 +1,62 @@
+from typing import Any, Callable
+
+from application.ao.service import AoService
+from application.event_tag.service import EventTagService
+from application.event_type.service import EventTypeService
+from application.location.service import LocationService
+from application.reference_data import RegionReferenceData
+from application.reference_data.cache import RegionReferenceCache, get_region_reference_cache
+
+
+class RegionReferenceService:
+    """
+    Returns a region's AOs, locations, event types and event tags as one
+    cached snapshot.
+
+    The four underlying services are injected by the caller (composition
+    root). When the snapshot is cached, opening a modal costs no round trips
+    for reference data. On a miss the four reads go through *gather*, which
+    the composition root backs with the API client's concurrent request
+    group; without one they run one after another.
+    """
+
+    def __init__(
+        self,
+        ao_service: AoService,
+        location_service: LocationService,
+        event_type_service: EventTypeService,
+        event_tag_service: EventTagService,
+        cache: RegionReferenceCache | None = None,
+        gather: Callable[..., list[Any]] | None = None,
+    ) -> None:
+        self._ao_service = ao_service
+        self._location_service = location_service
+        self._event_type_service = event_type_service
+        self._event_tag_service = event_tag_service
+        self._cache = cache if cache is not None else get_region_reference_cache()
+        self._gather = gather or _run_in_order
+
+    def get_snapshot(self, region_org_id: int | str) -> RegionReferenceData:
+        """Return the reference data for *region_org_id*, loading it on a cache miss."""
+        return self._cache.get(int(region_org_id), self.load_bundle)
+
+    def load_bundle(self, region_org_id: int | str) -> RegionReferenceData:
+        """Fetch the four collections for *region_org_id* as one concurrent request group, bypassing the cache."""
+        region_org_id = int(region_org_id)
+        aos, locations, event_types, event_tags = self._gather(
+            lambda: self._ao_service.get_region_aos(region_org_id),
+            lambda: self._location_service.get_org_locations(region_org_id),
+            lambda: self._event_type_service.get_all_event_types_for_org(region_org_id),
+            lambda: self._event_tag_service.get_all_tags_for_org(region_org_id),
+        )
+        return RegionReferenceData(
+            region_org_id=region_org_id,
+            aos=aos,
+            locations=locations,
+            event_types=event_types,
+            event_tags=event_tags,
+        )
+
+
+def _run_in_order(*calls: Callable[[], Any]) -> list[Any]:
+    return [call() for call in calls]
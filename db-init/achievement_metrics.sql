@@ -0,0 +1,30 @@
+-- Side tables for incremental achievement evaluation in scripts/award_achievements.py.
+--
+-- These are not part of the F3-Data-Models migrations, so they are applied separately: db-init runs this file after
+-- `alembic upgrade head`, and deployed databases need it applied once by hand before incremental mode takes effect:
+--
+--   psql "host=$DATABASE_HOST user=$DATABASE_USER dbname=$DATABASE_SCHEMA" -f db-init/achievement_metrics.sql
+--
+-- Until then the script evaluates every achievement in full. Safe to re-run.
+
+-- Per-achievement high-water mark of attendance_expanded / event_instance_expanded updates already evaluated
+CREATE TABLE IF NOT EXISTS achievement_metric_checkpoints (
+    achievement_id integer PRIMARY KEY REFERENCES achievements (id) ON DELETE CASCADE,
+    signature varchar NOT NULL,
+    high_water timestamp,
+    award_year integer NOT NULL,
+    rebuilt timestamp NOT NULL DEFAULT now()
+);
+
+-- Running metric per (achievement, user, award_year, award_period) as of the achievement's checkpoint
+CREATE TABLE IF NOT EXISTS achievement_metrics (
+    achievement_id integer NOT NULL REFERENCES achievements (id) ON DELETE CASCADE,
+    user_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    award_year integer NOT NULL,
+    award_period integer NOT NULL,
+    metric integer NOT NULL,
+    updated timestamp NOT NULL DEFAULT now(),
+    PRIMARY KEY (achievement_id, user_id, award_year, award_period)
+);
+
+CREATE INDEX IF NOT EXISTS achievement_metrics_metric_idx ON achievement_metrics (achievement_id, award_year, metric);
@@ -50,6 +50,13 @@ run_migrations() {
     echo "✅ Database schema created successfully!"
 }
 
+# Function to apply the app's own tables that are not in the F3-Data-Models migrations
+apply_app_schema() {
+    echo "🗄️ Applying achievement_metrics.sql..."
+    PGPASSWORD=$DATABASE_PASSWORD psql -v ON_ERROR_STOP=1 -h "$DATABASE_HOST" -U "$DATABASE_USER" -d "$DATABASE_SCHEMA" -f /achievement_metrics.sql
+    echo "✅ Achievement metric tables ready!"
+}
+
 # Function to show migration info without running them (for debugging/inspection)
 show_migration_info() {
     echo "🔍 ALEMBIC MIGRATION INSPECTION (NO CHANGES APPLIED):"
@@ -79,6 +86,7 @@ main() {
     wait_for_db
     create_database
     run_migrations
+    apply_app_schema
     show_migration_info
 
     # Show F3-Data-Models version info
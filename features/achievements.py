@@ -7,7 +7,6 @@ This module provides:
 - Manual achievement tagging
 """
 
-import copy
 import json
 from datetime import datetime
 from logging import Logger
@@ -51,9 +50,9 @@ from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
     current_date_cst,
     get_user,
+    invalidate_region_record,
     safe_convert,
     safe_get,
-    update_local_region_records,
 )
 from utilities.slack.sdk_orm import SdkBlockView, as_selector_options
 
@@ -734,7 +733,7 @@ def handle_config_form(body: dict, client: WebClient, logger: Logger, context: d
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
 
 
 def build_new_achievement_form(
@@ -950,7 +949,7 @@ def build_tag_achievement_form(
         return
 
     update_view_id = safe_get(body, legacy_actions.LOADING_ID)
-    achievement_form = copy.deepcopy(legacy_forms.ACHIEVEMENT_FORM)
+    achievement_form = legacy_forms.ACHIEVEMENT_FORM.copy()
     callback_id = ACHIEVEMENT_TAG_CALLBACK_ID
 
     # Build achievement list
@@ -16,9 +16,7 @@ from f3_data_models.models import (
     AttendanceType,
     EventInstance,
     EventType_x_EventInstance,
-    Location,
     Org,
-    Org_Type,
     Org_x_SlackSpace,
     SlackSpace,
     SlackUser,
@@ -26,7 +24,7 @@ from f3_data_models.models import (
 )
 from f3_data_models.utils import DbManager
 from slack_sdk.web import WebClient
-from sqlalchemy import not_, or_
+from sqlalchemy import or_
 from sqlmodel import func
 
 from features import connect
@@ -39,6 +37,7 @@ from utilities.database.special_queries import (
     get_admin_users,
     get_aoq_users,
     missing_backblasts_query,
+    replace_actual_attendance,
 )
 from utilities.helper_functions import (
     REGION_RECORDS,
@@ -46,7 +45,9 @@ from utilities.helper_functions import (
     fix_from_llm_tags,
     get_location_display_name,
     get_pax,
+    get_region_reference_data,
     get_user,
+    get_users_bulk,
     parse_rich_block,
     remove_keys_from_dict,
     replace_rich_text_user_channel,
@@ -66,12 +67,12 @@ def add_custom_field_blocks(
 ) -> slack_orm.BlockView:
     if initial_values is None:
         initial_values = {}
-    output_form = copy.deepcopy(form)
+    output_form = slack_orm.BlockView(blocks=list(form.blocks))
     for custom_field in (region_record.custom_fields or {}).values():
         if safe_get(custom_field, "enabled"):
             output_form.add_block(
                 slack_orm.InputBlock(
-                    element=forms.CUSTOM_FIELD_TYPE_MAP[custom_field["type"]],
+                    element=copy.copy(forms.CUSTOM_FIELD_TYPE_MAP[custom_field["type"]]),
                     action=actions.CUSTOM_FIELD_PREFIX + custom_field["name"],
                     label=custom_field["name"],
                     optional=True,
@@ -118,7 +119,7 @@ def backblast_middleware(
         event_instance_id = safe_convert(safe_get(body, "actions", 0, "value"), int)
         event_instance = DbManager.get(EventInstance, event_instance_id)
         if event_instance.backblast_ts:
-            form = copy.deepcopy(forms.ALREADY_POSTED_FORM)
+            form = forms.ALREADY_POSTED_FORM.copy()
             form.post_modal(
                 client=client,
                 trigger_id=safe_get(body, "trigger_id"),
@@ -136,7 +137,7 @@ def backblast_middleware(
         event_instance_id = safe_convert(safe_get(body, "actions", 0, "value"), int)
         event_instance = DbManager.get(EventInstance, event_instance_id)
         if event_instance.backblast_ts:
-            form = copy.deepcopy(forms.ALREADY_POSTED_FORM)
+            form = forms.ALREADY_POSTED_FORM.copy()
             form.update_modal(
                 client=client,
                 view_id=safe_get(body, actions.LOADING_ID),
@@ -310,12 +311,7 @@ def build_missing_backblasts_form(
     if not user_is_admin:
         return
 
-    from f3_data_models.models import Org_Type
-
-    ao_records = DbManager.find_records(
-        Org,
-        filters=[Org.parent_id == region_record.org_id, Org.org_type == Org_Type.ao, Org.is_active.is_(True)],
-    )
+    ao_records = get_region_reference_data(region_record.org_id).aos
 
     # Build filter blocks first so we can parse existing selections
     filter_block = slack_orm.InputBlock(
@@ -549,7 +545,7 @@ def build_backblast_form(
         event_instance_id = safe_get(backblast_metadata, "event_instance_id")
     update_view_id = safe_get(body, actions.LOADING_ID) or safe_get(body, "view", "id")
 
-    backblast_form = copy.deepcopy(forms.BACKBLAST_FORM)
+    backblast_form = forms.BACKBLAST_FORM.copy()
     attendance_non_slack_users = []
     is_paxminer_backblast = False
     if event_instance_id:
@@ -606,12 +602,10 @@ def build_backblast_form(
                         }
                     ],
                 }
-                # find moleskin block number and add hint to edit form about legacy backblast
-                for i, block in enumerate(backblast_form.blocks):
-                    if block.action == actions.BACKBLAST_MOLESKIN:
-                        backblast_form.blocks[
-                            i
-                        ].hint = ":warning: This backblast was created in paxminer. If resaving, we recommend deleting the header lines so they are not duplicated."  # noqa: E501
+                # add hint to edit form about legacy backblast
+                backblast_form.editable_block(
+                    actions.BACKBLAST_MOLESKIN
+                ).hint = ":warning: This backblast was created in paxminer. If resaving, we recommend deleting the header lines so they are not duplicated."  # noqa: E501
         else:
             moleskin_block = None
         initial_backblast_data = {
@@ -647,26 +641,14 @@ def build_backblast_form(
         event_metadata = {}
     else:
         # this is triggered for unscheduled backblasts
-        for block in forms.UNSCHEDULED_BACKBLAST_BLOCKS:
+        for block in forms.UNSCHEDULED_BACKBLAST_BLOCKS.blocks:
             backblast_form.blocks.insert(2, block)
         backblast_form.delete_block(actions.BACKBLAST_INFO)
-        aos: List[Org] = DbManager.find_records(
-            Org, [Org.parent_id == region_record.org_id, Org.is_active, Org.org_type == Org_Type.ao]
-        )
-        ao_location_records = DbManager.find_join_records2(
-            Location,
-            Org,
-            [
-                Location.org_id == Org.id,
-                or_(Org.parent_id == region_record.org_id, Org.id == region_record.org_id),
-                Location.is_active,
-            ],
+        reference_data = get_region_reference_data(region_record.org_id)
+        aos = reference_data.aos
+        location_records = sorted(
+            reference_data.locations, key=lambda location: (get_location_display_name(location) or "").lower()
         )
-        location_records: List[Location] = [record[0] for record in ao_location_records]
-        # De-duplicate in case a location appears in both sources.
-        location_records = list({location.id: location for location in location_records}.values())
-        location_records.sort(key=lambda location: (get_location_display_name(location) or "").lower())
-        region_org_record: Org = DbManager.get(Org, region_record.org_id, joinedloads=[Org.event_types])
         backblast_form.set_options(
             {
                 actions.BACKBLAST_AO: slack_orm.as_selector_options(
@@ -674,8 +656,8 @@ def build_backblast_form(
                     values=[str(ao.id) for ao in aos],
                 ),
                 actions.BACKBLAST_EVENT_TYPE: slack_orm.as_selector_options(
-                    names=[event_type.name for event_type in region_org_record.event_types],
-                    values=[str(event_type.id) for event_type in region_org_record.event_types],
+                    names=[event_type.name for event_type in reference_data.event_types],
+                    values=[str(event_type.id) for event_type in reference_data.event_types],
                 ),
                 actions.BACKBLAST_LOCATION: slack_orm.as_selector_options(
                     names=[get_location_display_name(location) for location in location_records],
@@ -691,9 +673,9 @@ def build_backblast_form(
         event_metadata = {}
         attendance_non_slack_users = []
 
-    org_event_types: Org = DbManager.get(Org, region_record.org_id, joinedloads=[Org.event_types])
+    org_event_types = get_region_reference_data(region_record.org_id).event_types
     event_type_options = slack_orm.as_selector_options(
-        [r.name for r in org_event_types.event_types], [str(r.id) for r in org_event_types.event_types]
+        [r.name for r in org_event_types], [str(r.id) for r in org_event_types]
     )
 
     if (current_date_cst() < (safe_get(event_record, "start_date") or current_date_cst())) or is_paxminer_backblast:
@@ -758,7 +740,7 @@ def handle_backblast_post(body: dict, client: WebClient, logger: Logger, context
     create_or_edit = "create" if safe_get(body, "view", "callback_id") == actions.BACKBLAST_CALLBACK_ID else "edit"
     metadata = json.loads(safe_get(body, "view", "private_metadata") or "{}")
     event_instance_id = safe_get(metadata, "event_instance_id")
-    backblast_form = copy.deepcopy(forms.BACKBLAST_FORM)
+    backblast_form = forms.BACKBLAST_FORM.copy()
     backblast_form = add_custom_field_blocks(backblast_form, region_record)
     slack_user_id = safe_get(body, "user", "id") or safe_get(body, "user_id")
 
@@ -775,7 +757,7 @@ def handle_backblast_post(body: dict, client: WebClient, logger: Logger, context
         event = None
         date = None
         event_type = None
-        for block in forms.UNSCHEDULED_BACKBLAST_BLOCKS:
+        for block in forms.UNSCHEDULED_BACKBLAST_BLOCKS.blocks:
             backblast_form.blocks.append(block)
         backblast_data: dict = backblast_form.get_selected_values(body)
         event_org = DbManager.get(Org, safe_convert(safe_get(backblast_data, actions.BACKBLAST_AO), int))
@@ -841,7 +823,8 @@ def handle_backblast_post(body: dict, client: WebClient, logger: Logger, context
         message_ts = None
 
     all_pax = list(set([the_q] + (the_coq or []) + pax))
-    db_users: List[SlackUser] = [get_user(p, region_record, client, logger) for p in all_pax]
+    db_users: List[SlackUser] = get_users_bulk(all_pax, region_record, client, logger)
+    users_by_slack_id = dict(zip(all_pax, db_users, strict=True))
     db_ids = []
     db_users_deduped = []
     for u in db_users:
@@ -895,13 +878,13 @@ def handle_backblast_post(body: dict, client: WebClient, logger: Logger, context
     else:
         the_coqs_formatted = get_pax(the_coq)
         the_coqs_full_list = [the_coqs_formatted]
-        the_coqs_users = [get_user(c, region_record, client, logger) for c in the_coq]
+        the_coqs_users = [users_by_slack_id[c] for c in the_coq]
         the_coqs_names_list = [user.user_name for user in the_coqs_users]
         the_coqs_formatted = ", " + ", ".join(the_coqs_full_list)
         the_coqs_names = ", " + ", ".join(the_coqs_names_list)
 
     # ao_name = get_channel_names([the_ao], logger, client)[0]
-    q_user = get_user(the_q, region_record, client, logger)
+    q_user = users_by_slack_id[the_q]
     q_name = q_user.user_name
     q_url = q_user.avatar_url
     count = count or auto_count
@@ -1187,12 +1170,7 @@ COUNT: {count}
         )
         for user, attendance_type in zip(db_users, attendance_types, strict=False)
     ]
-
-    DbManager.delete_records(
-        Attendance,
-        filters=[Attendance.event_instance_id == event_instance_id, not_(Attendance.is_planned)],
-    )
-    DbManager.create_records(attendance_records)
+    replace_actual_attendance(event_instance_id, attendance_records)
 
     # ── Downrange cross-posting ────────────────────────────────────────────────
     # Find PAX who have a home region different from the current region and cross-post
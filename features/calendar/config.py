@@ -1,14 +1,12 @@
-import copy
 from logging import Logger
 
 from f3_data_models.models import SlackSpace
 from f3_data_models.utils import DbManager
 from slack_sdk.web import WebClient
 
-from features.calendar import event_instance, event_tag, event_type
 from utilities.constants import EVENT_TAG_COLORS
 from utilities.database.orm import SlackSettings
-from utilities.helper_functions import safe_convert, safe_get
+from utilities.helper_functions import invalidate_region_record, safe_convert, safe_get
 from utilities.slack import actions, orm
 
 CALENDAR_CONFIG_POST_CALENDAR_IMAGE = "calendar_config_post_calendar_image"
@@ -24,7 +22,7 @@ CALENDAR_CONFIG_OPEN_EVENT_COLOR = "calendar_config_open_event_color"
 def build_calendar_config_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
-    form = copy.deepcopy(CALENDAR_CONFIG_FORM)
+    form = CALENDAR_CONFIG_FORM.copy()
     form.update_modal(  # TODO: add a "back to main menu" button?
         client=client,
         view_id=safe_get(body, "view", "id"),
@@ -37,7 +35,7 @@ def build_calendar_config_form(
 def build_calendar_general_config_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
-    form = copy.deepcopy(CALENDAR_CONFIG_GENERAL_FORM)
+    form = CALENDAR_CONFIG_GENERAL_FORM.copy()
     q_lineups_time = (
         f"{str(region_record.send_q_lineups_hour_cst).zfill(2)}:00"
         if region_record.send_q_lineups_hour_cst
@@ -68,8 +66,7 @@ def build_calendar_general_config_form(
 def handle_calendar_config_general(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
-    form = copy.deepcopy(CALENDAR_CONFIG_GENERAL_FORM)
-    values = form.get_selected_values(body)
+    values = CALENDAR_CONFIG_GENERAL_FORM.get_selected_values(body)
     region_record.calendar_group_by_option = safe_get(values, CALENDAR_CONFIG_GROUP_BY_OPTION)
     region_record.send_q_lineups = safe_get(values, actions.CALENDAR_CONFIG_Q_LINEUP) == "yes"
     region_record.send_q_lineups_method = safe_get(values, CALENDAR_CONFIG_Q_LINEUP_METHOD)
@@ -87,9 +84,10 @@ def handle_calendar_config_general(
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
+    invalidate_region_record(region_record.team_id)
 
 
-CALENDAR_CONFIG_GENERAL_FORM = orm.BlockView(
+CALENDAR_CONFIG_GENERAL_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Send Q Lineups",
@@ -190,7 +188,7 @@ CALENDAR_CONFIG_GENERAL_FORM = orm.BlockView(
     ]
 )
 
-CALENDAR_CONFIG_FORM = orm.BlockView(
+CALENDAR_CONFIG_FORM = orm.FrozenBlockView(
     blocks=[
         orm.ActionsBlock(
             elements=[
@@ -233,7 +231,7 @@ CALENDAR_CONFIG_FORM = orm.BlockView(
         ),
         orm.SectionBlock(
             label=":date: Manage Single Events",
-            action=event_instance.CALENDAR_MANAGE_EVENT_INSTANCE,
+            action=actions.CALENDAR_MANAGE_EVENT_INSTANCE,
             element=orm.OverflowElement(
                 options=orm.as_selector_options(
                     names=["Add Single Event", "Edit or Deactivate Single Events"],
@@ -243,7 +241,7 @@ CALENDAR_CONFIG_FORM = orm.BlockView(
         ),
         orm.SectionBlock(
             label=":runner: Manage Event Types",
-            action=event_type.CALENDAR_MANAGE_EVENT_TYPES,
+            action=actions.CALENDAR_MANAGE_EVENT_TYPES,
             element=orm.OverflowElement(
                 options=orm.as_selector_options(
                     names=["Add Event Type", "Edit or Deactivate Event Types"],
@@ -253,7 +251,7 @@ CALENDAR_CONFIG_FORM = orm.BlockView(
         ),
         orm.SectionBlock(
             label=":label: Manage Event Tags",
-            action=event_tag.CALENDAR_MANAGE_EVENT_TAGS,
+            action=actions.CALENDAR_MANAGE_EVENT_TAGS,
             element=orm.OverflowElement(
                 options=orm.as_selector_options(
                     names=["Add Event Tag", "Edit or Delete Event Tags"],
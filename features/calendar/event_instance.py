@@ -1,4 +1,3 @@
-import copy
 from datetime import datetime, timedelta
 from logging import Logger
 
@@ -9,24 +8,22 @@ from slack_sdk.web import WebClient
 from application.ao.service import AoService
 from application.event_instance import EventInstanceData
 from application.event_instance.service import EventInstanceService
-from application.event_tag.service import EventTagService
 from application.event_type.service import EventTypeService
-from application.location.service import LocationService
 from features.calendar import event_preblast
 from infrastructure.api_client import (
     get_api_ao_repository,
     get_api_event_instance_repository,
-    get_api_event_tag_repository,
     get_api_event_type_repository,
-    get_api_location_repository,
 )
 from utilities.bot_logger import post_bot_log
 from utilities.builders import add_loading_form
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
+    CALENDAR_FEED_CACHE,
     _parse_view_private_metadata,
     current_date_cst,
     get_location_display_name,
+    get_region_reference_data,
     get_user,
     parse_rich_block,
     replace_user_channel_ids,
@@ -34,12 +31,20 @@ from utilities.helper_functions import (
     safe_get,
 )
 from utilities.slack import actions, orm
+from utilities.slack.actions import (
+    ADD_EVENT_INSTANCE_CALLBACK_ID,
+    CALENDAR_ADD_EVENT_INSTANCE_AO,
+    CALENDAR_MANAGE_EVENT_INSTANCE_AO,
+    CALENDAR_MANAGE_EVENT_INSTANCE_DATE,
+    CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE,
+    CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE,
+    EVENT_CLOSE_CALLBACK_ID,
+)
 
 # ---------------------------------------------------------------------------
 # Action / callback ID constants (feature-local)
 # ---------------------------------------------------------------------------
 CALENDAR_ADD_EVENT_INSTANCE_PREBLAST = "calendar_add_event_instance_preblast"
-CALENDAR_ADD_EVENT_INSTANCE_AO = "calendar_add_event_instance_ao"
 CALENDAR_ADD_EVENT_INSTANCE_LOCATION = "calendar_add_event_instance_location"
 CALENDAR_ADD_EVENT_INSTANCE_TYPE = "calendar_add_event_instance_type"
 CALENDAR_ADD_EVENT_INSTANCE_TAG = "calendar_add_event_instance_tag"
@@ -54,17 +59,14 @@ CALENDAR_ADD_EVENT_AO = "calendar_add_event_ao"
 CALENDAR_ADD_EVENT_INSTANCE_FREQUENCY = "calendar_add_event_instance_frequency"
 CALENDAR_ADD_EVENT_INSTANCE_DESCRIPTION = "calendar_add_event_instance_description"
 CALENDAR_ADD_EVENT_INSTANCE_OPTIONS = "calendar_add_event_instance_options"
-ADD_EVENT_INSTANCE_CALLBACK_ID = "add_event_instance_callback_id"
-CALENDAR_MANAGE_EVENT_INSTANCE = "calendar_manage_event_instance"
 EDIT_DELETE_EVENT_INSTANCE_CALLBACK_ID = "edit_delete_event_instance_callback_id"
-CALENDAR_MANAGE_EVENT_INSTANCE_AO = "calendar_manage_event_instance_ao"
-CALENDAR_MANAGE_EVENT_INSTANCE_DATE = "calendar_manage_event_instance_date"
 EVENT_CLOSE_REASON = "event_close_reason"
-EVENT_CLOSE_CALLBACK_ID = "event_close_callback_id"
 
 META_DO_NOT_SEND_AUTO_PREBLASTS = "do_not_send_auto_preblasts"
 META_EXCLUDE_FROM_PAX_VAULT = "exclude_from_pax_vault"
 
+EVENT_LIST_PAGE_SIZE = 40  # with the filters and page buttons, well under Slack's 100-block modal limit
+
 
 # ---------------------------------------------------------------------------
 # Composition root
@@ -72,26 +74,23 @@ META_EXCLUDE_FROM_PAX_VAULT = "exclude_from_pax_vault"
 
 
 def _build_event_instance_service() -> EventInstanceService:
-    """Build the event-instance service using the production API-backed repository."""
-    return EventInstanceService(repository=get_api_event_instance_repository())
+    """Build the event-instance service using the production API-backed repository.
+
+    API writes bypass the SQLAlchemy session hooks, so the service invalidates the calendar feed cache itself.
+    """
+    return EventInstanceService(
+        repository=get_api_event_instance_repository(), on_write=CALENDAR_FEED_CACHE.invalidate_writes
+    )
 
 
 def _build_ao_service() -> AoService:
     return AoService(repository=get_api_ao_repository())
 
 
-def _build_location_service() -> LocationService:
-    return LocationService(repository=get_api_location_repository())
-
-
 def _build_event_type_service() -> EventTypeService:
     return EventTypeService(repository=get_api_event_type_repository())
 
 
-def _build_event_tag_service() -> EventTagService:
-    return EventTagService(repository=get_api_event_tag_repository())
-
-
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
@@ -127,7 +126,7 @@ def build_event_instance_add_form(
         update_view_id = None
 
     title_text = "Add an Event"
-    form = copy.deepcopy(INSTANCE_FORM)
+    form = INSTANCE_FORM.copy()
     if new_preblast or (safe_get(view_metadata, "is_preblast") == "True"):
         # Add a preblast block if this is a new event
         form.blocks.insert(
@@ -141,15 +140,11 @@ def build_event_instance_add_form(
         )
         parent_metadata.update({"is_preblast": "True"})
 
-    ao_service = _build_ao_service()
-    location_service = _build_location_service()
-    event_type_service = _build_event_type_service()
-    event_tag_service = _build_event_tag_service()
-
-    aos = ao_service.get_region_aos(region_record.org_id)
-    locations = location_service.get_org_locations(region_record.org_id)
-    event_types = event_type_service.get_all_event_types_for_org(region_record.org_id)
-    event_tags = event_tag_service.get_all_tags_for_org(region_record.org_id)
+    reference_data = get_region_reference_data(region_record.org_id)
+    aos = reference_data.aos
+    locations = reference_data.locations
+    event_types = reference_data.event_types
+    event_tags = reference_data.event_tags
 
     form.set_options(
         {
@@ -216,7 +211,7 @@ def build_event_instance_add_form(
         form_data = INSTANCE_FORM.get_selected_values(body)
         ao_id = safe_convert(safe_get(form_data, action_id), int)
         if ao_id:
-            ao = ao_service.get_ao_by_id(ao_id)
+            ao = next((a for a in aos if a.id == ao_id), None)
             if ao and ao.default_location_id:
                 initial_values[CALENDAR_ADD_EVENT_INSTANCE_LOCATION] = str(ao.default_location_id)
 
@@ -253,7 +248,7 @@ def handle_event_instance_add(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
     metadata = _parse_view_private_metadata(body)
-    form = copy.deepcopy(INSTANCE_FORM)
+    form = INSTANCE_FORM.copy()
     if safe_get(metadata, "is_preblast") == "True":
         form.blocks.insert(
             -1,
@@ -428,12 +423,15 @@ def build_event_instance_list_form(
     filter_ao_id = None
     filter_values = {}
     region_org_id = region_record.org_id
+    action_id = safe_get(body, "actions", 0, "action_id")
 
-    if safe_get(body, "actions", 0, "action_id") in [
+    if action_id in [
         CALENDAR_MANAGE_EVENT_INSTANCE_AO,
         CALENDAR_MANAGE_EVENT_INSTANCE_DATE,
+        CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE,
+        CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE,
     ]:
-        filter_values = orm.BlockView(blocks=copy.deepcopy(EVENT_LIST_FILTERS)).get_selected_values(body)
+        filter_values = EVENT_LIST_FILTERS.get_selected_values(body)
         update_view_id = safe_get(body, "view", "id")
         if safe_get(filter_values, CALENDAR_MANAGE_EVENT_INSTANCE_AO):
             filter_ao_id = safe_convert(safe_get(filter_values, CALENDAR_MANAGE_EVENT_INSTANCE_AO), int)
@@ -441,17 +439,30 @@ def build_event_instance_list_form(
             date_str = safe_get(filter_values, CALENDAR_MANAGE_EVENT_INSTANCE_DATE)
             start_date = datetime.strptime(date_str, "%Y-%m-%d").date()
 
+    # page_cursors holds the cursor each visited page started at; a filter change starts over at the first page
+    page_cursors = [None]
+    if action_id in (CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE, CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE):
+        metadata = _parse_view_private_metadata(body)
+        page_cursors = metadata.get("page_cursors") or [None]
+        if action_id == CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE and metadata.get("next_cursor"):
+            page_cursors = [*page_cursors, metadata["next_cursor"]]
+        elif action_id == CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE and len(page_cursors) > 1:
+            page_cursors = page_cursors[:-1]
+
     service = _build_event_instance_service()
-    records = service.get_region_instances(
+    page = service.get_region_instances_page(
         region_org_id=region_org_id,
         start_date=start_date,
         ao_org_id=filter_ao_id,
+        limit=EVENT_LIST_PAGE_SIZE,
+        cursor=page_cursors[-1],
     )
+    records = page.items
 
     ao_service = _build_ao_service()
     ao_orgs = ao_service.get_region_aos(region_record.org_id)
 
-    form = orm.BlockView(blocks=copy.deepcopy(EVENT_LIST_FILTERS))
+    form = EVENT_LIST_FILTERS.copy()
     form.set_options(
         {
             CALENDAR_MANAGE_EVENT_INSTANCE_AO: orm.as_selector_options(
@@ -504,6 +515,19 @@ def build_event_instance_list_form(
             )
         )
 
+    page_buttons = []
+    if len(page_cursors) > 1:
+        page_buttons.append(
+            orm.ButtonElement(":arrow_left: Previous", value="prev", action=CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE)
+        )
+    if page.next_cursor:
+        page_buttons.append(
+            orm.ButtonElement("Next :arrow_right:", value="next", action=CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE)
+        )
+    if page_buttons:
+        form.blocks.append(orm.ActionsBlock(elements=page_buttons))
+    page_metadata = {"page_cursors": page_cursors, "next_cursor": page.next_cursor}
+
     if update_view_id:
         form.update_modal(
             client=client,
@@ -511,6 +535,7 @@ def build_event_instance_list_form(
             callback_id=EDIT_DELETE_EVENT_INSTANCE_CALLBACK_ID,
             title_text=title_text,
             submit_button_text="None",
+            parent_metadata=page_metadata,
         )
     else:
         form.post_modal(
@@ -520,6 +545,7 @@ def build_event_instance_list_form(
             callback_id=EDIT_DELETE_EVENT_INSTANCE_CALLBACK_ID,
             submit_button_text="None",
             new_or_add="add",
+            parent_metadata=page_metadata,
         )
 
 
@@ -545,7 +571,7 @@ def handle_event_instance_edit_delete(
         )
         action_text = None
     elif action == "Close":
-        form = copy.deepcopy(EVENT_CLOSE_FORM)
+        form = EVENT_CLOSE_FORM.copy()
         form.update_modal(
             client=client,
             view_id=safe_get(body, "view", "id"),
@@ -593,7 +619,7 @@ def handle_event_instance_close(
 # Forms
 # ---------------------------------------------------------------------------
 
-EVENT_CLOSE_FORM = orm.BlockView(
+EVENT_CLOSE_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Reason for Closing",
@@ -605,7 +631,7 @@ EVENT_CLOSE_FORM = orm.BlockView(
     ]
 )
 
-INSTANCE_FORM = orm.BlockView(
+INSTANCE_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="AO",
@@ -686,23 +712,25 @@ INSTANCE_FORM = orm.BlockView(
     ]
 )
 
-EVENT_LIST_FILTERS = [
-    orm.InputBlock(
-        label="AO Filter",
-        action=CALENDAR_MANAGE_EVENT_INSTANCE_AO,
-        element=orm.StaticSelectElement(
-            placeholder="Select an AO",
+EVENT_LIST_FILTERS = orm.FrozenBlockView(
+    blocks=[
+        orm.InputBlock(
+            label="AO Filter",
+            action=CALENDAR_MANAGE_EVENT_INSTANCE_AO,
+            element=orm.StaticSelectElement(
+                placeholder="Select an AO",
+            ),
+            optional=True,
+            dispatch_action=True,
         ),
-        optional=True,
-        dispatch_action=True,
-    ),
-    orm.InputBlock(
-        label="Date Filter",
-        action=CALENDAR_MANAGE_EVENT_INSTANCE_DATE,
-        element=orm.DatepickerElement(
-            placeholder="Select a date",
+        orm.InputBlock(
+            label="Date Filter",
+            action=CALENDAR_MANAGE_EVENT_INSTANCE_DATE,
+            element=orm.DatepickerElement(
+                placeholder="Select a date",
+            ),
+            optional=True,
+            dispatch_action=True,
         ),
-        optional=True,
-        dispatch_action=True,
-    ),
-]
+    ]
+)
@@ -1,7 +1,6 @@
 import json
 import random
 import time
-from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from logging import Logger
@@ -12,9 +11,7 @@ from f3_data_models.models import (
     Attendance_x_AttendanceType,
     AttendanceType,
     EventInstance,
-    EventTag,
     EventTag_x_EventInstance,
-    Location,
     Org,
 )
 from f3_data_models.utils import DbManager
@@ -37,6 +34,7 @@ from utilities.helper_functions import (
     current_date_cst,
     fix_from_llm_tags,
     get_location_display_name,
+    get_region_reference_data,
     get_user,
     get_user_names,
     parse_rich_block,
@@ -309,14 +307,11 @@ def build_event_preblast_form(
 
     preblast_channel = get_preblast_channel(region_record, preblast_info)
     if action_value == "Edit Preblast" or preblast_info.user_is_q:
-        form = deepcopy(EVENT_PREBLAST_FORM)
+        form = EVENT_PREBLAST_FORM.copy()
 
-        location_records: list[Location] = DbManager.find_records(
-            Location, [Location.org_id == region_record.org_id, Location.is_active]
-        )  # noqa
-        event_tags: list[EventTag] = DbManager.find_records(
-            EventTag, [or_(EventTag.specific_org_id == region_record.org_id, EventTag.specific_org_id.is_(None))]
-        )
+        reference_data = get_region_reference_data(region_record.org_id)
+        location_records = reference_data.locations
+        event_tags = reference_data.event_tags
         # TODO: filter locations to AO?
         # TODO: show hardcoded details (date, time, etc.)
         form.set_options(
@@ -389,7 +384,7 @@ def build_event_preblast_form(
                     )
                 )
         else:
-            form.blocks[-1].label = "When would you like to send the preblast?"
+            form.editable_block(actions.EVENT_PREBLAST_SEND_OPTIONS).label = "When would you like to send the preblast?"
         form.blocks.append(orm.ActionsBlock(elements=preblast_info.action_blocks))
     else:
         blocks = [
@@ -613,7 +608,7 @@ def send_preblast(
         icon_url = None
     else:
         slack_id = q_user_id or slack_user_id
-        q_name, q_url = get_user_names([slack_id], logger, client, return_urls=True)
+        q_name, q_url = get_user_names([slack_id], logger, client, return_urls=True, region_record=region_record)
         q_name = (q_name or [""])[0]
         q_url = q_url[0]
         username = f"{q_name} (via F3 Nation)"
@@ -941,7 +936,9 @@ def handle_event_preblast_action(
                 )
             blocks = [b.as_form_field() for b in blocks]
 
-            q_name, q_url = get_user_names([slack_user_id], logger, client, return_urls=True)
+            q_name, q_url = get_user_names(
+                [slack_user_id], logger, client, return_urls=True, region_record=region_record
+            )
             q_name = (q_name or [""])[0]
             q_url = q_url[0]
             preblast_channel = get_preblast_channel(region_record, preblast_info)
@@ -1022,7 +1019,9 @@ def handle_event_preblast_action(
                         alt_text="Preblast Image",
                     ),
                 )
-            q_name, q_url = get_user_names([slack_user_id], logger, client, return_urls=True)
+            q_name, q_url = get_user_names(
+                [slack_user_id], logger, client, return_urls=True, region_record=region_record
+            )
             q_name = (q_name or [""])[0]
             q_url = q_url[0]
             preblast_channel = get_preblast_channel(region_record, preblast_info)
@@ -1091,7 +1090,7 @@ DEFAULT_PREBLAST = {
     "elements": [{"type": "rich_text_section", "elements": [{"text": "No preblast text entered", "type": "text"}]}],
 }
 
-EVENT_PREBLAST_FORM = orm.BlockView(
+EVENT_PREBLAST_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Title",
@@ -19,14 +19,15 @@ from utilities.builders import add_loading_form
 from utilities.constants import EVENT_TAG_COLORS
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import safe_convert, safe_get
+from utilities.slack.actions import (
+    CALENDAR_ADD_EVENT_TAG_CALLBACK_ID,
+    EVENT_TAG_EDIT_DELETE,
+)
 from utilities.slack.sdk_orm import SdkBlockView, as_selector_options
 
 # Action IDs
-CALENDAR_MANAGE_EVENT_TAGS = "calendar-manage-event-tags"
 CALENDAR_ADD_EVENT_TAG_NEW = "calendar-add-event-tag-new"
 CALENDAR_ADD_EVENT_TAG_COLOR = "calendar-add-event-tag-color"
-EVENT_TAG_EDIT_DELETE = "event-tag-edit-delete"
-CALENDAR_ADD_EVENT_TAG_CALLBACK_ID = "calendar-add-event-tag-id"
 EDIT_DELETE_AO_CALLBACK_ID = "edit-delete-ao-id"
 CALENDAR_EVENT_TAG_COLORS_IN_USE = "calendar-event-tag-colors-in-use"
 CALENDAR_EVENT_TAG_NOTICE = "calendar-event-tag-notice"
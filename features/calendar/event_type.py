@@ -14,18 +14,19 @@ from utilities.bot_logger import post_bot_log
 from utilities.builders import add_loading_form
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import safe_convert, safe_get
+from utilities.slack.actions import (
+    CALENDAR_ADD_EVENT_TYPE_CALLBACK_ID,
+    EVENT_TYPE_EDIT_DELETE,
+)
 from utilities.slack.sdk_orm import SdkBlockView, as_selector_options
 
 # ---------------------------------------------------------------------------
 # Action / callback ID constants (feature-local)
 # ---------------------------------------------------------------------------
-CALENDAR_MANAGE_EVENT_TYPES = "calendar-manage-event-types"
 CALENDAR_ADD_EVENT_TYPE_NEW = "calendar-add-event-type-new"
 CALENDAR_ADD_EVENT_TYPE_CATEGORY = "calendar-add-event-type-category"
 CALENDAR_ADD_EVENT_TYPE_ACRONYM = "calendar-add-event-type-acronym"
 CALENDAR_ADD_EVENT_TYPE_LIST = "calendar-add-event-type-list"
-CALENDAR_ADD_EVENT_TYPE_CALLBACK_ID = "calendar-add-event-type-id"
-EVENT_TYPE_EDIT_DELETE = "event-type-edit-delete"
 EDIT_DELETE_EVENT_TYPE_CALLBACK_ID = "edit-delete-event-type-id"
 _EVENT_TYPE_NOTE = "event-type-note"
 
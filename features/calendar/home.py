@@ -1,4 +1,3 @@
-import copy
 import datetime
 import json
 import time
@@ -12,9 +11,7 @@ from f3_data_models.models import (
     Attendance_x_AttendanceType,
     EventInstance,
     EventType,
-    Location,
     Org,
-    Org_Type,
     Series_Exception,
 )
 from f3_data_models.utils import DbManager
@@ -31,13 +28,16 @@ from features.calendar.event_preblast import (
     post_hc_thread_reply,
 )
 from utilities import constants
+from utilities.calendar_feed_cache import FeedEvent
 from utilities.constants import GCP_IMAGE_URL, LOCAL_DEVELOPMENT, S3_IMAGE_URL
 from utilities.database.orm import SlackSettings
 from utilities.database.special_queries import CalendarHomeQuery, get_admin_users, get_aoq_users, home_schedule_query
 from utilities.helper_functions import (
+    CALENDAR_FEED_CACHE,
     _parse_view_private_metadata,
     current_date_cst,
     get_location_display_name,
+    get_region_reference_data,
     get_user,
     safe_convert,
     safe_get,
@@ -45,6 +45,15 @@ from utilities.helper_functions import (
 )
 from utilities.slack import actions, orm
 
+HOME_SCHEDULE_LIMIT = 100
+HOME_MAX_PAGE_HISTORY = 30  # keeps the cursors well under Slack's 3000 character private_metadata limit
+HOME_FILTER_ACTIONS = {
+    actions.CALENDAR_HOME_AO_FILTER,
+    actions.CALENDAR_HOME_EVENT_TYPE_FILTER,
+    actions.CALENDAR_HOME_DATE_FILTER,
+    actions.CALENDAR_HOME_Q_FILTER,
+}
+
 
 def handle_event_preblast_select_button(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
@@ -73,7 +82,9 @@ def build_home_form(
     slack_user_id = safe_get(body, "user", "id") or safe_get(body, "user_id")
     user_id = get_user(slack_user_id, region_record, client, logger).user_id
 
-    metadata = safe_convert(safe_get(body, "view", "metadata", "event_payload"), json.loads) or {}
+    # Only carry state over from the calendar home itself, not from whichever view opened it
+    on_home_view = safe_get(body, "view", "callback_id") == actions.CALENDAR_HOME_CALLBACK_ID
+    metadata = _parse_view_private_metadata(body) if on_home_view else {}
     user_is_admin = safe_get(metadata, "user_is_admin")
     if user_is_admin is None:
         admin_users = get_admin_users(region_record.org_id, region_record.team_id)
@@ -88,21 +99,10 @@ def build_home_form(
 
     start_time = time.time()
     group_by_option = region_record.calendar_group_by_option or "ao"
-    ao_records = DbManager.find_records(
-        Org, filters=[Org.parent_id == region_record.org_id, Org.org_type == Org_Type.ao, Org.is_active.is_(True)]
-    )
-    location_records = DbManager.find_records(Location, [Location.org_id == region_record.org_id, Location.is_active])
-    location_records2 = DbManager.find_join_records2(
-        Location,
-        Org,
-        [Location.org_id == Org.id, Org.parent_id == region_record.org_id, Location.is_active],
-    )
-    location_records.extend(record[0] for record in location_records2)
-    location_records.sort(key=sort_by_name(get_location_display_name))
-    event_type_records: List[EventType] = DbManager.find_records(
-        EventType,
-        filters=[or_(EventType.specific_org_id == region_record.org_id, EventType.specific_org_id.is_(None))],
-    )
+    reference_data = get_region_reference_data(region_record.org_id)
+    ao_records = reference_data.aos
+    location_records = sorted(reference_data.locations, key=sort_by_name(get_location_display_name))
+    event_type_records = reference_data.event_types
     split_time = time.time()
     print(f"AO and Event Type time: {split_time - start_time}")
     start_time = time.time()
@@ -175,12 +175,15 @@ def build_home_form(
         existing_filter_data = {}
 
     # Build the filter
+    today = datetime.datetime.now(tz=pytz.timezone("US/Central")).date()
     start_date = (
         safe_convert(
             safe_get(existing_filter_data, actions.CALENDAR_HOME_DATE_FILTER), datetime.datetime.strptime, ["%Y-%m-%d"]
         )
-        or datetime.datetime.now(tz=pytz.timezone("US/Central")).date()
+        or today
     )
+    if isinstance(start_date, datetime.datetime):
+        start_date = start_date.date()
 
     selected_group_filter_ids = [
         v
@@ -188,85 +191,119 @@ def build_home_form(
         if v is not None
     ]
 
-    filter = [EventInstance.start_date >= start_date, EventInstance.is_active]
-    if group_by_option == "ao":
-        filter_org_ids = selected_group_filter_ids or [region_record.org_id]
-        filter.append(or_(EventInstance.org_id.in_(filter_org_ids), Org.parent_id.in_(filter_org_ids)))
-    else:
-        # Keep location grouping constrained to this region and its child AOs.
-        filter.append(or_(EventInstance.org_id == region_record.org_id, Org.parent_id == region_record.org_id))
-        if selected_group_filter_ids:
-            filter.append(EventInstance.location_id.in_(selected_group_filter_ids))
-
-    if safe_get(existing_filter_data, actions.CALENDAR_HOME_EVENT_TYPE_FILTER):
-        event_type_ids = [int(x) for x in safe_get(existing_filter_data, actions.CALENDAR_HOME_EVENT_TYPE_FILTER)]
-        filter.append(EventType.id.in_(event_type_ids))
-
+    event_type_ids = [
+        v
+        for v in (
+            safe_convert(x, int)
+            for x in (safe_get(existing_filter_data, actions.CALENDAR_HOME_EVENT_TYPE_FILTER) or [])
+        )
+        if v is not None
+    ]
     open_q_only = actions.FILTER_OPEN_Q in (safe_get(existing_filter_data, actions.CALENDAR_HOME_Q_FILTER) or [])
     only_users_events = actions.FILTER_MY_EVENTS in (
         safe_get(existing_filter_data, actions.CALENDAR_HOME_Q_FILTER) or []
     )
-    # Run the query
-    # TODO: implement pagination / dynamic limit
     split_time = time.time()
     print(f"Block building time: {split_time - start_time}")
     start_time = time.time()
-    events: list[CalendarHomeQuery] = home_schedule_query(
-        user_id, filter, limit=100, open_q_only=open_q_only, only_users_events=only_users_events
+
+    # Keyset pagination: page_starts holds the (start_date, id) cursor each visited page started after
+    page_starts = metadata.get("page_starts") or [None]
+    if action_id == actions.CALENDAR_HOME_NEXT_PAGE and metadata.get("next_cursor"):
+        page_starts = [*page_starts, metadata["next_cursor"]][-HOME_MAX_PAGE_HISTORY:]
+    elif action_id == actions.CALENDAR_HOME_PREV_PAGE and len(page_starts) > 1:
+        page_starts = page_starts[:-1]
+    elif action_id in HOME_FILTER_ACTIONS:
+        page_starts = [None]
+    after = _decode_page_cursor(page_starts[-1])
+
+    # Serve from the region's cached feed; only the viewer's HC / Q flags are worked out per request
+    feed = CALENDAR_FEED_CACHE.get(region_record.org_id, today)
+    events = feed.select(
+        user_id,
+        start_date,
+        org_ids=selected_group_filter_ids if group_by_option == "ao" else None,
+        location_ids=selected_group_filter_ids if group_by_option != "ao" else None,
+        event_type_ids=event_type_ids,
+        open_q_only=open_q_only,
+        only_users_events=only_users_events,
+        limit=HOME_SCHEDULE_LIMIT + 1,
+        after=after,
     )
+    if events is None:
+        events = [
+            FeedEvent.from_home_query(row, user_id)
+            for row in _query_home_schedule(
+                region_record,
+                user_id,
+                start_date,
+                group_by_option,
+                selected_group_filter_ids,
+                event_type_ids,
+                open_q_only,
+                only_users_events,
+                after,
+            )
+        ]
+    has_more = len(events) > HOME_SCHEDULE_LIMIT
 
     split_time = time.time()
-    print(f"Home schedule query: {split_time - start_time}")
+    print(f"Home schedule query: {split_time - start_time} (feed cache: {CALENDAR_FEED_CACHE.stats()})")
     start_time = time.time()
 
     # Build the event list
     active_date = datetime.date(2020, 1, 1)
     block_count = 1
-    for event in events:
+    last_shown = None
+    for event in events[:HOME_SCHEDULE_LIMIT]:
+        if block_count > 90:
+            # Slack caps a view at 100 blocks; the rest goes on the next page
+            has_more = True
+            break
         option_names: List[str] = []
-        if event.event.start_date != active_date:
-            active_date = event.event.start_date
+        user_q = user_id in event.q_user_ids
+        user_attending = user_id in event.attendee_ids
+        if event.start_date != active_date:
+            active_date = event.start_date
             blocks.append(orm.DividerBlock())
             blocks.append(orm.HeaderBlock(label=f":calendar: {active_date.strftime('%A, %B %d')}"))
             block_count += 2
-        if event.event.series_exception == Series_Exception.closed:
-            label = f"{event.org.name} {' / '.join(t.name for t in event.event_types)} - CLOSED :no_entry:"
+        if event.series_exception == Series_Exception.closed:
+            label = f"{event.org_name} {' / '.join(event.event_type_names)} - CLOSED :no_entry:"
             if user_is_admin:
                 option_names.append("Reopen Event")
             else:
                 option_names.append("Event Closed")
         else:
-            if block_count > 90:
-                break
             if not user_is_admin:
-                if event.user_q:
+                if user_q:
                     option_names.append("Edit Preblast")
                 else:
                     option_names.append("View Preblast")
-            if event.event.highlight:
-                label = f":star: *{event.event.name}* @ {event.org.name} @ {event.event.start_time}"
-            elif event.series and event.series.name and event.org.name not in event.series.name:
-                label = f"{event.series.name} @ {event.org.name} @ {event.event.start_time}"
+            if event.highlight:
+                label = f":star: *{event.name}* @ {event.org_name} @ {event.start_time}"
+            elif event.series_name and event.org_name not in event.series_name:
+                label = f"{event.series_name} @ {event.org_name} @ {event.start_time}"
             else:
-                label = f"{event.org.name} {' / '.join(t.name for t in event.event_types)} @ {event.event.start_time}"  # noqa
+                label = f"{event.org_name} {' / '.join(event.event_type_names)} @ {event.start_time}"  # noqa
             if event.planned_qs:
                 label += f" / Q: {event.planned_qs}"
             else:
                 label += " / Q: Open!"
                 option_names.append("Take Q")
-            if event.user_q:
+            if user_q:
                 label += " :muscle:"
-            if event.user_attending:
+            if user_attending:
                 label += " :white_check_mark:"
                 option_names.append("Un-HC")
             else:
                 option_names.append("HC")
-            if event.event.preblast_rich:
+            if event.has_preblast:
                 label += " :pencil:"
             if user_is_admin:
                 option_names.append("Assign Q")
                 option_names.append("Close Event")
-                if event.event.start_date > current_date_cst():
+                if event.start_date > current_date_cst():
                     option_names.append("Edit Preblast")
                 else:
                     option_names.append("Edit Backblast")
@@ -274,14 +311,28 @@ def build_home_form(
             orm.SectionBlock(
                 label=label,
                 element=orm.OverflowElement(
-                    action=f"{actions.CALENDAR_HOME_EVENT}_{event.event.id}",
+                    action=f"{actions.CALENDAR_HOME_EVENT}_{event.id}",
                     options=orm.as_selector_options(option_names),
                 ),
             )
         )
         block_count += 1
+        last_shown = event
+
+    metadata["page_starts"] = page_starts
+    metadata["next_cursor"] = _encode_page_cursor(last_shown) if has_more and last_shown else None
+    page_buttons = []
+    if len(page_starts) > 1:
+        page_buttons.append(
+            orm.ButtonElement(":arrow_left: Previous page", value="prev", action=actions.CALENDAR_HOME_PREV_PAGE)
+        )
+    if metadata["next_cursor"]:
+        page_buttons.append(
+            orm.ButtonElement("Next page :arrow_right:", value="next", action=actions.CALENDAR_HOME_NEXT_PAGE)
+        )
+    if page_buttons:
+        blocks.append(orm.ActionsBlock(elements=page_buttons))
 
-    # TODO: add "next page" button
     form = orm.BlockView(blocks=blocks)
     form.set_initial_values(existing_filter_data)
     view_id = update_view_id or safe_get(body, actions.LOADING_ID) or safe_get(body, "view", "id")
@@ -311,6 +362,49 @@ def build_home_form(
     start_time = time.time()
 
 
+def _encode_page_cursor(event: FeedEvent) -> list:
+    return [event.start_date.isoformat(), event.id]
+
+
+def _decode_page_cursor(cursor) -> tuple[datetime.date, int] | None:
+    if not cursor:
+        return None
+    return datetime.date.fromisoformat(cursor[0]), int(cursor[1])
+
+
+def _query_home_schedule(
+    region_record: SlackSettings,
+    user_id: int,
+    start_date: datetime.date,
+    group_by_option: str,
+    selected_group_filter_ids: List[int],
+    event_type_ids: List[int],
+    open_q_only: bool,
+    only_users_events: bool,
+    after: tuple[datetime.date, int] | None = None,
+) -> list[CalendarHomeQuery]:
+    """Uncached path, for start dates before today or pages the capped feed can't fully answer."""
+    filter = [EventInstance.start_date >= start_date, EventInstance.is_active]
+    if group_by_option == "ao":
+        filter_org_ids = selected_group_filter_ids or [region_record.org_id]
+        filter.append(or_(EventInstance.org_id.in_(filter_org_ids), Org.parent_id.in_(filter_org_ids)))
+    else:
+        # Keep location grouping constrained to this region and its child AOs.
+        filter.append(or_(EventInstance.org_id == region_record.org_id, Org.parent_id == region_record.org_id))
+        if selected_group_filter_ids:
+            filter.append(EventInstance.location_id.in_(selected_group_filter_ids))
+    if event_type_ids:
+        filter.append(EventType.id.in_(event_type_ids))
+    return home_schedule_query(
+        user_id,
+        filter,
+        limit=HOME_SCHEDULE_LIMIT + 1,
+        open_q_only=open_q_only,
+        only_users_events=only_users_events,
+        after=after,
+    )
+
+
 def build_calendar_image_form(
     body: dict,
     client: WebClient,
@@ -386,7 +480,7 @@ def build_calendar_image_form(
     )
 
 
-ASSIGN_Q_FORM = orm.BlockView(
+ASSIGN_Q_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(label="Assign Q to this event"),
         orm.InputBlock(
@@ -427,9 +521,9 @@ def build_assign_q_form(
         joinedloads=[Attendance.slack_users, Attendance.attendance_types],
     )
 
-    form = copy.deepcopy(ASSIGN_Q_FORM)
-    form.blocks[0].label = (
-        f"*AO:* {event_instance.org.name}\n"
+    form = ASSIGN_Q_FORM.copy()
+    form.blocks[0] = orm.SectionBlock(
+        label=f"*AO:* {event_instance.org.name}\n"
         + f"*Event:* {event_instance.name}\n"
         + f"*Date:* {event_instance.start_date.strftime('%A, %B %d')}\n"
         + f"*Start Time:* {event_instance.start_time or 'TBD'}\n"
@@ -673,7 +767,7 @@ def handle_home_event(body: dict, client: WebClient, logger: Logger, context: di
             body, client, logger, context, region_record, event_instance_id=event_instance_id, update_view_id=view_id
         )
     elif action == "Close Event":
-        form = copy.deepcopy(event_instance.EVENT_CLOSE_FORM)
+        form = event_instance.EVENT_CLOSE_FORM.copy()
         form.post_modal(
             client=client,
             trigger_id=safe_get(body, "trigger_id"),
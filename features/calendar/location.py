@@ -9,6 +9,7 @@ from slack_sdk.web import WebClient
 
 from application.location import LocationData
 from application.location.service import LocationService
+from features.calendar.nearby_events import invalidate_region_midpoint
 from infrastructure.api_client import get_api_location_repository
 from utilities.bot_logger import post_bot_log
 from utilities.builders import add_loading_form
@@ -20,15 +21,16 @@ from utilities.helper_functions import (
     safe_get,
     trigger_map_revalidation,
 )
+from utilities.slack.actions import (
+    ADD_LOCATION_CALLBACK_ID,
+    CALENDAR_ADD_AO_NEW_LOCATION,
+    LOCATION_EDIT_DELETE,
+)
 from utilities.slack.sdk_orm import SdkBlockView, as_selector_options
 
 # ---------------------------------------------------------------------------
 # Action / callback ID constants (feature-local)
 # ---------------------------------------------------------------------------
-CALENDAR_MANAGE_LOCATIONS = "calendar-manage-locations"
-CALENDAR_ADD_AO_NEW_LOCATION = "calendar-add-ao-new-location"
-LOCATION_EDIT_DELETE = "location-edit-delete"
-ADD_LOCATION_CALLBACK_ID = "add-location-id"
 EDIT_DELETE_LOCATION_CALLBACK_ID = "edit-delete-location-id"
 _LOCATION_NOTICE = "location-notice"
 
@@ -355,6 +357,7 @@ def handle_location_add(body: dict, client: WebClient, logger: Logger, context:
         )
         trigger_map_revalidation(action="map.created", map_update_data=MapUpdateData(locationId=new_location.id))
         created_location_id = new_location.id
+    invalidate_region_midpoint(region_record.org_id)
 
     if safe_get(metadata, "update_view_id"):
         from features.calendar import ao
@@ -416,6 +419,7 @@ def handle_location_edit_delete(
         deleted_name = next((get_location_display_name(loc) for loc in locations if loc.id == location_id), "selected")
         service.delete_location(location_id)
         trigger_map_revalidation(action="map.deleted", map_update_data=MapUpdateData(locationId=location_id))
+        invalidate_region_midpoint(region_record.org_id)
         remaining = [loc for loc in locations if loc.id != location_id]
         remaining.sort(key=lambda loc: get_location_display_name(loc).lower())
         views = LocationViews()
@@ -1,9 +1,11 @@
 import datetime
 import json
 import math
+import os
+import time
 from dataclasses import dataclass
 from logging import Logger
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from f3_data_models.models import (
     Attendance,
@@ -18,6 +20,7 @@ from f3_data_models.utils import DbManager
 from slack_sdk.web import WebClient
 
 from utilities.database.orm import SlackSettings
+from utilities.database.special_queries import highlighted_events_in_box
 from utilities.helper_functions import (
     REGION_RECORDS,
     current_date_cst,
@@ -39,6 +42,9 @@ DEFAULT_DISTANCE = "50"
 DEFAULT_SORT = "distance"
 DEFAULT_DAYS_AHEAD = 60
 MAX_EVENTS_DISPLAYED = 20
+EARTH_RADIUS_MILES = 3958.8
+BOX_MARGIN_DEGREES = 1e-6  # absorbs float rounding at the box edge
+REGION_MIDPOINT_TTL_SECONDS = float(os.environ.get("REGION_MIDPOINT_TTL_SECONDS", "3600"))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -48,7 +54,7 @@ MAX_EVENTS_DISPLAYED = 20
 
 def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Return the great-circle distance in miles between two lat/lon points."""
-    R = 3958.8  # Earth radius in miles
+    R = EARTH_RADIUS_MILES
     phi1, phi2 = math.radians(lat1), math.radians(lat2)
     dphi = math.radians(lat2 - lat1)
     dlambda = math.radians(lon2 - lon1)
@@ -56,6 +62,23 @@ def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+def bounding_box(lat: float, lon: float, miles: float) -> Tuple[Tuple[float, float], Optional[Tuple[float, float]]]:
+    """
+    Return ((min_lat, max_lat), (min_lon, max_lon)) enclosing every point within ``miles`` of (lat, lon).
+
+    The box is a superset of the haversine circle, so filtering on it first never drops a point that
+    ``haversine_miles`` would keep. Longitude is None (unbounded) when the circle reaches a pole or the antimeridian.
+    """
+    angular = miles / EARTH_RADIUS_MILES
+    lat_range = (lat - math.degrees(angular) - BOX_MARGIN_DEGREES, lat + math.degrees(angular) + BOX_MARGIN_DEGREES)
+    if angular >= math.pi / 2 - math.radians(abs(lat)):
+        return lat_range, None
+    dlon = math.degrees(math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(lat))))) + BOX_MARGIN_DEGREES
+    if lon - dlon < -180 or lon + dlon > 180:
+        return lat_range, None
+    return lat_range, (lon - dlon, lon + dlon)
+
+
 def _get_target_settings(region_org_id: int) -> Optional[SlackSettings]:
     """Return SlackSettings for a region org, or None if not found or not on Slack."""
     ox = DbManager.find_first_record(Org_x_SlackSpace, [Org_x_SlackSpace.org_id == region_org_id])
@@ -106,11 +129,27 @@ class NearbyEventRow:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+_region_midpoints: Dict[int, Tuple[Optional[tuple], float]] = {}
+
+
+def invalidate_region_midpoint(org_id: Optional[int] = None) -> None:
+    """Drop the cached midpoint for one region (or all regions) after its locations change."""
+    if org_id is None:
+        _region_midpoints.clear()
+    else:
+        _region_midpoints.pop(org_id, None)
+
+
 def get_region_midpoint(org_id: int) -> Optional[tuple]:
     """
     Return (avg_lat, avg_lon) centroid of all geolocated locations for this region and its AOs.
-    Returns None if no locations with lat/lon are found.
+    Returns None if no locations with lat/lon are found. Cached per region for REGION_MIDPOINT_TTL_SECONDS;
+    location edits made through the app invalidate it straight away.
     """
+    cached = _region_midpoints.get(org_id)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+
     region_locations: List[Location] = DbManager.find_records(
         Location,
         filters=[Location.org_id == org_id, Location.is_active],
@@ -125,12 +164,13 @@ def get_region_midpoint(org_id: int) -> Optional[tuple]:
     all_locations = region_locations + ao_locations
     geolocated = [loc for loc in all_locations if loc.latitude and loc.longitude]
 
-    if not geolocated:
-        return None
-
-    avg_lat = sum(loc.latitude for loc in geolocated) / len(geolocated)
-    avg_lon = sum(loc.longitude for loc in geolocated) / len(geolocated)
-    return avg_lat, avg_lon
+    midpoint = None
+    if geolocated:
+        avg_lat = sum(loc.latitude for loc in geolocated) / len(geolocated)
+        avg_lon = sum(loc.longitude for loc in geolocated) / len(geolocated)
+        midpoint = (avg_lat, avg_lon)
+    _region_midpoints[org_id] = (midpoint, time.monotonic() + REGION_MIDPOINT_TTL_SECONDS)
+    return midpoint
 
 
 def get_nearby_special_events(
@@ -148,17 +188,9 @@ def get_nearby_special_events(
     today = current_date_cst()
     end_date = today + datetime.timedelta(days=days_ahead)
 
-    # Fetch all highlighted active upcoming events
-    all_events: List[EventInstance] = DbManager.find_records(
-        EventInstance,
-        filters=[
-            EventInstance.highlight,
-            EventInstance.is_active,
-            EventInstance.start_date >= today,
-            EventInstance.start_date <= end_date,
-        ],
-        joinedloads=[EventInstance.org, EventInstance.location],
-    )
+    # Only highlighted events inside the bounding box of the search circle come back from the DB
+    lat_range, lon_range = bounding_box(center_lat, center_lon, max_miles)
+    all_events: List[EventInstance] = highlighted_events_in_box(today, end_date, org_id, lat_range, lon_range)
 
     # Filter: AO-level events from other regions with location data within range
     candidates: List[tuple] = []
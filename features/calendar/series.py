@@ -1,4 +1,3 @@
-import copy
 import json
 from datetime import datetime, timedelta
 from logging import Logger
@@ -7,16 +6,12 @@ from f3_data_models.models import Day_Of_Week, Event_Cadence
 from slack_sdk.web import WebClient
 
 from application.ao.service import AoService
-from application.event_tag.service import EventTagService
 from application.event_type.service import EventTypeService
-from application.location.service import LocationService
 from application.series import SeriesData
 from application.series.service import SeriesService
 from infrastructure.api_client import (
     get_api_ao_repository,
-    get_api_event_tag_repository,
     get_api_event_type_repository,
-    get_api_location_repository,
     get_api_series_repository,
 )
 from utilities import constants
@@ -27,6 +22,7 @@ from utilities.helper_functions import (
     MapUpdateData,
     _parse_view_private_metadata,
     get_location_display_name,
+    get_region_reference_data,
     safe_convert,
     safe_get,
     trigger_map_revalidation,
@@ -50,18 +46,10 @@ def _build_ao_service() -> AoService:
     return AoService(repository=get_api_ao_repository())
 
 
-def _build_location_service() -> LocationService:
-    return LocationService(repository=get_api_location_repository())
-
-
 def _build_event_type_service() -> EventTypeService:
     return EventTypeService(repository=get_api_event_type_repository())
 
 
-def _build_event_tag_service() -> EventTagService:
-    return EventTagService(repository=get_api_event_tag_repository())
-
-
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
@@ -101,18 +89,14 @@ def build_series_add_form(
         update_view_id = None
 
     title_text = "Edit a Series" if edit_event else "Add a Series"
-    form = copy.deepcopy(SERIES_FORM)
+    form = SERIES_FORM.copy()
     parent_metadata.update({"is_series": "True"})
 
-    ao_service = _build_ao_service()
-    location_service = _build_location_service()
-    event_type_service = _build_event_type_service()
-    event_tag_service = _build_event_tag_service()
-
-    aos = ao_service.get_region_aos(region_record.org_id)
-    locations = location_service.get_org_locations(region_record.org_id)
-    event_types = event_type_service.get_all_event_types_for_org(region_record.org_id)
-    event_tags = event_tag_service.get_all_tags_for_org(region_record.org_id)
+    reference_data = get_region_reference_data(region_record.org_id)
+    aos = reference_data.aos
+    locations = reference_data.locations
+    event_types = reference_data.event_types
+    event_tags = reference_data.event_tags
 
     form.set_options(
         {
@@ -187,7 +171,8 @@ def build_series_add_form(
     action_id = safe_get(body, "actions", 0, "action_id")
     if action_id in (actions.CALENDAR_ADD_SERIES_AO, actions.CALENDAR_ADD_EVENT_AO):
         form_data = SERIES_FORM.get_selected_values(body)
-        ao = ao_service.get_ao_by_id(safe_convert(safe_get(form_data, action_id), int))
+        selected_ao_id = safe_convert(safe_get(form_data, action_id), int)
+        ao = next((a for a in aos if a.id == selected_ao_id), None)
         if ao and ao.default_location_id:
             initial_values[actions.CALENDAR_ADD_SERIES_LOCATION] = str(ao.default_location_id)
 
@@ -379,7 +364,7 @@ def build_series_list_form(
     if safe_get(body, "actions", 0, "action_id") in [
         actions.CALENDAR_MANAGE_SERIES_AO,
     ]:
-        filter_values = orm.BlockView(blocks=copy.deepcopy(SERIES_LIST_FILTERS)).get_selected_values(body)
+        filter_values = SERIES_LIST_FILTERS.get_selected_values(body)
         update_view_id = safe_get(body, "view", "id")
         if safe_get(filter_values, actions.CALENDAR_MANAGE_SERIES_AO):
             filter_org = safe_convert(safe_get(filter_values, actions.CALENDAR_MANAGE_SERIES_AO), int)
@@ -397,7 +382,7 @@ def build_series_list_form(
 
     ao_orgs = ao_service.get_region_aos(region_record.org_id)
 
-    form = orm.BlockView(blocks=copy.deepcopy(SERIES_LIST_FILTERS))
+    form = SERIES_LIST_FILTERS.copy()
     form.set_options(
         {
             actions.CALENDAR_MANAGE_SERIES_AO: orm.as_selector_options(
@@ -468,7 +453,7 @@ def handle_series_edit_delete(
         )
 
 
-SERIES_FORM = orm.BlockView(
+SERIES_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="AO",
@@ -606,14 +591,16 @@ SERIES_FORM = orm.BlockView(
     ]
 )
 
-SERIES_LIST_FILTERS = [
-    orm.InputBlock(
-        label="AO Filter",
-        action=actions.CALENDAR_MANAGE_SERIES_AO,
-        element=orm.StaticSelectElement(
-            placeholder="Select an AO",
+SERIES_LIST_FILTERS = orm.FrozenBlockView(
+    blocks=[
+        orm.InputBlock(
+            label="AO Filter",
+            action=actions.CALENDAR_MANAGE_SERIES_AO,
+            element=orm.StaticSelectElement(
+                placeholder="Select an AO",
+            ),
+            optional=True,
+            dispatch_action=True,
         ),
-        optional=True,
-        dispatch_action=True,
-    ),
-]
+    ]
+)
@@ -1,4 +1,3 @@
-import copy
 import os
 from logging import Logger
 
@@ -14,11 +13,11 @@ from utilities.database.orm import SlackSettings
 from utilities.database.special_queries import get_admin_users, make_user_admin
 from utilities.helper_functions import (
     get_user,
+    invalidate_region_record,
     safe_convert,
     safe_get,
-    update_local_region_records,
 )
-from utilities.slack import actions, forms
+from utilities.slack import actions, forms, orm
 
 
 def build_config_form(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
@@ -37,25 +36,28 @@ def build_config_form(body: dict, client: WebClient, logger: Logger, context: di
             user_is_admin = any(u[0].id == slack_user.user_id for u in admin_users)
 
         if user_is_admin:
-            config_form = copy.deepcopy(forms.CONFIG_FORM)
+            config_form = forms.CONFIG_FORM.copy()
             if region_record.org_id in constants.ACHIEVEMENTS_ALPHA_TESTING_ORG_IDS:
-                config_form.blocks[0].elements.append(copy.deepcopy(forms.ACHIEVEMENT_BUTTON))
+                config_form.blocks[0] = orm.ActionsBlock(
+                    elements=[*config_form.blocks[0].elements, forms.ACHIEVEMENT_BUTTON]
+                )
         else:
             if region_record.org_id is None:
-                config_form = copy.deepcopy(forms.CONFIG_NO_ORG_FORM)
+                config_form = forms.CONFIG_NO_ORG_FORM.copy()
             elif len(admin_users) == 0:
                 make_user_admin(region_record.org_id, slack_user.user_id)
-                config_form = copy.deepcopy(forms.CONFIG_FORM)
+                config_form = forms.CONFIG_FORM.copy()
             else:
-                config_form = copy.deepcopy(forms.CONFIG_NO_PERMISSIONS_FORM)
-                config_form.blocks[1].label += " Your region's admin users are: "
+                config_form = forms.CONFIG_NO_PERMISSIONS_FORM.copy()
                 user_labels = []
                 for admin_user in admin_users:
                     if admin_user[1]:
                         user_labels.append(f" <@{admin_user[1].slack_id}>")
                     else:
                         user_labels.append(admin_user[0].f3_name or "")
-                config_form.blocks[1].label += ", ".join(user_labels)
+                config_form.blocks[1] = orm.SectionBlock(
+                    label=config_form.blocks[1].label + " Your region's admin users are: " + ", ".join(user_labels)
+                )
 
         config_form.update_modal(
             client=client,
@@ -67,7 +69,7 @@ def build_config_form(body: dict, client: WebClient, logger: Logger, context: di
 
 
 def build_config_email_form(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
-    config_form = copy.deepcopy(forms.CONFIG_EMAIL_FORM)
+    config_form = forms.CONFIG_EMAIL_FORM.copy()
 
     if region_record.email_password:
         fernet = Fernet(os.environ[constants.PASSWORD_ENCRYPT_KEY].encode())
@@ -100,7 +102,7 @@ def build_config_email_form(body: dict, client: WebClient, logger: Logger, conte
 def build_config_general_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
-    config_form = copy.deepcopy(forms.CONFIG_GENERAL_FORM)
+    config_form = forms.CONFIG_GENERAL_FORM.copy()
 
     config_form.set_initial_values(
         {
@@ -175,7 +177,7 @@ def handle_config_email_post(
         fields={SlackSpace.settings: region_record.__dict__},
     )
 
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
 
 
 def handle_config_general_post(
@@ -217,4 +219,4 @@ def handle_config_general_post(
         fields={SlackSpace.settings: region_record.__dict__},
     )
 
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
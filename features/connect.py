@@ -27,22 +27,24 @@ from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
     get_region_record,
     get_user,
+    invalidate_region_record,
     safe_get,
-    update_local_region_records,
 )
-from utilities.slack.actions import LOADING_ID
+from utilities.slack.actions import (
+    APPROVE_CONNECTION,
+    CONNECT_EXISTING_REGION,
+    CONNECT_EXISTING_REGION_CALLBACK_ID,
+    CREATE_NEW_REGION,
+    CREATE_NEW_REGION_CALLBACK_ID,
+    DENY_CONNECTION,
+    LOADING_ID,
+    SELECT_REGION,
+)
 
-CONNECT_EXISTING_REGION = "connect_existing_region"
-CREATE_NEW_REGION = "create_new_region"
-CONNECT_EXISTING_REGION_CALLBACK_ID = "connect_existing_region"
-CREATE_NEW_REGION_CALLBACK_ID = "create_new_region"
-SELECT_REGION = "select_region"
 NEW_REGION_NAME = "new_region_name"
 STARFISH_EXISTING_REGION = "connect_region_starfish"
 SEARCH_REGION = "search_region"
 MIGRATION_DATE = "connect_migration_date"
-APPROVE_CONNECTION = "approve_connection"
-DENY_CONNECTION = "deny_connection"
 
 
 def build_connect_options_form(
@@ -296,6 +298,7 @@ def handle_approve_connection(
             filters=[SlackSpace.team_id == region_record.team_id],
             fields={SlackSpace.settings: region_record.__dict__},
         )
+        invalidate_region_record(team_id)
     # Make the current user an admin of the new org
     slack_user_id = metadata.get("user_id")
     user_id = get_user(slack_user_id, region_record, client, logger).user_id
@@ -375,8 +378,6 @@ def handle_approve_connection(
     except Exception as e:
         logger.error(f"Error updating original admin message: {e}")
 
-    update_local_region_records()
-
 
 def handle_deny_connection(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
     metadata = safe_get(body, "message", "metadata") or {}
@@ -1,4 +1,3 @@
-import copy
 from logging import Logger
 
 from f3_data_models.models import SlackSpace
@@ -7,8 +6,8 @@ from slack_sdk.web import WebClient
 
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
+    invalidate_region_record,
     safe_get,
-    update_local_region_records,
 )
 from utilities.slack import actions, forms
 from utilities.slack import orm as slack_orm
@@ -49,7 +48,7 @@ def build_custom_field_menu(
     #         filters=[SlackSpace.team_id == region_record.team_id],
     #         fields={SlackSpace.settings: region_record.__dict__},
     #     )
-    #     update_local_region_records()
+    #     invalidate_region_record(region_record.team_id)
 
     for custom_field in custom_fields.values():
         label = f"Name: {custom_field['name']}\nType: {custom_field['type']}"
@@ -134,7 +133,7 @@ def build_custom_field_add_edit(
     else:
         custom_field_name = None
 
-    custom_field_form = copy.deepcopy(forms.CUSTOM_FIELD_ADD_EDIT_FORM)
+    custom_field_form = forms.CUSTOM_FIELD_ADD_EDIT_FORM.copy()
     custom_field = safe_get(region_record.custom_fields, custom_field_name or "")
 
     if custom_field:
@@ -194,7 +193,7 @@ def delete_custom_field(body: dict, client: WebClient, logger: Logger, context:
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
     build_custom_field_menu(body, client, logger, context, region_record, update_view_id=view_id)
 
 
@@ -228,7 +227,7 @@ def handle_custom_field_add(body: dict, client: WebClient, logger: Logger, conte
             filters=[SlackSpace.team_id == region_record.team_id],
             fields={SlackSpace.settings: region_record.__dict__},
         )
-        update_local_region_records()
+        invalidate_region_record(region_record.team_id)
 
     previous_view_id = safe_get(body, "view", "previous_view_id")
     build_custom_field_menu(body, client, logger, context, region_record, update_view_id=previous_view_id)
@@ -253,4 +252,4 @@ def handle_custom_field_menu(
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
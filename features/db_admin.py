@@ -1,4 +1,3 @@
-import copy
 import os
 import ssl
 from logging import Logger
@@ -21,6 +20,7 @@ from utilities.helper_functions import (
     # current_date_cst,
     get_region_record,
     get_user,
+    invalidate_region_record,
     safe_convert,
     safe_get,
     trigger_map_revalidation,
@@ -47,10 +47,10 @@ def build_db_admin_form(
 ):
     update_view_id = update_view_id or safe_get(body, actions.LOADING_ID)
     if body.get("text") == os.environ.get("DB_ADMIN_PASSWORD") or message:
-        form = copy.deepcopy(DB_ADMIN_FORM)
+        form = DB_ADMIN_FORM.copy()
         # form.blocks[-1].label = message or " "
     else:
-        form = copy.deepcopy(DB_WRONG_PASSWORD_FORM)
+        form = DB_WRONG_PASSWORD_FORM.copy()
 
     form.update_modal(
         client=client,
@@ -202,7 +202,7 @@ def handle_trigger_map_revalidation(
         map_update_data=update_data,
     )
     msg = "Map revalidation triggered successfully." if success else "Failed to trigger map revalidation."
-    form = copy.deepcopy(DB_ADMIN_FORM)
+    form = DB_ADMIN_FORM.copy()
     form.blocks.append(orm.SectionBlock(label=msg))
     form.update_modal(
         client=client,
@@ -246,6 +246,7 @@ def handle_make_org(
             filters=[SlackSpace.team_id == region_record.team_id],
             fields={SlackSpace.settings: region_record.__dict__},
         )
+        invalidate_region_record(region_record.team_id)
     # Make the current user an admin of the new org
     slack_user_id = safe_get(body, "user", "id")
     user_id = get_user(slack_user_id, region_record, client, logger).user_id
@@ -278,6 +279,7 @@ def handle_update_bot_token(
                 SlackSpace.settings: region_record.__dict__,
             },
         )
+        invalidate_region_record(region_record.team_id)
 
 
 def handle_send_admin_announcement(
@@ -356,7 +358,7 @@ def handle_refresh_cache(
 ):
     from utilities.helper_functions import update_local_region_records, update_local_slack_users
 
-    update_local_region_records()
+    update_local_region_records(full=True)
     update_local_slack_users()
 
 
@@ -398,7 +400,7 @@ def handle_long_run_task(
     )
 
 
-DB_ADMIN_FORM = orm.BlockView(
+DB_ADMIN_FORM = orm.FrozenBlockView(
     blocks=[
         orm.ActionsBlock(
             elements=[
@@ -450,7 +452,7 @@ DB_ADMIN_FORM = orm.BlockView(
     ]
 )
 
-DB_WRONG_PASSWORD_FORM = orm.BlockView(
+DB_WRONG_PASSWORD_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(
             action=actions.DB_ADMIN_TEXT,
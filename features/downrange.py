@@ -1,4 +1,3 @@
-import copy
 import json
 import ssl
 from logging import Logger
@@ -13,9 +12,9 @@ from utilities.database.special_queries import get_admin_users
 from utilities.helper_functions import (
     REGION_RECORDS,
     get_user,
+    invalidate_region_record,
     safe_convert,
     safe_get,
-    update_local_region_records,
 )
 from utilities.slack import actions
 from utilities.slack.orm import (
@@ -27,6 +26,7 @@ from utilities.slack.orm import (
     ContextElement,
     DividerBlock,
     ExternalSelectElement,
+    FrozenBlockView,
     HeaderBlock,
     InputBlock,
     PlainTextInputElement,
@@ -277,64 +277,66 @@ def _ssl_context():
 
 
 # Blocks for the admin settings section (appended below the search when user is admin)
-DOWNRANGE_ADMIN_BLOCKS = [
-    DividerBlock(),
-    HeaderBlock(label=":lock: Admin: Downrange Settings"),
-    InputBlock(
-        label="Invite link sharing",
-        action=actions.DOWNRANGE_INVITE_SHARING,
-        element=RadioButtonsElement(
-            initial_value="request_only",
-            options=as_selector_options(
-                names=["Share invite link proactively", "Require a request for invite", "Direct email invite"],
-                values=["proactive", "request_only", "direct_email"],
+DOWNRANGE_ADMIN_BLOCKS = FrozenBlockView(
+    blocks=[
+        DividerBlock(),
+        HeaderBlock(label=":lock: Admin: Downrange Settings"),
+        InputBlock(
+            label="Invite link sharing",
+            action=actions.DOWNRANGE_INVITE_SHARING,
+            element=RadioButtonsElement(
+                initial_value="request_only",
+                options=as_selector_options(
+                    names=["Share invite link proactively", "Require a request for invite", "Direct email invite"],
+                    values=["proactive", "request_only", "direct_email"],
+                ),
+            ),
+            optional=False,
+            hint=(
+                "Proactive: any bot user can see your invite link directly. "
+                "Request: users must request an invite, and you approve it. "
+                "Direct email: the requester's email is shared with your admins so they can send a direct Slack invite."
             ),
         ),
-        optional=False,
-        hint=(
-            "Proactive: any bot user can see your invite link directly. "
-            "Request: users must request an invite, and you approve it. "
-            "Direct email: the requester's email is shared with your admins so they can send a direct Slack invite."
-        ),
-    ),
-    InputBlock(
-        label="Slack invite link",
-        action=actions.DOWNRANGE_INVITE_LINK,
-        element=PlainTextInputElement(
-            placeholder="https://join.slack.com/t/your-workspace/...",
-        ),
-        optional=True,
-        hint=(
-            "To get your invite link: Slack → Settings → Invitations → Invite people → Copy link. "
-            "You can set the link to never expire. Even if you choose 'Require a request', you can "
-            "pre-fill this so admins can approve requests with one click."
+        InputBlock(
+            label="Slack invite link",
+            action=actions.DOWNRANGE_INVITE_LINK,
+            element=PlainTextInputElement(
+                placeholder="https://join.slack.com/t/your-workspace/...",
+            ),
+            optional=True,
+            hint=(
+                "To get your invite link: Slack → Settings → Invitations → Invite people → Copy link. "
+                "You can set the link to never expire. Even if you choose 'Require a request', you can "
+                "pre-fill this so admins can approve requests with one click."
+            ),
         ),
-    ),
-    DividerBlock(),
-    InputBlock(
-        label="Downrange backblast cross-posting",
-        action=actions.DOWNRANGE_CHANNEL_POSTING,
-        element=RadioButtonsElement(
-            initial_value="off",
-            options=as_selector_options(
-                names=["Off", "Enabled"],
-                values=["off", "enabled"],
+        DividerBlock(),
+        InputBlock(
+            label="Downrange backblast cross-posting",
+            action=actions.DOWNRANGE_CHANNEL_POSTING,
+            element=RadioButtonsElement(
+                initial_value="off",
+                options=as_selector_options(
+                    names=["Off", "Enabled"],
+                    values=["off", "enabled"],
+                ),
+            ),
+            optional=False,
+            hint=(
+                "When enabled, backblasts posted in other regions that tag PAX from your region "
+                "will be cross-posted to the channel below."
             ),
         ),
-        optional=False,
-        hint=(
-            "When enabled, backblasts posted in other regions that tag PAX from your region "
-            "will be cross-posted to the channel below."
+        InputBlock(
+            label="Cross-post channel",
+            action=actions.DOWNRANGE_CHANNEL,
+            element=ChannelsSelectElement(placeholder="Select a channel..."),
+            optional=True,
+            hint="The channel in your workspace where downrange backblasts will be cross-posted.",
         ),
-    ),
-    InputBlock(
-        label="Cross-post channel",
-        action=actions.DOWNRANGE_CHANNEL,
-        element=ChannelsSelectElement(placeholder="Select a channel..."),
-        optional=True,
-        hint="The channel in your workspace where downrange backblasts will be cross-posted.",
-    ),
-]
+    ]
+)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -349,7 +351,7 @@ def build_downrange_menu(body: dict, client: WebClient, logger: Logger, context:
     form = _build_form_base()
 
     if is_admin_user:
-        for block in copy.deepcopy(DOWNRANGE_ADMIN_BLOCKS):
+        for block in DOWNRANGE_ADMIN_BLOCKS.blocks:
             form.add_block(block)
         form.set_initial_values(
             {
@@ -442,7 +444,7 @@ def handle_region_select(body: dict, client: WebClient, logger: Logger, context:
     # Re-add admin section, restoring current form values
     if is_admin_user:
         current_values = safe_get(body, "view", "state", "values") or {}
-        for block in copy.deepcopy(DOWNRANGE_ADMIN_BLOCKS):
+        for block in DOWNRANGE_ADMIN_BLOCKS.blocks:
             form.add_block(block)
         form.set_initial_values(
             {
@@ -882,7 +884,7 @@ def handle_downrange_settings(
 
     from f3_data_models.models import SlackSpace
 
-    form_data = BlockView(blocks=copy.deepcopy(DOWNRANGE_ADMIN_BLOCKS)).get_selected_values(body)
+    form_data = DOWNRANGE_ADMIN_BLOCKS.get_selected_values(body)
 
     region_record.downrange_invite_sharing = safe_get(form_data, actions.DOWNRANGE_INVITE_SHARING) or "request_only"
     region_record.downrange_invite_link = safe_get(form_data, actions.DOWNRANGE_INVITE_LINK) or None
@@ -894,4 +896,4 @@ def handle_downrange_settings(
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
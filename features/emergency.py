@@ -1,4 +1,3 @@
-import copy
 from datetime import datetime
 from logging import Logger
 
@@ -12,11 +11,11 @@ from utilities.helper_functions import get_user, safe_get
 from utilities.sendmail import send_via_sendgrid
 from utilities.slack import actions
 from utilities.slack.orm import (
-    BlockView,
     ContextBlock,
     ContextElement,
     DividerBlock,
     ExternalSelectElement,
+    FrozenBlockView,
     HeaderBlock,
     InputBlock,
     SectionBlock,
@@ -37,7 +36,7 @@ def build_emergency_search_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
     """Build the emergency info search modal with local and external user selectors."""
-    form = copy.deepcopy(EMERGENCY_SEARCH_FORM)
+    form = EMERGENCY_SEARCH_FORM.copy()
 
     if safe_get(body, actions.LOADING_ID):
         form.update_modal(
@@ -251,7 +250,7 @@ def _show_error_modal(client: WebClient, body: dict, message: str):
     )
 
 
-EMERGENCY_SEARCH_FORM = BlockView(
+EMERGENCY_SEARCH_FORM = FrozenBlockView(
     blocks=[
         HeaderBlock(label="Search for Emergency Info"),
         ContextBlock(
@@ -1,8 +1,7 @@
 import copy
 from logging import Logger
-from typing import List
 
-from f3_data_models.models import EventInstance, EventType_x_EventInstance, Org, Org_Type
+from f3_data_models.models import EventInstance, EventType_x_EventInstance, Org
 from f3_data_models.utils import DbManager, get_session
 from slack_sdk.models.blocks import (
     DividerBlock,
@@ -15,15 +14,17 @@ from slack_sdk.web import WebClient
 from sqlalchemy import func
 
 from utilities.database.orm import SlackSettings
-from utilities.helper_functions import safe_convert, safe_get
+from utilities.helper_functions import get_region_reference_data, safe_convert, safe_get
+from utilities.slack.actions import (
+    PAXMINER_MAPPING_ID,
+    PAXMINER_ORIGINATING_CHANNEL,
+    PAXMINER_REGION,
+)
 from utilities.slack.sdk_orm import SdkBlockView
 
 # Action IDs
-PAXMINER_ORIGINATING_CHANNEL = "paxminer-originating-channel"
 PAXMINER_EVENT_TYPE = "paxminer-event-type"
 PAXMINER_AO = "paxminer-assign-ao"
-PAXMINER_MAPPING_ID = "paxminer-mapping-id"
-PAXMINER_REGION = "paxminer-assign-region"
 PAXMINER_CURRENT_MAPPING = "paxminer-current-mapping"
 
 
@@ -95,19 +96,13 @@ def build_paxminer_mapping_form(
             safe_get(body, "view", "state", "values", PAXMINER_REGION, PAXMINER_REGION, "selected_option", "value"), int
         )
 
-        org_record = DbManager.get(Org, (initial_org or region_record.org_id), joinedloads=[Org.event_types])
-        event_type_options = [Option(label=et.name, value=str(et.id)) for et in org_record.event_types]
+        org_record = DbManager.get(Org, (initial_org or region_record.org_id))
+        reference_data = get_region_reference_data(org_record.id)
+        event_type_options = [Option(label=et.name, value=str(et.id)) for et in reference_data.event_types]
         intial_event_type = next(et for et in event_type_options if et.label == "Bootcamp")
         initial_region = {"text": org_record.name, "value": str(org_record.id)}
         current_mapping_text = get_paxminer_mapping_text(initial_channel)
-        ao_records: List[Org] = DbManager.find_records(
-            Org,
-            [
-                Org.parent_id == (initial_org or region_record.org_id),
-                Org.org_type == Org_Type.ao,
-                Org.is_active.is_(True),
-            ],
-        )
+        ao_records = reference_data.aos
         form = copy.deepcopy(PAXMINER_MAPPING_FORM)
         form.set_options(
             {
@@ -1,4 +1,3 @@
-import copy
 import json
 from logging import Logger
 from typing import List
@@ -12,7 +11,7 @@ from application.position.service import PositionService
 from infrastructure.api_client.ao_repository import get_api_ao_repository
 from infrastructure.api_client.position_repository import get_api_position_repository
 from utilities.database.orm import SlackSettings
-from utilities.helper_functions import SLACK_USERS, get_user, safe_convert, safe_get
+from utilities.helper_functions import get_slack_users_for_user_ids, get_users_bulk, safe_convert, safe_get
 from utilities.slack import actions, forms, orm
 
 # ---------------------------------------------------------------------------
@@ -133,12 +132,8 @@ class PositionViews:
 # ---------------------------------------------------------------------------
 
 
-def _user_id_to_slack_id_map(team_id: str) -> dict:
-    if not SLACK_USERS:
-        from utilities.helper_functions import update_local_slack_users
-
-        update_local_slack_users()
-    return {su.user_id: su.slack_id for su in SLACK_USERS.values() if su.slack_team_id == team_id}
+def _user_id_to_slack_id_map(team_id: str, user_ids: List[int]) -> dict:
+    return {su.user_id: su.slack_id for su in get_slack_users_for_user_ids(team_id, user_ids)}
 
 
 # ---------------------------------------------------------------------------
@@ -171,7 +166,8 @@ def build_config_slt_form(
 
     aos = ao_service.get_region_aos(region_record.org_id)
 
-    user_id_to_slack_id = _user_id_to_slack_id_map(region_record.team_id)
+    assigned_user_ids = [u.user_id for p in position_assignments for u in p.users]
+    user_id_to_slack_id = _user_id_to_slack_id_map(region_record.team_id, assigned_user_ids)
 
     form = PositionViews.build_slt_modal(
         position_assignments=position_assignments,
@@ -199,7 +195,7 @@ def build_config_slt_form(
 
 
 def build_new_position_form(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
-    form = copy.deepcopy(forms.CONFIG_NEW_POSITION_FORM)
+    form = forms.CONFIG_NEW_POSITION_FORM.copy()
     selected_org_id = safe_convert(
         safe_get(
             body,
@@ -255,18 +251,26 @@ def handle_new_position_post(
 def handle_config_slt_post(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
     form_data = body["view"]["state"]["values"]
     org_assignments: dict = {}
+    selections: list = []
 
     for key, value in form_data.items():
         if key.startswith(actions.SLT_SELECT):
             position_id, org_id = map(int, key.replace(actions.SLT_SELECT, "").split("_"))
             org_id = org_id if org_id != 0 else region_record.org_id
-            slack_user_ids = value[key].get("selected_users", [])
-            users = [get_user(u, region_record, client, logger) for u in slack_user_ids]
-            user_ids = [u.user_id for u in users if u]
+            selections.append((org_id, position_id, value[key].get("selected_users", [])))
+
+    # Resolve every selected user across all positions in one lookup
+    all_slack_ids = list(dict.fromkeys(u for _, _, slack_user_ids in selections for u in slack_user_ids))
+    users = get_users_bulk(all_slack_ids, region_record, client, logger)
+    users_by_slack_id = dict(zip(all_slack_ids, users, strict=True))
+
+    for org_id, position_id, slack_user_ids in selections:
+        users = [users_by_slack_id.get(u) for u in slack_user_ids]
+        user_ids = [u.user_id for u in users if u]
 
-            if org_id not in org_assignments:
-                org_assignments[org_id] = {}
-            org_assignments[org_id][position_id] = user_ids
+        if org_id not in org_assignments:
+            org_assignments[org_id] = {}
+        org_assignments[org_id][position_id] = user_ids
 
     service = _build_position_service()
     for org_id, position_map in org_assignments.items():
@@ -333,7 +337,7 @@ def build_edit_position_form(
     region_record: SlackSettings,
     position: PositionData,
 ):
-    form = copy.deepcopy(forms.CONFIG_NEW_POSITION_FORM)
+    form = forms.CONFIG_NEW_POSITION_FORM.copy()
 
     form.set_initial_values(
         {
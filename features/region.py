@@ -1,4 +1,3 @@
-import copy
 import re
 from logging import Logger
 
@@ -10,7 +9,7 @@ from slack_sdk.web import WebClient
 from features import connect
 from utilities.database.orm import SlackSettings
 from utilities.database.special_queries import get_admin_users
-from utilities.helper_functions import get_user, safe_get, upload_files_to_storage
+from utilities.helper_functions import get_users_bulk, safe_get, upload_files_to_storage
 from utilities.slack import actions, orm
 
 
@@ -21,7 +20,7 @@ def build_region_form(
     context: dict,
     region_record: SlackSettings,
 ):
-    form = copy.deepcopy(REGION_FORM)
+    form = REGION_FORM.copy()
     org_record: Org = DbManager.get(Org, region_record.org_id)
     org_meta = org_record.meta if org_record else {}
 
@@ -127,7 +126,7 @@ def handle_region_edit(body: dict, client: WebClient, logger: Logger, context: d
     DbManager.update_record(Org, region_record.org_id, fields)
 
     admin_users_slack = safe_get(form_data, actions.REGION_ADMINS)
-    admin_users: list[SlackUser] = [get_user(user_id, region_record, client, logger) for user_id in admin_users_slack]
+    admin_users: list[SlackUser] = get_users_bulk(admin_users_slack or [], region_record, client, logger)
     admin_user_ids = [u.user_id for u in admin_users]
     admin_role_id = DbManager.find_first_record(Role, filters=[Role.name == "admin"]).id
     admin_records = [
@@ -154,7 +153,7 @@ def handle_region_edit(body: dict, client: WebClient, logger: Logger, context: d
     DbManager.create_or_ignore(Role_x_User_x_Org, admin_records)
 
 
-REGION_FORM = orm.BlockView(
+REGION_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Region Title",
@@ -7,19 +7,20 @@ from slack_sdk.models import blocks
 from slack_sdk.web import WebClient
 
 from utilities.database.orm import SlackSettings
-from utilities.helper_functions import safe_get
+from utilities.helper_functions import invalidate_region_record, safe_get
+from utilities.slack.actions import (
+    REPORTING_CALLBACK_ID,
+)
 from utilities.slack.sdk_orm import SdkBlockView, as_selector_options
 
 MONTHLY_REPORTS_ENABLED = "monthly_reports_enabled"
 REGION_REPORTING_CHANNEL = "region_reporting_channel"
-REPORTING_CALLBACK_ID = "reporting_settings"
 MONTHLY_REPORT_OPTIONS = {
     "monthly_summary": "Region Monthly Summary",
     # "region_leaderboard": "Region Leaderboard",
     "ao_monthly_summary": "AO Monthly Summary",
     # "ao_leaderboard": "AO Leaderboard",
 }
-RUN_MONTHLY_REPORTS_NOW = "run_monthly_reports_now"
 
 
 def build_reporting_form(
@@ -72,6 +73,7 @@ def handle_reporting_edit(body: dict, client: WebClient, logger: Logger, context
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
+    invalidate_region_record(region_record.team_id)
 
 
 FORM = SdkBlockView(
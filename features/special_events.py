@@ -1,4 +1,3 @@
-import copy
 from logging import Logger
 
 from f3_data_models.models import SlackSpace
@@ -6,7 +5,7 @@ from f3_data_models.utils import DbManager
 from slack_sdk.web import WebClient
 
 from utilities.database.orm import SlackSettings
-from utilities.helper_functions import safe_convert, safe_get, update_local_region_records
+from utilities.helper_functions import invalidate_region_record, safe_convert, safe_get
 from utilities.slack import actions, orm
 
 
@@ -17,7 +16,7 @@ def build_special_settings_form(
     context: dict,
     region_record: SlackSettings,
 ):
-    form = copy.deepcopy(SPECIAL_EVENTS_FORM)
+    form = SPECIAL_EVENTS_FORM.copy()
     form.set_initial_values(
         {
             actions.SPECIAL_EVENTS_ENABLED: "enable" if region_record.special_events_enabled else None,
@@ -56,10 +55,10 @@ def handle_special_settings_edit(
         fields={SlackSpace.settings: region_record.__dict__},
     )
 
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
 
 
-SPECIAL_EVENTS_FORM = orm.BlockView(
+SPECIAL_EVENTS_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Enable Region Info Canvas",
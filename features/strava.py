@@ -1,4 +1,3 @@
-import copy
 import json
 import os
 from datetime import datetime
@@ -169,7 +168,7 @@ def build_strava_modify_form(
         activity_description = activity_description.split("COT:")[0]
     activity_description += "\n\nLearn more about F3 at https://f3nation.com"
 
-    modify_form = copy.deepcopy(forms.STRAVA_ACTIVITY_MODIFY_FORM)
+    modify_form = forms.STRAVA_ACTIVITY_MODIFY_FORM.copy()
     modify_form.set_initial_values(
         {
             actions.STRAVA_ACTIVITY_TITLE: backblast_title,
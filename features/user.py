@@ -9,9 +9,14 @@ from slack_sdk import WebClient
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import get_user, safe_convert, safe_get, upload_files_to_storage
 from utilities.slack import actions
+from utilities.slack.actions import (
+    IGNORE_EVENT,
+    USER_FORM_BROUGHT_BY,
+    USER_FORM_HOME_REGION,
+    USER_FORM_ID,
+)
 from utilities.slack.orm import (
     ActionsBlock,
-    BlockView,
     ButtonElement,
     CheckboxInputElement,
     ContextBlock,
@@ -20,6 +25,7 @@ from utilities.slack.orm import (
     DividerBlock,
     ExternalSelectElement,
     FileInputElement,
+    FrozenBlockView,
     HeaderBlock,
     ImageBlock,
     InputBlock,
@@ -28,18 +34,14 @@ from utilities.slack.orm import (
 )
 
 USER_FORM_USERNAME = "user_name"
-USER_FORM_HOME_REGION = "user_home_region"
 USER_FORM_IMAGE = "user_image"
 USER_FORM_IMAGE_UPLOAD = "user_image_upload"
-USER_FORM_ID = "user_form_id"
 USER_FORM_EMERGENCY_CONTACT = "user_emergency_contact"
 USER_FORM_EMERGENCY_CONTACT_PHONE = "user_emergency_contact_phone"
 USER_FORM_EMERGENCY_CONTACT_NOTES = "user_emergency_contact_notes"
-IGNORE_EVENT = "user_ignore_event"
 USER_FORM_START_DATE = "user_start_date"
 USER_META_START_DATE = "start_date_override"
 USER_EMERGENCY_INFO_SHARING = "user_emergency_info_dr_sharing"
-USER_FORM_BROUGHT_BY = "user_brought_by"
 USER_META_BROUGHT_BY = "brought_by"
 USER_FORM_F3_NAME_ORIGIN = "user_f3_name_origin"
 USER_META_F3_NAME_ORIGIN = "f3_name_origin"
@@ -48,7 +50,7 @@ USER_META_F3_WHY = "my_f3_why"
 
 
 def build_user_form(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
-    form = copy.deepcopy(FORM)
+    form = FORM.copy()
 
     slack_user: SlackUser = get_user(
         safe_get(body, "user", "id") or safe_get(body, "user_id"), region_record, client, logger
@@ -92,7 +94,9 @@ def build_user_form(body: dict, client: WebClient, logger: Logger, context: dict
     else:
         action_block_index = next(i for i, block in enumerate(form.blocks) if isinstance(block, ActionsBlock))
         stats_url = f"{os.getenv('STATS_URL')}/stats/pax/{user.id}"
-        form.blocks[action_block_index].elements[0].url = stats_url
+        action_block = copy.deepcopy(form.blocks[action_block_index])
+        action_block.elements[0].url = stats_url
+        form.blocks[action_block_index] = action_block
 
     try:
         if safe_get(body, actions.LOADING_ID):
@@ -169,7 +173,7 @@ def handle_user_form(body: dict, client: WebClient, logger: Logger, context: dic
             DbManager.update_record(User, slack_user.user_id, update_fields)
 
 
-FORM = BlockView(
+FORM = FrozenBlockView(
     blocks=[
         InputBlock(
             label="Username",
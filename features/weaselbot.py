@@ -6,7 +6,6 @@ This module now only handles Kotter Reports configuration and legacy achievement
 For new achievement functionality, use the achievements module.
 """
 
-import copy
 from logging import Logger
 
 from f3_data_models.models import (
@@ -20,9 +19,9 @@ from sqlalchemy.exc import ProgrammingError
 
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
+    invalidate_region_record,
     safe_convert,
     safe_get,
-    update_local_region_records,
 )
 from utilities.slack import actions, forms
 
@@ -56,7 +55,7 @@ def handle_achievements_tag(body: dict, client: WebClient, logger: Logger, conte
 def build_config_form(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
     # paxminer_schema = region_record.paxminer_schema
     # update_view_id = safe_get(body, actions.LOADING_ID)
-    config_form = copy.deepcopy(forms.WEASELBOT_CONFIG_FORM)
+    config_form = forms.WEASELBOT_CONFIG_FORM.copy()
     callback_id = actions.WEASELBOT_CONFIG_CALLBACK_ID
     trigger_id = safe_get(body, "trigger_id")
 
@@ -69,7 +68,7 @@ def build_config_form(body: dict, client: WebClient, logger: Logger, context: di
         weaselbot_achievements = None
 
     if not weaselbot_achievements:
-        config_form = copy.deepcopy(forms.NO_WEASELBOT_CONFIG_FORM)
+        config_form = forms.NO_WEASELBOT_CONFIG_FORM.copy()
         config_form.post_modal(
             client=client,
             trigger_id=trigger_id,
@@ -129,4 +128,4 @@ def handle_config_form(body: dict, client: WebClient, logger: Logger, context: d
         filters=[SlackSpace.team_id == region_record.team_id],
         fields={SlackSpace.settings: region_record.__dict__},
     )
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
@@ -1,4 +1,3 @@
-import copy
 import random
 from logging import Logger
 
@@ -9,8 +8,8 @@ from slack_sdk.web import WebClient
 from utilities import constants
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import (
+    invalidate_region_record,
     safe_get,
-    update_local_region_records,
 )
 from utilities.slack import actions, forms
 
@@ -18,7 +17,7 @@ from utilities.slack import actions, forms
 def build_welcome_config_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
-    welcome_message_config_form = copy.deepcopy(forms.WELCOME_MESSAGE_CONFIG_FORM)
+    welcome_message_config_form = forms.WELCOME_MESSAGE_CONFIG_FORM.copy()
 
     welcome_message_config_form.set_initial_values(
         {
@@ -43,7 +42,7 @@ def build_welcome_message_form(
     body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings
 ):
     update_view_id = safe_get(body, actions.LOADING_ID)
-    welcome_message_config_form = copy.deepcopy(forms.WELCOME_MESSAGE_CONFIG_FORM)
+    welcome_message_config_form = forms.WELCOME_MESSAGE_CONFIG_FORM.copy()
 
     welcome_message_config_form.set_initial_values(
         {
@@ -81,7 +80,7 @@ def handle_welcome_message_config_post(
         fields={SlackSpace.settings: region_record.__dict__},
     )
 
-    update_local_region_records()
+    invalidate_region_record(region_record.team_id)
 
 
 def handle_team_join(body: dict, client: WebClient, logger: Logger, context: dict, region_record: SlackSettings):
@@ -6,7 +6,12 @@ from infrastructure.api_client.event_instance_repository import (
 )
 from infrastructure.api_client.event_tag_repository import ApiEventTagRepository, get_api_event_tag_repository
 from infrastructure.api_client.event_type_repository import ApiEventTypeRepository, get_api_event_type_repository
-from infrastructure.api_client.exceptions import F3ApiAuthError, F3ApiError, F3ApiNotFoundError
+from infrastructure.api_client.exceptions import (
+    F3ApiAuthError,
+    F3ApiCircuitOpenError,
+    F3ApiError,
+    F3ApiNotFoundError,
+)
 from infrastructure.api_client.location_repository import ApiLocationRepository, get_api_location_repository
 from infrastructure.api_client.position_repository import ApiPositionRepository, get_api_position_repository
 from infrastructure.api_client.series_repository import ApiSeriesRepository, get_api_series_repository
@@ -31,4 +36,5 @@ __all__ = [
     "F3ApiError",
     "F3ApiNotFoundError",
     "F3ApiAuthError",
+    "F3ApiCircuitOpenError",
 ]
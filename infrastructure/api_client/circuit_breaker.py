@@ -0,0 +1,127 @@
+"""
+Per-host circuit breaker for the F3 Nation REST API client.
+
+After ``failure_threshold`` consecutive failures (network errors, 5xx or
+429 responses) the breaker opens and requests to that host fail fast with
+``F3ApiCircuitOpenError`` instead of waiting out timeouts.  After
+``reset_seconds`` one trial request is let through (half-open); its outcome
+closes or re-opens the breaker.  State changes are logged.
+
+Optional environment variables:
+    F3_API_BREAKER_FAILURES  –  Consecutive failures that open the breaker
+                                (defaults to 5).
+    F3_API_BREAKER_RESET_SECONDS  –  Seconds an open breaker waits before a
+                                     trial request (defaults to 30).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+from infrastructure.api_client.exceptions import F3ApiCircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _env_number(name: str, default: float, cast=float) -> float:
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures for one host and fails fast while open."""
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_seconds: float = 30.0) -> None:
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_request(self) -> bool:
+        """Raise ``F3ApiCircuitOpenError`` unless a request may be sent now.
+
+        Returns True when the request is the half-open trial; the caller must then
+        ``release_trial`` once it is done, whatever the outcome.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return False
+            if self._state == OPEN:
+                remaining = self._opened_at + self.reset_seconds - time.monotonic()
+                if remaining > 0:
+                    raise F3ApiCircuitOpenError(self.host, remaining)
+                self._transition(HALF_OPEN)
+            if self._trial_in_flight:
+                raise F3ApiCircuitOpenError(self.host, 0)
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self) -> None:
+        """Let another trial through if the current one ended without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        log = logger.warning if state == OPEN else logger.info
+        log(
+            "F3 API circuit breaker for %s: %s -> %s (%d consecutive failures)",
+            self.host,
+            self._state,
+            state,
+            self._failures,
+        )
+        self._state = state
+
+
+# ---------------------------------------------------------------------------
+# Module-level registry
+# ---------------------------------------------------------------------------
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Return the shared ``CircuitBreaker`` for *host*, creating it on first call."""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=int(_env_number("F3_API_BREAKER_FAILURES", 5, int)),
+                reset_seconds=_env_number("F3_API_BREAKER_RESET_SECONDS", 30.0),
+            )
+            _breakers[host] = breaker
+        return breaker
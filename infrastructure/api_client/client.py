@@ -13,42 +13,261 @@ Optional:
     F3_API_BASE_URL  –  Override the base URL (defaults to
                         https://api.f3nation.com).  Useful for local
                         testing against a dev API instance.
+    F3_API_TIMEOUT_SECONDS  –  Read timeout per attempt (defaults to 8).
+    F3_API_CONNECT_TIMEOUT_SECONDS  –  Connect timeout per attempt (defaults
+                                       to 3.05).
+    F3_API_MAX_RETRIES  –  Extra attempts for GET/PUT/DELETE after a network
+                           error or a 429/502/503/504 (defaults to 2).  POST
+                           is never retried.
+    F3_API_BACKOFF_SECONDS / F3_API_BACKOFF_MAX_SECONDS  –  Base and cap of the
+                           full-jitter exponential backoff between attempts
+                           (default 0.2 / 2).
+    F3_API_MAX_CONCURRENCY  –  Max requests ``gather`` runs at once
+                               (defaults to 8).
+    F3_API_POOL_MAXSIZE  –  Pooled connections kept per host (defaults to 16,
+                            never fewer than ``F3_API_MAX_CONCURRENCY``).
+    F3_API_CACHE_ENABLED  –  ``true`` turns on the GET response cache
+                             (``ResponseCache``).  Off by default.
+    F3_API_CACHE_MAX_ENTRIES  –  Max cached responses (defaults to 1000).
+    F3_API_CACHE_TTL_SECONDS  –  TTL for endpoints without their own entry in
+                                 ``ENDPOINT_TTL_SECONDS`` (defaults to 30).
 """
 
 from __future__ import annotations
 
+import contextvars
+import copy
+import json
+import logging
 import os
-from typing import Any
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from infrastructure.api_client.circuit_breaker import get_circuit_breaker
 from infrastructure.api_client.exceptions import F3ApiAuthError, F3ApiError, F3ApiNotFoundError
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_BASE_URL = "https://api.f3nation.com"
 _CLIENT_IDENTIFIER = "f3-nation-slack-bot"
 _DEFAULT_TIMEOUT_SECONDS = 8.0
+_DEFAULT_CONNECT_TIMEOUT_SECONDS = 3.05  # just over a TCP retransmission window
+_DEFAULT_MAX_RETRIES = 2
+_DEFAULT_BACKOFF_SECONDS = 0.2
+_DEFAULT_BACKOFF_MAX_SECONDS = 2.0
+_DEFAULT_MAX_CONCURRENCY = 8
+_DEFAULT_POOL_MAXSIZE = 16
+_IDEMPOTENT_METHODS = frozenset({"get", "put", "delete"})
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_WORKER_THREAD_PREFIX = "f3-api"
+
+# Called with (seconds, cached) per request; see ``set_request_observer``
+_request_observer: Callable[[float, bool], None] | None = None
+
+
+def set_request_observer(observer: Callable[[float, bool], None] | None) -> None:
+    """Register a callback for every API request (``None`` removes it).
+
+    Requests sent over the network, including conditional revalidations, report their wall time with retries and
+    ``cached=False``. GETs answered from a fresh response cache entry never reach ``_send`` and report the lookup
+    time with ``cached=True``.
+    """
+    global _request_observer
+    _request_observer = observer
+
+
+# Reference data changes rarely; AOs change most often (renames, new AOs) so they expire soonest
+ENDPOINT_TTL_SECONDS: dict[str, float] = {
+    "/v1/org": 60,
+    "/v1/location": 300,
+    "/v1/event-type": 600,
+    "/v1/event-tag": 600,
+}
+
+
+def _resource_family(path: str) -> str:
+    """``/v1/org/id/12`` -> ``/v1/org``; writes invalidate every cached read in the same family."""
+    return "/".join(path.split("?", 1)[0].split("/")[:3])
+
+
+@dataclass
+class _CachedResponse:
+    payload: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """
+    Bounded LRU of GET responses keyed by method, path and params.
+
+    Entries live for the TTL of their resource family (``ENDPOINT_TTL_SECONDS``,
+    else ``default_ttl_seconds``). Once expired, an entry that came with an
+    ``ETag`` or ``Last-Modified`` header is revalidated with a conditional
+    request instead of being dropped, so an unchanged resource costs a 304
+    rather than a full body. Any POST/PUT/DELETE through the client drops the
+    whole resource family.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        default_ttl_seconds: float = 30,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.ttls = dict(ENDPOINT_TTL_SECONDS if ttls is None else ttls)
+        self._entries: OrderedDict[tuple[str, str, str], _CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(method: str, path: str, params: dict[str, Any] | None) -> tuple[str, str, str]:
+        return (method.lower(), path, json.dumps(params or {}, sort_keys=True, default=str))
+
+    def ttl_for(self, path: str) -> float:
+        return self.ttls.get(_resource_family(path), self.default_ttl_seconds)
+
+    def lookup(self, key: tuple[str, str, str]) -> tuple[Any, dict[str, str]]:
+        """Return ``(payload, {})`` for a fresh entry, or ``(None, conditional_headers)`` for a miss.
+
+        The conditional headers are empty unless a stale entry can be revalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, {}
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry.payload), {}
+            self.misses += 1
+            headers = {}
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            if not headers:
+                del self._entries[key]
+            return None, headers
+
+    def revalidated(self, key: tuple[str, str, str]) -> Any:
+        """Handle a 304: extend the stale entry's lifetime and return its payload."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl_for(key[1])
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return copy.deepcopy(entry.payload)
+
+    def store(self, key: tuple[str, str, str], payload: Any, headers: Any) -> None:
+        entry = _CachedResponse(
+            payload=copy.deepcopy(payload),
+            expires_at=time.monotonic() + self.ttl_for(key[1]),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_family(self, path: str) -> None:
+        family = _resource_family(path)
+        with self._lock:
+            stale = [key for key in self._entries if _resource_family(key[1]) == family]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+        }
+
+
+def _env_number(name: str, default: float, cast=float) -> float:
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _response_cache_from_env() -> ResponseCache | None:
+    if os.environ.get("F3_API_CACHE_ENABLED", "false").lower() != "true":
+        return None
+    try:
+        return ResponseCache(
+            max_entries=int(os.environ.get("F3_API_CACHE_MAX_ENTRIES", "1000")),
+            default_ttl_seconds=float(os.environ.get("F3_API_CACHE_TTL_SECONDS", "30")),
+        )
+    except (TypeError, ValueError):
+        return ResponseCache()
 
 
 class F3ApiClient:
     """Thin wrapper around ``requests.Session`` that handles auth headers and
-    maps HTTP error codes to typed exceptions."""
+    maps HTTP error codes to typed exceptions.
+
+    Pass a ``ResponseCache`` (or set ``F3_API_CACHE_ENABLED=true``) to serve
+    repeated GETs from memory."""
 
-    def __init__(self) -> None:
+    def __init__(self, response_cache: ResponseCache | None = None) -> None:
         api_key = os.environ.get("F3_API_KEY")
         if not api_key:
             raise ValueError("F3_API_KEY is required for F3ApiClient")
 
         base_url = os.environ.get("F3_API_BASE_URL", _DEFAULT_BASE_URL).rstrip("/")
-        timeout_raw = os.environ.get("F3_API_TIMEOUT_SECONDS", str(_DEFAULT_TIMEOUT_SECONDS))
 
         self._base_url = base_url
-        self._timeout_seconds = _DEFAULT_TIMEOUT_SECONDS
-        try:
-            self._timeout_seconds = float(timeout_raw)
-        except (TypeError, ValueError):
-            self._timeout_seconds = _DEFAULT_TIMEOUT_SECONDS
+        self._timeout_seconds = _env_number("F3_API_TIMEOUT_SECONDS", _DEFAULT_TIMEOUT_SECONDS)
+        self._connect_timeout_seconds = _env_number("F3_API_CONNECT_TIMEOUT_SECONDS", _DEFAULT_CONNECT_TIMEOUT_SECONDS)
+        self._max_retries = max(0, _env_number("F3_API_MAX_RETRIES", _DEFAULT_MAX_RETRIES, int))
+        self._backoff_seconds = _env_number("F3_API_BACKOFF_SECONDS", _DEFAULT_BACKOFF_SECONDS)
+        self._backoff_max_seconds = _env_number("F3_API_BACKOFF_MAX_SECONDS", _DEFAULT_BACKOFF_MAX_SECONDS)
+        self._breaker = get_circuit_breaker(urlparse(base_url).netloc or base_url)
+
+        self._max_concurrency = max(1, _env_number("F3_API_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY, int))
+        pool_maxsize = max(self._max_concurrency, _env_number("F3_API_POOL_MAXSIZE", _DEFAULT_POOL_MAXSIZE, int))
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._response_cache = response_cache if response_cache is not None else _response_cache_from_env()
 
         self._session = requests.Session()
+        # One host, so a couple of pools is plenty; each keeps enough connections that concurrent requests
+        # (gather, threaded handlers) reuse them instead of reconnecting. Retries are handled in _send.
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._session.headers.update(
             {
                 "Authorization": f"Bearer {api_key}",
@@ -61,8 +280,15 @@ class F3ApiClient:
     # Public verb methods
     # ------------------------------------------------------------------
 
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """The GET response cache, or *None* when caching is off. ``response_cache.stats()`` has the counters."""
+        return self._response_cache
+
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        return self._request("get", path, params=params)
+        if self._response_cache is None:
+            return self._request("get", path, params=params)
+        return self._cached_get(path, params)
 
     def post(self, path: str, json: dict[str, Any] | None = None) -> Any:
         return self._request("post", path, json=json)
@@ -73,18 +299,131 @@ class F3ApiClient:
     def delete(self, path: str, json: dict[str, Any] | None = None) -> Any:
         return self._request("delete", path, json=json)
 
+    def gather(self, *calls: Callable[[], Any]) -> list[Any]:
+        """Run independent zero-argument callables (usually repository reads) concurrently.
+
+        Results are returned in call order. Every call runs to completion; the
+        first exception (in call order) is then re-raised. Calls made from inside
+        a gathered call run inline, so nesting can't exhaust the worker pool.
+        """
+        if len(calls) <= 1 or threading.current_thread().name.startswith(_WORKER_THREAD_PREFIX):
+            return [call() for call in calls]
+
+        # Each call gets a copy of the caller's context so per-request state (e.g. route instrumentation) follows it
+        futures = [self._get_executor().submit(contextvars.copy_context().run, call) for call in calls]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix=_WORKER_THREAD_PREFIX
+                )
+            return self._executor
+
     def _request(self, method: str, path: str, **kwargs) -> Any:
+        try:
+            return self._handle_response(self._send(method, path, **kwargs))
+        finally:
+            # Even a failed write may have been applied, so don't keep serving the old reads
+            if method != "get" and self._response_cache is not None:
+                self._response_cache.invalidate_family(path)
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send one request, retrying idempotent verbs on transient failures and honouring the breaker."""
+        observer = _request_observer
+        if observer is None:
+            return self._send_with_retries(method, path, **kwargs)
+        start = time.perf_counter()
+        try:
+            return self._send_with_retries(method, path, **kwargs)
+        finally:
+            observer(time.perf_counter() - start, False)
+
+    def _send_with_retries(self, method: str, path: str, **kwargs) -> requests.Response:
         request_fn = getattr(self._session, method)
         url = f"{self._base_url}{path}"
+        attempts = 1 + (self._max_retries if method in _IDEMPOTENT_METHODS else 0)
+        for attempt in range(attempts):
+            trial = self._breaker.before_request()
+            retry_after = None
+            try:
+                response = request_fn(url, timeout=(self._connect_timeout_seconds, self._timeout_seconds), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                self._breaker.record_failure()
+                if attempt + 1 == attempts:
+                    raise F3ApiError(0, f"Network error calling F3 API {method.upper()} {path}: {exc}") from exc
+                reason = type(exc).__name__
+            except requests.RequestException as exc:
+                self._breaker.record_failure()
+                raise F3ApiError(0, f"Network error calling F3 API {method.upper()} {path}: {exc}") from exc
+            else:
+                if response.status_code < 500 and response.status_code != 429:
+                    self._breaker.record_success()
+                    return response
+                self._breaker.record_failure()
+                if response.status_code not in _RETRY_STATUSES or attempt + 1 == attempts:
+                    return response
+                reason = f"HTTP {response.status_code}"
+                retry_after = response.headers.get("Retry-After")
+            finally:
+                if trial:
+                    self._breaker.release_trial()  # even if something unexpected was raised
+
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.info(
+                "F3 API %s %s failed (%s); retry %d/%d in %.2fs [breaker %s]",
+                method.upper(),
+                path,
+                reason,
+                attempt + 1,
+                attempts - 1,
+                delay,
+                self._breaker.state,
+            )
+            time.sleep(delay)
+
+    def _backoff_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Full-jitter exponential backoff, raised to the server's Retry-After (seconds) when it sends one."""
+        delay = random.uniform(0, min(self._backoff_max_seconds, self._backoff_seconds * 2**attempt))
         try:
-            response = request_fn(url, timeout=self._timeout_seconds, **kwargs)
-        except requests.RequestException as exc:
-            raise F3ApiError(0, f"Network error calling F3 API {method.upper()} {path}: {exc}") from exc
-        return self._handle_response(response)
+            delay = max(delay, float(retry_after)) if retry_after is not None else delay
+        except (TypeError, ValueError):
+            pass
+        return min(delay, self._backoff_max_seconds)
+
+    def _cached_get(self, path: str, params: dict[str, Any] | None) -> Any:
+        cache = self._response_cache
+        start = time.perf_counter()
+        key = cache.key("get", path, params)
+        payload, conditional_headers = cache.lookup(key)
+        if payload is not None:
+            observer = _request_observer
+            if observer is not None:
+                observer(time.perf_counter() - start, True)
+            return payload
+
+        if conditional_headers:
+            response = self._send("get", path, params=params, headers=conditional_headers)
+            if response.status_code == 304:
+                payload = cache.revalidated(key)
+                if payload is not None:
+                    return payload
+                response = self._send("get", path, params=params)  # entry was evicted meanwhile
+        else:
+            response = self._send("get", path, params=params)
+
+        payload = self._handle_response(response)
+        cache.store(key, payload, response.headers)
+        return payload
 
     def _handle_response(self, response: requests.Response) -> Any:
         if response.status_code == 404:
@@ -4,7 +4,9 @@ API-backed implementation of ``EventInstanceRepository``.
 Maps responses from the F3 Nation REST API to ``EventInstanceData`` objects.
 
 Endpoints used:
-  GET    /v1/event-instance                 - list (filter by regionOrgId, aoOrgId, startDate)
+  GET    /v1/event-instance                 - list (filter by regionOrgId, aoOrgId, startDate, endDate;
+                                               paginated with pageIndex / pageSize, returns totalCount;
+                                               ordered by the JSON ``sorting`` list of {id, desc})
   GET    /v1/event-instance/id/{id}         - single
   POST   /v1/event-instance                 - create or update (crupdate)
   DELETE /v1/event-instance/id/{id}         - hard delete
@@ -16,13 +18,21 @@ updated seriesException value.
 
 from __future__ import annotations
 
+import json
+import logging
 from datetime import date
-from typing import Any
+from typing import Any, Iterator
 
-from application.event_instance import EventInstanceData
+from application.event_instance import EventInstanceData, EventInstancePage
 from infrastructure.api_client.client import F3ApiClient, get_f3_api_client
 from infrastructure.api_client.exceptions import F3ApiNotFoundError
 
+logger = logging.getLogger(__name__)
+
+_MAX_PAGE_SIZE = 200
+# Pages must be cut from one chronological order, or sorting each page locally still mixes up page boundaries
+_PAGE_SORTING = json.dumps([{"id": "startDate", "desc": False}, {"id": "startTime", "desc": False}])
+
 
 def _parse_instance(raw: dict) -> EventInstanceData:
     """Convert a raw API response dict to an ``EventInstanceData`` object."""
@@ -163,6 +173,18 @@ def _build_state_change_payload(
     return payload
 
 
+def _list_params(region_org_id: int, start_date: date, ao_org_id: int | None, end_date: date | None) -> dict:
+    params: dict = {
+        "regionOrgId": region_org_id,
+        "startDate": start_date.strftime("%Y-%m-%d"),
+    }
+    if ao_org_id is not None:
+        params["aoOrgId"] = ao_org_id
+    if end_date is not None:
+        params["endDate"] = end_date.strftime("%Y-%m-%d")
+    return params
+
+
 class ApiEventInstanceRepository:
     """Fetches and mutates event instances via the F3 Nation REST API."""
 
@@ -174,16 +196,76 @@ class ApiEventInstanceRepository:
         region_org_id: int,
         start_date: date,
         ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int | None = None,
     ) -> list[EventInstanceData]:
-        params: dict = {
-            "regionOrgId": region_org_id,
-            "startDate": start_date.strftime("%Y-%m-%d"),
-        }
-        if ao_org_id is not None:
-            params["aoOrgId"] = ao_org_id
+        if limit is None:
+            # Unbounded: one request, returning whatever the API sends back
+            result = self._client.get(
+                "/v1/event-instance", params=_list_params(region_org_id, start_date, ao_org_id, end_date)
+            )
+            raw_list: list[dict] = result.get("eventInstances") or result.get("results") or []
+            return [_parse_instance(i) for i in raw_list]
+
+        records: list[EventInstanceData] = []
+        for page in self.iter_pages(region_org_id, start_date, ao_org_id, end_date, limit=min(limit, _MAX_PAGE_SIZE)):
+            records.extend(page.items)
+            if len(records) >= limit:
+                return records[:limit]
+        return records
+
+    def get_page(
+        self,
+        region_org_id: int,
+        start_date: date,
+        ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int = 25,
+        cursor: str | None = None,
+    ) -> EventInstancePage:
+        # The API paginates by page index; the cursor is that index, so callers never do offset math
+        page_index = int(cursor) if cursor else 0
+        page_size = max(1, min(limit, _MAX_PAGE_SIZE))
+        params = _list_params(region_org_id, start_date, ao_org_id, end_date)
+        params.update({"pageIndex": page_index, "pageSize": page_size, "sorting": _PAGE_SORTING})
         result = self._client.get("/v1/event-instance", params=params)
         raw_list: list[dict] = result.get("eventInstances") or result.get("results") or []
-        return [_parse_instance(i) for i in raw_list]
+        total_count = result.get("totalCount")
+        items = [_parse_instance(i) for i in raw_list]
+        order = [(i.start_date or date.min, i.start_time or "") for i in items]
+        if order != sorted(order):
+            logger.warning(
+                "F3 API returned event instance page %d for region %s out of date order; page boundaries may skip "
+                "or repeat events",
+                page_index,
+                region_org_id,
+            )
+
+        if total_count is not None:
+            has_more = (page_index + 1) * page_size < total_count
+        else:
+            has_more = len(raw_list) >= page_size
+        return EventInstancePage(
+            items=items,
+            next_cursor=str(page_index + 1) if has_more else None,
+            total_count=total_count,
+        )
+
+    def iter_pages(
+        self,
+        region_org_id: int,
+        start_date: date,
+        ao_org_id: int | None = None,
+        end_date: date | None = None,
+        limit: int = 25,
+    ) -> Iterator[EventInstancePage]:
+        cursor = None
+        while True:
+            page = self.get_page(region_org_id, start_date, ao_org_id, end_date, limit=limit, cursor=cursor)
+            yield page
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
 
     def get_by_id(self, instance_id: int) -> EventInstanceData | None:
         try:
@@ -12,3 +12,12 @@ class F3ApiNotFoundError(F3ApiError):
 
 class F3ApiAuthError(F3ApiError):
     """Raised when the API returns 401 or 403."""
+
+
+class F3ApiCircuitOpenError(F3ApiError):
+    """Raised without contacting the API while its host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_in_seconds: float) -> None:
+        self.host = host
+        self.retry_in_seconds = retry_in_seconds
+        super().__init__(0, f"circuit open for {host}, not retrying for {retry_in_seconds:.1f}s")
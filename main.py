@@ -2,9 +2,7 @@ import json
 import logging
 import os
 import re
-import time
 import traceback
-from typing import Callable, Tuple
 
 import functions_framework
 from dotenv import load_dotenv
@@ -15,11 +13,17 @@ from slack_bolt.adapter.google_cloud_functions import SlackRequestHandler
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk.web import WebClient
 
-import scripts
-from features import strava
+from utilities import instrumentation
 from utilities.builders import add_debug_form, add_loading_form, send_error_response
 from utilities.constants import ENABLE_DEBUGGING, LOCAL_DEVELOPMENT, SOCKET_MODE
 from utilities.database.orm import SlackSettings
+from utilities.dispatch import (
+    LAZY_ROUTE_MAX_AGE_SECONDS,
+    RouteTimer,
+    lazy_dispatch_enabled,
+    publish_lazy_route,
+    read_lazy_route,
+)
 from utilities.helper_functions import (
     get_oauth_settings,
     get_region_record,
@@ -27,7 +31,7 @@ from utilities.helper_functions import (
     safe_get,
     update_local_region_records,
 )
-from utilities.routing import MAIN_MAPPER
+from utilities.routing import MAIN_MAPPER, Route
 from utilities.slack.actions import LOADING_ID
 
 
@@ -65,6 +69,7 @@ app = App(
     process_before_response=process_before_response,
     oauth_settings=get_oauth_settings(),
 )
+instrumentation.install()
 
 # ----------------------------------------
 # Production Mode: Google Cloud Function HTTP Handler
@@ -78,13 +83,19 @@ if not LOCAL_DEVELOPMENT:
             return Response("Service is running", status=200, headers={"Access-Control-Allow-Origin": "*"})
         elif request.path == "/gcp_event":
             logging.info("GCP Event")
+            import scripts
+
             return scripts.handle(request)
         elif request.path == "/exchange_token":
             logging.info("Strava token exchange request")
             logging.info(f"Request query parameters: {request.args}")
             logging.info(f"Request headers: {request.headers}")
             logging.info(f"Request body: {request.get_data(as_text=True)}")
+            from features import strava
+
             return strava.strava_exchange_token(request)
+        elif request.path == "/slack-lazy":
+            return run_lazy_route(request)
         elif request.path[:6] == "/slack":
             slack_handler = SlackRequestHandler(app=app)
             return slack_handler.handle(request)
@@ -97,54 +108,23 @@ if not LOCAL_DEVELOPMENT:
 
 def main_response(body: dict, logger: logging.Logger, client: WebClient, ack: Ack, context: dict):
     request_type, request_id = get_request_type(body)
+    timer = RouteTimer(request_type, request_id)
 
     if LOCAL_DEVELOPMENT:
         logger.info(json.dumps(body, indent=4))
     else:
         logger.info(body)
 
-    team_id = safe_get(body, "team_id") or safe_get(body, "team", "id")
-
-    lookup: Tuple[Callable, bool] = safe_get(safe_get(MAIN_MAPPER, request_type), request_id)
+    lookup: tuple = safe_get(safe_get(MAIN_MAPPER, request_type), request_id)
 
     if lookup:
-        run_function, add_loading = lookup
-        if ENABLE_DEBUGGING and request_type != "view_submission":
-            body[LOADING_ID] = add_debug_form(body=body, client=client)
-            # NOTE: do not put debugging breakpoints above this line
-        elif add_loading:
-            body[LOADING_ID] = add_loading_form(body=body, client=client)
-
-        if request_type != "block_suggestion":
-            ack()
-
-        try:
-            try:
-                region_record: SlackSettings = get_region_record(team_id, body, context, client, logger)
-            except Exception as exc:
-                logger.warning(f"Error getting region record: {exc}")
-                region_record = SlackSettings(team_id=safe_get(body, "team_id") or safe_get(body, "team", "id"))
-            # time the call
-            start_time = time.time()
-            resp = run_function(
-                body=body,
-                client=client,
-                logger=logger,
-                context=context,
-                region_record=region_record,
-            )
-            if request_type == "block_suggestion":
-                ack(options=resp if resp is not None else [])
-            # elif request_type == "view_submission":
-            #     update_submit_modal(
-            #         client=client, logger=logger, text="Your data was saved successfully!"
-            #     )  # TODO: handle errors
-            end_time = time.time()
-            logger.info(f"Function {run_function.__name__} took {end_time - start_time:.2f} seconds to run.")
-        except Exception as exc:
-            tb_str = "".join(traceback.format_exception(None, exc, exc.__traceback__))
-            send_error_response(body=body, client=client, error=str(exc)[:3000])
-            logger.error(tb_str)
+        client = instrumentation.InstrumentedWebClient.wrap(client)
+        route = Route(*lookup)
+        timer.lazy = route.lazy and request_type != "block_suggestion" and lazy_dispatch_enabled()
+        if timer.lazy:
+            queue_route(route, body, logger, client, ack, context, timer)
+        else:
+            run_route(route, body, logger, client, ack, context, timer)
     else:
         ack()
         logger.warning(
@@ -153,6 +133,112 @@ def main_response(body: dict, logger: logging.Logger, client: WebClient, ack: Ac
         )
 
 
+def queue_route(
+    route: Route, body: dict, logger: logging.Logger, client: WebClient, ack: Ack, context: dict, timer: RouteTimer
+):
+    """Acks a lazy route and publishes it for ``/slack-lazy``, running it inline if it cannot be published.
+
+    The loading modal is opened here, while the trigger_id is still valid; its view id travels in the body.
+    """
+    if route.add_loading:
+        body[LOADING_ID] = add_loading_form(body=body, client=client)
+    ack()
+    timer.ack()
+    try:
+        message_id = publish_lazy_route(timer.request_type, timer.request_id, body)
+    except Exception as exc:
+        logger.warning(f"Could not queue lazy route {timer.route}, running it inline: {exc}")
+        run_route(route, body, logger, client, ack, context, timer)
+    else:
+        timer.queued(logger, route.handler.__name__, message_id)
+
+
+def run_lazy_route(request: Request) -> Response:
+    """Runs a lazy route delivered by the ``LAZY_ROUTE_TOPIC`` push subscription.
+
+    Answers 200 once the handler has run, errors included (they reach the user through ``send_error_response``), so
+    Pub/Sub does not redeliver handlers that post to Slack or write to the database.
+    """
+    delivery = read_lazy_route(request)
+    if delivery is None:
+        return Response("Invalid lazy route delivery", status=403)
+
+    body = delivery.body
+    timer = RouteTimer(delivery.request_type, delivery.request_id, lazy=True)
+    timer.queued_ms = delivery.queued_ms
+    if delivery.queued_ms > LAZY_ROUTE_MAX_AGE_SECONDS * 1000:
+        logging.warning(f"Dropping lazy route {timer.route} queued {delivery.queued_ms:.0f} ms ({delivery.message_id})")
+        return Response("Lazy route expired", status=200)
+
+    lookup: tuple = safe_get(safe_get(MAIN_MAPPER, delivery.request_type), delivery.request_id)
+    if not lookup:
+        logging.warning(f"no handler for lazy route: {timer.route}")
+        return Response("No handler", status=200)
+
+    team_id = safe_get(body, "team_id") or safe_get(body, "team", "id")
+    bot = app.installation_store.find_bot(
+        enterprise_id=safe_get(body, "enterprise", "id") or safe_get(body, "enterprise_id"),
+        team_id=team_id,
+        is_enterprise_install=bool(safe_get(body, "is_enterprise_install")),
+    )
+    if not bot:
+        logging.error(f"No installation for team {team_id}, dropping lazy route {timer.route}")
+        return Response("No installation", status=200)
+
+    client = instrumentation.InstrumentedWebClient.wrap(WebClient(token=bot.bot_token))
+    context = {"bot_token": bot.bot_token, "team_id": team_id}
+    run_route(Route(*lookup), body, app.logger, client, lambda *args, **kwargs: None, context, timer)
+    return Response("OK", status=200)
+
+
+def run_route(
+    route: Route, body: dict, logger: logging.Logger, client: WebClient, ack: Ack, context: dict, timer: RouteTimer
+):
+    team_id = safe_get(body, "team_id") or safe_get(body, "team", "id")
+    request_type = timer.request_type
+
+    timer.begin()
+    try:
+        # Lazy routes were acked, after any loading modal, by queue_route
+        if not timer.lazy:
+            if ENABLE_DEBUGGING and request_type != "view_submission":
+                body[LOADING_ID] = add_debug_form(body=body, client=client)
+                # NOTE: do not put debugging breakpoints above this line
+            elif route.add_loading:
+                body[LOADING_ID] = add_loading_form(body=body, client=client)
+
+            if request_type != "block_suggestion":
+                ack()
+                timer.ack()
+
+        try:
+            region_record: SlackSettings = get_region_record(team_id, body, context, client, logger)
+        except Exception as exc:
+            logger.warning(f"Error getting region record: {exc}")
+            region_record = SlackSettings(team_id=team_id)
+        timer.start()
+        resp = route.handler(
+            body=body,
+            client=client,
+            logger=logger,
+            context=context,
+            region_record=region_record,
+        )
+        if request_type == "block_suggestion":
+            ack(options=resp if resp is not None else [])
+            timer.ack()
+        # elif request_type == "view_submission":
+        #     update_submit_modal(
+        #         client=client, logger=logger, text="Your data was saved successfully!"
+        #     )  # TODO: handle errors
+    except Exception as exc:
+        tb_str = "".join(traceback.format_exception(None, exc, exc.__traceback__))
+        send_error_response(body=body, client=client, error=str(exc)[:3000])
+        logger.error(tb_str)
+    finally:
+        timer.finish(logger, route.handler.__name__)
+
+
 ARGS = [main_response]
 LAZY_KWARGS = {}
 
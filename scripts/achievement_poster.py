@@ -0,0 +1,279 @@
+"""Rate-limit-aware Slack posting engine for achievement notifications.
+
+Messages are queued per workspace. Each workspace's queue is drained by one worker, so posts to a workspace are
+paced (``min_interval`` seconds apart, in line with Slack's ~1 message/second guidance for ``chat.postMessage``),
+while up to ``max_concurrency`` workspaces post at the same time. A 429 response is retried after the
+``Retry-After`` delay Slack sends back.
+
+Progress is journaled to a JSON-lines file: every job is recorded before posting starts and marked once Slack
+accepts it. If the process dies part way through, the next run resumes the unposted jobs and never re-sends the
+posted ones. A job Slack rejects stays queued and is retried on later runs, up to ``MAX_ATTEMPTS`` runs in all.
+
+The journal must outlive the container to be of any use, so it lives on the ``PROGRESS_DIR`` volume mount. Without
+that mount it falls back to the temp dir, where it only survives for the life of the container.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import WebClient
+
+MAX_CONCURRENCY = int(os.getenv("ACHIEVEMENT_POST_MAX_CONCURRENCY", "8"))
+MIN_INTERVAL_SECONDS = float(os.getenv("ACHIEVEMENT_POST_MIN_INTERVAL_SECONDS", "1.0"))
+MAX_RETRIES = int(os.getenv("ACHIEVEMENT_POST_MAX_RETRIES", "5"))
+MAX_ATTEMPTS = int(os.getenv("ACHIEVEMENT_POST_MAX_ATTEMPTS", "3"))
+PROGRESS_DIR = "/mnt/achievement-state"
+PROGRESS_PATH = os.getenv(
+    "ACHIEVEMENT_POST_PROGRESS_PATH",
+    os.path.join(
+        PROGRESS_DIR if os.path.isdir(PROGRESS_DIR) else tempfile.gettempdir(), "achievement_post_progress.jsonl"
+    ),
+)
+PROGRESS_RETENTION_DAYS = int(os.getenv("ACHIEVEMENT_POST_PROGRESS_RETENTION_DAYS", "14"))
+
+EVENT_QUEUED = "queued"
+EVENT_POSTED = "posted"
+EVENT_FAILED = "failed"
+
+
+@dataclass
+class PostJob:
+    """One ``chat.postMessage`` call. ``key`` must be stable across runs so the journal can dedupe it."""
+
+    key: str
+    team_id: str
+    channel: str
+    text: str
+    blocks: List[Dict] = field(default_factory=list)
+    description: str = ""
+
+
+@dataclass
+class PostingResult:
+    posted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    pending: List[str] = field(default_factory=list)
+
+
+class ProgressJournal:
+    """Append-only record of queued/posted/failed jobs, compacted after each run.
+
+    Posted keys are finished. A failed job stays in ``pending`` until it has failed ``max_attempts`` times, after
+    which it is finished as failed.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = PROGRESS_PATH,
+        retention_days: int = PROGRESS_RETENTION_DAYS,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        self.path = path
+        self.retention = timedelta(days=retention_days)
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self.pending: Dict[str, PostJob] = {}
+        self.failures: Dict[str, int] = {}  # key -> failed attempts so far, for jobs still pending
+        self.done: Dict[str, Tuple[str, str]] = {}  # key -> (EVENT_POSTED or EVENT_FAILED, ISO timestamp)
+        if path and os.path.dirname(os.path.abspath(path)) == tempfile.gettempdir():
+            print(f"Achievement post journal is at {path}; it will not survive a container restart")
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a torn final line from a crash
+                event = entry.get("event")
+                if event == EVENT_QUEUED:
+                    job = PostJob(**entry["job"])
+                    if job.key not in self.done:
+                        self.pending[job.key] = job
+                elif event == EVENT_POSTED:
+                    self._finish(EVENT_POSTED, entry["key"], entry.get("at", ""))
+                elif event == EVENT_FAILED:
+                    self._fail(entry["key"], entry.get("at", ""), entry.get("attempts"))
+
+    def _append(self, entries: Iterable[dict]) -> None:
+        if not self.path:
+            return
+        with self._lock, open(self.path, "a") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _finish(self, event: str, key: str, at: str) -> None:
+        self.pending.pop(key, None)
+        self.failures.pop(key, None)
+        self.done[key] = (event, at)
+
+    def _fail(self, key: str, at: str, attempts: Optional[int] = None) -> int:
+        attempts = attempts or self.failures.get(key, 0) + 1
+        self.failures[key] = attempts
+        if attempts >= self.max_attempts:
+            self._finish(EVENT_FAILED, key, at)
+        return attempts
+
+    def is_done(self, key: str) -> bool:
+        return key in self.done
+
+    def record_queued(self, jobs: Iterable[PostJob]) -> None:
+        new_jobs = [job for job in jobs if job.key not in self.done and job.key not in self.pending]
+        for job in new_jobs:
+            self.pending[job.key] = job
+        self._append({"event": EVENT_QUEUED, "job": asdict(job)} for job in new_jobs)
+
+    def record_posted(self, key: str) -> None:
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            self._finish(EVENT_POSTED, key, now)
+        self._append([{"event": EVENT_POSTED, "key": key, "at": now}])
+
+    def record_failed(self, key: str) -> None:
+        """Counts a failed attempt; the job is retried next run until it reaches ``max_attempts``."""
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            attempts = self._fail(key, now)
+        self._append([{"event": EVENT_FAILED, "key": key, "at": now, "attempts": attempts}])
+
+    def compact(self) -> None:
+        """Rewrites the journal with only unfinished jobs and recently finished keys."""
+        if not self.path:
+            return
+        cutoff = (datetime.now(UTC) - self.retention).isoformat()
+        with self._lock:
+            self.done = {key: (event, at) for key, (event, at) in self.done.items() if at >= cutoff}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                for job in self.pending.values():
+                    f.write(json.dumps({"event": EVENT_QUEUED, "job": asdict(job)}) + "\n")
+                    if job.key in self.failures:
+                        entry = {"event": EVENT_FAILED, "key": job.key, "attempts": self.failures[job.key]}
+                        f.write(json.dumps(entry) + "\n")
+                for key, (event, at) in self.done.items():
+                    entry = {"event": event, "key": key, "at": at}
+                    if event == EVENT_FAILED:
+                        entry["attempts"] = self.failures.get(key, self.max_attempts)
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.path)
+
+
+class AchievementPoster:
+    """Posts ``PostJob`` objects with per-workspace queues and a global concurrency ceiling."""
+
+    def __init__(
+        self,
+        journal: Optional[ProgressJournal] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        min_interval: float = MIN_INTERVAL_SECONDS,
+        max_retries: int = MAX_RETRIES,
+        client_factory: Optional[Callable[[str], WebClient]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.journal = journal or ProgressJournal(path=None)
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.client_factory = client_factory or (lambda token: WebClient(token))
+        self.sleep = sleep
+        self._lock = threading.Lock()
+
+    def pending_team_ids(self) -> List[str]:
+        """Workspaces with jobs left over from an earlier, interrupted run."""
+        return list(dict.fromkeys(job.team_id for job in self.journal.pending.values()))
+
+    def run(self, jobs: List[PostJob], tokens: Dict[str, str]) -> PostingResult:
+        result = PostingResult()
+        self.journal.record_queued(jobs)
+
+        # Resumed jobs first, then this run's, each keeping its original order within a workspace
+        queues: Dict[str, List[PostJob]] = {}
+        for job in list(self.journal.pending.values()) + jobs:
+            queue = queues.setdefault(job.team_id, [])
+            if job.key not in {queued.key for queued in queue}:
+                queue.append(job)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="achievements") as executor:
+            futures = []
+            for team_id, queue in queues.items():
+                token = tokens.get(team_id)
+                if not token:
+                    print(f"[{team_id}] No bot token available. Leaving {len(queue)} achievement post(s) pending.")
+                    result.pending.extend(job.key for job in queue)
+                    continue
+                futures.append(executor.submit(self._drain, team_id, queue, token, result))
+            for future in futures:
+                future.result()
+
+        self.journal.compact()
+        print(
+            f"Achievement posting: {result.posted} posted, {result.skipped} already posted, "
+            f"{result.failed} failed, {result.rate_limited} rate-limit retries, {len(result.pending)} pending"
+        )
+        return result
+
+    def _drain(self, team_id: str, queue: List[PostJob], token: str, result: PostingResult) -> None:
+        client = self.client_factory(token)
+        last_post = None
+        for job in queue:
+            if self.journal.is_done(job.key):
+                with self._lock:
+                    result.skipped += 1
+                continue
+            if last_post is not None:
+                wait = self.min_interval - (time.monotonic() - last_post)
+                if wait > 0:
+                    self.sleep(wait)
+            outcome = self._post(client, job, result)
+            last_post = time.monotonic()
+            with self._lock:
+                if outcome == EVENT_POSTED:
+                    result.posted += 1
+                elif outcome == EVENT_FAILED:
+                    result.failed += 1
+                else:
+                    result.pending.append(job.key)
+
+    def _post(self, client: WebClient, job: PostJob, result: PostingResult) -> Optional[str]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                client.chat_postMessage(channel=job.channel, text=job.text, blocks=job.blocks or None)
+                self.journal.record_posted(job.key)
+                print(f"[{job.team_id}] Posted {job.description or job.key}")
+                return EVENT_POSTED
+            except SlackApiError as e:
+                if e.response.status_code != 429:
+                    print(f"[{job.team_id}] Error posting {job.description or job.key}: {e}")
+                    self.journal.record_failed(job.key)
+                    return EVENT_FAILED
+                with self._lock:
+                    result.rate_limited += 1
+                if attempt == self.max_retries:
+                    break
+                retry_after = float(e.response.headers.get("Retry-After") or e.response.headers.get("retry-after") or 1)
+                print(f"[{job.team_id}] Rate limited; retrying in {retry_after:.0f}s")
+                self.sleep(retry_after)
+            except Exception as e:
+                print(f"[{job.team_id}] Error posting {job.description or job.key}: {e}")
+                self.journal.record_failed(job.key)
+                return EVENT_FAILED
+        # Still rate limited: leave the job in the journal so the next run picks it up
+        print(f"[{job.team_id}] Giving up on {job.description or job.key} for now; it will be retried next run")
+        return None
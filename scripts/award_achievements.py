@@ -5,14 +5,28 @@ Usage (from repo root, with env + poetry activated):
 
 Core logic:
   1. Load active, auto_award achievements
-  2. For each achievement + each relevant (award_year, award_period) within the current year
-     (or lifetime), compute the metric defined by auto_threshold_type subject to auto_filters
+  2. For each relevant (award_year, award_period) within the current year (or lifetime), compute the
+     metric defined by auto_threshold_type subject to auto_filters. Achievements are grouped by
+     (cadence, threshold_type) and each group is computed in one pass, with one FILTERed aggregate
+     per distinct filter set; existing awards are prefetched once per run
   3. Identify users whose metric >= auto_threshold
   4. Respect region scoping (specific_org_id => user.home_region_id must match)
   5. Insert missing rows into achievements_x_users (award_year/period keyed) (unless --dry-run)
 
 Idempotent: already-awarded combinations are skipped.
 
+Incremental mode (default, ACHIEVEMENTS_INCREMENTAL=true): running metrics are kept per
+(achievement, user, award_year, award_period) in the `achievement_metrics` side table, with a per-achievement
+high-water mark over `attendance_expanded` / `event_instance_expanded` updates in `achievement_metric_checkpoints`.
+Each run only recomputes users whose attendance changed since the checkpoint and folds them into the side table. A
+lowered threshold is re-checked against the stored metrics; an achievement is rebuilt from scratch when it is new, its
+cadence/filters change or the year rolls over, and `--full-rebuild` forces that for every achievement (audits). Runs
+with `--today` skip the side tables entirely, as do runs against a database where `db-init/achievement_metrics.sql`
+has not been applied.
+
+`--benchmark` runs the old per-achievement loop and the grouped evaluation side by side (read-only) and
+prints the query count, wall time and whether both produced the same candidates.
+
 Assumptions / notes:
   - award_year == calendar year (UTC) for all non-lifetime cadences
   - weekly periods use ISO week numbers (1..53); monthly 1..12; quarterly 1..4; yearly single period 1
@@ -32,9 +46,12 @@ If filter keys are unrecognised, they are ignored (logged at DEBUG level).
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import ssl
 import sys
+import time
 
 import pytz
 
@@ -49,12 +66,14 @@ from typing import Any, Dict, Iterable, List, Sequence, Tuple
 from f3_data_models.models import Achievement, Achievement_x_User, Org_x_SlackSpace, SlackSpace, SlackUser, User
 from f3_data_models.utils import get_session
 from slack_sdk.web import WebClient
-from sqlalchemy import Integer, and_, distinct, func, literal, select, tuple_
+from sqlalchemy import Integer, and_, delete, distinct, event, func, inspect, literal, or_, select, true, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from scripts.achievement_poster import AchievementPoster, PostJob, ProgressJournal
 from utilities import constants
 from utilities.database.orm import SlackSettings
+from utilities.database.orm.achievement_metrics import AchievementMetric, AchievementMetricCheckpoint
 from utilities.database.orm.views import EventAttendance, EventInstanceExpanded
 
 # ---------------------------------------------------------------------------
@@ -191,27 +210,62 @@ def _apply_filters(base_filters: list, auto_filters: Dict[str, Any]) -> tuple[li
     return base_filters, False, False, list(exclude_type_ids), list(exclude_tag_ids)
 
 
-def _build_metric_columns(threshold_type: str):
+def _build_metric_columns(threshold_type: str, where=None):
+    """Aggregate for ``threshold_type``; ``where`` becomes a ``FILTER (WHERE ...)`` clause on the aggregate."""
+
+    def agg(expr):
+        return expr.filter(where) if where is not None else expr
+
     if threshold_type == "posts":
-        return func.count(EventAttendance.id)
+        return agg(func.count(EventAttendance.id))
     if threshold_type == "unique_aos":
-        return func.count(distinct(EventInstanceExpanded.ao_org_id))
+        return agg(func.count(distinct(EventInstanceExpanded.ao_org_id)))
     if threshold_type == "qs":
         # Number of times the user Q'd (q_ind is 1 for Q, 0/NULL otherwise)
-        return func.coalesce(func.sum(EventAttendance.q_ind), 0)
+        return func.coalesce(agg(func.sum(EventAttendance.q_ind)), 0)
     if threshold_type == "posts_at_ao":
         # Posts scoped by AO via auto_filters (ao_org_id); when no ao_org_id
         # filter is supplied, this becomes equivalent to total posts.
-        return func.count(EventAttendance.id)
+        return agg(func.count(EventAttendance.id))
     raise ValueError(f"Unsupported auto_threshold_type: {threshold_type}")
 
 
+def _period_expr(cadence: str):
+    if cadence == "weekly":
+        return func.extract("week", EventInstanceExpanded.start_date)
+    if cadence == "monthly":
+        return func.extract("month", EventInstanceExpanded.start_date)
+    if cadence == "quarterly":
+        return (func.extract("month", EventInstanceExpanded.start_date) - 1) / 3 + 1
+    if cadence == "yearly":
+        return 1
+    raise ValueError(f"Unsupported cadence: {cadence}")
+
+
+def _is_elapsed_period(cadence: str, period: int, today: date) -> bool:
+    """Defensive check that a computed period is not in the future."""
+    if cadence == "weekly":
+        return 1 <= period <= today.isocalendar().week
+    if cadence == "monthly":
+        return 1 <= period <= today.month
+    if cadence == "quarterly":
+        return 1 <= period <= (today.month - 1) // 3 + 1
+    if cadence == "yearly":
+        return period == 1
+    return False
+
+
 def _compute_all_period_metrics(
-    session: Session, achievement: Achievement, threshold_type: str, today: date
+    session: Session,
+    achievement: Achievement,
+    threshold_type: str,
+    today: date,
+    extra_filters: list | None = None,
 ) -> list[tuple[int, int, int]]:
     """Return list of (user_id, award_year, award_period, metric).
 
     Single query per achievement to cover all elapsed periods in current year (or lifetime).
+    ``extra_filters`` narrows the scan, e.g. to users whose attendance changed since the last run.
     """
     print(f"Computing metrics for achievement={achievement.id} ({threshold_type})...")
     metric_col = _build_metric_columns(threshold_type)
@@ -223,6 +277,7 @@ def _compute_all_period_metrics(
         filters, need_type_join, need_tag_join, *_ = _apply_filters([], achievement.auto_filters or {})
         if achievement.specific_org_id:
             filters.append(EventAttendance.home_region_id == achievement.specific_org_id)
+        filters.extend(extra_filters or [])
         query = select(
             EventAttendance.user_id.label("user_id"),
             func.cast(literal(-1), Integer).label("award_year"),
@@ -242,18 +297,9 @@ def _compute_all_period_metrics(
     filters, need_type_join, need_tag_join, *_ = _apply_filters(filters, achievement.auto_filters or {})
     if achievement.specific_org_id:
         filters.append(EventAttendance.home_region_id == achievement.specific_org_id)
+    filters.extend(extra_filters or [])
 
-    # Period expression
-    if cadence == "weekly":
-        period_expr = func.extract("week", EventInstanceExpanded.start_date)
-    elif cadence == "monthly":
-        period_expr = func.extract("month", EventInstanceExpanded.start_date)
-    elif cadence == "quarterly":
-        period_expr = (func.extract("month", EventInstanceExpanded.start_date) - 1) / 3 + 1
-    elif cadence == "yearly":
-        period_expr = 1
-    else:
-        raise ValueError(f"Unsupported cadence: {cadence}")
+    period_expr = _period_expr(cadence)
 
     query = select(
         EventAttendance.user_id.label("user_id"),
@@ -267,26 +313,309 @@ def _compute_all_period_metrics(
     query = query.filter(*filters).group_by("user_id", "award_period")
     rows = session.execute(query).all()
     # Filter out future periods (e.g., if partial query produced future periods due to date overlap) - defensive
-    valid_rows: list[tuple[int, int, int, int]] = []
-    if cadence == "weekly":
-        current_week = today.isocalendar().week
-        for r in rows:
-            if 1 <= r[2] <= current_week:
-                valid_rows.append((r[0], r[1], r[2], int(r[3])))
-    elif cadence == "monthly":
-        for r in rows:
-            if 1 <= r[2] <= today.month:
-                valid_rows.append((r[0], r[1], r[2], int(r[3])))
-    elif cadence == "quarterly":
-        current_q = (today.month - 1) // 3 + 1
-        for r in rows:
-            if 1 <= r[2] <= current_q:
-                valid_rows.append((r[0], r[1], r[2], int(r[3])))
-    elif cadence == "yearly":
-        for r in rows:
-            if r[2] == 1:
-                valid_rows.append((r[0], r[1], r[2], int(r[3])))
-    return valid_rows
+    return [(r[0], r[1], r[2], int(r[3])) for r in rows if _is_elapsed_period(cadence, r[2], today)]
+
+
+# ---------------------------------------------------------------------------
+# Grouped metric computation
+# ---------------------------------------------------------------------------
+
+
+MetricRow = Tuple[int, int, int, int]  # (user_id, award_year, award_period, metric)
+
+
+def _filter_signature(achievement: Achievement) -> str:
+    """Achievements with the same signature count exactly the same attendance rows."""
+    return json.dumps(
+        {"filters": achievement.auto_filters or {}, "specific_org_id": achievement.specific_org_id},
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _achievement_filter_clause(achievement: Achievement):
+    filters, *_ = _apply_filters([], achievement.auto_filters or {})
+    if achievement.specific_org_id:
+        filters.append(EventAttendance.home_region_id == achievement.specific_org_id)
+    return and_(*filters) if filters else true()
+
+
+def _compute_group_metrics(
+    session: Session,
+    cadence: str,
+    threshold_type: str,
+    achievements: Sequence[Achievement],
+    today: date,
+    extra_filters: list | None = None,
+) -> Dict[str, List[MetricRow]]:
+    """Computes metrics for every achievement sharing ``cadence`` and ``threshold_type`` in one query.
+
+    Each distinct filter signature becomes its own ``FILTER (WHERE ...)`` aggregate column, so the
+    attendance data is scanned once however many achievements (and thresholds) share it. Returns
+    non-zero rows keyed by filter signature.
+    """
+    clauses: Dict[str, Any] = {}
+    for achievement in achievements:
+        clauses.setdefault(_filter_signature(achievement), _achievement_filter_clause(achievement))
+    signatures = list(clauses)
+    print(
+        f"Computing {cadence}/{threshold_type} metrics for {len(achievements)} achievement(s) "
+        f"across {len(signatures)} filter set(s)..."
+    )
+
+    filters: list = list(extra_filters or [])
+    if len(signatures) == 1:
+        filters.append(clauses[signatures[0]])
+        metric_cols = [_build_metric_columns(threshold_type).label("m0")]
+    else:
+        filters.append(or_(*clauses.values()))
+        metric_cols = [
+            _build_metric_columns(threshold_type, where=clauses[sig]).label(f"m{i}") for i, sig in enumerate(signatures)
+        ]
+
+    if cadence == "lifetime":
+        year_col, period_col, group_by = literal(-1), literal(-1), ["user_id"]
+    else:
+        filters.append(
+            and_(EventInstanceExpanded.start_date >= date(today.year, 1, 1), EventInstanceExpanded.start_date <= today)
+        )
+        year_col, period_col, group_by = literal(today.year), _period_expr(cadence), ["user_id", "award_period"]
+
+    query = (
+        select(
+            EventAttendance.user_id.label("user_id"),
+            func.cast(year_col, Integer).label("award_year"),
+            func.cast(period_col, Integer).label("award_period"),
+            *metric_cols,
+        )
+        .join(EventInstanceExpanded, EventInstanceExpanded.id == EventAttendance.event_instance_id)
+        .filter(*filters)
+        .group_by(*group_by)
+    )
+
+    results: Dict[str, List[MetricRow]] = {sig: [] for sig in signatures}
+    for row in session.execute(query):
+        user_id, award_year, award_period = row[0], row[1], row[2]
+        if cadence != "lifetime" and not _is_elapsed_period(cadence, award_period, today):
+            continue
+        for i, sig in enumerate(signatures):
+            metric = int(row[3 + i] or 0)
+            if metric:
+                results[sig].append((user_id, award_year, award_period, metric))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Incremental evaluation
+# ---------------------------------------------------------------------------
+
+
+INCREMENTAL_ENABLED = os.getenv("ACHIEVEMENTS_INCREMENTAL", "true").lower() == "true"
+METRIC_WRITE_CHUNK = 5000
+# ``updated`` is the writer's transaction-start now(), so a row can commit with a timestamp older than the
+# high-water mark; each run re-reads this far behind the checkpoint. Re-evaluating a user is idempotent.
+CHECKPOINT_OVERLAP_SECONDS = float(os.getenv("ACHIEVEMENTS_CHECKPOINT_OVERLAP_SECONDS", "300"))
+
+
+@dataclass
+class IncrementalRun:
+    """Shared state for one incremental run.
+
+    ``high_water`` is the latest ``updated`` timestamp across the attendance views, read once before any
+    achievement is evaluated; rows changed after it, or committed late with an earlier timestamp, are picked up
+    (again) by the next run through ``CHECKPOINT_OVERLAP_SECONDS``, which is harmless.
+    ``rebuild`` forces every achievement to be recomputed from scratch (for audits).
+    """
+
+    high_water: datetime | None
+    rebuild: bool = False
+
+
+def metric_tables_available(session: Session) -> bool:
+    """Whether ``db-init/achievement_metrics.sql`` has been applied to this database."""
+    inspector = inspect(session.get_bind())
+    return all(inspector.has_table(table.__tablename__) for table in (AchievementMetric, AchievementMetricCheckpoint))
+
+
+def attendance_high_water(session: Session) -> datetime | None:
+    attendance_max = session.execute(select(func.max(EventAttendance.updated))).scalar()
+    event_max = session.execute(select(func.max(EventInstanceExpanded.updated))).scalar()
+    return max((v for v in (attendance_max, event_max) if v is not None), default=None)
+
+
+def _metric_signature(achievement: Achievement, threshold_type: str) -> str:
+    """Fingerprint of everything that changes an achievement's metrics, then ``:<threshold>``.
+
+    The threshold is kept readable rather than hashed: raising it needs no rebuild, since changed rows are compared
+    against the current threshold every run, and lowering it only needs the stored metrics re-checked.
+    """
+    payload = {
+        "cadence": str(achievement.auto_cadence.name).lower(),
+        "threshold_type": threshold_type,
+        "filters": achievement.auto_filters or {},
+        "specific_org_id": achievement.specific_org_id,
+    }
+    digest = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{digest}:{achievement.auto_threshold}"
+
+
+def _needs_rebuild(
+    checkpoint: AchievementMetricCheckpoint | None, signature: str, cadence: str, today: date, run: IncrementalRun
+) -> bool:
+    if run.rebuild or checkpoint is None or checkpoint.high_water is None:
+        return True
+    digest = signature.partition(":")[0]
+    checkpoint_digest, _, checkpoint_threshold = (checkpoint.signature or "").partition(":")
+    if checkpoint_digest != digest or not checkpoint_threshold.isdigit():
+        return True
+    # Non-lifetime metrics are scoped to the current year, so start over when it rolls
+    return cadence != "lifetime" and checkpoint.award_year != today.year
+
+
+def _lowered_from(checkpoint: AchievementMetricCheckpoint, signature: str) -> int | None:
+    """The checkpoint's threshold when ``signature`` lowers it, else None."""
+    threshold = signature.partition(":")[2]
+    checkpoint_threshold = (checkpoint.signature or "").partition(":")[2]
+    if threshold.isdigit() and checkpoint_threshold.isdigit() and int(threshold) < int(checkpoint_threshold):
+        return int(checkpoint_threshold)
+    return None
+
+
+def _changed_since(checkpoints: Iterable[AchievementMetricCheckpoint]) -> datetime:
+    """Oldest high-water mark, less the overlap for rows that committed after it with an earlier ``updated``."""
+    return min(c.high_water for c in checkpoints) - timedelta(seconds=CHECKPOINT_OVERLAP_SECONDS)
+
+
+def _changed_users_query(since: datetime):
+    """Users with an attendance row, or an event they attended, updated after ``since``."""
+    return (
+        select(EventAttendance.user_id)
+        .join(EventInstanceExpanded, EventInstanceExpanded.id == EventAttendance.event_instance_id)
+        .filter(or_(EventAttendance.updated > since, EventInstanceExpanded.updated > since))
+        .distinct()
+    )
+
+
+def _save_checkpoints(
+    session: Session,
+    achievements: Sequence[Achievement],
+    signatures: Dict[int, str],
+    award_year: int,
+    high_water: datetime | None,
+    rebuilt: bool,
+) -> None:
+    stmt = pg_insert(AchievementMetricCheckpoint).values(
+        [
+            {"achievement_id": a.id, "signature": signatures[a.id], "high_water": high_water, "award_year": award_year}
+            for a in achievements
+        ]
+    )
+    updates = {
+        "signature": stmt.excluded.signature,
+        "high_water": stmt.excluded.high_water,
+        "award_year": stmt.excluded.award_year,
+    }
+    if rebuilt:
+        updates["rebuilt"] = func.now()
+    session.execute(
+        stmt.on_conflict_do_update(index_elements=[AchievementMetricCheckpoint.achievement_id], set_=updates)
+    )
+
+
+def _incremental_group_metrics(
+    session: Session,
+    cadence: str,
+    threshold_type: str,
+    achievements: Sequence[Achievement],
+    today: date,
+    run: IncrementalRun,
+) -> Dict[int, List[MetricRow]]:
+    """Returns metric rows that may newly qualify since the last run, folds them into the side table and advances
+    the checkpoints.
+
+    Achievements needing a rebuild are computed in full. The rest only recompute users whose attendance
+    (or whose events) changed since the oldest of their checkpoints; those users' rows in ``achievement_metrics``
+    are replaced wholesale so removed attendance is reflected too. Achievements whose threshold was lowered also get
+    the stored rows between the new and old threshold, which were below the bar when last evaluated.
+    """
+    award_year = -1 if cadence == "lifetime" else today.year
+    ids = [a.id for a in achievements]
+    checkpoints = {
+        c.achievement_id: c
+        for c in session.scalars(
+            select(AchievementMetricCheckpoint).filter(AchievementMetricCheckpoint.achievement_id.in_(ids))
+        ).all()
+    }
+    signatures = {a.id: _metric_signature(a, threshold_type) for a in achievements}
+    rebuild = [a for a in achievements if _needs_rebuild(checkpoints.get(a.id), signatures[a.id], cadence, today, run)]
+    update = [a for a in achievements if a not in rebuild]
+
+    rows: Dict[int, List[MetricRow]] = {}
+    if rebuild:
+        print(f"Rebuilding metrics for achievements={[a.id for a in rebuild]}")
+        by_signature = _compute_group_metrics(session, cadence, threshold_type, rebuild, today)
+        rows.update({a.id: by_signature[_filter_signature(a)] for a in rebuild})
+        session.execute(delete(AchievementMetric).where(AchievementMetric.achievement_id.in_([a.id for a in rebuild])))
+        _save_checkpoints(session, rebuild, signatures, award_year, run.high_water, rebuilt=True)
+    if update:
+        changed = _changed_users_query(_changed_since(checkpoints[a.id] for a in update))
+        by_signature = _compute_group_metrics(
+            session, cadence, threshold_type, update, today, extra_filters=[EventAttendance.user_id.in_(changed)]
+        )
+        rows.update({a.id: by_signature[_filter_signature(a)] for a in update})
+        session.execute(
+            delete(AchievementMetric).where(
+                AchievementMetric.achievement_id.in_([a.id for a in update]),
+                AchievementMetric.award_year == award_year,
+                AchievementMetric.user_id.in_(changed),
+            )
+        )
+        _save_checkpoints(session, update, signatures, award_year, run.high_water, rebuilt=False)
+        print(
+            f"Incremental update for achievements={[a.id for a in update]}: {sum(len(rows[a.id]) for a in update)} rows"
+        )
+
+    _write_metrics(session, rows)
+    for achievement in update:
+        old_threshold = _lowered_from(checkpoints[achievement.id], signatures[achievement.id])
+        if old_threshold is not None:
+            rows[achievement.id] = _with_stored_metrics(
+                session, achievement, award_year, old_threshold, rows[achievement.id]
+            )
+    return rows
+
+
+def _write_metrics(session: Session, rows: Dict[int, List[MetricRow]]) -> None:
+    values = [
+        {"achievement_id": achievement_id, "user_id": u, "award_year": y, "award_period": p, "metric": m}
+        for achievement_id, achievement_rows in rows.items()
+        for u, y, p, m in achievement_rows
+    ]
+    for i in range(0, len(values), METRIC_WRITE_CHUNK):
+        session.execute(pg_insert(AchievementMetric).values(values[i : i + METRIC_WRITE_CHUNK]))
+
+
+def _with_stored_metrics(
+    session: Session, achievement: Achievement, award_year: int, old_threshold: int, rows: List[MetricRow]
+) -> List[MetricRow]:
+    """``rows`` plus the stored metrics that meet the lowered threshold but not the one they were last checked at."""
+    stored = session.execute(
+        select(
+            AchievementMetric.user_id,
+            AchievementMetric.award_year,
+            AchievementMetric.award_period,
+            AchievementMetric.metric,
+        ).filter(
+            AchievementMetric.achievement_id == achievement.id,
+            AchievementMetric.award_year == award_year,
+            AchievementMetric.metric >= achievement.auto_threshold,
+            AchievementMetric.metric < old_threshold,
+        )
+    ).all()
+    print(f"Threshold lowered for achievement={achievement.id}: re-checking {len(stored)} stored metric rows")
+    merged = {(u, y, p): (u, y, p, m) for u, y, p, m in stored}
+    merged.update({(u, y, p): (u, y, p, m) for u, y, p, m in rows})
+    return list(merged.values())
 
 
 # ---------------------------------------------------------------------------
@@ -303,63 +632,148 @@ class CandidateAward:
     metric: int
 
 
-def _existing_awards(session: Session, achievement_id: int, year: int, period: int) -> set[int]:
-    q = select(Achievement_x_User.user_id).filter(
-        Achievement_x_User.achievement_id == achievement_id,
-        Achievement_x_User.award_year == year,
-        Achievement_x_User.award_period == period,
-    )
-    return {r[0] for r in session.execute(q).all()}
+ExistingAwards = Dict[Tuple[int, int, int], set[int]]  # (achievement_id, award_year, award_period) -> user ids
 
 
-def process_achievement(session: Session, achievement: Achievement, today: date) -> List[CandidateAward]:
+def _auto_threshold_type(achievement: Achievement) -> str | None:
+    """Normalized threshold type, or None when the achievement can't be auto-awarded."""
     if not achievement.auto_award or not achievement.is_active:
-        return []
+        return None
     if not achievement.auto_threshold or not achievement.auto_threshold_type:
-        return []
-
+        return None
     threshold_type = str(achievement.auto_threshold_type).lower()
-    if threshold_type not in SUPPORTED_THRESHOLD_TYPES:
+    return threshold_type if threshold_type in SUPPORTED_THRESHOLD_TYPES else None
+
+
+def _prefetch_existing_awards(session: Session, achievement_ids: Sequence[int], years: Iterable[int]) -> ExistingAwards:
+    """Loads every existing award for ``achievement_ids`` in ``years`` with a single query."""
+    existing: ExistingAwards = defaultdict(set)
+    if not achievement_ids:
+        return existing
+    query = select(
+        Achievement_x_User.achievement_id,
+        Achievement_x_User.award_year,
+        Achievement_x_User.award_period,
+        Achievement_x_User.user_id,
+    ).filter(
+        Achievement_x_User.achievement_id.in_(list(achievement_ids)), Achievement_x_User.award_year.in_(list(years))
+    )
+    for achievement_id, award_year, award_period, user_id in session.execute(query).all():
+        existing[(achievement_id, award_year, award_period)].add(user_id)
+    return existing
+
+
+def _candidates_from_rows(
+    achievement: Achievement, rows: Iterable[MetricRow], existing: ExistingAwards
+) -> List[CandidateAward]:
+    """Rows meeting the achievement's threshold that haven't been awarded yet."""
+    return [
+        CandidateAward(
+            achievement_id=achievement.id,
+            user_id=user_id,
+            award_year=award_year,
+            award_period=award_period,
+            metric=metric,
+        )
+        for user_id, award_year, award_period, metric in rows
+        if metric >= achievement.auto_threshold
+        and user_id not in existing.get((achievement.id, award_year, award_period), ())
+    ]
+
+
+def process_achievement(session: Session, achievement: Achievement, today: date) -> List[CandidateAward]:
+    """Evaluates a single achievement with its own metric and existing-award queries.
+
+    Kept for ``--achievement-id`` style one-offs and as the baseline for ``--benchmark``; daily runs use
+    ``evaluate_achievements``.
+    """
+    threshold_type = _auto_threshold_type(achievement)
+    if threshold_type is None:
         return []
 
     all_rows = _compute_all_period_metrics(session, achievement, threshold_type, today)
     if not all_rows:
         return []
 
-    # Collect unique (year, period)
-    period_keys = {(r[1], r[2]) for r in all_rows}
-
     # Prefetch all existing awards for this achievement & these periods
-    existing_map: dict[tuple[int, int], set[int]] = {k: set() for k in period_keys}
-    period_list = list(period_keys)
-    if period_list:
-        existing_query = (
-            select(
-                Achievement_x_User.user_id,
-                Achievement_x_User.award_year,
-                Achievement_x_User.award_period,
-            )
-            .filter(Achievement_x_User.achievement_id == achievement.id)
-            .filter(tuple_(Achievement_x_User.award_year, Achievement_x_User.award_period).in_(list(period_keys)))
+    period_keys = list({(r[1], r[2]) for r in all_rows})
+    existing: ExistingAwards = defaultdict(set)
+    existing_query = (
+        select(
+            Achievement_x_User.user_id,
+            Achievement_x_User.award_year,
+            Achievement_x_User.award_period,
         )
-        # Note: Using period_keys directly inside IN since SQLAlchemy will expand tuple set properly.
-        # If dialect issues arise, replace with list(year_period_tuples).
-        for user_id, y, p in session.execute(existing_query).all():
-            existing_map.setdefault((y, p), set()).add(user_id)
-
-    awards: list[CandidateAward] = []
-    for user_id, award_year, award_period, metric in all_rows:
-        if metric >= achievement.auto_threshold and user_id not in existing_map.get((award_year, award_period), set()):
-            awards.append(
-                CandidateAward(
-                    achievement_id=achievement.id,
-                    user_id=user_id,
-                    award_year=award_year,
-                    award_period=award_period,
-                    metric=metric,
-                )
-            )
-    return awards
+        .filter(Achievement_x_User.achievement_id == achievement.id)
+        .filter(tuple_(Achievement_x_User.award_year, Achievement_x_User.award_period).in_(period_keys))
+    )
+    for user_id, y, p in session.execute(existing_query).all():
+        existing[(achievement.id, y, p)].add(user_id)
+    return _candidates_from_rows(achievement, all_rows, existing)
+
+
+def evaluate_achievements(
+    session: Session,
+    achievements: Sequence[Achievement],
+    today: date,
+    incremental: IncrementalRun | None = None,
+) -> List[CandidateAward]:
+    """Evaluates all achievements with one metric query per (cadence, threshold_type) group.
+
+    Achievements in a group that share filters also share a metric column, so e.g. 25/50/100-post
+    achievements cost a single aggregate. Existing awards for every achievement are loaded once up front.
+    """
+    groups: Dict[Tuple[str, str], List[Achievement]] = defaultdict(list)
+    for achievement in achievements:
+        threshold_type = _auto_threshold_type(achievement)
+        if threshold_type is not None:
+            groups[(str(achievement.auto_cadence.name).lower(), threshold_type)].append(achievement)
+    if not groups:
+        return []
+
+    existing = _prefetch_existing_awards(
+        session, [a.id for group in groups.values() for a in group], years=(today.year, -1)
+    )
+    candidates: List[CandidateAward] = []
+    for (cadence, threshold_type), group in groups.items():
+        if incremental is not None:
+            rows = _incremental_group_metrics(session, cadence, threshold_type, group, today, incremental)
+        else:
+            by_signature = _compute_group_metrics(session, cadence, threshold_type, group, today)
+            rows = {a.id: by_signature[_filter_signature(a)] for a in group}
+        for achievement in group:
+            candidates.extend(_candidates_from_rows(achievement, rows[achievement.id], existing))
+    return candidates
+
+
+def benchmark_evaluation(session: Session, achievements: Sequence[Achievement], today: date) -> None:
+    """Prints query count and wall time of the per-achievement loop vs grouped evaluation (read-only)."""
+    counter = {"queries": 0}
+
+    def count_query(*_args):
+        counter["queries"] += 1
+
+    def measure(label: str, fn):
+        counter["queries"] = 0
+        start = time.perf_counter()
+        candidates = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {counter['queries']} queries, {elapsed:.2f}s, {len(candidates)} candidates")
+        return {(c.achievement_id, c.user_id, c.award_year, c.award_period) for c in candidates}
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", count_query)
+    try:
+        legacy = measure(
+            "Per-achievement loop", lambda: [c for a in achievements for c in process_achievement(session, a, today)]
+        )
+        grouped = measure("Grouped evaluation", lambda: evaluate_achievements(session, achievements, today))
+    finally:
+        event.remove(engine, "before_cursor_execute", count_query)
+    print(f"Candidate sets match: {legacy == grouped}")
+
+
+AWARD_WRITE_CHUNK = 5000
 
 
 def award_candidates(session: Session, candidates: Sequence[CandidateAward], dry_run: bool) -> None:
@@ -392,20 +806,23 @@ def award_candidates(session: Session, candidates: Sequence[CandidateAward], dry
         for c in candidates
     ]
 
-    # Bulk insert with ON CONFLICT DO NOTHING (composite PK prevents duplicates in races)
-    stmt = pg_insert(Achievement_x_User).values(rows)
-    stmt = stmt.on_conflict_do_nothing(
-        index_elements=[
-            Achievement_x_User.achievement_id,
-            Achievement_x_User.user_id,
-            Achievement_x_User.award_year,
-            Achievement_x_User.award_period,
-        ]
-    )
-    result = session.execute(stmt)
+    # Bulk insert with ON CONFLICT DO NOTHING (composite PK prevents duplicates in races), chunked to stay
+    # under the bind parameter limit now that every achievement's awards are inserted together
+    inserted = 0
+    for i in range(0, len(rows), AWARD_WRITE_CHUNK):
+        stmt = pg_insert(Achievement_x_User).values(rows[i : i + AWARD_WRITE_CHUNK])
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[
+                Achievement_x_User.achievement_id,
+                Achievement_x_User.user_id,
+                Achievement_x_User.award_year,
+                Achievement_x_User.award_period,
+            ]
+        )
+        result = session.execute(stmt)
+        inserted += result.rowcount if result.rowcount is not None else 0
     session.commit()
 
-    inserted = result.rowcount if result.rowcount is not None else 0
     print(f"Inserted {inserted} new achievement awards (requested {len(rows)}).")
     if inserted < len(rows):
         print("Some awards already existed and were skipped.")
@@ -517,7 +934,12 @@ def _build_dm_blocks(achievement: Achievement) -> List[Dict]:
     return blocks
 
 
-def post_achievements(session: Session, candidates: Sequence[CandidateAward], dry_run: bool) -> None:
+def post_achievements(
+    session: Session,
+    candidates: Sequence[CandidateAward],
+    dry_run: bool,
+    poster: AchievementPoster | None = None,
+) -> None:
     """Post achievement notifications based on each region's settings.
 
     Groups candidates by their home region's Slack space and posts according
@@ -525,9 +947,37 @@ def post_achievements(session: Session, candidates: Sequence[CandidateAward], dr
     - post_individually: Post each achievement separately in achievement_channel
     - post_summary: Post a daily summary grouped by achievement in achievement_channel
     - send_in_dms_only: Send DM to each user for their achievements
+
+    Messages are handed to an ``AchievementPoster``, which posts to several workspaces at once, honours Slack
+    rate limits and journals progress so an interrupted run resumes without double-posting.
     """
-    if not candidates:
+    jobs, tokens = _build_post_jobs(session, candidates, dry_run)
+    if dry_run:
         return
+    poster = poster or AchievementPoster(
+        journal=ProgressJournal(), client_factory=lambda token: WebClient(token, ssl=_get_ssl_context())
+    )
+    if not jobs and not poster.pending_team_ids():
+        return
+    # Workspaces with posts left over from an interrupted run need their tokens too
+    missing_team_ids = [t for t in poster.pending_team_ids() if t not in tokens]
+    if missing_team_ids:
+        for team_id, bot_token in session.execute(
+            select(SlackSpace.team_id, SlackSpace.bot_token).filter(SlackSpace.team_id.in_(missing_team_ids))
+        ).all():
+            if bot_token:
+                tokens[team_id] = bot_token
+    poster.run(jobs, tokens)
+
+
+def _build_post_jobs(
+    session: Session, candidates: Sequence[CandidateAward], dry_run: bool
+) -> Tuple[List[PostJob], Dict[str, str]]:
+    """Group candidates by home region and build each region's messages. Returns (jobs, bot tokens by team)."""
+    jobs: List[PostJob] = []
+    tokens: Dict[str, str] = {}
+    if not candidates:
+        return jobs, tokens
 
     # Gather all unique user_ids and achievement_ids
     user_ids = list({c.user_id for c in candidates})
@@ -545,7 +995,7 @@ def post_achievements(session: Session, candidates: Sequence[CandidateAward], dr
     home_region_ids = list({u.home_region_id for u in users_by_id.values() if u.home_region_id})
     if not home_region_ids:
         print("No users with home regions found. Skipping achievement posting.")
-        return
+        return jobs, tokens
 
     # Load SlackSpaces for home regions via Org_x_SlackSpace
     slack_space_query = (
@@ -559,7 +1009,7 @@ def post_achievements(session: Session, candidates: Sequence[CandidateAward], dr
 
     if not region_slack_spaces:
         print("No Slack spaces found for user home regions. Skipping achievement posting.")
-        return
+        return jobs, tokens
 
     # Get all team_ids we need slack users for
     team_ids = list({ss.team_id for ss in region_slack_spaces.values()})
@@ -609,7 +1059,6 @@ def post_achievements(session: Session, candidates: Sequence[CandidateAward], dr
             group.achievements[candidate.achievement_id] = []
         group.achievements[candidate.achievement_id].append((user_info, candidate))
 
-    # Post for each region based on settings
     for team_id, group in region_groups.items():
         settings = group.slack_settings
 
@@ -634,60 +1083,68 @@ def post_achievements(session: Session, candidates: Sequence[CandidateAward], dr
                 print(f"  - {ach_name}: {', '.join(users)}")
             continue
 
-        ssl_context = _get_ssl_context()
-        client = WebClient(group.bot_token, ssl=ssl_context)
-
+        tokens[team_id] = group.bot_token
         if send_option == "post_individually":
-            _post_individually(client, achievement_channel, group, achievements_by_id, team_id)
+            jobs.extend(_post_individually(achievement_channel, group, achievements_by_id, team_id))
         elif send_option == "post_summary":
-            _post_summary(client, achievement_channel, group, achievements_by_id, team_id)
+            jobs.extend(_post_summary(achievement_channel, group, achievements_by_id, team_id))
         elif send_option == "send_in_dms_only":
-            _send_dms(client, group, achievements_by_id, team_id)
+            jobs.extend(_send_dms(group, achievements_by_id, team_id))
         else:
             print(f"[{team_id}] Unknown send_option: {send_option}. Defaulting to summary.")
-            _post_summary(client, achievement_channel, group, achievements_by_id, team_id)
+            jobs.extend(_post_summary(achievement_channel, group, achievements_by_id, team_id))
+    return jobs, tokens
+
+
+def _award_key(prefix: str, team_id: str, candidate: CandidateAward) -> str:
+    return (
+        f"{prefix}:{team_id}:{candidate.achievement_id}:{candidate.user_id}:"
+        f"{candidate.award_year}:{candidate.award_period}"
+    )
 
 
 def _post_individually(
-    client: WebClient,
     channel: str,
     group: RegionAchievementGroup,
     achievements_by_id: Dict[int, Achievement],
     team_id: str,
-) -> None:
-    """Post each achievement as an individual message."""
+) -> List[PostJob]:
+    """Build one post per achievement earned."""
     if not channel:
         print(f"[{team_id}] No achievement channel configured. Skipping individual posts.")
-        return
+        return []
 
+    jobs = []
     for ach_id, user_awards in group.achievements.items():
         achievement = achievements_by_id.get(ach_id)
         if not achievement:
             continue
 
-        for user_info, _candidate in user_awards:
+        for user_info, candidate in user_awards:
             user_tag = f"<@{user_info.slack_user_id}>"
-            msg = _build_achievement_message(achievement, user_tag)
-            blocks = _build_achievement_blocks(achievement, user_tag)
-
-            try:
-                client.chat_postMessage(channel=channel, text=msg, blocks=blocks)
-                print(f"[{team_id}] Posted achievement '{achievement.name}' for {user_info.user_name}")
-            except Exception as e:
-                print(f"[{team_id}] Error posting achievement: {e}")
+            jobs.append(
+                PostJob(
+                    key=_award_key("individual", team_id, candidate),
+                    team_id=team_id,
+                    channel=channel,
+                    text=_build_achievement_message(achievement, user_tag),
+                    blocks=_build_achievement_blocks(achievement, user_tag),
+                    description=f"achievement '{achievement.name}' for {user_info.user_name}",
+                )
+            )
+    return jobs
 
 
 def _post_summary(
-    client: WebClient,
     channel: str,
     group: RegionAchievementGroup,
     achievements_by_id: Dict[int, Achievement],
     team_id: str,
-) -> None:
-    """Post a single summary of all achievements earned."""
+) -> List[PostJob]:
+    """Build a single summary post of all achievements earned."""
     if not channel:
         print(f"[{team_id}] No achievement channel configured. Skipping summary post.")
-        return
+        return []
 
     # Build sections with their corresponding achievements for image support
     section_data: List[Tuple[Achievement, str]] = []
@@ -700,7 +1157,7 @@ def _post_summary(
         section_data.append((achievement, section_text))
 
     if not section_data:
-        return
+        return []
 
     today_str = datetime.now(UTC).strftime("%B %d, %Y")
     header = f"📊 *Achievement Summary for {today_str}*"
@@ -715,20 +1172,27 @@ def _post_summary(
         if achievement.image_url:
             blocks.append({"type": "image", "image_url": achievement.image_url, "alt_text": achievement.name})
 
-    try:
-        client.chat_postMessage(channel=channel, text=full_msg, blocks=blocks)
-        print(f"[{team_id}] Posted achievement summary with {len(section_data)} achievement types")
-    except Exception as e:
-        print(f"[{team_id}] Error posting achievement summary: {e}")
+    # Key on the exact set of awards so a later run the same day with new awards still posts
+    award_keys = sorted(_award_key("summary", team_id, c) for awards in group.achievements.values() for _, c in awards)
+    digest = hashlib.sha1("|".join(award_keys).encode()).hexdigest()[:16]
+    return [
+        PostJob(
+            key=f"summary:{team_id}:{digest}",
+            team_id=team_id,
+            channel=channel,
+            text=full_msg,
+            blocks=blocks,
+            description=f"achievement summary with {len(section_data)} achievement types",
+        )
+    ]
 
 
 def _send_dms(
-    client: WebClient,
     group: RegionAchievementGroup,
     achievements_by_id: Dict[int, Achievement],
     team_id: str,
-) -> None:
-    """Send DMs to each user for their achievements."""
+) -> List[PostJob]:
+    """Build a DM to each user for each of their achievements."""
     # Group by user to batch their achievements
     user_achievements: Dict[str, List[Tuple[Achievement, CandidateAward]]] = defaultdict(list)
 
@@ -740,16 +1204,20 @@ def _send_dms(
         for user_info, _candidate in user_awards:
             user_achievements[user_info.slack_user_id].append((achievement, _candidate))
 
+    jobs = []
     for slack_user_id, achievements in user_achievements.items():
-        for achievement, _candidate in achievements:
-            msg = _build_dm_message(achievement)
-            blocks = _build_dm_blocks(achievement)
-
-            try:
-                client.chat_postMessage(channel=slack_user_id, text=msg, blocks=blocks)
-                print(f"[{team_id}] Sent DM for achievement '{achievement.name}' to {slack_user_id}")
-            except Exception as e:
-                print(f"[{team_id}] Error sending DM to {slack_user_id}: {e}")
+        for achievement, candidate in achievements:
+            jobs.append(
+                PostJob(
+                    key=_award_key("dm", team_id, candidate),
+                    team_id=team_id,
+                    channel=slack_user_id,
+                    text=_build_dm_message(achievement),
+                    blocks=_build_dm_blocks(achievement),
+                    description=f"DM for achievement '{achievement.name}' to {slack_user_id}",
+                )
+            )
+    return jobs
 
 
 def main():  # pragma: no cover - CLI
@@ -760,6 +1228,14 @@ def main():  # pragma: no cover - CLI
     parser.add_argument(
         "--today", type=str, help="Override today's date (YYYY-MM-DD, UTC) for backfilling / testing", default=None
     )
+    parser.add_argument(
+        "--full-rebuild", action="store_true", help="Recompute every metric from scratch instead of incrementally"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare query count / wall time of per-achievement vs grouped evaluation, then exit without writing",
+    )
     args = parser.parse_args()
     print(f"Auto-award achievements started at {datetime.now(UTC).isoformat()}")
     print(f"Arguments: achievement_id={args.achievement_id}, dry_run={args.dry_run}, today={args.today}")
@@ -767,6 +1243,14 @@ def main():  # pragma: no cover - CLI
     today = datetime.strptime(args.today, "%Y-%m-%d").date() if args.today else datetime.now(UTC).date()
     current_hour = datetime.now(pytz.timezone("US/Central")).hour
 
+    if args.benchmark:
+        with get_session() as session:
+            ach_query = select(Achievement).filter(Achievement.auto_award.is_(True), Achievement.is_active.is_(True))
+            if args.achievement_id:
+                ach_query = ach_query.filter(Achievement.id == args.achievement_id)
+            benchmark_evaluation(session, session.scalars(ach_query).all(), today)
+        return
+
     if current_hour != constants.ACHIEVEMENT_AWARD_HOUR_CST:
         return
 
@@ -776,16 +1260,22 @@ def main():  # pragma: no cover - CLI
             ach_query = ach_query.filter(Achievement.id == args.achievement_id)
         achievements = session.scalars(ach_query).all()
         print(f"Processing {len(achievements)} achievements...")
-        total_candidates = 0
-        all_candidates = []
-        for ach in achievements:
-            cands = process_achievement(session, ach, today)
-            award_candidates(session, cands, args.dry_run)
-            total_candidates += len(cands)
-            all_candidates.extend(cands)
-
-        # Post achievement notifications
-        if all_candidates and not args.skip_post:
+
+        # Backfills with --today recompute statelessly so they don't disturb the incremental checkpoints
+        incremental = None
+        if INCREMENTAL_ENABLED and not args.today and not metric_tables_available(session):
+            print("Achievement metric tables are missing (apply db-init/achievement_metrics.sql); running in full")
+        elif INCREMENTAL_ENABLED and not args.today:
+            incremental = IncrementalRun(high_water=attendance_high_water(session), rebuild=args.full_rebuild)
+
+        all_candidates = evaluate_achievements(session, achievements, today, incremental)
+        award_candidates(session, all_candidates, args.dry_run)
+        if incremental and not args.dry_run:
+            session.commit()  # metrics + checkpoints, even when nothing new was awarded
+        total_candidates = len(all_candidates)
+
+        # Post achievement notifications (also resumes posts left pending by an interrupted run)
+        if not args.skip_post:
             print(f"\nPosting {len(all_candidates)} achievement notifications...")
             post_achievements(session, all_candidates, args.dry_run)
 
@@ -52,7 +52,7 @@ class BackblastItem:
 class BackblastList:
     items: List[BackblastItem] = field(default_factory=list)
 
-    def pull_data(self):
+    def pull_data(self, region_org_id: int | None = None):
         session = get_session()
         ParentOrg = aliased(Org)
 
@@ -70,6 +70,7 @@ class BackblastList:
             .alias()
         )
 
+        region_filters = [] if region_org_id is None else [ParentOrg.id == region_org_id]
         query = (
             session.query(
                 EventInstance,
@@ -101,6 +102,7 @@ class BackblastList:
                 EventInstance.start_date >= (current_date_cst() - timedelta(days=5)),  # eventually configurable
                 EventInstance.backblast_ts.is_(None),  # not already sent
                 EventInstance.is_active,  # not canceled
+                *region_filters,
             )
             .order_by(ParentOrg.name, Org.name, EventInstance.start_time)
         )
@@ -121,13 +123,14 @@ class BackblastList:
         session.close()
 
 
-def send_backblast_reminders(force=False):
+def send_backblast_reminders(force=False, region_org_id: int | None = None):
+    """Sends backblast reminders for every region, or only ``region_org_id`` (the hourly runner's per-region tasks)."""
     # get the current time in US/Central timezone
     current_time = datetime.now(pytz.timezone("US/Central"))
     # check if the current time is between 5:00 PM and 6:00 PM, eventually configurable
     if current_time.hour == 17 or force:
         backblast_list = BackblastList()
-        backblast_list.pull_data()
+        backblast_list.pull_data(region_org_id=region_org_id)
 
         for backblast in backblast_list.items:
             # TODO: add some handling for missing stuff
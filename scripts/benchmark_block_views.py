@@ -0,0 +1,75 @@
+"""Micro-benchmark for building the largest modal forms in ``utilities/slack/forms.py``.
+
+For each form it times the old per-request path (``copy.deepcopy`` of the whole template, then serialize every block)
+against the frozen-template path (``FrozenBlockView.copy()``, which clones only the blocks an overlay touches and
+serves the rest from JSON rendered at import time). Both paths apply the same initial-value overlay and must produce
+identical Slack JSON.
+
+Usage (from repo root, no API key or database needed):
+  python scripts/benchmark_block_views.py
+  python scripts/benchmark_block_views.py --forms 3 --runs 5000
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import copy
+import json
+import timeit
+from typing import Callable, List, Tuple
+
+from utilities.slack import forms, orm
+
+
+def largest_forms(count: int) -> List[Tuple[str, orm.FrozenBlockView]]:
+    """Returns the ``count`` templates in forms.py with the most serialized JSON."""
+    templates = [(name, value) for name, value in vars(forms).items() if isinstance(value, orm.FrozenBlockView)]
+    templates.sort(key=lambda item: len(json.dumps(item[1].as_form_field())), reverse=True)
+    return templates[:count]
+
+
+def overlay_for(template: orm.FrozenBlockView) -> dict:
+    """Initial values for the first two input blocks, the typical shape of a per-request overlay."""
+    inputs = [b.action for b in template.blocks if isinstance(b, orm.InputBlock) and b.action]
+    return dict.fromkeys(inputs[:2])
+
+
+def deepcopy_path(template: orm.FrozenBlockView, overlay: dict) -> Callable[[], List[dict]]:
+    def build():
+        form = orm.BlockView(blocks=copy.deepcopy(list(template.blocks)))
+        form.set_initial_values(overlay)
+        return [b.as_form_field() for b in form.blocks]
+
+    return build
+
+
+def frozen_path(template: orm.FrozenBlockView, overlay: dict) -> Callable[[], List[dict]]:
+    def build():
+        form = template.copy()
+        form.set_initial_values(overlay)
+        return form.as_form_field()
+
+    return build
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark deepcopy vs frozen BlockView templates")
+    parser.add_argument("--forms", type=int, help="How many of the largest forms to benchmark", default=5)
+    parser.add_argument("--runs", type=int, help="Builds per form and variant", default=2000)
+    args = parser.parse_args()
+
+    print(f"{'form':<28} {'blocks':>6} {'deepcopy':>12} {'frozen':>12} {'speedup':>8}")
+    for name, template in largest_forms(args.forms):
+        overlay = overlay_for(template)
+        old, new = deepcopy_path(template, overlay), frozen_path(template, overlay)
+        assert old() == new(), f"{name}: frozen template rendered different JSON"
+        old_us = timeit.timeit(old, number=args.runs) / args.runs * 1e6
+        new_us = timeit.timeit(new, number=args.runs) / args.runs * 1e6
+        print(f"{name:<28} {len(template.blocks):>6} {old_us:>9.1f} us {new_us:>9.1f} us {old_us / new_us:>7.1f}x")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
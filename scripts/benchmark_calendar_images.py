@@ -0,0 +1,88 @@
+"""Benchmark for the Q sheet renderer in ``scripts/calendar_images``.
+
+Builds a synthetic week for a region with ``--aos`` AOs and times ``render_calendar_image`` plus
+``save_calendar_image``. When pandas, dataframe_image and Playwright are installed it also times the old
+``dfi.export(..., "playwright")`` path on the same grid for comparison.
+
+Usage (from repo root, no API key or database needed):
+  python scripts/benchmark_calendar_images.py
+  python scripts/benchmark_calendar_images.py --aos 60 --runs 20
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from io import BytesIO
+from typing import List, Tuple
+
+from scripts.calendar_images import cell_colors, render_calendar_image, save_calendar_image
+
+COLOR_DICTS = {
+    "region": {"Ruck": "Purple"},
+    "nation_not_black": {"Convergence": "Red"},
+    "nation_black": {"Sandbag": "Black"},
+    "generic": {"OPEN!": "Green", "CLOSED": "Closed"},
+}
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def synthetic_week(aos: int) -> Tuple[List[str], List[List[str]]]:
+    columns = ["AO\nLocation"] + [f"{day}\n2025/01/{6 + i:02d}" for i, day in enumerate(DAYS)]
+    labels = ["", "OPEN!\nBC 0530", "Slaw\nBC 0530", "Hoss\nConvergence\n0530", "CLOSED", "Slaw\nRuck\n0600"]
+    rows = [[f"The AO {a}\nPark {a}"] + [labels[(a * 7 + d) % len(labels)] for d in range(7)] for a in range(aos)]
+    rows.append(["Last updated at 01/06 05:00 AM CST"] + [""] * 7)
+    return columns, rows
+
+
+def render_pillow(columns: List[str], rows: List[List[str]]) -> int:
+    out = BytesIO()
+    save_calendar_image(render_calendar_image(columns, rows, COLOR_DICTS), out)
+    return len(out.getvalue())
+
+
+def render_playwright(columns: List[str], rows: List[List[str]]):
+    import dataframe_image as dfi
+    import pandas as pd
+
+    styled = (
+        pd.DataFrame(rows, columns=columns)
+        .style.map(lambda cell: f"background-color: {cell_colors(cell, COLOR_DICTS)[0]}")
+        .hide(axis="index")
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        dfi.export(styled, os.path.join(tmp, "calendar.png"), table_conversion="playwright")
+
+
+def _time(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark the Pillow Q sheet renderer")
+    parser.add_argument("--aos", type=int, help="AO rows in the synthetic week", default=25)
+    parser.add_argument("--runs", type=int, help="Renders per variant", default=10)
+    args = parser.parse_args()
+
+    columns, rows = synthetic_week(args.aos)
+    render_pillow(columns, rows)  # load the font once
+    pillow_s = _time(lambda: render_pillow(columns, rows), args.runs)
+    print(f"pillow:     {pillow_s * 1e3:8.1f} ms/image ({render_pillow(columns, rows) / 1024:.0f} KiB PNG)")
+
+    if all(importlib.util.find_spec(m) for m in ("pandas", "dataframe_image", "playwright")):
+        old_s = _time(lambda: render_playwright(columns, rows), max(1, args.runs // 5))
+        print(f"playwright: {old_s * 1e3:8.1f} ms/image ({old_s / pillow_s:.1f}x slower)")
+    else:
+        print("playwright: skipped (pandas, dataframe_image or playwright not installed)")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
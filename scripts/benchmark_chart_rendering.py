@@ -0,0 +1,78 @@
+"""Benchmark for the monthly reporting render stage (``scripts/monthly_reporting.ChartPipeline``).
+
+Builds ``--orgs`` synthetic orgs with two years of monthly summaries and renders one ``create_org_monthly_summary``
+chart per org, first inline and then on ``--workers`` processes. Nothing is uploaded; rendered files are deleted as
+the upload stage receives them. Reports charts per second for each worker count.
+
+Usage (from repo root, no API key or database needed; needs matplotlib and mplcyberpunk):
+  python scripts/benchmark_chart_rendering.py
+  python scripts/benchmark_chart_rendering.py --orgs 64 --workers 1 4 8
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import random
+from datetime import datetime
+from typing import List
+
+from scripts.monthly_reporting import ChartPipeline, OrgMonthlySummary, ReportMessage
+from utilities.database.orm import SlackSettings
+
+
+def synthetic_summaries(org_id: int, seed: int = 5) -> List[OrgMonthlySummary]:
+    rng = random.Random(seed + org_id)
+    now = datetime.now()
+    records = []
+    for year in (now.year - 2, now.year - 1, now.year):
+        for month in range(1, 13):
+            if (year, month) >= (now.year, now.month):
+                break
+            events = rng.randint(8, 40)
+            records.append(
+                OrgMonthlySummary(
+                    org_id=org_id,
+                    month=datetime(year, month, 1),
+                    event_count=events,
+                    total_posts=events * rng.randint(5, 15),
+                    total_fngs=rng.randint(0, 6),
+                    unique_pax_count=rng.randint(20, 90),
+                )
+            )
+    return records
+
+
+def discard(paths: List[str], settings: SlackSettings, text: str, channel: str):
+    for path in paths:
+        os.remove(path)
+
+
+def run(orgs: int, workers: int) -> float:
+    settings = SlackSettings(team_id="T-bench")
+    with ChartPipeline(workers=workers, upload=discard) as pipeline:
+        for org_id in range(orgs):
+            pipeline.submit(ReportMessage(settings, "", f"C{org_id}", [("summary", synthetic_summaries(org_id))]))
+    return pipeline.charts_per_second
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark monthly summary chart rendering per worker count")
+    parser.add_argument("--orgs", type=int, help="Orgs to render one monthly summary chart for", default=24)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", help="Worker counts to compare", default=sorted({1, os.cpu_count() or 1})
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'workers':>8} {'charts/s':>9} {'speedup':>8}")
+    for workers in args.workers:
+        rate = run(args.orgs, workers)
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>9.2f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,249 @@
+"""Benchmark for the calendar home schedule query.
+
+Compares the old aggregate-first query (attendance aggregated for every matching event, then filtered and
+limited) with the limit-first keyset query in ``home_schedule_statement``, for the default, open-Q and
+my-events views, then walks pages with the keyset cursor to show later pages cost the same as the first.
+
+Usage (from repo root, against the local docker-compose Postgres):
+  python scripts/benchmark_home_schedule.py --seed-events 20000
+  python scripts/benchmark_home_schedule.py --region-org-id 123 --user-id 456
+
+``--seed-events`` creates a synthetic region (AOs, users, event instances and attendance) inside the
+benchmark's transaction and rolls it back at the end, so nothing is left behind.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+from f3_data_models.models import (
+    Attendance,
+    Attendance_x_AttendanceType,
+    Event,
+    Event_Category,
+    EventInstance,
+    EventType,
+    EventType_x_EventInstance,
+    Org,
+    Org_Type,
+    User,
+)
+from f3_data_models.utils import get_session
+from sqlalchemy import and_, case, event, func, or_, select
+from sqlalchemy.orm import Session
+
+from utilities.database.special_queries import Q_ATTENDANCE_TYPE_IDS, home_schedule_statement
+
+PAGE_SIZE = 100
+
+
+def legacy_statement(user_id: int, filters: list, limit: int, open_q_only: bool, only_users_events: bool):
+    """The previous open-Q / my-events path: aggregate first, filter on the aggregate, then limit."""
+    subquery = (
+        select(
+            Attendance.event_instance_id,
+            func.string_agg(
+                case(
+                    (
+                        and_(
+                            Attendance.is_planned,
+                            Attendance_x_AttendanceType.attendance_type_id.in_(Q_ATTENDANCE_TYPE_IDS),
+                        ),
+                        User.f3_name,
+                    ),
+                    else_=None,
+                ),
+                ",",
+            ).label("planned_qs"),
+            func.max(case((Attendance.user_id == user_id, 1), else_=0)).label("user_attending"),
+        )
+        .select_from(Attendance)
+        .join(User, User.id == Attendance.user_id)
+        .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
+        .join(EventInstance, EventInstance.id == Attendance.event_instance_id)
+        .join(Org, Org.id == EventInstance.org_id)
+        .filter(*filters)
+        .group_by(Attendance.event_instance_id)
+        .alias()
+    )
+    final_filters = list(filters)
+    if open_q_only:
+        final_filters.append(subquery.c.planned_qs.is_(None))
+    if only_users_events:
+        final_filters.append(subquery.c.user_attending == 1)
+    return (
+        select(EventInstance, Org, EventType, subquery.c.planned_qs, subquery.c.user_attending, Event)
+        .join(Org, Org.id == EventInstance.org_id)
+        .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
+        .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
+        .outerjoin(subquery, subquery.c.event_instance_id == EventInstance.id)
+        .outerjoin(Event, Event.id == EventInstance.series_id)
+        .filter(*final_filters)
+        .order_by(EventInstance.start_date, EventInstance.id, Org.name, EventInstance.start_time)
+        .limit(limit)
+    )
+
+
+def seed_region(session: Session, n_events: int, n_aos: int = 25, n_users: int = 500) -> Tuple[int, int]:
+    """Adds a synthetic region to the session (uncommitted). Returns (region_org_id, user_id)."""
+    rng = random.Random(42)
+    region = Org(org_type=Org_Type.region, name="Benchmark Region", is_active=True)
+    session.add(region)
+    session.flush()
+    aos = [
+        Org(org_type=Org_Type.ao, name=f"Benchmark AO {i}", parent_id=region.id, is_active=True) for i in range(n_aos)
+    ]
+    users = [User(email=f"home-benchmark-{i}@example.com", f3_name=f"Bench {i}") for i in range(n_users)]
+    event_type = EventType(name="Benchmark Bootcamp", event_category=Event_Category.first_f)
+    session.add_all([*aos, *users, event_type])
+    session.flush()
+
+    start = date.today()
+    instances = [
+        EventInstance(
+            org_id=rng.choice(aos).id,
+            start_date=start + timedelta(days=i * 365 // n_events),
+            start_time="0530",
+            name="Bootcamp",
+            is_active=True,
+        )
+        for i in range(n_events)
+    ]
+    session.add_all(instances)
+    session.flush()
+    session.add_all(EventType_x_EventInstance(event_instance_id=ei.id, event_type_id=event_type.id) for ei in instances)
+
+    attendance = []
+    for ei in instances:
+        if rng.random() < 0.6:  # 40% of events have an open Q
+            attendance.append(
+                Attendance(
+                    event_instance_id=ei.id,
+                    user_id=rng.choice(users).id,
+                    is_planned=True,
+                    attendance_x_attendance_types=[Attendance_x_AttendanceType(attendance_type_id=2)],
+                )
+            )
+        for pax in rng.sample(users, rng.randint(0, 8)):
+            attendance.append(
+                Attendance(
+                    event_instance_id=ei.id,
+                    user_id=pax.id,
+                    is_planned=True,
+                    attendance_x_attendance_types=[Attendance_x_AttendanceType(attendance_type_id=1)],
+                )
+            )
+    session.add_all(attendance)
+    session.flush()
+    print(f"Seeded region {region.id}: {n_events} events, {len(attendance)} attendance rows")
+    return region.id, users[0].id
+
+
+def measure(session: Session, build: Callable[[], object], runs: int) -> Tuple[int, List[float], list]:
+    """Runs the statement ``runs`` times. Returns (queries per run, latencies in ms, last result)."""
+    queries = 0
+
+    def count_query(*_args):
+        nonlocal queries
+        queries += 1
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", count_query)
+    latencies, rows = [], []
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            rows = session.execute(build()).all()
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_query)
+    return queries // runs, latencies, rows
+
+
+def _summary(label: str, queries: int, latencies: List[float], rows: list) -> str:
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    events = len({r[0].id for r in rows})
+    return (
+        f"  {label:<12} {queries} query/run  p50 {statistics.median(latencies):8.1f} ms  "
+        f"p95 {p95:8.1f} ms  {events} events"
+    )
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark the calendar home schedule query")
+    parser.add_argument("--region-org-id", type=int, help="Existing region to benchmark", default=None)
+    parser.add_argument("--user-id", type=int, help="Viewer for the my-events variant", default=None)
+    parser.add_argument("--seed-events", type=int, help="Seed a synthetic region with this many events", default=0)
+    parser.add_argument("--runs", type=int, help="Runs per variant", default=20)
+    parser.add_argument("--pages", type=int, help="Pages to walk with the keyset cursor", default=5)
+    args = parser.parse_args()
+
+    session = get_session()
+    try:
+        if args.seed_events:
+            region_org_id, user_id = seed_region(session, args.seed_events)
+        elif args.region_org_id and args.user_id:
+            region_org_id, user_id = args.region_org_id, args.user_id
+        else:
+            parser.error("pass --seed-events, or both --region-org-id and --user-id")
+
+        filters = [
+            EventInstance.start_date >= date.today(),
+            EventInstance.is_active,
+            or_(EventInstance.org_id == region_org_id, Org.parent_id == region_org_id),
+        ]
+        for label, open_q_only, only_users_events in (
+            ("Default", False, False),
+            ("Open Q", True, False),
+            ("My events", False, True),
+        ):
+            print(f"{label}:")
+            print(
+                _summary(
+                    "aggregate",
+                    *measure(
+                        session,
+                        lambda o=open_q_only, m=only_users_events: legacy_statement(user_id, filters, PAGE_SIZE, o, m),
+                        args.runs,
+                    ),
+                )
+            )
+            print(
+                _summary(
+                    "limit-first",
+                    *measure(
+                        session,
+                        lambda o=open_q_only, m=only_users_events: home_schedule_statement(
+                            user_id, filters, PAGE_SIZE, o, m
+                        ),
+                        args.runs,
+                    ),
+                )
+            )
+
+        print("Keyset pages (default view):")
+        after = None
+        for page in range(1, args.pages + 1):
+            queries, latencies, rows = measure(
+                session, lambda a=after: home_schedule_statement(user_id, filters, PAGE_SIZE, after=a), args.runs
+            )
+            print(_summary(f"page {page}", queries, latencies, rows))
+            if not rows:
+                break
+            last = rows[-1][0]
+            after = (last.start_date, last.id)
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark for ``features/calendar/nearby_events.get_nearby_special_events`` on a synthetic nation.
+
+Builds ``--locations`` geolocated AO locations spread over the continental US, each with a highlighted event, and
+compares the old path (every highlighted event comes back from the DB and is run through ``haversine_miles``) with
+the bounding-box path (only events inside ``bounding_box`` come back, as the SQL filter does). Both must return the
+same events with the same distances; the rows column is what the DB has to send and the ORM has to hydrate.
+
+Usage (from repo root, no API key or database needed):
+  python scripts/benchmark_nearby_events.py
+  python scripts/benchmark_nearby_events.py --locations 20000 --runs 200
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import random
+import timeit
+from typing import List, Tuple
+
+from features.calendar.nearby_events import DISTANCE_VALUES, bounding_box, haversine_miles
+
+# (event_id, region_org_id, latitude, longitude)
+Event = Tuple[int, int, float, float]
+
+
+def synthetic_nation(locations: int, seed: int = 3) -> List[Event]:
+    rng = random.Random(seed)
+    return [(i, i // 10, rng.uniform(25.0, 49.0), rng.uniform(-124.0, -67.0)) for i in range(locations)]
+
+
+def in_range(events: List[Event], region_id: int, lat: float, lon: float, miles: float) -> List[Tuple[int, float]]:
+    """The Python half of get_nearby_special_events: other regions' events within ``miles``."""
+    rows = []
+    for event_id, parent_id, event_lat, event_lon in events:
+        if parent_id == region_id:
+            continue
+        dist = haversine_miles(lat, lon, event_lat, event_lon)
+        if dist <= miles:
+            rows.append((event_id, dist))
+    return rows
+
+
+def box_query(events: List[Event], lat: float, lon: float, miles: float) -> List[Event]:
+    """What ``highlighted_events_in_box`` returns from the DB."""
+    (min_lat, max_lat), lon_range = bounding_box(lat, lon, miles)
+    return [
+        e for e in events if min_lat <= e[2] <= max_lat and (lon_range is None or lon_range[0] <= e[3] <= lon_range[1])
+    ]
+
+
+def _time(func, runs: int) -> float:
+    return timeit.timeit(func, number=runs) / runs
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark nearby special events: full scan vs bounding box")
+    parser.add_argument("--locations", type=int, help="Geolocated locations (one event each)", default=10000)
+    parser.add_argument("--runs", type=int, help="Searches per distance and variant", default=100)
+    args = parser.parse_args()
+
+    events = synthetic_nation(args.locations)
+    region_id, lat, lon = events[0][1], events[0][2], events[0][3]
+
+    print(f"{'miles':>6} {'rows old':>9} {'rows box':>9} {'old':>10} {'box':>10} {'speedup':>8}")
+    for miles in map(float, DISTANCE_VALUES):
+        old = in_range(events, region_id, lat, lon, miles)
+        boxed = box_query(events, lat, lon, miles)
+        assert in_range(boxed, region_id, lat, lon, miles) == old, f"{miles} miles: bounding box changed the results"
+
+        old_us = _time(lambda m=miles: in_range(events, region_id, lat, lon, m), args.runs)
+        box_us = _time(lambda m=miles: in_range(box_query(events, lat, lon, m), region_id, lat, lon, m), args.runs)
+        print(
+            f"{miles:>6.0f} {len(events):>9} {len(boxed):>9} {old_us * 1e3:>7.2f} ms {box_us * 1e3:>7.2f} ms "
+            f"{old_us / box_us:>7.1f}x"
+        )
+    print("box timings include the in-memory box filter, which runs in SQL in the app")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
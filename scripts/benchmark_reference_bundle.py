@@ -0,0 +1,123 @@
+"""Benchmark for loading a region's reference data bundle through the F3 API client.
+
+Starts a local stub of the F3 Nation API that answers the AO, location, event type and event tag list
+endpoints after an injected delay, then times ``RegionReferenceService.load_bundle`` with the four reads
+made one after another versus as one ``F3ApiClient.gather`` request group.
+
+Usage (from repo root, no API key or database needed):
+  python scripts/benchmark_reference_bundle.py
+  python scripts/benchmark_reference_bundle.py --latency-ms 250 --runs 10
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import urlparse
+
+from application.ao.service import AoService
+from application.event_tag.service import EventTagService
+from application.event_type.service import EventTypeService
+from application.location.service import LocationService
+from application.reference_data.cache import RegionReferenceCache
+from application.reference_data.service import RegionReferenceService
+from infrastructure.api_client import (
+    ApiAoRepository,
+    ApiEventTagRepository,
+    ApiEventTypeRepository,
+    ApiLocationRepository,
+    F3ApiClient,
+)
+
+REGION_ORG_ID = 1
+
+STUB_RESPONSES = {
+    "/v1/org": {"orgs": [{"id": 100 + i, "name": f"AO {i}", "parentId": REGION_ORG_ID} for i in range(20)]},
+    "/v1/location": {
+        "locations": [{"id": 200 + i, "locationName": f"Location {i}", "orgId": 100 + i} for i in range(20)]
+    },
+    "/v1/event-type": {"eventTypes": [{"id": 1, "name": "Bootcamp"}, {"id": 2, "name": "Ruck"}]},
+    "/v1/event-tag": {"eventTags": [{"id": 1, "name": "Open", "color": "Green"}]},
+}
+
+
+def start_stub_server(latency_ms: float) -> ThreadingHTTPServer:
+    """Serves STUB_RESPONSES on a free local port, sleeping ``latency_ms`` before each response."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused like the real API
+
+        def do_GET(self):
+            time.sleep(latency_ms / 1000)
+            payload = json.dumps(STUB_RESPONSES.get(urlparse(self.path).path, {})).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def build_service(client: F3ApiClient, concurrent: bool) -> RegionReferenceService:
+    return RegionReferenceService(
+        ao_service=AoService(repository=ApiAoRepository(client)),
+        location_service=LocationService(repository=ApiLocationRepository(client)),
+        event_type_service=EventTypeService(repository=ApiEventTypeRepository(client)),
+        event_tag_service=EventTagService(repository=ApiEventTagRepository(client)),
+        cache=RegionReferenceCache(),
+        gather=client.gather if concurrent else None,
+    )
+
+
+def measure(service: RegionReferenceService, runs: int) -> List[float]:
+    service.load_bundle(REGION_ORG_ID)  # warm the connection pool
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        service.load_bundle(REGION_ORG_ID)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _summary(label: str, latencies: List[float]) -> str:
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    return f"  {label:<12} p50 {statistics.median(latencies):8.1f} ms  p95 {p95:8.1f} ms"
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Benchmark serial vs concurrent reference data loading")
+    parser.add_argument("--latency-ms", type=float, help="Delay the stub adds to every response", default=150)
+    parser.add_argument("--runs", type=int, help="Bundle loads per variant", default=20)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency_ms)
+    os.environ["F3_API_KEY"] = "benchmark"
+    os.environ["F3_API_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    try:
+        client = F3ApiClient()
+        print(f"Region reference bundle, 4 requests, {args.latency_ms:.0f} ms injected latency:")
+        serial = measure(build_service(client, concurrent=False), args.runs)
+        print(_summary("serial", serial))
+        concurrent = measure(build_service(client, concurrent=True), args.runs)
+        print(_summary("gather", concurrent))
+        print(f"  speedup      {statistics.median(serial) / statistics.median(concurrent):.1f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,86 @@
+"""Startup benchmark: how long the app's module-level imports take on a cold interpreter.
+
+Runs ``python -X importtime`` in a fresh subprocess over the top-level imports of ``main.py`` (the part of a
+Cloud Functions cold start that happens before Slack's 3-second ack window starts counting down), then prints the
+total and the slowest modules. Constructing the Bolt ``App`` is left out because it calls the Slack API.
+
+Usage (from repo root, no API key or database needed):
+  python scripts/benchmark_startup.py
+  python scripts/benchmark_startup.py --top 30 --runs 5
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import argparse
+import ast
+import re
+import statistics
+import subprocess
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def main_imports(path: str = os.path.join(REPO_ROOT, "main.py")) -> str:
+    """The top-level import statements of ``main.py`` as one source string."""
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def profile_imports(source: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Runs ``source`` under ``-X importtime`` in a fresh interpreter.
+
+    Returns the wall time of the top-level imports in ms and ``{module: (self_us, cumulative_us)}`` for every module
+    that was loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", source],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = int(match[1]), int(match[2]), match[3], match[4]
+        modules[module] = (self_us, cumulative_us)
+        if len(indent) == 1:  # a module imported directly by ``source``
+            total_us += cumulative_us
+    return total_us / 1000, modules
+
+
+def _slowest(modules: Dict[str, Tuple[int, int]], top: int) -> List[Tuple[str, int]]:
+    return sorted(((m, self_us) for m, (self_us, _) in modules.items()), key=lambda x: x[1], reverse=True)[:top]
+
+
+def main():  # pragma: no cover - CLI
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of main.py")
+    parser.add_argument("--top", type=int, help="Slowest modules to list (by self time)", default=15)
+    parser.add_argument("--runs", type=int, help="Fresh interpreters to measure", default=3)
+    args = parser.parse_args()
+
+    source = main_imports()
+    totals = []
+    for _ in range(args.runs):
+        total_ms, modules = profile_imports(source)
+        totals.append(total_ms)
+
+    app_modules = sorted(m for m in modules if m.split(".")[0] in ("features", "scripts"))
+    print(f"main.py imports: median {statistics.median(totals):.0f} ms over {args.runs} runs, {len(modules)} modules")
+    print(f"feature/script modules loaded at startup: {', '.join(app_modules) or 'none'}")
+    print(f"slowest {args.top} modules by self time:")
+    for module, self_us in _slowest(modules, args.top):
+        print(f"  {self_us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
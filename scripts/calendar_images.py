@@ -1,6 +1,6 @@
 import os
 import sys
-from typing import List
+from typing import List, Tuple
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -25,9 +25,8 @@ from f3_data_models.models import (
     SlackSpace,
     User,
 )
-
-# import dataframe_image as dfi
 from f3_data_models.utils import DbManager, get_session
+from PIL import Image, ImageDraw, ImageFont
 from slack_sdk import WebClient
 from slack_sdk.models import blocks
 from sqlalchemy import and_, func, or_, select
@@ -44,73 +43,111 @@ def time_int_to_str(time: int) -> str:
     return f"{time // 100:02d}{time % 100:02d}"
 
 
-def highlight_cells(s, color_dicts):
+# Calendar grid styling: 15px centred text, 1px #F0FFFF borders, bold header row on black
+CELL_FONT_PX = 15
+CELL_PADDING_PX = (6, 4)  # horizontal, vertical
+CELL_LINE_HEIGHT = 1.3
+BORDER_COLOR = "#F0FFFF"
+DEFAULT_CELL_COLORS = ("#000000", "#F0FFFF")  # background, text
+IMAGE_SCALE = 2  # render at 2x so the text stays sharp when Slack scales the image down
+
+_fonts: dict = {}
+
+
+def cell_colors(cell: str, color_dicts: dict) -> Tuple[str, str]:
+    """Background and text colour for a calendar cell: the first line naming a tag (or OPEN!/CLOSED) picks them.
+
+    Lines are checked top to bottom and the first tagged one decides, whatever its scope. Only when one line matches
+    several scopes does region beat national, and national black comes last among the tags.
+    """
+    for tag in str(cell).split("\n"):
+        for scope in ("region", "nation_not_black", "nation_black", "generic"):
+            if tag in color_dicts[scope]:
+                return EVENT_TAG_COLORS[color_dicts[scope][tag]]
+    return DEFAULT_CELL_COLORS
+
+
+def _font(px: int) -> ImageFont.ImageFont:
+    # Pillow's bundled font, so the output does not depend on the fonts installed on the host
+    if px not in _fonts:
+        _fonts[px] = ImageFont.load_default(size=px)
+    return _fonts[px]
+
+
+def _text_mask(
+    font: ImageFont.FreeTypeFont, line: str, stroke: int, cache: dict
+) -> Tuple[Tuple[int, int], Image.Image]:
+    """Coverage mask for one line centred on (0, 0), and its offset; AO names, times and OPEN! repeat a lot."""
+    key = (line, stroke)
+    if key not in cache:
+        left, top, right, bottom = font.getbbox(line, anchor="mm", stroke_width=stroke)
+        mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+        ImageDraw.Draw(mask).text((-left, -top), line, font=font, fill=255, anchor="mm", stroke_width=stroke)
+        cache[key] = ((left, top), mask)
+    return cache[key]
+
+
+def render_calendar_image(columns: List[str], rows: List[List[str]], color_dicts: dict) -> Image.Image:
+    """Draws the Q sheet grid: one header row of ``columns`` then ``rows``, each cell coloured by ``cell_colors``.
+
+    Columns are as wide as their longest line and rows as tall as their tallest cell; output is deterministic.
+    """
+    font = _font(CELL_FONT_PX * IMAGE_SCALE)
+    pad_x, pad_y = (p * IMAGE_SCALE for p in CELL_PADDING_PX)
+    line_h = round(CELL_FONT_PX * CELL_LINE_HEIGHT * IMAGE_SCALE)
+    border = IMAGE_SCALE
+    header_stroke = max(1, IMAGE_SCALE // 2)  # faux bold, the bundled font has no bold face
+
+    grid = [[str(c) for c in columns]] + [["" if c is None else str(c) for c in row] for row in rows]
+    lines = [[cell.split("\n") for cell in row] for row in grid]
+    col_w = [
+        max(font.getlength(line) for row in lines for line in row[i]) + 2 * (pad_x + header_stroke)
+        for i in range(len(columns))
+    ]
+    col_w = [int(round(w)) for w in col_w]
+    row_h = [max(len(cell) for cell in row) * line_h + 2 * pad_y for row in lines]
+
+    width = sum(col_w) + border * (len(col_w) + 1)
+    height = sum(row_h) + border * (len(row_h) + 1)
+    image = Image.new("RGB", (width, height), BORDER_COLOR)
+    draw = ImageDraw.Draw(image)
+    masks: dict = {}
+
+    y = border
+    for r, row in enumerate(lines):
+        x = border
+        for c, cell_lines in enumerate(row):
+            if r == 0:
+                background, text_color = DEFAULT_CELL_COLORS
+            else:
+                background, text_color = cell_colors(grid[r][c], color_dicts)
+            draw.rectangle((x, y, x + col_w[c] - 1, y + row_h[r] - 1), fill=background)
+            text_top = y + (row_h[r] - len(cell_lines) * line_h) // 2
+            for i, line in enumerate(cell_lines):
+                if not line:
+                    continue
+                (left, top), mask = _text_mask(font, line, header_stroke if r == 0 else 0, masks)
+                image.paste(text_color, (x + col_w[c] // 2 + left, text_top + i * line_h + line_h // 2 + top), mask)
+            x += col_w[c] + border
+        y += row_h[r] + border
+    return image
+
+
+def save_calendar_image(image: Image.Image, path) -> None:
+    """Writes the grid as a palette PNG: flat cell colours plus text anti-aliasing fit in 256 colours, and it
+    encodes in about half the time of RGB at a third of the size."""
+    image.quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(path, format="PNG")
+
+
+def generate_calendar_images(force: bool = False, region_org_id: int | None = None):
+    """Renders and posts the Q sheets for every region, or only ``region_org_id`` (the hourly runner's per-region
+    tasks)."""
     import pandas as pd
 
-    highlight_cells_list = []
-    for cell in s:
-        cell_str = str(cell)
-        tags = cell_str.split("\n")
-        found = False
-        if tags:
-            for tag in tags:
-                if tag in color_dicts["region"].keys():
-                    highlight_cells_list.append(f"background-color: {EVENT_TAG_COLORS[color_dicts['region'][tag]][0]}")
-                    found = True
-                    break
-                elif tag in color_dicts["nation_not_black"].keys():
-                    highlight_cells_list.append(
-                        f"background-color: {EVENT_TAG_COLORS[color_dicts['nation_not_black'][tag]][0]}"
-                    )
-                    found = True
-                    break
-                elif tag in color_dicts["nation_black"].keys():
-                    highlight_cells_list.append(
-                        f"background-color: {EVENT_TAG_COLORS[color_dicts['nation_black'][tag]][0]}"
-                    )
-                    found = True
-                    break
-                elif tag in color_dicts["generic"].keys():
-                    highlight_cells_list.append(f"background-color: {EVENT_TAG_COLORS[color_dicts['generic'][tag]][0]}")
-                    found = True
-                    break
-        if not found:
-            highlight_cells_list.append("background-color: #000000")
-    return pd.Series(highlight_cells_list)
-
-
-def set_text_color(s, color_dicts):
-    text_color_list = []
-    for cell in s:
-        cell_str = str(cell)
-        tags = cell_str.split("\n")
-        found = False
-        if tags:
-            for tag in tags:
-                if tag in color_dicts["region"].keys():
-                    text_color_list.append(f"color: {EVENT_TAG_COLORS[color_dicts['region'][tag]][1]}")
-                    found = True
-                    break
-                elif tag in color_dicts["nation_not_black"].keys():
-                    text_color_list.append(f"color: {EVENT_TAG_COLORS[color_dicts['nation_not_black'][tag]][1]}")
-                    found = True
-                    break
-                elif tag in color_dicts["nation_black"].keys():
-                    text_color_list.append(f"color: {EVENT_TAG_COLORS[color_dicts['nation_black'][tag]][1]}")
-                    found = True
-                    break
-                elif tag in color_dicts["generic"].keys():
-                    text_color_list.append(f"color: {EVENT_TAG_COLORS[color_dicts['generic'][tag]][1]}")
-                    found = True
-                    break
-        if not found:
-            text_color_list.append("color: #F0FFFF")
-    return text_color_list
-
-
-def generate_calendar_images(force: bool = False):
-    import dataframe_image as dfi
-    import pandas as pd
+    # Scoped runs only read their own region's AOs, events and tags
+    event_filters = []
+    if region_org_id is not None:
+        event_filters = [EventInstance.org_id.in_(select(Org.id).where(Org.parent_id == region_org_id))]
 
     with get_session() as session:
         tomorrow_day_of_week = (current_date_cst() + timedelta(days=1)).weekday()
@@ -134,6 +171,7 @@ def generate_calendar_images(force: bool = False):
                 Attendance_x_AttendanceType.attendance_type_id == 2,
                 EventInstance.start_date >= current_week_start,
                 EventInstance.start_date < next_week_end,
+                *event_filters,
             )
             .alias()
         )
@@ -150,6 +188,7 @@ def generate_calendar_images(force: bool = False):
                 Attendance_x_AttendanceType.attendance_type_id == 2,
                 EventInstance.start_date >= current_week_start,
                 EventInstance.start_date < next_week_end,
+                *event_filters,
             )
             .group_by(Attendance.event_instance_id)
             .alias()
@@ -199,22 +238,31 @@ def generate_calendar_images(force: bool = False):
                 (EventInstance.is_active),
                 # (EventInstance.series_id.is_not(None)),
                 or_(EventTag.name.is_(None), EventTag.name != "Off-The-Books"),
+                *event_filters,
             )
         )
 
         results = query.all()
         df_all = pd.DataFrame(results)
+        if df_all.empty:
+            print(f"No events to render for region {region_org_id}" if region_org_id else "No events to render")
+            return
 
-        event_tags = session.query(EventTag).all()
-
-        region_org_records = (
+        event_tags_query = session.query(EventTag)
+        region_query = (
             session.query(Org, Org_x_SlackSpace, SlackSpace)
             .select_from(Org)
             .join(Org_x_SlackSpace, Org.id == Org_x_SlackSpace.org_id)
             .join(SlackSpace, Org_x_SlackSpace.slack_space_id == SlackSpace.id)
             .filter(Org.org_type == Org_Type.region)
-            .all()
         )
+        if region_org_id is not None:
+            event_tags_query = event_tags_query.filter(
+                or_(EventTag.specific_org_id == region_org_id, EventTag.specific_org_id.is_(None))
+            )
+            region_query = region_query.filter(Org.id == region_org_id)
+        event_tags = event_tags_query.all()
+        region_org_records = region_query.all()
 
         for region_id in df_all["region_id"].unique():
             try:
@@ -386,51 +434,15 @@ def generate_calendar_images(force: bool = False):
                             footer_row[row_key_col] = timestamp_str
                             df2 = pd.concat([df2, pd.DataFrame([footer_row])], ignore_index=True)
 
-                            # Set CSS properties for th elements in dataframe
-                            th_props = [
-                                ("font-size", "15px"),
-                                ("text-align", "center"),
-                                ("font-weight", "bold"),
-                                ("color", "#F0FFFF"),
-                                ("background-color", "#000000"),
-                                ("white-space", "pre-wrap"),
-                                ("border", "1px solid #F0FFFF"),
-                            ]
-
-                            # Set CSS properties for td elements in dataframe
-                            td_props = [
-                                ("font-size", "15px"),
-                                ("text-align", "center"),
-                                ("white-space", "pre-wrap"),
-                                # ('background-color', '#000000'),
-                                # ("color", "#F0FFFF"),
-                                ("border", "1px solid #F0FFFF"),
-                            ]
-
-                            # Set table styles
-                            styles = [
-                                {"selector": "th", "props": th_props},
-                                {"selector": "td", "props": td_props},
-                            ]
-
-                            # set style and export png
-                            # df_styled = df2.style.set_table_styles(styles).apply(highlight_cells).hide_index()
-                            # apply styles, hide the index
-                            df_styled = (
-                                df2.style.set_table_styles(styles)
-                                .apply(highlight_cells, color_dicts=all_color_dicts)
-                                .hide(axis="index")
-                            )
-                            df_styled = df_styled.apply(set_text_color, color_dicts=all_color_dicts, axis=1)
-
                             # create calendar image
+                            image = render_calendar_image(list(df2.columns), df2.values.tolist(), all_color_dicts)
                             random_chars = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=10))
                             filename = f"{region_id}-{week}-{random_chars}.png"
                             filename_static = f"{region_id}-{week}.png"
                             if LOCAL_DEVELOPMENT:
-                                dfi.export(df_styled, filename, table_conversion="playwright")
+                                save_calendar_image(image, filename)
                             else:
-                                dfi.export(df_styled, f"/mnt/calendar-images/{filename}", table_conversion="playwright")
+                                save_calendar_image(image, f"/mnt/calendar-images/{filename}")
                                 if DB_SCHEMA == "f3_prod":
                                     shutil.copyfile(
                                         f"/mnt/calendar-images/{filename}", f"/mnt/calendar-images/{filename_static}"
@@ -532,14 +544,16 @@ def generate_calendar_images(force: bool = False):
                             print(f"Error posting to Slack channel: {e}")
                         # update org record with new filename
                     print(f"Updating Slack app settings for region {region_name} with {slack_app_settings}")
+                    # Bump updated so running app instances pick the new images up on their next refresh
                     session.query(SlackSpace).filter(SlackSpace.team_id == slack_app_settings["team_id"]).update(
-                        {"settings": slack_app_settings}
+                        {"settings": slack_app_settings, "updated": func.timezone("utc", func.now())}
                     )
                     session.commit()
 
             except Exception as e:
                 print(f"Error processing region {region_id}: {e}")
-    update_local_region_records()
+    if region_org_id is None:
+        update_local_region_records()
 
 
 def create_special_events_text(events: List[EventInstance], slack_settings_dict: dict, max_events: int = 10) -> str:
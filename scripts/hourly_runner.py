@@ -4,8 +4,13 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 import argparse
+import functools
+import time
+from typing import Callable, List, Tuple
 
 import requests
+from f3_data_models.models import Org_x_SlackSpace, SlackSpace
+from f3_data_models.utils import DbManager
 
 # from features import canvas
 from scripts import (
@@ -19,73 +24,115 @@ from scripts import (
     q_lineups,
     update_slack_users,
 )
+from scripts.task_scheduler import ScheduledTask, TaskScheduler, format_summary
 
 APP_URL = os.getenv("APP_URL", "http://localhost:8080")
-
-
-def run_all_hourly_scripts(force: bool = False, run_reporting: bool = True, reporting_org_id: int | None = None):
-    print("Running hourly scripts")
-
-    print("Running calendar images")
-    try:
-        calendar_images.generate_calendar_images(force=force)
-    except Exception as e:
-        print(f"Error generating calendar images: {e}")
-
-    print("Running backblast reminders")
-    try:
-        backblast_reminders.send_backblast_reminders()
-    except Exception as e:
-        print(f"Error sending backblast reminders: {e}")
-
-    print("Running preblast reminders")
-    try:
-        preblast_reminders.send_preblast_reminders()
-    except Exception as e:
-        print(f"Error sending preblast reminders: {e}")
-
-    print("Running automated preblast send")
-    try:
-        auto_preblast_send.send_automated_preblasts()
-    except Exception as e:
-        print(f"Error sending automated preblasts: {e}")
-
-    print("Running Q lineups")
-    try:
-        q_lineups.send_lineups(force=force)
-    except Exception as e:
-        print(f"Error sending Q lineups: {e}")
-
-    print("Updating Slack users")
+MAX_WORKERS = int(os.getenv("HOURLY_RUNNER_MAX_WORKERS", "8"))
+WORKSPACE_CONCURRENCY = int(os.getenv("HOURLY_RUNNER_WORKSPACE_CONCURRENCY", "2"))
+TASK_TIMEOUT_SECONDS = float(os.getenv("HOURLY_RUNNER_TASK_TIMEOUT_SECONDS", "1800"))
+
+
+def _region_workspaces() -> List[Tuple[int, str]]:
+    """(org id, Slack team id) for every org connected to a workspace, one workspace per org."""
+    records = DbManager.find_join_records2(SlackSpace, Org_x_SlackSpace, filters=[True])
+    return sorted({r[1].org_id: r[0].team_id for r in records if r[0].team_id}.items())
+
+
+def _per_region_tasks(
+    group: str, func: Callable[..., object], regions: List[Tuple[int, str]], **kwargs
+) -> List[ScheduledTask]:
+    """One ``group[<org id>]`` task per region, capped by its workspace; a single nation-wide task without regions."""
+    if not regions:
+        return [ScheduledTask(group, functools.partial(func, **kwargs))]
+    return [
+        ScheduledTask(
+            f"{group}[{org_id}]",
+            functools.partial(func, region_org_id=org_id, **kwargs),
+            group=group,
+            workspace=team_id,
+        )
+        for org_id, team_id in regions
+    ]
+
+
+def build_hourly_tasks(
+    force: bool = False, run_reporting: bool = True, reporting_org_id: int | None = None
+) -> List[ScheduledTask]:
+    """Models the hourly scripts as scheduler tasks.
+
+    Scripts that loop over regions (Q sheet images, backblast reminders, Q lineups) run as one task per region, and
+    Slack user sync as one task per workspace, so a slow region only holds up its own workspace's slots. Preblast
+    reminders, auto preblasts, home regions, nudges, reporting and achievements pull their data in a single
+    nation-wide pass and stay as one task each.
+    """
     try:
-        update_slack_users.update_slack_users()
+        regions = _region_workspaces()
     except Exception as e:
-        print(f"Error updating Slack users: {e}")
-
-    print("Updating home regions for users")
-    try:
-        update_slack_users.update_home_regions()
-    except Exception as e:
-        print(f"Error updating home regions for users: {e}")
-
-    print("Running home region nudge")
-    try:
-        home_region_nudge.send_home_region_nudges()
-    except Exception as e:
-        print(f"Error running home region nudge: {e}")
-
+        print(f"Error listing workspaces, running region scripts nation-wide: {e}")
+        regions = []
+
+    tasks = [
+        *_per_region_tasks("calendar_images", calendar_images.generate_calendar_images, regions, force=force),
+        *_per_region_tasks("backblast_reminders", backblast_reminders.send_backblast_reminders, regions),
+        ScheduledTask("preblast_reminders", preblast_reminders.send_preblast_reminders),
+        ScheduledTask("auto_preblasts", auto_preblast_send.send_automated_preblasts),
+        *_per_region_tasks("q_lineups", q_lineups.send_lineups, regions, force=force),
+    ]
+
+    team_ids = sorted({team_id for _, team_id in regions})
+    if team_ids:
+        for team_id in team_ids:
+            tasks.append(
+                ScheduledTask(
+                    f"slack_user_sync[{team_id}]",
+                    functools.partial(update_slack_users.update_slack_users, team_id=team_id),
+                    group="slack_user_sync",
+                    workspace=team_id,
+                )
+            )
+    else:
+        tasks.append(ScheduledTask("slack_user_sync", update_slack_users.update_slack_users))
+
+    tasks.extend(
+        [
+            ScheduledTask("home_regions", update_slack_users.update_home_regions, depends_on=["slack_user_sync"]),
+            ScheduledTask("home_region_nudge", home_region_nudge.send_home_region_nudges, depends_on=["home_regions"]),
+        ]
+    )
     if run_reporting:
-        print("Running monthly reporting")
-        try:
-            monthly_reporting.cycle_all_orgs(run_org_id=reporting_org_id)
-        except Exception as e:
-            print(f"Error running monthly reporting: {e}")
+        tasks.append(
+            ScheduledTask(
+                "monthly_reporting",
+                lambda: monthly_reporting.cycle_all_orgs(run_org_id=reporting_org_id),
+            )
+        )
+    tasks.append(ScheduledTask("achievements", award_achievements.main, depends_on=["slack_user_sync"]))
+    return tasks
+
+
+def run_all_hourly_scripts(
+    force: bool = False,
+    run_reporting: bool = True,
+    reporting_org_id: int | None = None,
+    max_workers: int = MAX_WORKERS,
+    workspace_concurrency: int = WORKSPACE_CONCURRENCY,
+):
+    print("Running hourly scripts")
+    start_time = time.monotonic()
+
+    scheduler = TaskScheduler(
+        max_workers=max_workers,
+        per_workspace_limit=workspace_concurrency,
+        default_timeout=TASK_TIMEOUT_SECONDS,
+    )
+    for task in build_hourly_tasks(force=force, run_reporting=run_reporting, reporting_org_id=reporting_org_id):
+        scheduler.add(task)
 
-    print("Running achievements update")
     try:
-        award_achievements.main()
+        results = scheduler.run()
+        print(format_summary(results, time.monotonic() - start_time))
     except Exception as e:
-        print(f"Error awarding achievements: {e}")
+        print(f"Error running hourly task scheduler: {e}")
 
     print("Notifying completion endpoint to update settings cache")
     try:
@@ -101,10 +148,14 @@ if __name__ == "__main__":
     parser.add_argument("--force", action="store_true")
     parser.add_argument("--skip-reporting", action="store_true")
     parser.add_argument("--reporting-org-id", type=int, default=None)
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--workspace-concurrency", type=int, default=WORKSPACE_CONCURRENCY)
     args = parser.parse_args()
 
     run_all_hourly_scripts(
         force=args.force,
         run_reporting=not args.skip_reporting,
         reporting_org_id=args.reporting_org_id,
+        max_workers=args.max_workers,
+        workspace_concurrency=args.workspace_concurrency,
     )
@@ -1,12 +1,16 @@
 import os
 import ssl
 import sys
+import tempfile
+import time
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pytz
 from f3_data_models.models import (
@@ -19,7 +23,7 @@ from f3_data_models.models import (
 from f3_data_models.utils import DbManager, get_session
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
-from sqlalchemy import and_, func, literal, select, union_all
+from sqlalchemy import and_, func, literal, literal_column, select, union_all
 
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import safe_get
@@ -55,6 +59,9 @@ DEFAULT_IMAGE_WIDTH = 800
 DEFAULT_IMAGE_HEIGHT = 800
 DEFAULT_IMAGE_SCALE = 3
 
+# Processes rendering charts during the nationwide run; 1 renders inline
+RENDER_WORKERS = int(os.getenv("MONTHLY_REPORT_RENDER_WORKERS", str(os.cpu_count() or 1)))
+
 
 def upload_files_to_slack(file_paths: List[str], settings: SlackSettings, text: str, channel: str):
     if not settings.bot_token or not file_paths or not channel:
@@ -71,7 +78,7 @@ def upload_files_to_slack(file_paths: List[str], settings: SlackSettings, text:
         with open(fp, "rb") as f:
             file_bytes = f.read()
         file = {
-            "filename": fp,
+            "filename": os.path.basename(fp),
             "file": file_bytes,
         }
         file_list.append(file)
@@ -96,9 +103,129 @@ def upload_files_to_slack(file_paths: List[str], settings: SlackSettings, text:
             print(f"Error uploading file to Slack: {e.response['error']}")
 
 
+def _temp_png(prefix: str) -> str:
+    """A unique path for a rendered chart, so concurrent renders never overwrite each other."""
+    fd, path = tempfile.mkstemp(prefix=f"{prefix}-", suffix=".png")
+    os.close(fd)
+    return path
+
+
+def upload_and_remove(file_paths: List[str], settings: SlackSettings, text: str, channel: str):
+    try:
+        upload_files_to_slack(file_paths, settings, text=text, channel=channel)
+    finally:
+        for fp in file_paths:
+            try:
+                os.remove(fp)
+            except OSError:
+                pass
+
+
+def render_chart(kind: str, records: list) -> Optional[str]:
+    """Renders one chart to a temp file (run in a worker process by ``ChartPipeline``)."""
+    if kind == "leaders":
+        return create_post_leaders_plot(records)
+    return create_org_monthly_summary(records)
+
+
+@dataclass
+class ReportMessage:
+    settings: SlackSettings
+    text: str
+    channel: str
+    charts: List[Tuple[str, list]]  # ("leaders" | "summary", records)
+
+
+class ChartPipeline:
+    """Renders report charts on a process pool and uploads each message once all of its charts are finished.
+
+    Matplotlib rendering is CPU-bound, so charts for different orgs render in parallel while finished messages are
+    uploaded from this process. At most ``max_pending`` messages are in flight, which keeps the region stream lazy.
+    """
+
+    def __init__(
+        self,
+        workers: int = RENDER_WORKERS,
+        max_pending: Optional[int] = None,
+        render: Callable[[str, list], Optional[str]] = render_chart,
+        upload: Callable[..., None] = upload_and_remove,
+    ):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending or self.workers * 4
+        self.render = render  # must be a module-level function so the worker processes can unpickle it
+        self.upload = upload
+        self.charts = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[ReportMessage, List[Future]]] = []
+        self._started = time.perf_counter()
+
+    def __enter__(self):
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def charts_per_second(self) -> float:
+        elapsed = time.perf_counter() - self._started
+        return self.charts / elapsed if elapsed else 0.0
+
+    def submit(self, message: ReportMessage):
+        futures = [self._render(kind, records) for kind, records in message.charts]
+        self._pending.append((message, futures))
+        self._upload_finished(block=len(self._pending) >= self.max_pending)
+
+    def close(self):
+        while self._pending:
+            self._upload_finished(block=True)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        print(f"Rendered {self.charts} charts with {self.workers} workers ({self.charts_per_second:.2f} charts/s)")
+
+    def _render(self, kind: str, records: list) -> Future:
+        if self._executor is not None:
+            return self._executor.submit(self.render, kind, records)
+        future = Future()
+        try:
+            future.set_result(self.render(kind, records))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _upload_finished(self, block: bool):
+        if block:
+            wait(self._pending[0][1])
+        still_pending = []
+        for message, futures in self._pending:
+            if not all(f.done() for f in futures):
+                still_pending.append((message, futures))
+                continue
+            paths = []
+            for f in futures:
+                try:
+                    path = f.result()
+                except Exception as e:
+                    print(f"Error rendering chart for {message.channel}: {e}")
+                    continue
+                if path:
+                    paths.append(path)
+            self.charts += len(paths)
+            try:
+                self.upload(paths, message.settings, text=message.text, channel=message.channel)
+            except Exception as e:
+                print(f"Error uploading charts to {message.channel}: {e}")
+        self._pending = still_pending
+
+
 def run_reporting_single_org(body: dict, client: WebClient, logger: any, context: dict, region_record: SlackSettings):
-    org_leaderboard_dict = pull_org_leaderboard_data()
-    monthly_summary_dict = pull_org_summary_data()
+    if not region_record.org_id:
+        return  # not connected to a region yet, so there is nothing to report on
+    org_leaderboard_dict = pull_org_leaderboard_data(region_org_id=region_record.org_id)
+    monthly_summary_dict = pull_org_summary_data(region_org_id=region_record.org_id)
     upload_files = []
     if region_record.org_id:
         if region_record.reporting_region_leaderboard_enabled and region_record.reporting_region_channel:
@@ -108,7 +235,7 @@ def run_reporting_single_org(body: dict, client: WebClient, logger: any, context
             if region_record.org_id in monthly_summary_dict:
                 upload_files.append(create_org_monthly_summary(monthly_summary_dict[region_record.org_id]))
         # Upload all files for the region
-        upload_files_to_slack(
+        upload_and_remove(
             upload_files,
             region_record,
             text="Here are your region's monthly reports!",
@@ -124,7 +251,7 @@ def run_reporting_single_org(body: dict, client: WebClient, logger: any, context
                 upload_files.append(create_post_leaders_plot(org_leaderboard_dict[ao.id]))
             if ao.id in monthly_summary_dict and region_record.reporting_ao_monthly_summary_enabled:
                 upload_files.append(create_org_monthly_summary(monthly_summary_dict[ao.id]))
-            upload_files_to_slack(
+            upload_and_remove(
                 upload_files,
                 region_record,
                 text=f"Here are your ({ao.name}) monthly reports!",
@@ -136,55 +263,83 @@ def cycle_all_orgs(run_org_id: int = None):
     current_time = datetime.now(pytz.timezone("US/Central"))
     if run_org_id or (current_time.day == 2 and current_time.hour == 20):
         records = DbManager.find_join_records3(Org_x_SlackSpace, Org, SlackSpace, filters=[Org.is_active])
-        region_orgs: List[Org] = [r[1] for r in records]
-        slack_spaces: List[SlackSpace] = [r[2] for r in records]
+        region_spaces: Dict[int, List[tuple]] = defaultdict(list)
+        for r in records:
+            region_spaces[r[1].id].append((r[1], r[2]))
         # org_leaderboard_dict = pull_org_leaderboard_data()
-        monthly_summary_dict = pull_org_summary_data()
 
         if run_org_id is None:
-            # Region reports
-            for org, slack in zip(region_orgs, slack_spaces, strict=False):
-                try:
-                    settings = SlackSettings(**slack.settings)
-                    upload_files = []
-                    # if org.id in org_leaderboard_dict:
-                    #     if settings.reporting_region_leaderboard_enabled and settings.reporting_region_channel:
-                    #         upload_files.append(create_post_leaders_plot(org_leaderboard_dict[org.id]))
-                    if org.id in monthly_summary_dict:
-                        if settings.reporting_region_monthly_summary_enabled:
-                            upload_files.append(create_org_monthly_summary(monthly_summary_dict[org.id]))
-                    # Upload all files for the region
-                    upload_files_to_slack(
-                        upload_files,
-                        settings,
-                        text=f"Here are your region's monthly summaries! Looking for leaderboards? Find these and more at {os.getenv('STATS_URL')}/stats/region/{org.id}",  # noqa: E501
-                        channel=settings.reporting_region_channel,
-                    )
-
-                    if settings.reporting_ao_monthly_summary_enabled:
-                        # AO reports
-                        ao_orgs = DbManager.find_records(Org, filters=[Org.parent_id == org.id, Org.is_active])
-                        for ao in ao_orgs:
-                            upload_files = []
-                            channel = ao.meta.get("slack_channel_id") or settings.backblast_destination_channel
-                            # if ao.id in org_leaderboard_dict and settings.reporting_ao_leaderboard_enabled:
-                            # #     channel = ao.meta.get("slack_channel_id") or settings.backblast_destination_channel
-                            # #     upload_files.append(create_post_leaders_plot(org_leaderboard_dict[ao.id]))
-                            if ao.id in monthly_summary_dict and settings.reporting_ao_monthly_summary_enabled:
-                                upload_files.append(create_org_monthly_summary(monthly_summary_dict[ao.id]))
-                            upload_files_to_slack(
-                                upload_files,
-                                settings,
-                                text=f"Here is your ({ao.name}) monthly summary! Looking for leaderboards? Find these and more at {os.getenv('STATS_URL')}/stats/region/{org.id}",  # noqa: E501
-                                channel=channel,
-                            )
-                except Exception as e:
-                    print(f"Error processing org {org.name} ({org.id}): {e}")
-                    continue
+            # Region reports, one region's summaries in memory at a time; charts render on the process pool
+            with ChartPipeline() as pipeline:
+                for region_org_id, monthly_summary_dict in iter_region_summary_data(region_spaces):
+                    for org, slack in region_spaces.get(region_org_id, []):
+                        try:
+                            queue_region_reports(pipeline, org, SlackSettings(**slack.settings), monthly_summary_dict)
+                        except Exception as e:
+                            print(f"Error processing org {org.name} ({org.id}): {e}")
+                            continue
+
+
+def queue_region_reports(
+    pipeline: ChartPipeline, org: Org, settings: SlackSettings, monthly_summary_dict: Dict[int, List[OrgMonthlySummary]]
+):
+    charts = []
+    # if org.id in org_leaderboard_dict:
+    #     if settings.reporting_region_leaderboard_enabled and settings.reporting_region_channel:
+    #         charts.append(("leaders", org_leaderboard_dict[org.id]))
+    if org.id in monthly_summary_dict:
+        if settings.reporting_region_monthly_summary_enabled:
+            charts.append(("summary", monthly_summary_dict[org.id]))
+    # Upload all files for the region
+    pipeline.submit(
+        ReportMessage(
+            settings,
+            text=f"Here are your region's monthly summaries! Looking for leaderboards? Find these and more at {os.getenv('STATS_URL')}/stats/region/{org.id}",  # noqa: E501
+            channel=settings.reporting_region_channel,
+            charts=charts,
+        )
+    )
+
+    if settings.reporting_ao_monthly_summary_enabled:
+        # AO reports
+        ao_orgs = DbManager.find_records(Org, filters=[Org.parent_id == org.id, Org.is_active])
+        for ao in ao_orgs:
+            charts = []
+            channel = ao.meta.get("slack_channel_id") or settings.backblast_destination_channel
+            # if ao.id in org_leaderboard_dict and settings.reporting_ao_leaderboard_enabled:
+            # #     channel = ao.meta.get("slack_channel_id") or settings.backblast_destination_channel
+            # #     charts.append(("leaders", org_leaderboard_dict[ao.id]))
+            if ao.id in monthly_summary_dict and settings.reporting_ao_monthly_summary_enabled:
+                charts.append(("summary", monthly_summary_dict[ao.id]))
+            pipeline.submit(
+                ReportMessage(
+                    settings,
+                    text=f"Here is your ({ao.name}) monthly summary! Looking for leaderboards? Find these and more at {os.getenv('STATS_URL')}/stats/region/{org.id}",  # noqa: E501
+                    channel=channel,
+                    charts=charts,
+                )
+            )
 
 
-def pull_org_leaderboard_data() -> Dict[int, List[OrgUserLeaderboard]]:
+def _org_scope(region_org_id: int | None, ao_org_id: int | None) -> list:
+    """SQL predicates limiting the reporting queries to one region (and its AOs) and/or one AO."""
+    scope = []
+    if region_org_id is not None:
+        scope.append(EventInstanceExpanded.region_org_id == region_org_id)
+    if ao_org_id is not None:
+        scope.append(EventInstanceExpanded.ao_org_id == ao_org_id)
+    return scope
+
+
+def pull_org_leaderboard_data(
+    region_org_id: int | None = None, ao_org_id: int | None = None
+) -> Dict[int, List[OrgUserLeaderboard]]:
+    """Post and Q leaders for the prior month and year to date, keyed by AO and region org id.
+
+    ``region_org_id`` / ``ao_org_id`` push the scope into SQL instead of aggregating the whole nation.
+    """
     session = get_session()
+    scope = _org_scope(region_org_id, ao_org_id)
 
     # Define reusable date range and month expression
     prior_month = datetime.now().month - 1 if datetime.now().month > 1 else 12
@@ -205,7 +360,7 @@ def pull_org_leaderboard_data() -> Dict[int, List[OrgUserLeaderboard]]:
                 func.sum(AttendanceExpanded.q_ind + AttendanceExpanded.coq_ind).label("total_qs"),
             )
             .join(AttendanceExpanded, AttendanceExpanded.event_instance_id == EventInstanceExpanded.id)
-            .filter(func.date_trunc(basis, EventInstanceExpanded.start_date) == trunc_date)
+            .filter(func.date_trunc(basis, EventInstanceExpanded.start_date) == trunc_date, *scope)
             .group_by(
                 org_id_col,
                 org_name_col,
@@ -247,20 +402,24 @@ def pull_org_leaderboard_data() -> Dict[int, List[OrgUserLeaderboard]]:
     return results_dict
 
 
-def create_post_leaders_plot(records: List[OrgUserLeaderboard]) -> str:
+def _top_leaders(records: List[OrgUserLeaderboard], basis: str, value_field: str, top_n: int):
+    basis_records = [r for r in records if r.basis == basis]
+    return sorted(basis_records, key=lambda r: getattr(r, value_field), reverse=True)[:top_n]
+
+
+def create_post_leaders_plot(records: List[OrgUserLeaderboard], out_path: Optional[str] = None) -> str:
     # guard for empty input
     if not records:
         print("No records to plot")
         return
 
-    from io import BytesIO
-
     import matplotlib.pyplot as plt
     import matplotlib.transforms as mtransforms
-    import requests
     from matplotlib.offsetbox import AnnotationBbox, OffsetImage
     from PIL import Image
 
+    from utilities import avatar_cache
+
     # Matplotlib export settings to mirror prior pixel density
     DPI = 300
     PX_W = DEFAULT_IMAGE_WIDTH * DEFAULT_IMAGE_SCALE  # e.g., 2400
@@ -275,29 +434,6 @@ def create_post_leaders_plot(records: List[OrgUserLeaderboard]) -> str:
     USERNAME_FONTSIZE = 24  # slightly smaller to avoid overlap
     VALUE_FONTSIZE = 28  # slightly smaller numbers
 
-    def _fetch_image(url: str) -> Image.Image | None:
-        if not url:
-            return None
-        try:
-            resp = requests.get(url, timeout=6)
-            resp.raise_for_status()
-            return Image.open(BytesIO(resp.content)).convert("RGBA")
-        except Exception:
-            return None
-
-    def _prepare_avatar(im: Image.Image, target_px: int = AVATAR_PX) -> Image.Image:
-        """Center-crop to square and resize to a consistent pixel size to avoid giant avatars."""
-        if im is None:
-            return None
-        w, h = im.size
-        side = min(w, h)
-        left = (w - side) // 2
-        top = (h - side) // 2
-        im = im.crop((left, top, left + side, top + side))
-        # hard cap so nothing is huge; consistent across all images
-        im = im.resize((target_px, target_px), Image.LANCZOS)
-        return im
-
     def create_post_leaders_chart(
         records: List[OrgUserLeaderboard],
         top_n: int = 5,
@@ -305,10 +441,11 @@ def create_post_leaders_plot(records: List[OrgUserLeaderboard]) -> str:
         value_field: str = "post_count",
         label: str = "Posts",
         bar_color: str = NEON_GREEN,
+        out_dir: str = ".",
+        avatars: Optional[Dict[str, Image.Image]] = None,
     ):
         # filter and sort
-        sorted_records = [r for r in records if r.basis == basis]
-        sorted_records = sorted(sorted_records, key=lambda r: getattr(r, value_field), reverse=True)[:top_n]
+        sorted_records = _top_leaders(records, basis, value_field, top_n)
         categories = [r.f3_name for r in sorted_records]
         raw_values = [getattr(r, value_field) for r in sorted_records]
         images = [r.avatar_url for r in sorted_records]
@@ -374,8 +511,7 @@ def create_post_leaders_plot(records: List[OrgUserLeaderboard]) -> str:
 
         for i, (name, val, img_url) in enumerate(zip(categories, values, images, strict=False)):
             # avatar image (normalized so none are huge)
-            avatar_im = _fetch_image(img_url) if img_url else None
-            avatar_im = _prepare_avatar(avatar_im, target_px=AVATAR_PX) if avatar_im is not None else None
+            avatar_im = (avatars or {}).get(img_url) if img_url else None
             if avatar_im is not None:
                 oi = OffsetImage(avatar_im, zoom=AVATAR_ZOOM)  # fixed pixel size; consistent
                 ab = AnnotationBbox(
@@ -442,31 +578,45 @@ def create_post_leaders_plot(records: List[OrgUserLeaderboard]) -> str:
             )
 
         # save single panel
-        out_file = f"{basis}_{label}_leaders.png"
+        out_file = os.path.join(out_dir, f"{basis}_{label}_leaders.png")
         fig.savefig(out_file, dpi=DPI, facecolor=fig.get_facecolor(), bbox_inches="tight", pad_inches=0.3)
         plt.close(fig)
 
-    # Generate and save the four panels
-    create_post_leaders_chart(
-        records, top_n=5, basis="month", value_field="post_count", label="Post", bar_color="#39FF14"
-    )
-    create_post_leaders_chart(
-        records, top_n=5, basis="year", value_field="post_count", label="Post", bar_color="#14E4FF"
-    )
-    create_post_leaders_chart(records, top_n=5, basis="month", value_field="total_qs", label="Q", bar_color="#FF5733")
-    create_post_leaders_chart(records, top_n=5, basis="year", value_field="total_qs", label="Q", bar_color="#FFBD33")
-
-    file_name = stitch_2x2(
-        [
-            "month_Post_leaders.png",
-            "year_Post_leaders.png",
-            "month_Q_leaders.png",
-            "year_Q_leaders.png",
-        ],
-        out_path="4up_post_leaders.png",
-        bg_color=(11, 18, 32),
-        padding=10,
-    )
+    # Generate the four panels in a private directory, so concurrent renders never share files
+    with tempfile.TemporaryDirectory() as panel_dir:
+        panels = [
+            ("month", "post_count", "Post", "#39FF14"),
+            ("year", "post_count", "Post", "#14E4FF"),
+            ("month", "total_qs", "Q", "#FF5733"),
+            ("year", "total_qs", "Q", "#FFBD33"),
+        ]
+        # Only the avatars shown in a panel, resized once and served from disk on later renders
+        avatars = avatar_cache.load_avatars(
+            (
+                r.avatar_url
+                for basis, value_field, _, _ in panels
+                for r in _top_leaders(records, basis, value_field, top_n=5)
+            ),
+            AVATAR_PX,
+        )
+        for basis, value_field, label, bar_color in panels:
+            create_post_leaders_chart(
+                records,
+                top_n=5,
+                basis=basis,
+                value_field=value_field,
+                label=label,
+                bar_color=bar_color,
+                out_dir=panel_dir,
+                avatars=avatars,
+            )
+
+        file_name = stitch_2x2(
+            [os.path.join(panel_dir, f"{basis}_{label}_leaders.png") for basis, _, label, _ in panels],
+            out_path=out_path or _temp_png("4up_post_leaders"),
+            bg_color=(11, 18, 32),
+            padding=10,
+        )
     return file_name
 
 
@@ -516,7 +666,7 @@ def stitch_2x2(
     return out_path
 
 
-def create_org_monthly_summary(records: List[OrgMonthlySummary]) -> str:
+def create_org_monthly_summary(records: List[OrgMonthlySummary], out_path: Optional[str] = None) -> str:
     # Build three subplots (Posts, Unique PAX, FNGs) with paired series for current and prior year.
     # Only plot points for months that had events (use None for missing months).
     import calendar
@@ -665,26 +815,31 @@ def create_org_monthly_summary(records: List[OrgMonthlySummary]) -> str:
     # axs[-1].set_xlabel("Month", fontsize=14)
     plt.setp(axs[-1].get_xticklabels(), rotation=45)
     plt.tight_layout(rect=[0, 0, 1, 0.97])
-    plt.savefig("org_monthly_attendance.png", dpi=300)
+    out_path = out_path or _temp_png("org_monthly_attendance")
+    plt.savefig(out_path, dpi=300)
     plt.close()
 
-    return "org_monthly_attendance.png"
+    return out_path
 
 
-def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
-    session = get_session()
+def _summary_window() -> Tuple[datetime, datetime]:
+    # Pull 2 years of data to support rolling 12-month view with prior year comparison
+    return datetime(datetime.now().year - 2, 1, 1), datetime(datetime.now().year, datetime.now().month, 1)
+
 
+def _summary_query(region_org_id: int | None = None, ao_org_id: int | None = None):
+    """Monthly event, post, FNG and unique PAX counts per AO and per region, with each row's region_org_id."""
     # Define reusable date range and month expression
-    # Pull 2 years of data to support rolling 12-month view with prior year comparison
-    start_date = datetime(datetime.now().year - 2, 1, 1)
-    end_date = datetime(datetime.now().year, datetime.now().month, 1)
+    start_date, end_date = _summary_window()
     month_expr = func.date_trunc("month", EventInstanceExpanded.start_date)
+    scope = _org_scope(region_org_id, ao_org_id)
 
     # Helper to build a scoped query for a given org id column
     def build_scoped_query(org_id_col, scope_name: str):
         # Subquery of events (one row per event) to avoid duplication from Attendance joins
         events_subq = (
             select(
+                EventInstanceExpanded.region_org_id.label("region_org_id"),
                 org_id_col.label("org_id"),
                 month_expr.label("month"),
                 EventInstanceExpanded.id.label("event_id"),
@@ -695,6 +850,7 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
                 and_(
                     EventInstanceExpanded.start_date >= start_date,
                     EventInstanceExpanded.start_date < end_date,
+                    *scope,
                 )
             )
             .subquery(f"events_subq_{scope_name}")
@@ -703,19 +859,21 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
         # Aggregate event-level metrics (counts and sums) from the deduplicated events
         events_agg = (
             select(
+                events_subq.c.region_org_id,
                 events_subq.c.org_id,
                 events_subq.c.month,
                 func.count(events_subq.c.event_id).label("event_count"),
                 func.sum(events_subq.c.pax_count).label("total_posts"),
                 func.sum(events_subq.c.fng_count).label("total_fngs"),
             )
-            .group_by(events_subq.c.org_id, events_subq.c.month)
+            .group_by(events_subq.c.region_org_id, events_subq.c.org_id, events_subq.c.month)
             .subquery(f"events_agg_{scope_name}")
         )
 
         # Distinct attendance per org, month, user to count unique pax across all events in that month
         attendance_distinct = (
             select(
+                EventInstanceExpanded.region_org_id.label("region_org_id"),
                 org_id_col.label("org_id"),
                 month_expr.label("month"),
                 AttendanceExpanded.user_id.label("user_id"),
@@ -726,6 +884,7 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
                 and_(
                     EventInstanceExpanded.start_date >= start_date,
                     EventInstanceExpanded.start_date < end_date,
+                    *scope,
                 )
             )
             .distinct()
@@ -734,16 +893,18 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
 
         attendance_agg = (
             select(
+                attendance_distinct.c.region_org_id,
                 attendance_distinct.c.org_id,
                 attendance_distinct.c.month,
                 func.count().label("unique_pax_count"),
             )
-            .group_by(attendance_distinct.c.org_id, attendance_distinct.c.month)
+            .group_by(attendance_distinct.c.region_org_id, attendance_distinct.c.org_id, attendance_distinct.c.month)
             .subquery(f"attendance_agg_{scope_name}")
         )
 
         # Final join of event aggregates with unique pax counts
         scoped_query = select(
+            events_agg.c.region_org_id.label("region_org_id"),
             events_agg.c.org_id.label("org_id"),
             events_agg.c.month.label("month"),
             events_agg.c.event_count,
@@ -754,6 +915,7 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
             events_agg.outerjoin(
                 attendance_agg,
                 and_(
+                    events_agg.c.region_org_id.is_not_distinct_from(attendance_agg.c.region_org_id),
                     events_agg.c.org_id == attendance_agg.c.org_id,
                     events_agg.c.month == attendance_agg.c.month,
                 ),
@@ -766,18 +928,75 @@ def pull_org_summary_data() -> Dict[int, List[OrgMonthlySummary]]:
     query_region = build_scoped_query(EventInstanceExpanded.region_org_id, "region")
 
     # Union both scopes so the result includes both AO and Region orgs
-    final_query = union_all(query_ao, query_region)
+    return union_all(query_ao, query_region).order_by(
+        literal_column("region_org_id"), literal_column("org_id"), literal_column("month")
+    )
 
-    results = session.execute(final_query).all()
 
-    results_dict: Dict[int, List[OrgMonthlySummary]] = {}
-    for row in results:
-        org_id = row.org_id
-        if org_id not in results_dict:
-            results_dict[org_id] = []
-        results_dict[org_id].append(OrgMonthlySummary(**row._asdict()))
+def _summary_from_row(row) -> OrgMonthlySummary:
+    return OrgMonthlySummary(
+        org_id=row.org_id,
+        month=row.month,
+        event_count=row.event_count,
+        total_posts=row.total_posts,
+        total_fngs=row.total_fngs,
+        unique_pax_count=row.unique_pax_count,
+    )
 
-    session.close()
+
+def _summary_region_ids() -> List[int]:
+    """Regions with at least one event in the summary window."""
+    start_date, end_date = _summary_window()
+    session = get_session()
+    try:
+        return list(
+            session.scalars(
+                select(EventInstanceExpanded.region_org_id)
+                .where(EventInstanceExpanded.start_date >= start_date, EventInstanceExpanded.start_date < end_date)
+                .distinct()
+            )
+        )
+    finally:
+        session.close()
+
+
+def _scoped_summary_data(
+    region_org_id: int | None = None, ao_org_id: int | None = None
+) -> Dict[int, List[OrgMonthlySummary]]:
+    session = get_session()
+    try:
+        org_summaries: Dict[int, List[OrgMonthlySummary]] = {}
+        for row in session.execute(_summary_query(region_org_id, ao_org_id)):
+            org_summaries.setdefault(row.org_id, []).append(_summary_from_row(row))
+        return org_summaries
+    finally:
+        session.close()
+
+
+def iter_region_summary_data(
+    region_org_ids: Iterable[int] | None = None,
+) -> Iterator[Tuple[int, Dict[int, List[OrgMonthlySummary]]]]:
+    """Yields ``(region_org_id, {org_id: summaries})`` for the region and its AOs, one region at a time.
+
+    Each region is read by its own region-scoped query, and that session is closed before the region is yielded, so
+    no cursor or transaction is held open while the caller renders and uploads. Defaults to every region with
+    events in the summary window.
+    """
+    for region_id in _summary_region_ids() if region_org_ids is None else region_org_ids:
+        org_summaries = _scoped_summary_data(region_org_id=region_id)
+        if org_summaries:
+            yield region_id, org_summaries
+
+
+def pull_org_summary_data(
+    region_org_id: int | None = None, ao_org_id: int | None = None
+) -> Dict[int, List[OrgMonthlySummary]]:
+    """Monthly summaries keyed by AO and region org id; pass a scope to aggregate one region or AO only."""
+    if region_org_id is not None or ao_org_id is not None:
+        return _scoped_summary_data(region_org_id, ao_org_id)
+    results_dict: Dict[int, List[OrgMonthlySummary]] = {}
+    for _, org_summaries in iter_region_summary_data():
+        results_dict.update(org_summaries)
     return results_dict
 
 
@@ -14,6 +14,7 @@ from f3_data_models.models import (
     Attendance_x_AttendanceType,
     EventInstance,
     Org,
+    Org_x_SlackSpace,
     Series_Exception,
     SlackSpace,
 )
@@ -41,12 +42,23 @@ from utilities.slack.orm import (
 )
 
 
-def send_lineups(force: bool = False):
+def send_lineups(force: bool = False, region_org_id: int | None = None):
+    """Sends Q lineups for every region, or only ``region_org_id`` (the hourly runner's per-region tasks)."""
     # get the current time in US/Central timezone
     current_time = datetime.now(pytz.timezone("US/Central"))
-    slack_spaces = DbManager.find_records(SlackSpace, filters=[True])
+    if region_org_id is None:
+        slack_spaces = DbManager.find_records(SlackSpace, filters=[True])
+    else:
+        slack_spaces = [
+            r[0]
+            for r in DbManager.find_join_records2(
+                SlackSpace, Org_x_SlackSpace, filters=[Org_x_SlackSpace.org_id == region_org_id]
+            )
+        ]
     slack_settings_list: List[SlackSettings] = [
-        SlackSettings(**s.settings) for s in slack_spaces if safe_get(s.settings, "org_id")
+        SlackSettings(**s.settings)
+        for s in slack_spaces
+        if safe_get(s.settings, "org_id") and region_org_id in (None, s.settings["org_id"])
     ]
 
     # find all slack settings where send_q_lineups is True and the current time matches the configured day and hour
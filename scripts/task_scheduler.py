@@ -0,0 +1,247 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+_current = threading.local()
+
+
+class TaskCancelled(Exception):
+    """Raised at a cancellation point once the scheduler has timed the running task out."""
+
+
+def cancel_event() -> Optional[threading.Event]:
+    """The running task's cancellation flag (None outside the scheduler), for threads the task starts itself."""
+    return getattr(_current, "event", None)
+
+
+def check_cancelled(event: Optional[threading.Event] = None):
+    """Cancellation point: raises ``TaskCancelled`` if the task (or the given flag's task) has timed out."""
+    event = event or cancel_event()
+    if event is not None and event.is_set():
+        raise TaskCancelled()
+
+
+@dataclass
+class ScheduledTask:
+    """A unit of work for the scheduler.
+
+    ``group`` ties per-workspace copies of the same script together so other tasks can depend on all of
+    them at once (e.g. ``depends_on=["slack_user_sync"]``). ``workspace`` is the Slack team id (or any
+    key) used for the per-workspace concurrency cap; nation-wide tasks leave it as ``None``.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    group: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+    workspace: Optional[str] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class TaskResult:
+    name: str
+    group: Optional[str]
+    workspace: Optional[str]
+    status: str
+    duration: float
+    error: Optional[str] = None
+
+
+class TaskScheduler:
+    """Runs ``ScheduledTask`` objects on a bounded thread pool, respecting dependencies.
+
+    A task starts once every task it depends on (by name or group) has finished, whatever the outcome,
+    which mirrors the hourly runner's historical "log the error and keep going" behaviour.
+
+    Python threads cannot be killed, so a task that exceeds its timeout is reported as timed out, its dependents
+    and its workspace slot are released, and its cancellation flag is set; the task stops at its next
+    ``check_cancelled()`` call, or runs on in the background if it never reaches one (e.g. a hung HTTP call).
+    Such abandoned threads still occupy the pool, so it has ``spare_workers`` extra threads for them; once
+    more tasks than that are abandoned, each one takes a slot from ``max_workers`` until its thread returns.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_workspace_limit: int = 2,
+        default_timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        spare_workers: Optional[int] = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.spare_workers = max(0, spare_workers if spare_workers is not None else max_workers // 2)
+        self.per_workspace_limit = max(1, per_workspace_limit)
+        self.default_timeout = default_timeout
+        self.poll_interval = poll_interval
+        self.tasks: Dict[str, ScheduledTask] = {}
+
+    def add(self, task: ScheduledTask) -> ScheduledTask:
+        if task.name in self.tasks:
+            raise ValueError(f"Duplicate task name: {task.name}")
+        self.tasks[task.name] = task
+        return task
+
+    def _resolve_dependencies(self) -> Dict[str, set]:
+        by_group: Dict[str, set] = {}
+        for task in self.tasks.values():
+            if task.group:
+                by_group.setdefault(task.group, set()).add(task.name)
+
+        resolved: Dict[str, set] = {}
+        for task in self.tasks.values():
+            deps = set()
+            for dep in task.depends_on:
+                if dep in self.tasks:
+                    deps.add(dep)
+                elif dep in by_group:
+                    deps.update(by_group[dep])
+                else:
+                    raise ValueError(f"Task {task.name} depends on unknown task or group: {dep}")
+            deps.discard(task.name)
+            resolved[task.name] = deps
+
+        # Reject cycles up front rather than deadlocking at run time
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at task: {name}")
+            visiting.add(name)
+            for dep in resolved[name]:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in resolved:
+            visit(name)
+        return resolved
+
+    def run(self) -> List[TaskResult]:
+        dependencies = self._resolve_dependencies()
+        pending: List[str] = list(self.tasks)  # insertion order doubles as priority
+        finished: Dict[str, TaskResult] = {}
+        running: Dict[Future, str] = {}
+        abandoned: Dict[Future, str] = {}  # timed out, thread still running
+        cancel_events: Dict[str, threading.Event] = {}
+        started_at: Dict[str, float] = {}
+        workspace_counts: Dict[str, int] = {}
+        lock = threading.Lock()
+
+        def execute(task: ScheduledTask, event: threading.Event):
+            with lock:
+                started_at[task.name] = time.monotonic()
+            _current.event = event
+            try:
+                task.func()
+            finally:
+                _current.event = None
+
+        def release(task: ScheduledTask):
+            if task.workspace is not None:
+                workspace_counts[task.workspace] -= 1
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers + self.spare_workers, thread_name_prefix="hourly")
+        try:
+            while pending or running:
+                for future in [f for f in abandoned if f.done()]:
+                    print(f"Timed out task {abandoned.pop(future)} has finished in the background")
+                capacity = self.max_workers - max(0, len(abandoned) - self.spare_workers)
+                for name in list(pending):
+                    if len(running) >= capacity:
+                        break
+                    task = self.tasks[name]
+                    if not dependencies[name].issubset(finished):
+                        continue
+                    if task.workspace is not None:
+                        if workspace_counts.get(task.workspace, 0) >= self.per_workspace_limit:
+                            continue
+                        workspace_counts[task.workspace] = workspace_counts.get(task.workspace, 0) + 1
+                    pending.remove(name)
+                    cancel_events[name] = threading.Event()
+                    running[executor.submit(execute, task, cancel_events[name])] = name
+
+                if not running and pending and abandoned and capacity <= 0:
+                    # Every thread is stuck in a timed-out task; wait for one to come back
+                    wait(abandoned, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                    continue
+                if not running:
+                    # Nothing runnable and nothing in flight means the remaining tasks can never start
+                    raise RuntimeError(f"Scheduler stalled with pending tasks: {pending}")
+
+                done, _ = wait(running, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+
+                for future in done:
+                    name = running.pop(future)
+                    task = self.tasks[name]
+                    release(task)
+                    with lock:
+                        duration = now - started_at.get(name, now)
+                    error = future.exception()
+                    if error:
+                        print(f"Error running {name}: {error}")
+                    finished[name] = TaskResult(
+                        name=name,
+                        group=task.group,
+                        workspace=task.workspace,
+                        status=STATUS_ERROR if error else STATUS_OK,
+                        duration=duration,
+                        error=str(error) if error else None,
+                    )
+
+                for future, name in list(running.items()):
+                    task = self.tasks[name]
+                    timeout = task.timeout if task.timeout is not None else self.default_timeout
+                    with lock:
+                        start = started_at.get(name)
+                    if timeout is None or start is None or now - start < timeout:
+                        continue
+                    print(f"Task {name} exceeded its {timeout:.0f}s timeout; cancelling it and continuing without it")
+                    running.pop(future)
+                    cancel_events[name].set()
+                    abandoned[future] = name
+                    release(task)
+                    finished[name] = TaskResult(
+                        name=name,
+                        group=task.group,
+                        workspace=task.workspace,
+                        status=STATUS_TIMEOUT,
+                        duration=now - start,
+                        error=f"Timed out after {timeout:.0f}s",
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return [finished[name] for name in self.tasks if name in finished]
+
+
+def format_summary(results: List[TaskResult], wall_time: float) -> str:
+    """Builds a plain-text timing summary, one line per group plus the slowest individual tasks."""
+    groups: Dict[str, List[TaskResult]] = {}
+    for result in results:
+        groups.setdefault(result.group or result.name, []).append(result)
+
+    lines = [f"Hourly run finished in {wall_time:.1f}s ({len(results)} tasks)"]
+    for group, group_results in groups.items():
+        total = sum(r.duration for r in group_results)
+        slowest = max(r.duration for r in group_results)
+        failures = [r for r in group_results if r.status != STATUS_OK]
+        line = f"  {group}: {len(group_results)} task(s), total {total:.1f}s, slowest {slowest:.1f}s"
+        if failures:
+            statuses = ", ".join(f"{r.name}={r.status}" for r in failures)
+            line += f", problems: {statuses}"
+        lines.append(line)
+
+    slowest_tasks = sorted(results, key=lambda r: r.duration, reverse=True)[:5]
+    if slowest_tasks:
+        lines.append("  Slowest tasks: " + ", ".join(f"{r.name} ({r.duration:.1f}s)" for r in slowest_tasks))
+    return "\n".join(lines)
@@ -1,5 +1,10 @@
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
 
 from sqlalchemy import case, select, update
 
@@ -8,63 +13,141 @@ from f3_data_models.models import Attendance, EventInstance, Org, Org_x_SlackSpa
 from f3_data_models.utils import DbManager, get_session
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
-from utilities.helper_functions import create_user, safe_get
+from scripts.task_scheduler import cancel_event, check_cancelled
+from utilities.database.special_queries import update_slack_users_by_id, upsert_slack_users
+from utilities.helper_functions import safe_get, slack_profile_row
 
+SYNC_CONCURRENCY = int(os.getenv("SLACK_USER_SYNC_CONCURRENCY", "4"))
+PAGE_SIZE = 200  # Slack's recommended maximum for users.list
 
-def update_slack_users(force=False):
+
+@dataclass
+class SyncResult:
+    workspace: str
+    pages: int = 0
+    members: int = 0
+    inserted: int = 0
+    updated: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def changed_per_second(self) -> float:
+        return (self.inserted + self.updated) / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        summary = (
+            f"{self.workspace}: {self.members} members in {self.pages} pages, {self.inserted} inserted, "
+            f"{self.updated} updated in {self.seconds:.1f}s ({self.changed_per_second:.1f} rows changed/s)"
+        )
+        return f"{summary}; stopped early: {self.error}" if self.error else summary
+
+
+def _existing_slack_users(team_id: str, slack_ids: List[str]) -> Dict[str, SlackUser]:
+    """The stored ``SlackUser`` rows for one page of members, preferring this workspace's row for shared users."""
+    records: List[SlackUser] = DbManager.find_records(SlackUser, filters=[SlackUser.slack_id.in_(slack_ids)])
+    return {r.slack_id: r for r in sorted(records, key=lambda r: r.slack_team_id == team_id)}
+
+
+def diff_page(
+    members: List[dict], existing: Dict[str, SlackUser], org_id: int | None, force: bool = False
+) -> Tuple[List[dict], List[dict]]:
+    """Splits one ``users.list`` page into profiles to create and ``SlackUser`` column updates keyed on ``id``.
+
+    Members without a linked user are (re)created; the rest are updated only if Slack's ``updated`` timestamp is newer
+    than the stored one, or always with ``force``. Bots and Slackbot are skipped.
+    """
+    new_profiles, updates = [], []
+    for user in members:
+        if user.get("is_bot") or user["id"] == "USLACKBOT":
+            continue
+        slack_user = existing.get(user["id"])
+        if not safe_get(slack_user, "user_id"):
+            new_profiles.append(slack_profile_row(user, org_id))
+        elif force or not slack_user.slack_updated or slack_user.slack_updated < user["updated"]:
+            updates.append(
+                {
+                    "id": slack_user.id,
+                    "user_name": safe_get(user, "profile", "display_name")
+                    or safe_get(user, "profile", "real_name")
+                    or safe_get(user, "name"),
+                    "slack_updated": safe_get(user, "updated"),
+                    "is_admin": safe_get(user, "is_admin") or False,
+                    "is_owner": safe_get(user, "is_owner") or False,
+                    "is_bot": safe_get(user, "is_bot") or False,
+                    "avatar_url": safe_get(user, "profile", "image_512"),
+                }
+            )
+    return new_profiles, updates
+
+
+def sync_workspace(
+    slack_space: SlackSpace, org_id: int | None, force: bool = False, cancel: threading.Event | None = None
+) -> SyncResult:
+    """Streams one workspace's ``users.list`` pages, writing each page's inserts and updates as it arrives.
+
+    ``cancel`` is the hourly runner's flag for this task; the sync stops between pages once it is set.
+    """
+    result = SyncResult(workspace=slack_space.workspace_name or slack_space.team_id)
+    start = time.monotonic()
+    client = WebClient(token=slack_space.settings.get("bot_token"))
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
+    cursor = None
+    try:
+        while True:
+            check_cancelled(cancel)
+            response = client.users_list(limit=PAGE_SIZE, cursor=cursor)
+            members: List[dict] = response["members"]
+            result.pages += 1
+            result.members += len(members)
+
+            existing = _existing_slack_users(slack_space.team_id, [m["id"] for m in members])
+            new_profiles, updates = diff_page(members, existing, org_id, force=force)
+            result.inserted += len(upsert_slack_users(new_profiles))
+            result.updated += update_slack_users_by_id(updates)
+
+            cursor = safe_get(response, "response_metadata", "next_cursor")
+            if not cursor:
+                break
+    except SlackApiError as e:
+        result.error = e.response["error"]
+    result.seconds = time.monotonic() - start
+    print(result)
+    return result
+
+
+def update_slack_users(force=False, team_id: str | None = None) -> List[SyncResult]:
     """
     Update Slack users in the database with their latest information from Slack.
+    If team_id is given, only that workspace is synced (used by the hourly runner to fan out per workspace);
+    otherwise up to SLACK_USER_SYNC_CONCURRENCY workspaces are synced at once.
     """
-    all_slack_users = DbManager.find_records(cls=SlackUser, filters=[True])
-    slack_user_dict = {user.slack_id: user for user in all_slack_users}
     all_slack_spaces: list[tuple[SlackSpace, Org_x_SlackSpace]] = DbManager.find_join_records2(
         SlackSpace,
         Org_x_SlackSpace,
-        filters=[True],
+        filters=[SlackSpace.team_id == team_id] if team_id else [True],
     )
-
-    for slack_space_record in all_slack_spaces:
-        slack_space = slack_space_record[0]
-        region_org_record = slack_space_record[1]
-        client = WebClient(token=slack_space.settings.get("bot_token"))
-        try:
-            users: list[dict] = []
-
-            response = client.users_list()
-            users = response["members"]
-            while response.get("response_metadata", {}).get("next_cursor"):
-                response = client.users_list(cursor=response["response_metadata"]["next_cursor"])
-                users.extend(response["members"])
-
-            for user in users:
-                if user["is_bot"] or user["id"] == "USLACKBOT":
-                    continue  # Skip bots and the Slackbot
-
-                slack_user = slack_user_dict.get(user["id"])
-                if not safe_get(slack_user, "user_id"):
-                    print(f"Creating new Slack user {user['id']} ({user.get('name')})")
-                    slack_user = create_user(user, region_org_record.org_id)
-                elif slack_user.slack_updated and slack_user.slack_updated >= user["updated"] and not force:
-                    continue
-                else:
-                    update_fields = {
-                        SlackUser.user_name: safe_get(user, "profile", "display_name")
-                        or safe_get(user, "profile", "real_name")
-                        or safe_get(user, "name"),
-                        SlackUser.slack_updated: safe_get(user, "updated"),
-                        SlackUser.is_admin: safe_get(user, "is_admin") or False,
-                        SlackUser.is_owner: safe_get(user, "is_owner") or False,
-                        SlackUser.is_bot: safe_get(user, "is_bot") or False,
-                        SlackUser.avatar_url: safe_get(user, "profile", "image_512"),
-                    }
-                    DbManager.update_record(SlackUser, slack_user.id, update_fields)
-
-            print("Slack users updated successfully.")
-
-        except SlackApiError as e:
-            print(f"Error updating Slack users for {slack_space.workspace_name}: {e.response['error']}")
-            continue
+    if not all_slack_spaces:
+        return []
+
+    start = time.monotonic()
+    cancel = cancel_event()  # the sync threads below do not inherit the runner task's thread-local flag
+    with ThreadPoolExecutor(max_workers=max(1, min(SYNC_CONCURRENCY, len(all_slack_spaces)))) as executor:
+        results = list(
+            executor.map(
+                lambda record: sync_workspace(record[0], record[1].org_id, force=force, cancel=cancel),
+                all_slack_spaces,
+            )
+        )
+    changed = sum(r.inserted + r.updated for r in results)
+    elapsed = time.monotonic() - start
+    print(
+        f"Slack users synced for {len(results)} workspace(s): {changed} rows changed in {elapsed:.1f}s "
+        f"({changed / elapsed if elapsed else 0:.1f} rows changed/s)"
+    )
+    return results
 
 
 def update_home_regions():
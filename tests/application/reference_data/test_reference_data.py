@@ -0,0 +1,128 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from application.ao import AoData
+from application.ao.service import AoService
+from application.event_tag import EventTagData
+from application.event_tag.service import EventTagService
+from application.event_type import EventTypeData
+from application.event_type.service import EventTypeService
+from application.location import LocationData
+from application.location.service import LocationService
+from application.reference_data.cache import RegionReferenceCache
+from application.reference_data.service import RegionReferenceService
+
+
+class RegionReferenceServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = RegionReferenceCache()
+        self.ao_repo = MagicMock()
+        self.ao_repo.get_by_parent_org.side_effect = lambda org_id: [AoData(id=11, name="The Forge", parent_id=org_id)]
+        self.location_repo = MagicMock()
+        self.location_repo.get_by_org.return_value = [
+            LocationData(id=100, name="Park", org_id=11),
+            LocationData(id=101, name="Closed", org_id=10, is_active=False),
+        ]
+        self.event_type_repo = MagicMock()
+        self.event_type_repo.get_all_for_org.return_value = [EventTypeData(id=1, name="Bootcamp")]
+        self.event_tag_repo = MagicMock()
+        self.event_tag_repo.get_all_for_org.return_value = [
+            EventTagData(id=5, name="Open", color="Green", specific_org_id=None)
+        ]
+
+        self.ao_service = AoService(self.ao_repo, reference_cache=self.cache)
+        self.location_service = LocationService(self.location_repo, reference_cache=self.cache)
+        self.event_type_service = EventTypeService(self.event_type_repo, reference_cache=self.cache)
+        self.event_tag_service = EventTagService(self.event_tag_repo, reference_cache=self.cache)
+        self.service = RegionReferenceService(
+            self.ao_service, self.location_service, self.event_type_service, self.event_tag_service, cache=self.cache
+        )
+
+    def _load_count(self):
+        return self.ao_repo.get_by_parent_org.call_count
+
+    def test_snapshot_contains_all_four_collections(self):
+        snapshot = self.service.get_snapshot("10")
+
+        self.assertEqual(snapshot.region_org_id, 10)
+        self.assertEqual([ao.id for ao in snapshot.aos], [11])
+        self.assertEqual([loc.id for loc in snapshot.locations], [100])
+        self.assertEqual([t.id for t in snapshot.event_types], [1])
+        self.assertEqual([t.id for t in snapshot.event_tags], [5])
+
+    def test_warm_cache_makes_no_repository_calls(self):
+        first = self.service.get_snapshot(10)
+        second = self.service.get_snapshot(10)
+
+        self.assertIs(first, second)
+        for repo_call in (
+            self.ao_repo.get_by_parent_org,
+            self.location_repo.get_by_org,
+            self.event_type_repo.get_all_for_org,
+            self.event_tag_repo.get_all_for_org,
+        ):
+            self.assertEqual(repo_call.call_count, 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_bundle_fetches_go_through_one_gather(self):
+        gathered = []
+
+        def gather(*calls):
+            gathered.append(len(calls))
+            return [call() for call in calls]
+
+        service = RegionReferenceService(
+            self.ao_service,
+            self.location_service,
+            self.event_type_service,
+            self.event_tag_service,
+            cache=self.cache,
+            gather=gather,
+        )
+        snapshot = service.get_snapshot(10)
+        service.get_snapshot(10)
+
+        self.assertEqual(gathered, [4])
+        self.assertEqual([ao.id for ao in snapshot.aos], [11])
+
+    def test_expired_snapshot_is_reloaded(self):
+        self.service.get_snapshot(10)
+        with patch("application.reference_data.cache.time.monotonic", return_value=10**9):
+            self.service.get_snapshot(10)
+
+        self.assertEqual(self._load_count(), 2)
+
+    def test_writes_invalidate_the_affected_region(self):
+        self.service.get_snapshot(10)
+        self.service.get_snapshot(20)
+
+        self.location_service.delete_location(100)
+        self.assertEqual(len(self.cache), 0)  # location 100 appears in both snapshots
+
+        self.service.get_snapshot(10)
+        self.service.get_snapshot(20)
+        self.ao_service.create_ao(10, "New AO", None, None, None)
+        self.service.get_snapshot(20)
+        self.assertEqual(self._load_count(), 4)
+
+        self.service.get_snapshot(10)
+        self.event_tag_service.create_org_specific_tag("Ruck", "Blue", 11)  # AO-level write reaches its region
+        self.event_type_service.update_org_specific_type(1, "Bootcamp", "BC", "first_f")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_unrelated_write_keeps_snapshot(self):
+        self.service.get_snapshot(10)
+
+        self.event_type_service.delete_org_specific_type(999)
+        self.ao_service.update_ao(50, 30, "Elsewhere", None, None, None)
+        self.service.get_snapshot(10)
+
+        self.assertEqual(self._load_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
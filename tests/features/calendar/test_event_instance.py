@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import unittest
@@ -6,9 +7,11 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 
-from application.event_instance import EventInstanceData
+from application.event_instance import EventInstanceData, EventInstancePage
 from application.event_instance.service import EventInstanceService
 from features.calendar.event_instance import (
+    CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE,
+    CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE,
     _build_event_instance_service,
     build_event_instance_list_form,
     handle_event_instance_close,
@@ -20,6 +23,7 @@ from infrastructure.api_client.event_instance_repository import (
     get_api_event_instance_repository,
 )
 from infrastructure.api_client.exceptions import F3ApiNotFoundError
+from utilities.helper_functions import CALENDAR_FEED_CACHE
 
 
 def _make_instance(
@@ -195,6 +199,43 @@ class EventInstanceServiceTest(unittest.TestCase):
         service.delete_instance(9)
         repo.delete.assert_called_once_with(9)
 
+    def test_writes_report_touched_instances_and_orgs(self):
+        repo = self._mock_repo()
+        repo.create.return_value = _make_instance(id=99, org_id=10)
+        repo.get_by_id.return_value = _make_instance(id=3, org_id=20)
+        on_write = MagicMock()
+        service = EventInstanceService(repository=repo, on_write=on_write)
+
+        service.create_instance(name="E", org_id="10", start_date=date(2026, 7, 4), start_time="0600", end_time="0700")
+        service.update_instance(
+            instance_id=5, name="E", org_id=11, start_date=date(2026, 7, 4), start_time="0600", end_time="0700"
+        )
+        service.close_instance(instance_id=3, close_reason=None)
+        service.reopen_instance(3)
+        service.delete_instance(9)
+
+        self.assertEqual(
+            [c.kwargs for c in on_write.call_args_list],
+            [
+                {"event_instance_ids": [99], "org_ids": [10]},
+                {"event_instance_ids": [5], "org_ids": [11]},
+                {"event_instance_ids": [3], "org_ids": [20]},
+                {"event_instance_ids": [3], "org_ids": [20]},
+                {"event_instance_ids": [9], "org_ids": []},
+            ],
+        )
+
+    def test_failed_write_does_not_report(self):
+        repo = self._mock_repo()
+        repo.delete.side_effect = RuntimeError("api down")
+        on_write = MagicMock()
+        service = EventInstanceService(repository=repo, on_write=on_write)
+
+        with self.assertRaises(RuntimeError):
+            service.delete_instance(9)
+
+        on_write.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # ApiEventInstanceRepository tests
@@ -241,6 +282,57 @@ class ApiEventInstanceRepositoryTest(unittest.TestCase):
         self.assertIn("aoOrgId", kwargs["params"])
         self.assertEqual(kwargs["params"]["aoOrgId"], 20)
 
+    def test_get_page_uses_page_index_cursor(self):
+        self.client.get.return_value = {"eventInstances": [self._raw_instance(id=3)], "totalCount": 5}
+        page = self.repo.get_page(
+            region_org_id=10, start_date=date(2026, 6, 1), end_date=date(2026, 7, 1), limit=2, cursor="1"
+        )
+
+        self.client.get.assert_called_once_with(
+            "/v1/event-instance",
+            params={
+                "regionOrgId": 10,
+                "startDate": "2026-06-01",
+                "endDate": "2026-07-01",
+                "pageIndex": 1,
+                "pageSize": 2,
+                "sorting": '[{"id": "startDate", "desc": false}, {"id": "startTime", "desc": false}]',
+            },
+        )
+        self.assertEqual([i.id for i in page.items], [3])
+        self.assertEqual(page.next_cursor, "2")
+
+    def test_get_page_warns_when_the_api_ignores_the_sort(self):
+        in_order = [self._raw_instance(id=1), self._raw_instance(id=2)]
+        self.client.get.return_value = {"eventInstances": in_order, "totalCount": 2}
+        with self.assertNoLogs("infrastructure.api_client.event_instance_repository", "WARNING"):
+            self.repo.get_page(region_org_id=10, start_date=date(2026, 6, 1))
+
+        later = {**self._raw_instance(id=3), "startDate": "2026-06-09"}
+        self.client.get.return_value = {"eventInstances": [later, self._raw_instance(id=4)], "totalCount": 2}
+        with self.assertLogs("infrastructure.api_client.event_instance_repository", "WARNING") as logs:
+            self.repo.get_page(region_org_id=10, start_date=date(2026, 6, 1))
+        self.assertIn("out of date order", logs.output[0])
+
+    def test_get_page_last_page_has_no_cursor(self):
+        self.client.get.return_value = {"eventInstances": [self._raw_instance(id=5)], "totalCount": 5}
+        self.assertIsNone(
+            self.repo.get_page(region_org_id=10, start_date=date(2026, 6, 1), limit=2, cursor="2").next_cursor
+        )
+
+        self.client.get.return_value = {"eventInstances": [self._raw_instance(id=5)]}
+        self.assertIsNone(self.repo.get_page(region_org_id=10, start_date=date(2026, 6, 1), limit=2).next_cursor)
+
+    def test_get_list_with_limit_stops_fetching_pages(self):
+        self.client.get.side_effect = [
+            {"eventInstances": [self._raw_instance(id=1), self._raw_instance(id=2)], "totalCount": 100},
+            {"eventInstances": [self._raw_instance(id=3), self._raw_instance(id=4)], "totalCount": 100},
+        ]
+        result = self.repo.get_list(region_org_id=10, start_date=date(2026, 6, 1), limit=2)
+
+        self.assertEqual([i.id for i in result], [1, 2])
+        self.assertEqual(self.client.get.call_count, 1)
+
     def test_get_list_handles_results_fallback(self):
         self.client.get.return_value = {"results": [self._raw_instance(id=2)]}
         result = self.repo.get_list(region_org_id=10, start_date=date(2026, 6, 1))
@@ -440,7 +532,9 @@ class CompositionRootTest(unittest.TestCase):
     def test_build_event_instance_service_uses_api_repository(self, mock_svc_cls, mock_get_repo):
         result = _build_event_instance_service()
         mock_get_repo.assert_called_once()
-        mock_svc_cls.assert_called_once_with(repository=mock_get_repo.return_value)
+        mock_svc_cls.assert_called_once_with(
+            repository=mock_get_repo.return_value, on_write=CALENDAR_FEED_CACHE.invalidate_writes
+        )
         self.assertIs(result, mock_svc_cls.return_value)
 
 
@@ -582,7 +676,7 @@ class BuildEventInstanceListFormTest(unittest.TestCase):
         mock_loading.return_value = "V_LOAD"
         mock_service = MagicMock()
         mock_build_service.return_value = mock_service
-        mock_service.get_region_instances.return_value = []
+        mock_service.get_region_instances_page.return_value = EventInstancePage()
 
         mock_ao_service = MagicMock()
         mock_build_ao.return_value = mock_ao_service
@@ -605,7 +699,7 @@ class BuildEventInstanceListFormTest(unittest.TestCase):
         mock_service = MagicMock()
         mock_build_service.return_value = mock_service
         closed_instance = _make_instance(id=1, name="Cancelled", series_exception="closed")
-        mock_service.get_region_instances.return_value = [closed_instance]
+        mock_service.get_region_instances_page.return_value = EventInstancePage(items=[closed_instance])
 
         mock_ao_service = MagicMock()
         mock_build_ao.return_value = mock_ao_service
@@ -623,6 +717,34 @@ class BuildEventInstanceListFormTest(unittest.TestCase):
         self.assertIsNotNone(event_block)
         self.assertIn("[CLOSED]", event_block.get("text", {}).get("text", ""))
 
+    @patch("features.calendar.event_instance._build_ao_service")
+    @patch("features.calendar.event_instance._build_event_instance_service")
+    def test_next_page_advances_cursor_and_keeps_history(self, mock_build_service, mock_build_ao):
+        mock_service = MagicMock()
+        mock_build_service.return_value = mock_service
+        mock_service.get_region_instances_page.return_value = EventInstancePage(
+            items=[_make_instance(id=9)], next_cursor="3"
+        )
+        mock_build_ao.return_value.get_region_aos.return_value = []
+
+        client = MagicMock()
+        body = {
+            "actions": [{"action_id": CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE}],
+            "view": {
+                "id": "V1",
+                "state": {"values": {}},
+                "blocks": [],
+                "private_metadata": json.dumps({"page_cursors": [None, "1"], "next_cursor": "2"}),
+            },
+        }
+        build_event_instance_list_form(body, client, MagicMock(), {}, self._region_record())
+
+        self.assertEqual(mock_service.get_region_instances_page.call_args.kwargs["cursor"], "2")
+        view = client.views_update.call_args.kwargs["view"]
+        self.assertEqual(json.loads(view["private_metadata"]), {"page_cursors": [None, "1", "2"], "next_cursor": "3"})
+        buttons = [e["action_id"] for b in view["blocks"] if b["type"] == "actions" for e in b["elements"]]
+        self.assertEqual(buttons, [CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE, CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from features.calendar import nearby_events
+
+
+def _in_box(lat, lon, lat_range, lon_range):
+    if not lat_range[0] <= lat <= lat_range[1]:
+        return False
+    return lon_range is None or lon_range[0] <= lon <= lon_range[1]
+
+
+def _event(event_id, parent_id, lat, lon):
+    return SimpleNamespace(
+        id=event_id,
+        org=SimpleNamespace(id=100 + event_id, parent_id=parent_id),
+        location=SimpleNamespace(latitude=lat, longitude=lon),
+    )
+
+
+class BoundingBoxTest(unittest.TestCase):
+    def test_box_contains_every_point_within_range(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            lat, lon = rng.uniform(-70, 70), rng.uniform(-170, 170)
+            miles = rng.choice([25, 50, 100, 200])
+            lat_range, lon_range = nearby_events.bounding_box(lat, lon, miles)
+            for _ in range(50):
+                plat = lat + rng.uniform(-4, 4)
+                plon = lon + rng.uniform(-8, 8)
+                if nearby_events.haversine_miles(lat, lon, plat, plon) <= miles:
+                    self.assertTrue(_in_box(plat, plon, lat_range, lon_range), (lat, lon, miles, plat, plon))
+
+    def test_box_is_tight_at_mid_latitudes(self):
+        lat_range, lon_range = nearby_events.bounding_box(35.0, -80.0, 50)
+
+        self.assertAlmostEqual(lat_range[1] - 35.0, 0.7236, places=3)
+        self.assertAlmostEqual(lon_range[1] + 80.0, 0.8834, places=3)
+
+    def test_longitude_unbounded_near_pole_and_antimeridian(self):
+        self.assertIsNone(nearby_events.bounding_box(89.5, 10.0, 100)[1])
+        self.assertIsNone(nearby_events.bounding_box(60.0, 179.9, 50)[1])
+
+
+class GetNearbySpecialEventsTest(unittest.TestCase):
+    def test_filters_and_distances_match_haversine(self):
+        events = [
+            _event(1, 2, 35.1, -80.1),  # near, other region
+            _event(2, 1, 35.1, -80.1),  # own region
+            _event(3, 2, 36.5, -80.0),  # outside the circle
+            _event(4, None, 35.0, -80.0),  # region-level event
+            _event(5, 3, 35.0, -80.5),
+        ]
+        with (
+            patch.object(nearby_events, "highlighted_events_in_box", return_value=events) as query,
+            patch.object(nearby_events.DbManager, "find_records", side_effect=[[SimpleNamespace(id=2)], []]),
+        ):
+            rows = nearby_events.get_nearby_special_events(1, 35.0, -80.0, 50, user_id=None)
+
+        self.assertEqual([r.event.id for r in rows], [1, 5])
+        self.assertEqual(rows[0].distance_miles, nearby_events.haversine_miles(35.0, -80.0, 35.1, -80.1))
+        self.assertEqual(rows[0].region_org.id, 2)
+        self.assertEqual(query.call_args.args[2:], (1, *nearby_events.bounding_box(35.0, -80.0, 50)))
+
+
+class RegionMidpointCacheTest(unittest.TestCase):
+    def setUp(self):
+        nearby_events.invalidate_region_midpoint()
+        self.addCleanup(nearby_events.invalidate_region_midpoint)
+
+    def test_midpoint_cached_until_invalidated(self):
+        locations = [SimpleNamespace(latitude=35.0, longitude=-80.0), SimpleNamespace(latitude=None, longitude=None)]
+        ao_rows = [(SimpleNamespace(latitude=37.0, longitude=-82.0), None)]
+        with (
+            patch.object(nearby_events.DbManager, "find_records", return_value=locations) as find,
+            patch.object(nearby_events.DbManager, "find_join_records2", return_value=ao_rows),
+        ):
+            self.assertEqual(nearby_events.get_region_midpoint(9), (36.0, -81.0))
+            self.assertEqual(nearby_events.get_region_midpoint(9), (36.0, -81.0))
+            self.assertEqual(find.call_count, 1)
+
+            nearby_events.invalidate_region_midpoint(9)
+            nearby_events.get_region_midpoint(9)
+            self.assertEqual(find.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
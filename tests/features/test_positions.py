@@ -250,11 +250,11 @@ class BuildConfigSltFormTest(unittest.TestCase):
 
 class HandleConfigSltPostTest(unittest.TestCase):
     @patch("features.positions._build_position_service")
-    @patch("features.positions.get_user")
-    def test_handle_config_slt_post_calls_update_assignments(self, mock_get_user, mock_build_service):
+    @patch("features.positions.get_users_bulk")
+    def test_handle_config_slt_post_calls_update_assignments(self, mock_get_users_bulk, mock_build_service):
         mock_slack_user = MagicMock()
         mock_slack_user.user_id = 42
-        mock_get_user.return_value = mock_slack_user
+        mock_get_users_bulk.return_value = [mock_slack_user]
 
         mock_service = MagicMock()
         mock_build_service.return_value = mock_service
@@ -270,9 +270,9 @@ class HandleConfigSltPostTest(unittest.TestCase):
         )
 
     @patch("features.positions._build_position_service")
-    @patch("features.positions.get_user")
-    def test_handle_config_slt_post_maps_zero_org_to_region(self, mock_get_user, mock_build_service):
-        mock_get_user.return_value = MagicMock(user_id=99)
+    @patch("features.positions.get_users_bulk")
+    def test_handle_config_slt_post_maps_zero_org_to_region(self, mock_get_users_bulk, mock_build_service):
+        mock_get_users_bulk.return_value = [MagicMock(user_id=99)]
         mock_service = MagicMock()
         mock_build_service.return_value = mock_service
 
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +8,7 @@ import requests
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
 
-from infrastructure.api_client.client import F3ApiClient, get_f3_api_client
+from infrastructure.api_client.client import F3ApiClient, ResponseCache, get_f3_api_client
 from infrastructure.api_client.exceptions import F3ApiAuthError, F3ApiError, F3ApiNotFoundError
 
 
@@ -49,7 +50,7 @@ class F3ApiClientTest(unittest.TestCase):
         self.assertEqual(result, {"ok": True})
         mock_session.get.assert_called_once_with(
             "http://api.local/v1/event-tag",
-            timeout=12.5,
+            timeout=(3.05, 12.5),
             params={"pageSize": 1},
         )
 
@@ -73,7 +74,7 @@ class F3ApiClientTest(unittest.TestCase):
         self.assertEqual(client._timeout_seconds, 8.0)
         mock_session.get.assert_called_once_with(
             "https://api.f3nation.com/v1/event-tag",
-            timeout=8.0,
+            timeout=(3.05, 8.0),
             params=None,
         )
 
@@ -158,5 +159,109 @@ class F3ApiClientTest(unittest.TestCase):
         mock_client_cls.assert_called_once()
 
 
+class F3ApiClientGatherTest(unittest.TestCase):
+    def setUp(self):
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key", "F3_API_MAX_CONCURRENCY": "4"}, clear=True):
+            self.client = F3ApiClient()
+
+    def test_runs_calls_concurrently_and_keeps_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            barrier.wait()  # only passes if all three calls are in flight at once
+            return value
+
+        result = self.client.gather(lambda: call("aos"), lambda: call("locations"), lambda: call("types"))
+
+        self.assertEqual(result, ["aos", "locations", "types"])
+
+    def test_waits_for_every_call_then_raises_first_error(self):
+        finished = []
+
+        def fail(message):
+            raise F3ApiError(500, message)
+
+        def succeed():
+            finished.append(True)
+            return "ok"
+
+        with self.assertRaisesRegex(F3ApiError, "first"):
+            self.client.gather(succeed, lambda: fail("first"), lambda: fail("second"), succeed)
+
+        self.assertEqual(finished, [True, True])
+
+    def test_nested_gather_runs_inline(self):
+        result = self.client.gather(lambda: self.client.gather(lambda: 1, lambda: 2), lambda: 3)
+
+        self.assertEqual(result, [[1, 2], 3])
+
+
+class F3ApiClientResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("infrastructure.api_client.client.requests.Session")
+        self.session = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.cache = ResponseCache(ttls={"/v1/org": 60, "/v1/location": 0})
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key", "F3_API_BASE_URL": "http://api.local"}, clear=True):
+            self.client = F3ApiClient(response_cache=self.cache)
+
+    def _response(self, status_code=200, payload=None, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.json.return_value = payload
+        response.headers = headers or {}
+        return response
+
+    def test_repeated_get_is_served_from_cache(self):
+        self.session.get.return_value = self._response(payload={"orgs": [{"id": 1}]})
+
+        first = self.client.get("/v1/org", params={"parentOrgIds": [5]})
+        first["orgs"].append({"id": 2})  # callers can't corrupt the cached copy
+        second = self.client.get("/v1/org", params={"parentOrgIds": [5]})
+        self.client.get("/v1/org", params={"parentOrgIds": [6]})
+
+        self.assertEqual(second, {"orgs": [{"id": 1}]})
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_expired_entry_is_revalidated_with_validators(self):
+        self.session.get.side_effect = [
+            self._response(payload={"locations": []}, headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Mar 2026"}),
+            self._response(status_code=304),
+        ]
+
+        self.client.get("/v1/location", params={"regionIds": [5]})
+        result = self.client.get("/v1/location", params={"regionIds": [5]})
+
+        self.assertEqual(result, {"locations": []})
+        self.assertEqual(
+            self.session.get.call_args.kwargs["headers"],
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 02 Mar 2026"},
+        )
+        self.assertEqual(self.cache.stats()["revalidations"], 1)
+
+    def test_writes_invalidate_the_resource_family(self):
+        self.session.get.return_value = self._response(payload={"org": {"id": 7}})
+        self.session.post.return_value = self._response(payload={"org": {"id": 7}})
+        self.session.delete.return_value = self._response(status_code=204)
+
+        self.client.get("/v1/org/id/7")
+        self.client.get("/v1/event-tag", params={"orgIds": [5]})
+        self.client.post("/v1/org", json={"id": 7, "name": "Renamed"})
+
+        self.assertEqual(len(self.cache), 1)
+        self.client.get("/v1/org/id/7")
+        self.client.get("/v1/event-tag", params={"orgIds": [5]})
+        self.assertEqual(self.session.get.call_count, 3)
+
+    def test_cache_is_off_by_default(self):
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key"}, clear=True):
+            self.assertIsNone(F3ApiClient().response_cache)
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key", "F3_API_CACHE_ENABLED": "true"}, clear=True):
+            self.assertIsInstance(F3ApiClient().response_cache, ResponseCache)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,154 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from infrastructure.api_client.circuit_breaker import CLOSED, OPEN
+from infrastructure.api_client.client import F3ApiClient
+from infrastructure.api_client.exceptions import F3ApiCircuitOpenError, F3ApiError
+
+
+class FaultInjectingServer:
+    """Local stub API. Each request pops the next fault from ``faults``; once empty it answers 200.
+
+    Faults: an int status code, ``("delay", seconds)`` before a 200, or ``"drop"`` to close the connection.
+    """
+
+    def __init__(self):
+        self.faults = []
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                stub.requests.append((self.command, self.path))
+                fault = stub.faults.pop(0) if stub.faults else 200
+                if fault == "drop":
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                if isinstance(fault, tuple):
+                    time.sleep(fault[1])
+                    fault = 200
+                payload = json.dumps({"status": fault}).encode()
+                self.send_response(fault)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, *_args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class F3ApiClientResilienceTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = FaultInjectingServer()
+        self.addCleanup(self.stub.stop)
+        env = {
+            "F3_API_KEY": "test-key",
+            "F3_API_BASE_URL": self.stub.url,
+            "F3_API_TIMEOUT_SECONDS": "0.3",
+            "F3_API_MAX_RETRIES": "2",
+            "F3_API_BACKOFF_SECONDS": "0.01",
+            "F3_API_BREAKER_FAILURES": "3",
+            "F3_API_BREAKER_RESET_SECONDS": "0.2",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            self.client = F3ApiClient()
+
+    def test_idempotent_requests_retry_transient_failures(self):
+        self.stub.faults = [503, 502]
+
+        self.assertEqual(self.client.get("/v1/org"), {"status": 200})
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_read_timeout_and_dropped_connection_are_retried(self):
+        self.stub.faults = [("delay", 0.6), "drop"]
+
+        self.assertEqual(self.client.put("/v1/org", json={"id": 1}), {"status": 200})
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_post_is_not_retried(self):
+        self.stub.faults = [503]
+
+        with self.assertRaises(F3ApiError) as ctx:
+            self.client.post("/v1/org", json={"name": "New AO"})
+
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(len(self.stub.requests), 1)
+
+    def test_gives_up_after_max_retries(self):
+        self.stub.faults = [504, 504, 504, 504]
+
+        with self.assertRaises(F3ApiError) as ctx:
+            self.client.get("/v1/org")
+
+        self.assertEqual(ctx.exception.status_code, 504)
+        self.assertEqual(len(self.stub.requests), 3)
+
+    def test_breaker_fails_fast_then_recovers(self):
+        self.stub.faults = [500, 500, 500]
+        with self.assertLogs("infrastructure.api_client.circuit_breaker", "WARNING") as logs:
+            for _ in range(3):
+                with self.assertRaises(F3ApiError):
+                    self.client.get("/v1/org")
+        self.assertIn("closed -> open", logs.output[0])
+
+        with self.assertRaises(F3ApiCircuitOpenError):
+            self.client.get("/v1/org")
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual(self.client._breaker.state, OPEN)
+
+        time.sleep(0.25)
+        self.assertEqual(self.client.get("/v1/org"), {"status": 200})
+        self.assertEqual(self.client._breaker.state, CLOSED)
+
+    def test_half_open_trial_is_released_when_it_raises(self):
+        self.stub.faults = [500, 500, 500]
+        with self.assertLogs("infrastructure.api_client.circuit_breaker", "WARNING"):
+            for _ in range(3):
+                with self.assertRaises(F3ApiError):
+                    self.client.get("/v1/org")
+        time.sleep(0.25)
+
+        # the half-open trial dies mid-body, then with something that isn't a requests error
+        with patch.object(self.client._session, "get", side_effect=requests.exceptions.ChunkedEncodingError("eof")):
+            with self.assertRaises(F3ApiError):
+                self.client.get("/v1/org")
+        self.assertEqual(self.client._breaker.state, OPEN)
+        time.sleep(0.25)
+        with patch.object(self.client._session, "get", side_effect=ValueError("bad header")):
+            with self.assertRaises(ValueError):
+                self.client.get("/v1/org")
+
+        self.assertEqual(self.client.get("/v1/org"), {"status": 200})
+        self.assertEqual(self.client._breaker.state, CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
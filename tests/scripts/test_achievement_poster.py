@@ -0,0 +1,162 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from slack_sdk.web import WebClient
+
+from scripts.achievement_poster import AchievementPoster, PostJob, ProgressJournal
+
+
+class _MockSlack(BaseHTTPRequestHandler):
+    """Minimal chat.postMessage endpoint that rate-limits the first request for each token."""
+
+    posts = []
+    rate_limited_tokens = set()
+    failing_channels = set()
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        payload = json.loads(body) if self.headers.get("Content-Type", "").startswith("application/json") else {}
+        if not payload:
+            payload = {k: v[0] for k, v in parse_qs(body).items()}
+        token = self.headers.get("Authorization", "")
+        with self.lock:
+            first_request = token not in self.rate_limited_tokens
+            self.rate_limited_tokens.add(token)
+            if not first_request and payload.get("channel") not in self.failing_channels:
+                self.posts.append((token, payload.get("channel"), payload.get("text")))
+
+        if first_request:
+            self._respond(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": "0"})
+        elif payload.get("channel") in self.failing_channels:
+            self._respond(200, {"ok": False, "error": "channel_not_found"})
+        else:
+            self._respond(200, {"ok": True, "channel": payload.get("channel"), "ts": "1.0"})
+
+    def _respond(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _job(key, team_id="T1", channel="C1", text="hi"):
+    return PostJob(key=key, team_id=team_id, channel=channel, text=text)
+
+
+class AchievementPosterTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _MockSlack)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/api/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _MockSlack.posts = []
+        _MockSlack.rate_limited_tokens = set()
+        _MockSlack.failing_channels = set()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal_path = os.path.join(tmp.name, "progress.jsonl")
+
+    def _poster(self, **kwargs):
+        return AchievementPoster(
+            journal=ProgressJournal(self.journal_path),
+            min_interval=0,
+            client_factory=lambda token: WebClient(token, base_url=self.base_url),
+            **kwargs,
+        )
+
+    def test_posts_each_workspace_after_retry_after(self):
+        jobs = [_job("a", "T1"), _job("b", "T1"), _job("c", "T2")]
+
+        result = self._poster().run(jobs, {"T1": "xoxb-1", "T2": "xoxb-2"})
+
+        self.assertEqual(result.posted, 3)
+        self.assertEqual(result.rate_limited, 2)
+        self.assertEqual(len(_MockSlack.posts), 3)
+
+    def test_rerun_skips_posted_jobs_and_resumes_pending_ones(self):
+        first = self._poster(max_retries=0).run([_job("a"), _job("b")], {"T1": "xoxb-1"})
+        # the very first request is rate limited and retries are disabled, so it is left pending
+        self.assertEqual(first.pending, ["a"])
+        self.assertEqual(first.posted, 1)
+
+        second = self._poster().run([_job("b")], {"T1": "xoxb-1"})
+
+        self.assertEqual(second.posted, 1)
+        self.assertEqual(second.skipped, 1)
+        self.assertEqual(len(_MockSlack.posts), 2)
+        self.assertEqual(ProgressJournal(self.journal_path).pending, {})
+
+    def test_failed_posts_are_retried_until_max_attempts(self):
+        _MockSlack.failing_channels = {"CBAD"}
+
+        for _ in range(2):
+            result = self._poster().run([_job("bad", channel="CBAD")], {"T1": "xoxb-1"})
+            self.assertEqual(result.failed, 1)
+            self.assertEqual(self._poster().pending_team_ids(), ["T1"])
+
+        result = self._poster().run([_job("bad", channel="CBAD")], {"T1": "xoxb-1"})
+
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(self._poster().pending_team_ids(), [])
+        journal = ProgressJournal(self.journal_path)
+        self.assertEqual(journal.done["bad"][0], "failed")
+
+    def test_a_failed_post_that_later_succeeds_is_posted_once(self):
+        _MockSlack.failing_channels = {"C1"}
+        self._poster().run([_job("a")], {"T1": "xoxb-1"})
+        _MockSlack.failing_channels = set()
+
+        result = self._poster().run([], {"T1": "xoxb-1"})
+
+        self.assertEqual(result.posted, 1)
+        self.assertEqual(ProgressJournal(self.journal_path).done["a"][0], "posted")
+
+    def test_global_concurrency_cap(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class SlowClient:
+            def chat_postMessage(self, **kwargs):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                threading.Event().wait(0.02)
+                with lock:
+                    active -= 1
+
+        poster = AchievementPoster(max_concurrency=2, min_interval=0, client_factory=lambda token: SlowClient())
+        jobs = [_job(f"{team}-{i}", team) for team in ("T1", "T2", "T3", "T4") for i in range(2)]
+
+        result = poster.run(jobs, dict.fromkeys(("T1", "T2", "T3", "T4"), "token"))
+
+        self.assertEqual(result.posted, 8)
+        self.assertLessEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
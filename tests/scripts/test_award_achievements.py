@@ -0,0 +1,240 @@
+import os
+import sys
+import unittest
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts.award_achievements import (
+    IncrementalRun,
+    _candidates_from_rows,
+    _changed_since,
+    _compute_all_period_metrics,
+    _compute_group_metrics,
+    _filter_signature,
+    _lowered_from,
+    _metric_signature,
+    _needs_rebuild,
+    _with_stored_metrics,
+)
+from utilities.database.orm.achievement_metrics import AchievementMetric, AchievementMetricCheckpoint
+from utilities.database.orm.views import EventAttendance
+
+SCHEMA_SQL = os.path.join(os.path.dirname(__file__), "../../db-init/achievement_metrics.sql")
+
+
+def _achievement(**overrides):
+    fields = {
+        "id": 1,
+        "auto_cadence": SimpleNamespace(name="monthly"),
+        "auto_threshold": 10,
+        "auto_filters": {"include": [{"ao_org_id": 5}]},
+        "specific_org_id": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _checkpoint(signature, award_year=2026, high_water=datetime(2026, 3, 1)):
+    return SimpleNamespace(signature=signature, award_year=award_year, high_water=high_water)
+
+
+class IncrementalEvaluationTest(unittest.TestCase):
+    def setUp(self):
+        self.run = IncrementalRun(high_water=datetime(2026, 3, 2))
+        self.today = date(2026, 3, 2)
+
+    def test_signature_tracks_threshold_and_filters(self):
+        base = _metric_signature(_achievement(), "posts")
+
+        self.assertEqual(base, _metric_signature(_achievement(), "posts"))
+        self.assertNotEqual(base, _metric_signature(_achievement(auto_threshold=11), "posts"))
+        self.assertNotEqual(base, _metric_signature(_achievement(auto_filters={}), "posts"))
+        self.assertNotEqual(base, _metric_signature(_achievement(), "qs"))
+
+    def test_threshold_changes_keep_the_checkpoint(self):
+        checkpoint = _checkpoint(_metric_signature(_achievement(), "posts"))
+        raised = _metric_signature(_achievement(auto_threshold=25), "posts")
+        lowered = _metric_signature(_achievement(auto_threshold=5), "posts")
+
+        self.assertFalse(_needs_rebuild(checkpoint, raised, "monthly", self.today, self.run))
+        self.assertFalse(_needs_rebuild(checkpoint, lowered, "monthly", self.today, self.run))
+        self.assertIsNone(_lowered_from(checkpoint, raised))
+        self.assertEqual(_lowered_from(checkpoint, lowered), 10)
+
+    def test_changed_rows_are_reread_behind_the_oldest_checkpoint(self):
+        checkpoints = [_checkpoint("a", high_water=datetime(2026, 3, 1, 12)), _checkpoint("b")]
+
+        with patch("scripts.award_achievements.CHECKPOINT_OVERLAP_SECONDS", 300):
+            self.assertEqual(_changed_since(checkpoints), datetime(2026, 2, 28, 23, 55))
+
+    def test_lowered_threshold_rechecks_stored_metrics(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(7, 2026, 1, 6), (8, 2026, 2, 7)]
+
+        rows = _with_stored_metrics(session, _achievement(auto_threshold=5), 2026, 10, [(8, 2026, 2, 9)])
+
+        self.assertEqual(sorted(rows), [(7, 2026, 1, 6), (8, 2026, 2, 9)])
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("achievement_metrics.metric >= %(metric_1)s", sql)
+        self.assertIn("achievement_metrics.metric < %(metric_2)s", sql)
+
+    def test_schema_sql_creates_the_mapped_tables(self):
+        with open(SCHEMA_SQL) as f:
+            sql = f.read()
+
+        for table in (AchievementMetric.__table__, AchievementMetricCheckpoint.__table__):
+            body = sql.split(f"CREATE TABLE IF NOT EXISTS {table.name} (")[1].split(");")[0]
+            with self.subTest(table=table.name):
+                self.assertEqual(
+                    {line.split()[0] for line in body.strip().splitlines() if not line.strip().startswith("PRIMARY")},
+                    set(table.columns.keys()),
+                )
+
+    def test_matching_checkpoint_runs_incrementally(self):
+        signature = _metric_signature(_achievement(), "posts")
+
+        self.assertFalse(_needs_rebuild(_checkpoint(signature), signature, "monthly", self.today, self.run))
+
+    def test_rebuild_triggers(self):
+        signature = _metric_signature(_achievement(), "posts")
+
+        self.assertTrue(_needs_rebuild(None, signature, "monthly", self.today, self.run))
+        self.assertTrue(_needs_rebuild(_checkpoint("old"), signature, "monthly", self.today, self.run))
+        self.assertTrue(
+            _needs_rebuild(_checkpoint(signature, award_year=2025), signature, "monthly", self.today, self.run)
+        )
+        self.assertTrue(
+            _needs_rebuild(_checkpoint(signature), signature, "monthly", self.today, IncrementalRun(None, rebuild=True))
+        )
+        # lifetime metrics are not scoped to a year, so a new year alone doesn't force a rebuild
+        self.assertFalse(
+            _needs_rebuild(_checkpoint(signature, award_year=-1), signature, "lifetime", self.today, self.run)
+        )
+
+
+class GroupedEvaluationTest(unittest.TestCase):
+    def test_filter_signature_ignores_threshold(self):
+        # thresholds share a metric column; only the counted rows matter
+        self.assertEqual(_filter_signature(_achievement()), _filter_signature(_achievement(auto_threshold=50)))
+        self.assertNotEqual(_filter_signature(_achievement()), _filter_signature(_achievement(auto_filters={})))
+        self.assertNotEqual(_filter_signature(_achievement()), _filter_signature(_achievement(specific_org_id=3)))
+
+    def test_candidates_respect_threshold_and_existing_awards(self):
+        rows = [(10, 2026, 1, 12), (11, 2026, 1, 9), (12, 2026, 1, 10), (10, 2026, 2, 15)]
+        existing = {(1, 2026, 1): {12}, (2, 2026, 2): {10}}
+
+        candidates = _candidates_from_rows(_achievement(), rows, existing)
+
+        self.assertEqual([(c.user_id, c.award_period, c.metric) for c in candidates], [(10, 1, 12), (10, 2, 15)])
+
+
+class GroupedMetricsMatchPerAchievementTest(unittest.TestCase):
+    """The single FILTERed pass must count exactly what the per-achievement queries count."""
+
+    today = date(2026, 5, 20)
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE event_instance_expanded (id INTEGER PRIMARY KEY, start_date DATE, ao_org_id INTEGER,"
+                    " first_f_ind INTEGER, updated DATETIME)"
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE TABLE attendance_expanded (id INTEGER PRIMARY KEY, user_id INTEGER,"
+                    " event_instance_id INTEGER, q_ind INTEGER, home_region_id INTEGER, updated DATETIME)"
+                )
+            )
+            events = [
+                # id, start_date, ao, first_f_ind
+                (1, "2025-12-30", 5, 1),  # last year: only lifetime counts it
+                (2, "2026-01-05", 5, 1),
+                (3, "2026-01-12", 6, 0),
+                (4, "2026-02-03", 5, 0),
+                (5, "2026-04-14", 6, 1),
+                (6, "2026-05-18", 5, 1),
+                (7, "2026-06-01", 5, 1),  # after today
+            ]
+            conn.execute(
+                text("INSERT INTO event_instance_expanded VALUES (:id, :d, :ao, :f, '2026-01-01')"),
+                [{"id": i, "d": d, "ao": ao, "f": f} for i, d, ao, f in events],
+            )
+            attendance = [
+                # user, event, q_ind, home_region
+                (10, 1, 1, 100),
+                (10, 2, 1, 100),
+                (10, 3, 0, 100),
+                (10, 4, 1, 100),
+                (10, 6, 0, 100),
+                (10, 7, 1, 100),
+                (11, 2, 0, 200),
+                (11, 3, 1, 200),
+                (11, 5, 0, 200),
+                (11, 6, 1, 200),
+                (12, 4, 0, 100),
+                (12, 5, 0, 100),
+            ]
+            conn.execute(
+                text("INSERT INTO attendance_expanded VALUES (:id, :u, :e, :q, :r, '2026-01-01')"),
+                [{"id": n, "u": u, "e": e, "q": q, "r": r} for n, (u, e, q, r) in enumerate(attendance, 1)],
+            )
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+
+    def _achievements(self, cadence):
+        return [
+            _achievement(id=1, auto_cadence=SimpleNamespace(name=cadence), auto_threshold=1),
+            _achievement(id=2, auto_cadence=SimpleNamespace(name=cadence), auto_threshold=3),  # shares id=1's column
+            _achievement(id=3, auto_cadence=SimpleNamespace(name=cadence), auto_filters={}, auto_threshold=2),
+            _achievement(
+                id=4, auto_cadence=SimpleNamespace(name=cadence), auto_filters={"include": [{"first_f_ind": 1}]}
+            ),
+            _achievement(id=5, auto_cadence=SimpleNamespace(name=cadence), auto_filters={}, specific_org_id=100),
+        ]
+
+    def test_rows_match_the_per_achievement_queries(self):
+        for cadence in ("weekly", "monthly", "quarterly", "yearly", "lifetime"):
+            for threshold_type in ("posts", "qs", "unique_aos", "posts_at_ao"):
+                achievements = self._achievements(cadence)
+                grouped = _compute_group_metrics(self.session, cadence, threshold_type, achievements, self.today)
+                for achievement in achievements:
+                    expected = _compute_all_period_metrics(self.session, achievement, threshold_type, self.today)
+                    with self.subTest(cadence=cadence, threshold_type=threshold_type, achievement=achievement.id):
+                        self.assertEqual(
+                            sorted(grouped[_filter_signature(achievement)]), sorted(r for r in expected if r[3])
+                        )
+
+    def test_changed_user_filter_narrows_every_column(self):
+        achievements = self._achievements("monthly")
+
+        grouped = _compute_group_metrics(
+            self.session, "monthly", "posts", achievements, self.today, extra_filters=[EventAttendance.user_id == 11]
+        )
+
+        self.assertEqual({row[0] for rows in grouped.values() for row in rows}, {11})
+
+    def test_one_filter_column_per_signature(self):
+        session = MagicMock()
+        session.execute.return_value = iter([])
+
+        _compute_group_metrics(session, "monthly", "posts", self._achievements("monthly"), self.today)
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertEqual(sql.count("FILTER (WHERE"), 4)  # 5 achievements, 4 distinct filter sets
+        for label in ("m0", "m1", "m2", "m3"):
+            self.assertIn(f"AS {label}", sql)
+        self.assertNotIn("AS m4", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from io import BytesIO
+
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts import calendar_images
+from utilities.constants import EVENT_TAG_COLORS
+
+COLOR_DICTS = {
+    "region": {"Ruck": "Purple"},
+    "nation_not_black": {"Convergence": "Red"},
+    "nation_black": {"Sandbag": "Black"},
+    "generic": {"OPEN!": "Green", "CLOSED": "Closed"},
+}
+COLUMNS = ["AO\nLocation", "Monday\n2025/01/06", "Tuesday\n2025/01/07", "Wednesday\n2025/01/08"]
+ROWS = [
+    ["The Depot\nRail yard", "OPEN!\nBC 0530", "Slaw\nConvergence\n0530", ""],
+    ["Moose Lodge", "CLOSED", "Slaw\nSandbag\nRuck\n0600", "Hoss\nBC 0530"],
+    ["Last updated at 01/06 05:00 AM CST", "", "", ""],
+]
+
+
+def _rgb(hex_color):
+    return tuple(int(hex_color[i : i + 2], 16) for i in (1, 3, 5))
+
+
+def _png_bytes(image):
+    out = BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+def _cell_boxes(image):
+    """(left, top, right, bottom) of every cell, found from the 1px-per-scale border lines."""
+    border = _rgb(calendar_images.BORDER_COLOR)
+    pixels = image.load()
+    width, height = image.size
+    cols = [x for x in range(width) if all(pixels[x, y] == border for y in range(height))]
+    rows = [y for y in range(height) if all(pixels[x, y] == border for x in range(width))]
+
+    def spans(lines):
+        return [(a + 1, b) for a, b in zip(lines, lines[1:], strict=False) if b > a + 1]
+
+    return [[(left, top, right, bottom) for left, right in spans(cols)] for top, bottom in spans(rows)]
+
+
+class CellColorsTest(unittest.TestCase):
+    def test_first_tagged_line_wins_and_region_beats_nation(self):
+        self.assertEqual(
+            calendar_images.cell_colors("Slaw\nRuck\nConvergence", COLOR_DICTS), EVENT_TAG_COLORS["Purple"]
+        )
+        self.assertEqual(calendar_images.cell_colors("Slaw\nSandbag\nRuck", COLOR_DICTS), EVENT_TAG_COLORS["Black"])
+        self.assertEqual(calendar_images.cell_colors("CLOSED", COLOR_DICTS), EVENT_TAG_COLORS["Closed"])
+        self.assertEqual(calendar_images.cell_colors("The Depot", COLOR_DICTS), calendar_images.DEFAULT_CELL_COLORS)
+
+
+class RenderCalendarImageTest(unittest.TestCase):
+    def setUp(self):
+        self.image = calendar_images.render_calendar_image(COLUMNS, ROWS, COLOR_DICTS)
+
+    def test_grid_matches_the_table_layout(self):
+        boxes = _cell_boxes(self.image)
+
+        self.assertEqual([len(row) for row in boxes], [4, 4, 4, 4])
+        # rows grow with the tallest cell: header 2 lines, then 3, 4 and 1 lines
+        heights = [row[0][3] - row[0][1] for row in boxes]
+        self.assertTrue(heights[3] < heights[0] < heights[1] < heights[2], heights)
+        # the long footer label sets the first column width
+        self.assertGreater(boxes[0][0][2] - boxes[0][0][0], boxes[0][3][2] - boxes[0][3][0])
+
+    def test_cells_are_filled_with_their_tag_colours(self):
+        boxes = _cell_boxes(self.image)
+        pixels = self.image.load()
+
+        for r, row in enumerate([COLUMNS] + ROWS):
+            for c, cell in enumerate(row):
+                background = calendar_images.DEFAULT_CELL_COLORS[0]
+                if r:
+                    background = calendar_images.cell_colors(cell, COLOR_DICTS)[0]
+                left, top, _, _ = boxes[r][c]
+                with self.subTest(cell=cell):
+                    self.assertEqual(pixels[left + 1, top + 1], _rgb(background))
+
+    def test_text_uses_the_tag_text_colour(self):
+        left, top, right, bottom = _cell_boxes(self.image)[1][1]  # OPEN! cell
+        colors = {color for _, color in self.image.crop((left, top, right, bottom)).getcolors(maxcolors=10000)}
+
+        self.assertIn(_rgb(EVENT_TAG_COLORS["Green"][1]), colors)
+
+    def test_output_is_deterministic(self):
+        again = calendar_images.render_calendar_image(COLUMNS, ROWS, COLOR_DICTS)
+
+        self.assertEqual(_png_bytes(self.image), _png_bytes(again))
+
+
+@unittest.skipUnless(
+    all(importlib.util.find_spec(m) for m in ("pandas", "dataframe_image", "playwright")),
+    "needs pandas, dataframe_image and a Playwright browser for the old HTML export",
+)
+class MatchesHtmlExportTest(unittest.TestCase):
+    def test_colour_areas_match_the_dataframe_image_export(self):
+        import dataframe_image as dfi
+        import pandas as pd
+
+        df = pd.DataFrame(ROWS, columns=COLUMNS)
+        styled = (
+            df.style.set_table_styles(
+                [
+                    {"selector": "th", "props": [("font-size", "15px"), ("white-space", "pre-wrap")]},
+                    {"selector": "td", "props": [("font-size", "15px"), ("white-space", "pre-wrap")]},
+                ]
+            )
+            .map(lambda cell: f"background-color: {calendar_images.cell_colors(cell, COLOR_DICTS)[0]}")
+            .hide(axis="index")
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "old.png")
+            dfi.export(styled, path, table_conversion="playwright")
+            old = Image.open(path).convert("RGB")
+        new = calendar_images.render_calendar_image(COLUMNS, ROWS, COLOR_DICTS)
+
+        def share(image, color):
+            counts = {rgb: n for n, rgb in image.getcolors(maxcolors=1 << 24)}
+            return counts.get(_rgb(color), 0) / (image.width * image.height)
+
+        for tag_color in ("Green", "Red", "Closed"):
+            background = EVENT_TAG_COLORS[tag_color][0]
+            with self.subTest(color=tag_color):
+                self.assertGreater(share(old, background), 0)
+                self.assertAlmostEqual(share(new, background), share(old, background), delta=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts import hourly_runner
+from scripts.task_scheduler import TaskScheduler
+
+REGIONS = [(1, "T1"), (2, "T1"), (3, "T2")]
+
+
+def _tasks(regions=REGIONS, **kwargs):
+    with patch.object(hourly_runner, "_region_workspaces", return_value=regions):
+        return {task.name: task for task in hourly_runner.build_hourly_tasks(**kwargs)}
+
+
+class BuildHourlyTasksTest(unittest.TestCase):
+    def test_region_scripts_run_as_one_task_per_region(self):
+        tasks = _tasks(force=True)
+
+        for group in ("calendar_images", "backblast_reminders", "q_lineups"):
+            with self.subTest(group=group):
+                members = [t for t in tasks.values() if t.group == group]
+                self.assertEqual([t.name for t in members], [f"{group}[1]", f"{group}[2]", f"{group}[3]"])
+                self.assertEqual([t.workspace for t in members], ["T1", "T1", "T2"])
+                self.assertEqual([t.func.keywords["region_org_id"] for t in members], [1, 2, 3])
+        self.assertEqual(tasks["q_lineups[2]"].func.keywords, {"region_org_id": 2, "force": True})
+        self.assertEqual(
+            [t.workspace for t in tasks.values() if t.group == "slack_user_sync"],
+            ["T1", "T2"],
+        )
+        self.assertIsNone(tasks["preblast_reminders"].workspace)
+
+    def test_dependencies_resolve_over_the_split_groups(self):
+        scheduler = TaskScheduler()
+        for task in _tasks(run_reporting=False).values():
+            scheduler.add(task)
+
+        resolved = scheduler._resolve_dependencies()
+
+        self.assertEqual(resolved["home_regions"], {"slack_user_sync[T1]", "slack_user_sync[T2]"})
+
+    def test_falls_back_to_nation_wide_tasks_without_regions(self):
+        with patch.object(hourly_runner, "_region_workspaces", side_effect=RuntimeError("db down")):
+            with patch("builtins.print"):
+                tasks = {task.name: task for task in hourly_runner.build_hourly_tasks()}
+
+        for name in ("calendar_images", "backblast_reminders", "q_lineups", "slack_user_sync"):
+            with self.subTest(name=name):
+                self.assertIsNone(tasks[name].workspace)
+        self.assertNotIn("region_org_id", tasks["calendar_images"].func.keywords)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts import monthly_reporting as reporting
+
+
+def _row(region_org_id, org_id, month, posts=10):
+    return SimpleNamespace(
+        region_org_id=region_org_id,
+        org_id=org_id,
+        month=datetime(2025, month, 1),
+        event_count=2,
+        total_posts=posts,
+        total_fngs=1,
+        unique_pax_count=5,
+    )
+
+
+def _fake_render(kind, records):
+    """Stands in for render_chart in worker processes: writes a unique file per chart, fails on "boom"."""
+    if records == ["boom"]:
+        raise RuntimeError("render failed")
+    fd, path = tempfile.mkstemp(prefix=f"{kind}-", suffix=".png")
+    os.write(fd, repr(records).encode())
+    os.close(fd)
+    return path
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class SummaryQueryScopeTest(unittest.TestCase):
+    def test_region_scope_is_pushed_into_every_subquery(self):
+        sql = _sql(reporting._summary_query(region_org_id=42))
+
+        # events and attendance subqueries for both the AO and region scopes
+        self.assertEqual(sql.count("event_instance_expanded.region_org_id = %(region_org_id_"), 4)
+        self.assertNotIn("event_instance_expanded.ao_org_id = %(", sql)
+        self.assertTrue(sql.endswith("ORDER BY region_org_id, org_id, month"))
+
+    def test_unscoped_query_has_no_org_predicates(self):
+        sql = _sql(reporting._summary_query())
+
+        self.assertNotIn("region_org_id = %(", sql)
+
+
+class SummaryStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        patcher = patch.object(reporting, "get_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_yields_one_region_at_a_time(self):
+        rows = {1: [_row(1, 1, 1), _row(1, 1, 2), _row(1, 11, 1)], 2: [_row(2, 2, 1), _row(2, 21, 1)], 3: []}
+        queried = []
+
+        def execute(query):
+            queried.append(_sql(query))
+            return iter(rows[len(queried)])
+
+        self.session.execute.side_effect = execute
+        regions = []
+        for region_id, orgs in reporting.iter_region_summary_data([1, 2, 3]):
+            # the region's session is closed before the caller renders and uploads
+            self.assertEqual(self.session.close.call_count, len(queried))
+            regions.append((region_id, orgs))
+
+        self.assertEqual([(region_id, sorted(orgs)) for region_id, orgs in regions], [(1, [1, 11]), (2, [2, 21])])
+        self.assertEqual([s.month.month for s in regions[0][1][1]], [1, 2])
+        self.assertEqual(len(queried), 3)
+        for sql in queried:
+            self.assertIn("region_org_id = %(", sql)
+
+    def test_defaults_to_regions_with_events_in_the_window(self):
+        self.session.scalars.return_value = iter([5])
+        self.session.execute.return_value = iter([_row(5, 5, 1)])
+
+        regions = list(reporting.iter_region_summary_data())
+
+        self.assertEqual([region_id for region_id, _ in regions], [5])
+        self.assertIn("DISTINCT event_instance_expanded.region_org_id", _sql(self.session.scalars.call_args.args[0]))
+        self.assertEqual(self.session.close.call_count, 2)
+
+    def test_pull_merges_regions_into_one_dict(self):
+        self.session.execute.return_value = iter([_row(1, 1, 1), _row(1, 11, 1, posts=3)])
+
+        summaries = reporting.pull_org_summary_data(region_org_id=1)
+
+        self.assertEqual(summaries[11], [reporting.OrgMonthlySummary(11, datetime(2025, 1, 1), 2, 3, 1, 5)])
+        self.assertIn("region_org_id = %(", _sql(self.session.execute.call_args.args[0]))
+
+    def test_leaderboard_scope_is_pushed_into_every_basis(self):
+        self.session.execute.return_value.all.return_value = []
+
+        self.assertEqual(reporting.pull_org_leaderboard_data(region_org_id=3, ao_org_id=4), {})
+
+        sql = _sql(self.session.execute.call_args.args[0])
+        self.assertEqual(sql.count("event_instance_expanded.region_org_id = %(region_org_id_"), 4)
+        self.assertEqual(sql.count("event_instance_expanded.ao_org_id = %(ao_org_id_"), 4)
+
+
+class RunReportingSingleOrgTest(unittest.TestCase):
+    def test_both_pulls_are_scoped_to_the_region(self):
+        with (
+            patch.object(reporting, "pull_org_leaderboard_data", return_value={}) as leaderboard,
+            patch.object(reporting, "pull_org_summary_data", return_value={}) as summary,
+            patch.object(reporting.DbManager, "find_records", return_value=[]),
+            patch.object(reporting, "upload_files_to_slack"),
+        ):
+            reporting.run_reporting_single_org(
+                {}, MagicMock(), MagicMock(), {}, reporting.SlackSettings(team_id="T1", org_id=7)
+            )
+
+        self.assertEqual(leaderboard.call_args.kwargs, {"region_org_id": 7})
+        self.assertEqual(summary.call_args.kwargs, {"region_org_id": 7})
+
+
+class ChartPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.uploads = []
+        patcher = patch("builtins.print")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _upload(self, paths, settings, text, channel):
+        contents = []
+        for path in paths:
+            with open(path) as f:
+                contents.append(f.read())
+            os.remove(path)
+        self.uploads.append((channel, contents))
+
+    def _messages(self, count):
+        settings = reporting.SlackSettings(team_id="T1")
+        return [
+            reporting.ReportMessage(settings, f"org {i}", f"C{i}", [("summary", [i]), ("leaders", [i, i])])
+            for i in range(count)
+        ]
+
+    def test_each_message_uploads_its_own_charts_once_rendered(self):
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.uploads.clear()
+                with reporting.ChartPipeline(
+                    workers=workers, max_pending=2, render=_fake_render, upload=self._upload
+                ) as pipeline:
+                    for message in self._messages(5):
+                        pipeline.submit(message)
+
+                self.assertEqual(sorted(self.uploads), [(f"C{i}", [f"[{i}]", f"[{i}, {i}]"]) for i in range(5)])
+                self.assertEqual(pipeline.charts, 10)
+                self.assertGreater(pipeline.charts_per_second, 0)
+
+    def test_failed_chart_does_not_block_the_message(self):
+        settings = reporting.SlackSettings(team_id="T1")
+        message = reporting.ReportMessage(settings, "org", "C1", [("summary", ["boom"]), ("summary", [1])])
+
+        with reporting.ChartPipeline(workers=1, render=_fake_render, upload=self._upload) as pipeline:
+            pipeline.submit(message)
+
+        self.assertEqual(self.uploads, [("C1", ["[1]"])])
+        self.assertEqual(pipeline.charts, 1)
+
+    def test_uploaded_charts_are_removed(self):
+        path = _fake_render("summary", [1])
+        with patch.object(reporting, "upload_files_to_slack") as upload:
+            reporting.upload_and_remove([path], reporting.SlackSettings(team_id="T1"), text="hi", channel="C1")
+
+        upload.assert_called_once()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
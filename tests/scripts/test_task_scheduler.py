@@ -0,0 +1,170 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts.task_scheduler import (
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    ScheduledTask,
+    TaskCancelled,
+    TaskScheduler,
+    check_cancelled,
+    format_summary,
+)
+
+
+class TaskSchedulerTest(unittest.TestCase):
+    def test_group_dependencies_run_after_every_member(self):
+        order = []
+        lock = threading.Lock()
+
+        def record(name):
+            def run():
+                time.sleep(0.01)
+                with lock:
+                    order.append(name)
+
+            return run
+
+        scheduler = TaskScheduler(max_workers=4, poll_interval=0.01)
+        scheduler.add(ScheduledTask("sync[A]", record("sync[A]"), group="sync", workspace="A"))
+        scheduler.add(ScheduledTask("sync[B]", record("sync[B]"), group="sync", workspace="B"))
+        scheduler.add(ScheduledTask("nudge", record("nudge"), depends_on=["sync"]))
+
+        results = scheduler.run()
+
+        self.assertEqual(order[-1], "nudge")
+        self.assertEqual({r.status for r in results}, {STATUS_OK})
+
+    def test_per_workspace_limit_caps_concurrency(self):
+        active = {"A": 0}
+        peak = {"A": 0}
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active["A"] += 1
+                peak["A"] = max(peak["A"], active["A"])
+            time.sleep(0.02)
+            with lock:
+                active["A"] -= 1
+
+        scheduler = TaskScheduler(max_workers=8, per_workspace_limit=2, poll_interval=0.005)
+        for i in range(6):
+            scheduler.add(ScheduledTask(f"task{i}", work, workspace="A"))
+
+        scheduler.run()
+
+        self.assertLessEqual(peak["A"], 2)
+
+    def test_errors_are_recorded_and_dependents_still_run(self):
+        ran = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        scheduler = TaskScheduler(poll_interval=0.01)
+        scheduler.add(ScheduledTask("first", fail))
+        scheduler.add(ScheduledTask("second", lambda: ran.append("second"), depends_on=["first"]))
+
+        results = {r.name: r for r in scheduler.run()}
+
+        self.assertEqual(results["first"].status, STATUS_ERROR)
+        self.assertEqual(results["first"].error, "boom")
+        self.assertEqual(ran, ["second"])
+
+    def test_timeout_releases_dependents(self):
+        release = threading.Event()
+        ran = []
+
+        scheduler = TaskScheduler(poll_interval=0.01)
+        scheduler.add(ScheduledTask("slow", lambda: release.wait(2), timeout=0.05))
+        scheduler.add(ScheduledTask("after", lambda: ran.append("after"), depends_on=["slow"]))
+
+        results = {r.name: r for r in scheduler.run()}
+        release.set()
+
+        self.assertEqual(results["slow"].status, STATUS_TIMEOUT)
+        self.assertEqual(ran, ["after"])
+
+    def test_timed_out_task_is_cancelled_at_its_next_check(self):
+        checks = []
+
+        def loop():
+            try:
+                while True:
+                    time.sleep(0.01)
+                    check_cancelled()
+                    checks.append(1)
+            except TaskCancelled:
+                checks.append("cancelled")
+                raise
+
+        scheduler = TaskScheduler(poll_interval=0.01)
+        scheduler.add(ScheduledTask("loop", loop, timeout=0.05))
+
+        results = scheduler.run()
+        deadline = time.monotonic() + 1
+        while checks[-1:] != ["cancelled"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(results[0].status, STATUS_TIMEOUT)
+        self.assertEqual(checks[-1], "cancelled")
+        check_cancelled()  # no-op outside a scheduled task
+
+    def test_hung_tasks_use_spare_threads(self):
+        hang = threading.Event()
+        self.addCleanup(hang.set)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.03)
+            with lock:
+                active[0] -= 1
+
+        scheduler = TaskScheduler(max_workers=2, spare_workers=2, poll_interval=0.005)
+        for i in range(2):
+            scheduler.add(ScheduledTask(f"hung{i}", hang.wait, timeout=0.02))
+        for i in range(4):
+            scheduler.add(ScheduledTask(f"work{i}", work, depends_on=["hung0", "hung1"]))
+
+        results = {r.name: r.status for r in scheduler.run()}
+
+        # the two stuck threads sit in the spare threads, so later work still gets both slots
+        self.assertEqual(peak[0], 2)
+        self.assertEqual([results[f"work{i}"] for i in range(4)], [STATUS_OK] * 4)
+
+    def test_unknown_dependency_and_cycles_are_rejected(self):
+        scheduler = TaskScheduler()
+        scheduler.add(ScheduledTask("a", lambda: None, depends_on=["missing"]))
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            scheduler.run()
+
+        scheduler = TaskScheduler()
+        scheduler.add(ScheduledTask("a", lambda: None, depends_on=["b"]))
+        scheduler.add(ScheduledTask("b", lambda: None, depends_on=["a"]))
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            scheduler.run()
+
+    def test_format_summary_groups_results(self):
+        scheduler = TaskScheduler(poll_interval=0.01)
+        scheduler.add(ScheduledTask("sync[A]", lambda: None, group="sync"))
+        scheduler.add(ScheduledTask("sync[B]", lambda: None, group="sync"))
+
+        summary = format_summary(scheduler.run(), wall_time=1.5)
+
+        self.assertIn("Hourly run finished in 1.5s (2 tasks)", summary)
+        self.assertIn("sync: 2 task(s)", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from slack_sdk.errors import SlackApiError
+
+from scripts import update_slack_users as sync
+from scripts.task_scheduler import TaskCancelled
+
+
+def _member(slack_id, updated=100, **overrides):
+    member = {
+        "id": slack_id,
+        "name": slack_id.lower(),
+        "team_id": "T1",
+        "updated": updated,
+        "is_bot": False,
+        "profile": {"display_name": f"Pax {slack_id}", "email": f"{slack_id}@example.com", "image_512": "big.png"},
+    }
+    member.update(overrides)
+    return member
+
+
+def _stored(slack_id, row_id, slack_updated=100, user_id=7, team_id="T1"):
+    return SimpleNamespace(
+        id=row_id, slack_id=slack_id, user_id=user_id, slack_updated=slack_updated, slack_team_id=team_id
+    )
+
+
+class DiffPageTest(unittest.TestCase):
+    def test_splits_new_changed_and_unchanged(self):
+        members = [
+            _member("U1"),
+            _member("U2", updated=200),
+            _member("U3"),
+            _member("U4"),
+            _member("B1", is_bot=True),
+            _member("USLACKBOT"),
+        ]
+        existing = {"U1": _stored("U1", 1), "U2": _stored("U2", 2), "U4": _stored("U4", 4, user_id=None)}
+
+        new_profiles, updates = sync.diff_page(members, existing, org_id=9)
+
+        self.assertEqual([p["slack_id"] for p in new_profiles], ["U3", "U4"])
+        self.assertEqual(new_profiles[0]["home_region_id"], 9)
+        self.assertEqual(
+            updates,
+            [
+                {
+                    "id": 2,
+                    "user_name": "Pax U2",
+                    "slack_updated": 200,
+                    "is_admin": False,
+                    "is_owner": False,
+                    "is_bot": False,
+                    "avatar_url": "big.png",
+                }
+            ],
+        )
+
+    def test_force_updates_everything_linked(self):
+        existing = {"U1": _stored("U1", 1), "U2": _stored("U2", 2, slack_updated=None)}
+
+        _, updates = sync.diff_page([_member("U1"), _member("U2")], existing, org_id=9, force=True)
+
+        self.assertEqual([u["id"] for u in updates], [1, 2])
+
+
+class SyncWorkspaceTest(unittest.TestCase):
+    def setUp(self):
+        self.space = SimpleNamespace(team_id="T1", workspace_name="Alpha", settings={"bot_token": "xoxb"})
+        self.client = MagicMock()
+        self.client.retry_handlers = []
+        patcher = patch.object(sync, "WebClient", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.existing = patch.object(sync, "_existing_slack_users", return_value={"U1": _stored("U1", 1, 50)})
+        self.upsert = patch.object(sync, "upsert_slack_users", side_effect=lambda profiles: profiles)
+        self.update = patch.object(sync, "update_slack_users_by_id", side_effect=len)
+        for p in (self.existing, self.upsert, self.update):
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_writes_each_page_as_it_arrives(self):
+        self.client.users_list.side_effect = [
+            {"members": [_member("U1"), _member("U2")], "response_metadata": {"next_cursor": "abc"}},
+            {"members": [_member("U3")], "response_metadata": {"next_cursor": ""}},
+        ]
+
+        with patch("builtins.print"):
+            result = sync.sync_workspace(self.space, org_id=9)
+
+        self.assertEqual(self.client.users_list.call_args_list[1].kwargs, {"limit": sync.PAGE_SIZE, "cursor": "abc"})
+        self.assertEqual(sync.upsert_slack_users.call_count, 2)
+        self.assertEqual(
+            (result.pages, result.members, result.inserted, result.updated, result.error), (2, 3, 2, 1, None)
+        )
+        self.assertIn("rows changed/s", str(result))
+
+    def test_slack_error_keeps_pages_already_written(self):
+        error = SlackApiError("ratelimited", {"error": "ratelimited"})
+        self.client.users_list.side_effect = [
+            {"members": [_member("U2")], "response_metadata": {"next_cursor": "abc"}},
+            error,
+        ]
+
+        with patch("builtins.print"):
+            result = sync.sync_workspace(self.space, org_id=9)
+
+        self.assertEqual((result.pages, result.inserted, result.error), (1, 1, "ratelimited"))
+
+    def test_stops_between_pages_once_cancelled(self):
+        cancel = threading.Event()
+
+        def first_page(**kwargs):
+            cancel.set()  # the hourly runner timed the task out while this page was in flight
+            return {"members": [_member("U2")], "response_metadata": {"next_cursor": "abc"}}
+
+        self.client.users_list.side_effect = first_page
+
+        with patch("builtins.print"), self.assertRaises(TaskCancelled):
+            sync.sync_workspace(self.space, org_id=9, cancel=cancel)
+
+        self.assertEqual(self.client.users_list.call_count, 1)
+        self.assertEqual(sync.upsert_slack_users.call_count, 1)
+
+    def test_syncs_workspaces_concurrently(self):
+        records = [(SimpleNamespace(team_id=t), SimpleNamespace(org_id=i)) for i, t in enumerate(["T1", "T2", "T3"])]
+        with (
+            patch.object(sync.DbManager, "find_join_records2", return_value=records),
+            patch.object(
+                sync,
+                "sync_workspace",
+                side_effect=lambda space, org_id, force, cancel: sync.SyncResult(space.team_id),
+            ),
+            patch("builtins.print"),
+        ):
+            results = sync.update_slack_users()
+
+        self.assertEqual([r.workspace for r in results], ["T1", "T2", "T3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import requests
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utilities import avatar_cache
+
+
+def _png(width=120, height=80) -> bytes:
+    out = BytesIO()
+    Image.new("RGB", (width, height), "red").save(out, format="PNG")
+    return out.getvalue()
+
+
+def _response(content: bytes = None, status: int = 200):
+    def raise_for_status():
+        if status >= 400:
+            raise requests.HTTPError(status, response=SimpleNamespace(status_code=status))
+
+    return SimpleNamespace(content=content or _png(), raise_for_status=raise_for_status)
+
+
+class AvatarCacheTest(unittest.TestCase):
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = patch.object(avatar_cache, "CACHE_DIR", cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_warm_cache_needs_no_network(self):
+        urls = ["https://a/1.png", "https://a/2.png", "https://a/1.png", None]
+        with patch.object(avatar_cache.requests, "get", return_value=_response()) as get:
+            first = avatar_cache.load_avatars(urls, 60)
+            second = avatar_cache.load_avatars(urls, 60)
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(sorted(second), ["https://a/1.png", "https://a/2.png"])
+        self.assertEqual((first["https://a/1.png"].size, second["https://a/1.png"].size), ((60, 60), (60, 60)))
+        self.assertEqual(second["https://a/2.png"].mode, "RGBA")
+
+    def test_stale_entries_are_refetched(self):
+        url = "https://a/1.png"
+        with patch.object(avatar_cache.requests, "get", return_value=_response()) as get:
+            avatar_cache.load_avatars([url], 60)
+            stale = time.time() - avatar_cache.TTL_SECONDS - 1
+            os.utime(avatar_cache.cache_path(url, 60), (stale, stale))
+            avatar_cache.load_avatars([url], 60)
+            avatar_cache.load_avatars([url], 40)  # another size is another entry
+
+        self.assertEqual(get.call_count, 3)
+
+    def test_failed_downloads_are_cached_as_misses(self):
+        url = "https://a/gone.png"
+        with patch.object(avatar_cache.requests, "get", return_value=_response(status=404)) as get:
+            self.assertEqual(avatar_cache.load_avatars([url], 60), {url: None})
+            self.assertEqual(avatar_cache.load_avatars([url], 60), {url: None})
+            expired = time.time() - avatar_cache.MISS_TTL_SECONDS - 1
+            os.utime(avatar_cache.cache_path(url, 60), (expired, expired))
+            avatar_cache.load_avatars([url], 60)
+
+        self.assertEqual(get.call_count, 2)
+
+    def test_transient_failures_are_not_cached(self):
+        url = "https://a/flaky.png"
+        failures = [requests.Timeout(), requests.ConnectionError(), _response(status=503)]
+        with patch.object(avatar_cache.requests, "get", side_effect=failures + [_response()]) as get:
+            for _ in failures:
+                self.assertEqual(avatar_cache.load_avatars([url], 60), {url: None})
+                self.assertFalse(os.path.exists(avatar_cache.cache_path(url, 60)))
+            self.assertEqual(avatar_cache.load_avatars([url], 60)[url].size, (60, 60))
+
+        self.assertEqual(get.call_count, 4)
+
+    def test_undecodable_images_are_cached_as_misses(self):
+        url = "https://a/not-an-image"
+        with patch.object(avatar_cache.requests, "get", return_value=_response(b"<html>")) as get:
+            avatar_cache.load_avatars([url], 60)
+            avatar_cache.load_avatars([url], 60)
+
+        self.assertEqual(get.call_count, 1)
+
+    def test_unwritable_cache_still_returns_the_avatar(self):
+        url = "https://a/1.png"
+        with (
+            patch.object(avatar_cache.requests, "get", return_value=_response()) as get,
+            patch.object(avatar_cache.tempfile, "mkstemp", side_effect=OSError(30, "Read-only file system")),
+        ):
+            first = avatar_cache.load_avatars([url], 60)
+            second = avatar_cache.load_avatars([url], 60)
+
+        self.assertEqual((first[url].size, second[url].size), ((60, 60), (60, 60)))
+        self.assertEqual(get.call_count, 2)
+
+    def test_misses_download_concurrently_up_to_the_limit(self):
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def slow_get(url, timeout):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _response()
+
+        with (
+            patch.object(avatar_cache, "FETCH_WORKERS", 3),
+            patch.object(avatar_cache.requests, "get", side_effect=slow_get),
+        ):
+            avatars = avatar_cache.load_avatars([f"https://a/{i}.png" for i in range(9)], 60)
+
+        self.assertEqual(len(avatars), 9)
+        self.assertEqual(peak[0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
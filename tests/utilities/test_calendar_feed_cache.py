@@ -0,0 +1,142 @@
+import os
+import sys
+import unittest
+from datetime import date
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from f3_data_models.models import Attendance, Attendance_x_AttendanceType, EventInstance
+
+from utilities.calendar_feed_cache import (
+    _SESSION_KEY,
+    CalendarFeed,
+    CalendarFeedCache,
+    FeedEvent,
+    _collect_flushed_writes,
+)
+
+TODAY = date(2026, 3, 2)
+
+
+def _event(event_id, org_id=11, start_date=TODAY, **overrides):
+    fields = {
+        "id": event_id,
+        "org_id": org_id,
+        "org_name": f"AO {org_id}",
+        "org_parent_id": 10,
+        "location_id": 100 + org_id,
+        "start_date": start_date,
+        "start_time": "0530",
+        "name": None,
+        "highlight": False,
+        "has_preblast": False,
+        "series_exception": None,
+        "series_name": None,
+        "event_types": ((1, "Bootcamp"),),
+    }
+    fields.update(overrides)
+    return FeedEvent(**fields)
+
+
+def _feed(events, region_org_id=10, truncated=False):
+    return CalendarFeed(
+        region_org_id=region_org_id,
+        start_date=TODAY,
+        org_ids=frozenset({region_org_id, 11, 12}),
+        events=events,
+        truncated=truncated,
+    )
+
+
+class CalendarFeedSelectTest(unittest.TestCase):
+    def setUp(self):
+        self.feed = _feed(
+            [
+                _event(1, planned_qs="Moneyball", attendee_ids=frozenset({7}), q_user_ids=frozenset({7})),
+                _event(2, org_id=12, event_types=((2, "Ruck"),)),
+                _event(3, start_date=date(2026, 3, 5), attendee_ids=frozenset({8})),
+            ]
+        )
+
+    def test_filters_match_home_schedule_query(self):
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY)], [1, 2, 3])
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY, org_ids=[12])], [2])
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY, location_ids=[111])], [1, 3])
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY, event_type_ids=[2])], [2])
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY, open_q_only=True)], [2, 3])
+        self.assertEqual([e.id for e in self.feed.select(8, TODAY, only_users_events=True)], [3])
+        self.assertEqual([e.id for e in self.feed.select(7, date(2026, 3, 4))], [3])
+
+    def test_keyset_cursor_starts_after_previous_page(self):
+        first_page = self.feed.select(7, TODAY, limit=2)
+        last = first_page[-1]
+
+        self.assertEqual([e.id for e in self.feed.select(7, TODAY, after=(last.start_date, last.id))], [3])
+
+    def test_falls_back_when_feed_cannot_answer(self):
+        truncated = _feed(self.feed.events, truncated=True)
+
+        self.assertIsNone(self.feed.select(7, date(2026, 3, 1)))
+        self.assertIsNone(truncated.select(7, TODAY, org_ids=[12], limit=5))
+        self.assertEqual([e.id for e in truncated.select(7, TODAY, limit=2)], [1, 2])
+
+
+class CalendarFeedCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.loads = []
+
+        def loader(region_org_id, today):
+            self.loads.append(region_org_id)
+            return _feed([_event(1, attendance_ids=frozenset({500}))], region_org_id=region_org_id)
+
+        self.cache = CalendarFeedCache(loader=loader)
+
+    def test_feed_is_reused_until_a_write_touches_it(self):
+        self.cache.get(10, TODAY)
+        self.cache.get(10, TODAY)
+        self.cache.invalidate_writes(event_instance_ids=[999], org_ids=[999], attendance_ids=[999])
+        self.cache.get(10, TODAY)
+        self.assertEqual(self.loads, [10])
+
+        self.cache.invalidate_writes(attendance_ids=[500])
+        self.cache.get(10, TODAY)
+        self.assertEqual(self.loads, [10, 10])
+
+    def test_new_day_and_expiry_reload(self):
+        self.cache.get(10, TODAY)
+        self.cache.get(10, date(2026, 3, 3))
+        self.cache.ttl_seconds = 0
+        self.cache.get(10, date(2026, 3, 3))
+        self.cache.get(10, date(2026, 3, 3))
+
+        self.assertEqual(len(self.loads), 4)
+
+    def test_committed_session_writes_invalidate_matching_regions(self):
+        self.cache.get(10, TODAY)
+        self.cache.get(20, TODAY)
+        session = SimpleNamespace(
+            info={},
+            new=[Attendance(event_instance_id=1, user_id=7, is_planned=True)],
+            dirty=[Attendance_x_AttendanceType(attendance_id=600, attendance_type_id=2)],
+            deleted=[],
+        )
+
+        _collect_flushed_writes(session, None)
+        self.cache._apply_writes(session.info.pop(_SESSION_KEY))
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()["invalidations"], 2)
+
+    def test_event_instance_on_another_region_leaves_feed_alone(self):
+        self.cache.get(10, TODAY)
+        session = SimpleNamespace(info={}, new=[EventInstance(id=None, org_id=99)], dirty=[], deleted=[])
+
+        _collect_flushed_writes(session, None)
+        self.cache._apply_writes(session.info.pop(_SESSION_KEY))
+
+        self.assertEqual(len(self.cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
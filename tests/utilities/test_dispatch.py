@@ -0,0 +1,98 @@
+import base64
+import json
+import logging
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utilities import dispatch
+
+
+class LazyRouteQueueTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(os.environ, {"SLACK_SIGNING_SECRET": "test-secret"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _publish(self, body):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {"messageIds": ["m-1"]}
+        with (
+            patch.object(dispatch, "LAZY_ROUTE_TOPIC", "projects/p/topics/lazy-routes"),
+            patch.object(dispatch, "_get_session", return_value=session),
+        ):
+            message_id = dispatch.publish_lazy_route("view_submission", "backblast-id", body)
+        self.assertEqual(message_id, "m-1")
+        url = session.post.call_args.args[0]
+        self.assertEqual(url, "https://pubsub.googleapis.com/v1/projects/p/topics/lazy-routes:publish")
+        return session.post.call_args.kwargs["json"]["messages"][0]
+
+    @staticmethod
+    def _push(message):
+        envelope = {"message": {**message, "messageId": "m-1"}, "subscription": "projects/p/subscriptions/s"}
+        return SimpleNamespace(data=json.dumps(envelope).encode())
+
+    def test_published_route_reads_back_from_push_delivery(self):
+        body = {"team": {"id": "T1"}, "view": {"callback_id": "backblast-id"}}
+
+        delivery = dispatch.read_lazy_route(self._push(self._publish(body)))
+
+        self.assertEqual(delivery.request_type, "view_submission")
+        self.assertEqual(delivery.request_id, "backblast-id")
+        self.assertEqual(delivery.body, body)
+        self.assertEqual(delivery.message_id, "m-1")
+        self.assertGreaterEqual(delivery.queued_ms, 0)
+
+    def test_unsigned_or_tampered_delivery_is_rejected(self):
+        message = self._publish({"team": {"id": "T1"}})
+        payload = json.loads(base64.b64decode(message["data"]))
+        payload["body"]["team"]["id"] = "T2"
+        tampered = {**message, "data": base64.b64encode(json.dumps(payload).encode()).decode()}
+
+        self.assertIsNone(dispatch.read_lazy_route(self._push(tampered)))
+        self.assertIsNone(dispatch.read_lazy_route(self._push({"data": message["data"]})))
+        self.assertIsNone(dispatch.read_lazy_route(SimpleNamespace(data=b"not json")))
+
+    def test_disabled_without_topic_or_secret(self):
+        with patch.object(dispatch, "LAZY_ROUTE_TOPIC", ""):
+            self.assertFalse(dispatch.lazy_dispatch_enabled())
+        with (
+            patch.object(dispatch, "LAZY_ROUTE_TOPIC", "projects/p/topics/lazy-routes"),
+            patch.dict(os.environ, {"SLACK_SIGNING_SECRET": ""}),
+        ):
+            self.assertFalse(dispatch.lazy_dispatch_enabled())
+
+
+class RouteTimerTest(unittest.TestCase):
+    def test_finish_logs_route_and_phases(self):
+        timer = dispatch.RouteTimer("view_submission", "backblast-id")
+        timer.ack()
+        first_ack = timer.acked_at
+        timer.ack()
+        timer.start()
+
+        with self.assertLogs("dispatch-test", logging.INFO) as logs:
+            timer.finish(logging.getLogger("dispatch-test"), "handle_backblast_post")
+
+        self.assertEqual(timer.acked_at, first_ack)
+        self.assertIn("Route view_submission:backblast-id (handle_backblast_post, lazy=False) acked in", logs.output[0])
+        self.assertLessEqual(timer.received_at, timer.acked_at)
+        self.assertLessEqual(timer.started_at, timer.finished_at)
+
+    def test_lazy_delivery_logs_queue_time(self):
+        timer = dispatch.RouteTimer("view_submission", "backblast-id", lazy=True)
+        timer.queued_ms = 1234.0
+        timer.start()
+
+        with self.assertLogs("dispatch-test", logging.INFO) as logs:
+            timer.finish(logging.getLogger("dispatch-test"), "handle_backblast_post")
+
+        self.assertIn("(handle_backblast_post, lazy=True) queued 1234 ms, handler ran", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
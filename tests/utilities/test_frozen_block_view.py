@@ -0,0 +1,87 @@
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utilities.slack import actions, forms, orm
+
+
+def _template():
+    return orm.FrozenBlockView(
+        blocks=[
+            orm.SectionBlock(label="Pick an AO", action="info"),
+            orm.InputBlock(label="AO", action="ao", element=orm.StaticSelectElement(placeholder="Select...")),
+            orm.InputBlock(label="Title", action="title", element=orm.PlainTextInputElement(initial_value="Beatdown")),
+        ]
+    )
+
+
+class FrozenBlockViewTest(unittest.TestCase):
+    def test_copy_renders_like_a_deepcopy(self):
+        options = {actions.BACKBLAST_EVENT_TYPE: orm.as_selector_options(["Bootcamp", "Ruck"], ["1", "2"])}
+        values = {actions.BACKBLAST_TITLE: "The Grind", actions.BACKBLAST_PAX: ["U1", "U2"]}
+
+        legacy = orm.BlockView(blocks=copy.deepcopy(list(forms.BACKBLAST_FORM.blocks)))
+        legacy.add_block(copy.deepcopy(forms.UNSCHEDULED_BACKBLAST_BLOCKS.blocks[1]))
+        legacy.set_options(options)
+        legacy.set_initial_values(values)
+
+        form = forms.BACKBLAST_FORM.copy()
+        form.add_block(forms.UNSCHEDULED_BACKBLAST_BLOCKS.blocks[1])
+        form.set_options(options)
+        form.set_initial_values(values)
+
+        self.assertEqual(form.as_form_field(), [b.as_form_field() for b in legacy.blocks])
+
+    def test_overlays_do_not_leak_into_the_template_or_other_copies(self):
+        template = _template()
+        before = template.as_form_field()
+
+        first = template.copy()
+        first.set_options({"ao": orm.as_selector_options(["Alpha"], ["1"])})
+        first.set_initial_values({"ao": "1", "info": "Changed", "title": "Other"})
+        first.delete_block("title")
+
+        self.assertEqual(template.as_form_field(), before)
+        self.assertEqual(template.copy().as_form_field(), before)
+        self.assertEqual((len(first.blocks), len(template.blocks)), (2, 3))
+        self.assertEqual(first.as_form_field()[1]["element"]["initial_option"]["value"], "1")
+
+    def test_untouched_blocks_stay_shared(self):
+        template = _template()
+        form = template.copy()
+        form.set_initial_values({"title": "Other"})
+
+        self.assertIs(form.blocks[0], template.blocks[0])
+        self.assertIsNot(form.blocks[2], template.blocks[2])
+
+    def test_editable_block_returns_private_copy(self):
+        template = _template()
+        form = template.copy()
+        form.editable_block("title").hint = "Keep it short"
+
+        self.assertIsNone(template.blocks[2].hint)
+        self.assertEqual(form.as_form_field()[2]["hint"]["text"], "Keep it short")
+        self.assertIsNone(form.editable_block("missing"))
+
+    def test_template_rejects_mutation(self):
+        template = _template()
+        with self.assertRaises(TypeError):
+            template.set_initial_values({"title": "Other"})
+        with self.assertRaises(TypeError):
+            template.add_block(orm.DividerBlock())
+
+    def test_deepcopy_gives_independent_block_view(self):
+        template = _template()
+        form = copy.deepcopy(template)
+        form.blocks[0].label = "Changed"
+
+        self.assertIs(type(form), orm.BlockView)
+        self.assertEqual(template.as_form_field()[0]["text"]["text"], "Pick an AO")
+        self.assertEqual(form.as_form_field()[0]["text"]["text"], "Changed")
+
+
+if __name__ == "__main__":
+    unittest.main()
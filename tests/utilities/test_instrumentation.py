@@ -0,0 +1,175 @@
+import contextvars
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+from slack_sdk.web import WebClient
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from infrastructure.api_client.client import F3ApiClient
+from utilities import instrumentation
+from utilities.dispatch import RouteTimer
+
+
+def _slack_ok(self, *, url, args):
+    return {"status": 200, "headers": {}, "body": '{"ok": true}'}
+
+
+def _api_ok(url, **kwargs):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"{}"
+    return response
+
+
+class CallCountingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        instrumentation.install()
+        instrumentation.install()  # idempotent
+
+    def setUp(self):
+        self.stats, token = instrumentation.start_collecting()
+        self.addCleanup(instrumentation.stop_collecting, token)
+
+    def test_db_statements_are_counted(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            conn.execute(text("select 2"))
+
+        self.assertEqual(self.stats.counts["db"], 2)
+        self.assertGreater(self.stats.seconds["db"], 0)
+
+    def test_slack_api_calls_are_counted_on_wrapped_clients_only(self):
+        client = WebClient(token="xoxb-test", timeout=12)
+        wrapped = instrumentation.InstrumentedWebClient.wrap(client)
+        with patch("slack_sdk.web.base_client.BaseClient._perform_urllib_http_request", _slack_ok):
+            wrapped.chat_postMessage(channel="C1", text="hi")
+            client.chat_postMessage(channel="C1", text="hi")
+
+        self.assertEqual(self.stats.counts["slack"], 1)
+        self.assertEqual((wrapped.token, wrapped.timeout), ("xoxb-test", 12))
+
+    def test_f3_api_calls_in_gather_count_against_the_route(self):
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key"}, clear=True):
+            client = F3ApiClient()
+        with patch.object(client._session, "get", side_effect=_api_ok):
+            client.gather(lambda: client.get("/v1/org"), lambda: client.get("/v1/location"))
+
+        self.assertEqual(self.stats.counts["f3_api"], 2)
+
+    def test_cache_hits_are_counted_apart_from_requests_sent(self):
+        with patch.dict(os.environ, {"F3_API_KEY": "test-key", "F3_API_CACHE_ENABLED": "true"}, clear=True):
+            client = F3ApiClient()
+        self.assertIsNotNone(client._response_cache)
+        with patch.object(client._session, "get", side_effect=_api_ok) as get:
+            client.get("/v1/org")
+            client.get("/v1/org")
+
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual((self.stats.counts["f3_api"], self.stats.counts["f3_api_cached"]), (1, 1))
+
+    def test_calls_outside_a_route_are_ignored(self):
+        contextvars.Context().run(instrumentation.record_call, "db", 1.0)
+
+        self.assertEqual(self.stats.counts["db"], 0)
+
+
+class RouteSummaryTest(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.reset)
+
+    def test_percentiles_and_ordering(self):
+        calls = instrumentation.CallStats()
+        calls.add("db", 0.01)
+        for ms in range(1, 101):
+            instrumentation.observe("block_actions:slow", "slow_handler", float(ms), calls)
+        instrumentation.observe("block_actions:fast", "fast_handler", 1.0, instrumentation.CallStats())
+
+        slow, fast = instrumentation.summary()
+
+        self.assertEqual((slow["route"], slow["count"], slow["mean_db_calls"]), ("block_actions:slow", 100, 1.0))
+        self.assertEqual((slow["p50_ms"], slow["p90_ms"], slow["p99_ms"], slow["max_ms"]), (50, 90, 99, 100))
+        self.assertEqual(fast["handler"], "fast_handler")
+
+    def test_summary_logged_when_due(self):
+        with patch.object(instrumentation, "ROUTE_STATS_SUMMARY_SECONDS", 0):
+            with self.assertLogs("utilities.instrumentation", logging.INFO) as logs:
+                instrumentation.observe("command:/help", "build_help_menu", 5.0, instrumentation.CallStats())
+
+        self.assertIn("command:/help (build_help_menu): n=1 p50=5", logs.output[0])
+
+    def test_route_timer_logs_structured_fields(self):
+        timer = RouteTimer("view_submission", "backblast-id")
+        timer.begin()
+        timer.ack()
+        instrumentation.record_call("slack", 0.002)
+        instrumentation.record_call("db", 0.001)
+
+        with self.assertLogs("timer-test", logging.INFO) as logs:
+            timer.finish(logging.getLogger("timer-test"), "handle_backblast_post")
+
+        fields = logs.records[0].json_fields
+        self.assertEqual(
+            (fields["route"], fields["slack_calls"], fields["db_calls"]), ("view_submission:backblast-id", 1, 1)
+        )
+        self.assertIn("slack 1x/2 ms", logs.output[0])
+        self.assertEqual(instrumentation.summary()[0]["handler"], "handle_backblast_post")
+        instrumentation.record_call("db", 1.0)  # collection stopped with the route
+        self.assertEqual(timer.calls.counts["db"], 1)
+
+
+class ProfileSamplingTest(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.reset)
+
+    def test_keeps_only_the_slowest_profiles(self):
+        with tempfile.TemporaryDirectory() as profile_dir:
+            with (
+                patch.object(instrumentation, "ROUTE_PROFILE_SAMPLE_RATE", 1.0),
+                patch.object(instrumentation, "ROUTE_PROFILE_KEEP", 1),
+                patch.object(instrumentation, "ROUTE_PROFILE_DIR", profile_dir),
+                self.assertLogs("utilities.instrumentation", logging.INFO),
+            ):
+                for total_ms in (20.0, 50.0, 10.0):
+                    profiler = instrumentation.start_profile()
+                    self.assertIsNotNone(profiler)
+                    sum(range(1000))
+                    instrumentation.stop_profile(profiler, "command:/help", "build_help_menu", total_ms)
+
+            self.assertEqual(os.listdir(profile_dir)[0].split("-")[0], "50ms")
+            self.assertEqual(len(os.listdir(profile_dir)), 1)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(instrumentation.start_profile())
+
+    def test_samples_only_routes_running_alone(self):
+        profile_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(profile_dir.cleanup)
+        with (
+            patch.object(instrumentation, "ROUTE_PROFILE_SAMPLE_RATE", 1.0),
+            patch.object(instrumentation, "ROUTE_PROFILE_DIR", profile_dir.name),
+        ):
+            first = RouteTimer("command", "/help")
+            first.begin()
+            second = RouteTimer("command", "/help")
+            second.begin()
+            self.assertIsNotNone(first._profiler)
+            self.assertIsNone(second._profiler)  # another route is already running
+
+            with self.assertNoLogs("utilities.instrumentation", logging.INFO):
+                second.finish(logging.getLogger("timer-test"), "build_help_menu")
+                first.finish(logging.getLogger("timer-test"), "build_help_menu")  # overlapped, so discarded
+
+
+if __name__ == "__main__":
+    unittest.main()
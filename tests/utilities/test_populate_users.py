@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from sqlalchemy.dialects import postgresql
+
+from utilities import helper_functions
+from utilities.database import special_queries
+
+
+def _member(slack_id, email=None, **overrides):
+    member = {
+        "id": slack_id,
+        "updated": 1700000000,
+        "profile": {"display_name": "", "real_name": f"Pax {slack_id}", "email": email, "image_192": "a.png"},
+    }
+    member.update(overrides)
+    return member
+
+
+class PopulateUsersTest(unittest.TestCase):
+    def test_pages_through_every_member(self):
+        client = MagicMock()
+        client.users_list.side_effect = [
+            {
+                "members": [_member("U1", "one@example.com"), _member("B1", is_bot=True)],
+                "response_metadata": {"next_cursor": "c2"},
+            },
+            {"members": [_member("U2", "two@example.com", is_admin=True)], "response_metadata": {"next_cursor": ""}},
+        ]
+        with (
+            patch.object(
+                helper_functions, "insert_workspace_members", side_effect=lambda team, rows: len(rows)
+            ) as insert,
+            patch.object(helper_functions, "SLACK_USER_CACHE") as cache,
+        ):
+            created = helper_functions.populate_users(client, "T1", org_id=5)
+
+        self.assertEqual(created, 3)
+        self.assertEqual(client.users_list.call_args_list[1].kwargs, {"limit": 200, "cursor": "c2"})
+        first_page = insert.call_args_list[0].args[1]
+        self.assertEqual(
+            (first_page[0]["email"], first_page[0]["user_name"], first_page[0]["home_region_id"]),
+            ("one@example.com", "Pax U1", 5),
+        )
+        self.assertEqual((first_page[1]["email"], first_page[1]["is_bot"]), ("B1", True))
+        self.assertEqual(first_page[0]["slack_updated"], 1700000000)
+        self.assertTrue(insert.call_args_list[1].args[1][0]["is_admin"])
+        cache.invalidate_team.assert_called_once_with("T1")
+
+
+class InsertSlackUserRowsTest(unittest.TestCase):
+    def test_emails_are_deduped_case_insensitively_and_lookups_scoped_to_the_team(self):
+        session = MagicMock()
+        session.execute.return_value = [MagicMock(id=7, email="Pax@Example.com")]
+        session.scalars.return_value.all.side_effect = [[], []]
+        members = [
+            {
+                "slack_id": slack_id,
+                "email": email,
+                "user_name": "Pax",
+                "avatar_url": None,
+                "home_region_id": 5,
+                "is_admin": False,
+                "is_owner": False,
+                "is_bot": False,
+                "slack_updated": None,
+            }
+            for slack_id, email in (("U1", "Pax@Example.com"), ("U2", "pax@example.com"))
+        ]
+
+        _, user_ids, inserted = special_queries._insert_slack_user_rows(session, members, team_id="T1")
+
+        user_insert = session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        self.assertEqual(len([k for k in user_insert.params if k.startswith("email")]), 1)
+        self.assertEqual(user_ids, {"pax@example.com": 7})
+        self.assertEqual(inserted, 2)
+        lookup = str(session.scalars.call_args_list[0].args[0])
+        self.assertIn("slack_users.slack_team_id", lookup)
+
+
+if __name__ == "__main__":
+    unittest.main()
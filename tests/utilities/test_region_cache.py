@@ -0,0 +1,122 @@
+import json
+import os
+import sys
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utilities.region_cache import RegionSettingsCache
+
+
+def _row(team_id: str, updated: datetime, **settings):
+    return SimpleNamespace(team_id=team_id, settings={"team_id": team_id, **settings}, updated=updated)
+
+
+class RegionSettingsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        session = self.session
+
+        @contextmanager
+        def fake_scope():
+            yield session
+
+        patcher = patch("utilities.region_cache.session_scope", fake_scope)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _returns(self, *results):
+        calls = []
+        for result in results:
+            response = MagicMock()
+            response.all.return_value = result
+            response.first.return_value = result[0] if result else None
+            calls.append(response)
+        self.session.execute.side_effect = calls
+
+    def test_first_get_loads_everything_then_only_polls_changes(self):
+        records = {}
+        cache = RegionSettingsCache(records, poll_seconds=0, listen=False)
+        self._returns(
+            [_row("T1", datetime(2026, 1, 1), org_id=1), _row("T2", datetime(2026, 1, 2), org_id=2)],
+            [_row("T2", datetime(2026, 1, 3), org_id=22)],
+        )
+
+        self.assertEqual(cache.get("T1").org_id, 1)
+        self.assertEqual(cache.get("T2").org_id, 22)
+
+        refresh_query = self.session.execute.call_args_list[1].args[0]
+        self.assertIn("slack_spaces.updated >", str(refresh_query))
+        self.assertIs(cache.records, records)
+        self.assertEqual(cache.high_water, datetime(2026, 1, 3))
+
+    def test_refresh_overlaps_the_high_water_mark(self):
+        cache = RegionSettingsCache(poll_seconds=0, listen=False, overlap_seconds=60)
+        self._returns(
+            [_row("T1", datetime(2026, 1, 1, 12, 0), org_id=1)],
+            # T2 committed late with a timestamp 30s behind the mark; T1 comes back unchanged
+            [_row("T1", datetime(2026, 1, 1, 12, 0), org_id=1), _row("T2", datetime(2026, 1, 1, 11, 59, 30))],
+        )
+        cache.sync()
+
+        self.assertEqual(cache.refresh(), 1)
+
+        params = self.session.execute.call_args_list[1].args[0].compile().params
+        self.assertIn(datetime(2026, 1, 1, 11, 59), params.values())
+        self.assertIn("T2", cache.records)
+        self.assertEqual(cache.high_water, datetime(2026, 1, 1, 12, 0))
+
+    def test_refresh_is_throttled_by_poll_interval(self):
+        cache = RegionSettingsCache(poll_seconds=3600, listen=False)
+        self._returns([_row("T1", datetime(2026, 1, 1))])
+
+        cache.get("T1")
+        cache.get("T1")
+
+        self.assertEqual(self.session.execute.call_count, 1)
+
+    def test_invalidate_reloads_one_team_and_notifies(self):
+        cache = RegionSettingsCache(poll_seconds=3600, listen=False)
+        self._returns(
+            [_row("T1", datetime(2026, 1, 1), org_id=1)],
+            [_row("T1", datetime(2026, 1, 5), org_id=9)],
+            [],
+        )
+        cache.get("T1")
+
+        refreshed = cache.invalidate("T1")
+
+        self.assertEqual(refreshed.org_id, 9)
+        self.assertEqual(cache.versions["T1"], datetime(2026, 1, 5))
+        # high-water mark only moves on polls so changes from other instances are not skipped
+        self.assertEqual(cache.high_water, datetime(2026, 1, 1))
+        notify_query = str(self.session.execute.call_args_list[2].args[0])
+        self.assertIn("pg_notify", notify_query)
+
+    def test_notifications_mark_single_entries_stale(self):
+        cache = RegionSettingsCache(poll_seconds=3600, listen=False)
+        self._returns(
+            [_row("T1", datetime(2026, 1, 1), org_id=1), _row("T2", datetime(2026, 1, 1), org_id=2)],
+            [_row("T1", datetime(2026, 1, 4), org_id=11)],
+        )
+        cache.get("T1")
+
+        listener = MagicMock()
+        listener.connection = object()
+        listener.drain.return_value = [
+            json.dumps({"team_id": "T1", "updated": "2026-01-04T00:00:00"}),
+            json.dumps({"team_id": "T2", "updated": "2025-12-31T00:00:00"}),  # older than cached, ignored
+        ]
+        cache._listener = listener
+
+        self.assertEqual(cache.get("T1").org_id, 11)
+        self.assertEqual(cache.get("T2").org_id, 2)
+        self.assertEqual(self.session.execute.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
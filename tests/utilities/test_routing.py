@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from scripts.benchmark_startup import REPO_ROOT, main_imports, profile_imports
+from utilities import routing
+
+# About 2x the ~1.1-1.3 s measured for main.py's imports, so one feature module (and its PIL/pandas/SQLAlchemy
+# imports) creeping back into startup fails it. Loosen on a slow runner with STARTUP_IMPORT_BUDGET_MS.
+STARTUP_IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "2500"))
+
+
+class RoutingTablesTest(unittest.TestCase):
+    def test_every_handler_resolves(self):
+        for request_type, mapper in routing.MAIN_MAPPER.items():
+            for key, entry in mapper.items():
+                with self.subTest(request_type=request_type, key=key):
+                    handler, add_loading, lazy = routing.Route(*entry)
+                    self.assertIsInstance(key, str)
+                    self.assertIsInstance(add_loading, bool)
+                    self.assertIsInstance(lazy, bool)
+                    self.assertFalse(lazy and request_type == "block_suggestion")
+                    func = handler.resolve() if isinstance(handler, routing.LazyHandler) else handler
+                    self.assertTrue(callable(func))
+                    self.assertEqual(handler.__name__, func.__name__)
+
+    def test_lazy_handler_is_memoized_and_callable(self):
+        handler = routing.LazyHandler("os.path", "join")
+
+        self.assertIs(handler.resolve(), handler.resolve())
+        self.assertEqual(handler("a", "b"), os.path.join("a", "b"))
+        self.assertIs(routing.backblast.handle_backblast_post, routing.backblast.handle_backblast_post)
+
+
+class StartupImportTest(unittest.TestCase):
+    def test_routing_does_not_import_features(self):
+        code = (
+            "import sys\n"
+            "import utilities.routing\n"
+            "print(' '.join(m for m in sys.modules if m.split('.')[0] in ('features', 'scripts')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_main_imports_within_budget(self):
+        total_ms, modules = profile_imports(main_imports())
+
+        self.assertEqual([m for m in modules if m.split(".")[0] in ("features", "scripts")], [])
+        self.assertLess(total_ms, STARTUP_IMPORT_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utilities import helper_functions
+from utilities.slack_user_cache import SlackUserCache
+
+
+def _slack_user(slack_id: str, team_id: str = "T1", user_id: int = 1):
+    return SimpleNamespace(slack_id=slack_id, slack_team_id=team_id, user_id=user_id, user_name=slack_id)
+
+
+class SlackUserCacheTest(unittest.TestCase):
+    def test_entries_are_scoped_by_team(self):
+        cache = SlackUserCache()
+        cache.put(_slack_user("U1", "T1"))
+
+        self.assertIsNotNone(cache.get("T1", "U1"))
+        self.assertIsNone(cache.get("T2", "U1"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = SlackUserCache(max_entries=2)
+        cache.put(_slack_user("U1"))
+        cache.put(_slack_user("U2"))
+        cache.get("T1", "U1")
+        cache.put(_slack_user("U3"))
+
+        found, missing = cache.get_many("T1", ["U1", "U2", "U3"])
+
+        self.assertEqual(set(found), {"U1", "U3"})
+        self.assertEqual(missing, ["U2"])
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_expired_entries_are_misses(self):
+        cache = SlackUserCache(ttl_seconds=0)
+        cache.put(_slack_user("U1"))
+
+        self.assertIsNone(cache.get("T1", "U1"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+
+class GetUsersBulkTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(helper_functions, "SLACK_USER_CACHE", SlackUserCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.region_record = SimpleNamespace(team_id="T1", org_id=10)
+
+    @patch("utilities.helper_functions.create_user")
+    @patch("utilities.helper_functions.DbManager")
+    def test_misses_are_loaded_in_one_query_then_served_from_cache(self, mock_db, mock_create_user):
+        mock_db.find_records.return_value = [_slack_user("U2", user_id=2), _slack_user("U1", user_id=1)]
+        client = MagicMock()
+
+        users = helper_functions.get_users_bulk(["U1", "U2", "U1"], self.region_record, client, MagicMock())
+        again = helper_functions.get_users_bulk(["U2"], self.region_record, client, MagicMock())
+
+        self.assertEqual([u.user_id for u in users], [1, 2, 1])
+        self.assertEqual(again[0].user_id, 2)
+        mock_db.find_records.assert_called_once()
+        client.users_info.assert_not_called()
+        mock_create_user.assert_not_called()
+
+    @patch("utilities.helper_functions.upsert_slack_users")
+    @patch("utilities.helper_functions.DbManager")
+    def test_unknown_users_are_fetched_from_slack_and_upserted_together(self, mock_db, mock_upsert):
+        mock_db.find_records.return_value = [_slack_user("U1", "T2", user_id=5), _slack_user("U1", "T1", user_id=1)]
+        mock_upsert.return_value = [_slack_user("U8", user_id=8), _slack_user("U9", user_id=9)]
+        client = MagicMock()
+        client.users_info.side_effect = lambda user: {"user": {"id": user, "profile": {"email": f"{user}@x.com"}}}
+
+        users = helper_functions.get_users_bulk(["U1", "U8", "U9"], self.region_record, client, MagicMock())
+
+        # the requesting workspace's row wins when a slack id exists in more than one workspace
+        self.assertEqual([u.user_id for u in users], [1, 8, 9])
+        self.assertEqual(client.users_info.call_count, 2)
+        profiles = mock_upsert.call_args.args[0]
+        self.assertEqual(
+            [(p["slack_id"], p["email"], p["home_region_id"]) for p in profiles],
+            [
+                ("U8", "u8@x.com", 10),
+                ("U9", "u9@x.com", 10),
+            ],
+        )
+
+    def test_fetch_slack_profiles_keeps_input_order(self):
+        client = MagicMock()
+        client.users_info.side_effect = lambda user: {"user": {"id": user}}
+
+        profiles = helper_functions.fetch_slack_profiles(["U3", "U1", "U3", "U2"], client)
+
+        self.assertEqual(list(profiles), ["U3", "U1", "U2"])
+        self.assertEqual(client.users_info.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
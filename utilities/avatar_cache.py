@@ -0,0 +1,125 @@
+"""On-disk cache of PAX avatars, centre-cropped and resized for charts.
+
+Entries are keyed by a hash of the avatar URL and target size, so one download serves every leaderboard that shows
+the same PAX. Writes go through a temp file and ``os.replace``, so report worker processes can share the directory.
+Missing avatars (4xx responses and undecodable images) are cached as empty files for ``MISS_TTL_SECONDS``, so a dead
+URL is not retried on every render; timeouts, connection errors and 5xx responses are not cached and retry next time.
+
+The cache only pays off across runs, so it lives on the ``PERSISTENT_DIR`` volume mount shared with the calendar
+images. Without that mount it falls back to the temp dir, which on Cloud Run is in memory and lasts one execution.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Dict, Iterable, Optional
+
+import requests
+from PIL import Image
+
+PERSISTENT_DIR = "/mnt/calendar-images"
+CACHE_DIR = os.environ.get(
+    "AVATAR_CACHE_DIR",
+    os.path.join(PERSISTENT_DIR if os.path.isdir(PERSISTENT_DIR) else tempfile.gettempdir(), "f3-avatar-cache"),
+)
+TTL_SECONDS = float(os.environ.get("AVATAR_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+FETCH_WORKERS = int(os.environ.get("AVATAR_FETCH_WORKERS", "8"))
+MISS_TTL_SECONDS = 3600
+FETCH_TIMEOUT_SECONDS = 6
+
+
+def cache_path(url: str, size: int) -> str:
+    digest = hashlib.sha256(f"{size}|{url}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, digest[:2], f"{digest}.png")
+
+
+def prepare_avatar(im: Image.Image, size: int) -> Image.Image:
+    """Center-crop to square and resize to a consistent pixel size to avoid giant avatars."""
+    w, h = im.size
+    side = min(w, h)
+    left = (w - side) // 2
+    top = (h - side) // 2
+    im = im.crop((left, top, left + side, top + side))
+    return im.resize((size, size), Image.LANCZOS)
+
+
+def _write(path: str, data: bytes):
+    """Best-effort cache write; a read-only, full or unwritable cache dir only costs a re-download next time."""
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _read_cached(path: str, now: float) -> tuple[bool, Optional[Image.Image]]:
+    """(hit, avatar); a fresh empty entry is a cached miss."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False, None
+    age = now - stat.st_mtime
+    if stat.st_size == 0:
+        return age < MISS_TTL_SECONDS, None
+    if age >= TTL_SECONDS:
+        return False, None
+    try:
+        with Image.open(path) as im:
+            return True, im.convert("RGBA")
+    except Exception:
+        return False, None
+
+
+def _download(url: str, size: int) -> Optional[Image.Image]:
+    path = cache_path(url, size)
+    try:
+        resp = requests.get(url, timeout=FETCH_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+    except requests.HTTPError as e:
+        if e.response is not None and 400 <= e.response.status_code < 500:
+            _write(path, b"")
+        return None
+    except requests.RequestException:
+        return None
+    try:
+        avatar = prepare_avatar(Image.open(BytesIO(resp.content)).convert("RGBA"), size)
+    except Exception:
+        _write(path, b"")
+        return None
+    out = BytesIO()
+    avatar.save(out, format="PNG")
+    _write(path, out.getvalue())
+    return avatar
+
+
+def load_avatars(urls: Iterable[str], size: int) -> Dict[str, Optional[Image.Image]]:
+    """Avatars for ``urls`` at ``size`` px (None where unavailable), downloading only stale or missing entries.
+
+    Misses are fetched concurrently, at most ``FETCH_WORKERS`` at a time.
+    """
+    now = time.time()
+    avatars: Dict[str, Optional[Image.Image]] = {}
+    missing = []
+    for url in dict.fromkeys(u for u in urls if u):
+        hit, avatar = _read_cached(cache_path(url, size), now)
+        if hit:
+            avatars[url] = avatar
+        else:
+            missing.append(url)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(missing)))) as executor:
+            for url, avatar in zip(missing, executor.map(lambda u: _download(u, size), missing), strict=True):
+                avatars[url] = avatar
+    return avatars
@@ -83,7 +83,7 @@ def _ensure_bot_in_channel(client: WebClient, channel_id: str, logger: Logger) -
 def _persist_channel(region_record: SlackSettings, channel_id: str, logger: Logger) -> None:
     """Save the resolved channel ID back to the database and update the cache."""
     # Import here to avoid circular-import issues at module load time.
-    from utilities.helper_functions import update_local_region_records  # noqa: PLC0415
+    from utilities.helper_functions import invalidate_region_record  # noqa: PLC0415
 
     try:
         region_record.bot_log_channel = channel_id
@@ -92,7 +92,7 @@ def _persist_channel(region_record: SlackSettings, channel_id: str, logger: Logg
             filters=[SlackSpace.team_id == region_record.team_id],
             fields={SlackSpace.settings: region_record.__dict__},
         )
-        update_local_region_records()
+        invalidate_region_record(region_record.team_id)
         logger.info(f"bot_logger: persisted bot_log_channel={channel_id} for team {region_record.team_id}")
     except Exception as exc:  # pragma: no cover
         logger.warning(f"bot_logger: failed to persist bot_log_channel: {exc}")
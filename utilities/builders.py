@@ -1,4 +1,3 @@
-import copy
 import time
 from logging import Logger
 from typing import Any, Dict
@@ -142,7 +141,7 @@ def ignore_event(body: dict, client: WebClient, logger: Logger, context: dict, r
 
 
 def send_error_response(body: dict, client: WebClient, error: str) -> None:
-    error_form = copy.deepcopy(forms.ERROR_FORM)
+    error_form = forms.ERROR_FORM.copy()
     error_msg = constants.ERROR_FORM_MESSAGE_TEMPLATE.format(error=error)
     error_form.set_initial_values({actions.ERROR_FORM_MESSAGE: error_msg})
 
@@ -156,5 +155,5 @@ def send_error_response(body: dict, client: WebClient, error: str) -> None:
     #         callback_id="error-id",
     #     )
     # else:
-    blocks = [block.as_form_field() for block in error_form.blocks]
+    blocks = error_form.as_form_field()
     client.chat_postMessage(channel=safe_get(body, "user", "id"), text=error, blocks=blocks)
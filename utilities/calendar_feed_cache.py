@@ -0,0 +1,359 @@
+import datetime
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from f3_data_models.models import (
+    Attendance,
+    Attendance_x_AttendanceType,
+    Event,
+    EventInstance,
+    EventType,
+    EventType_x_EventInstance,
+    Org,
+    Series_Exception,
+    User,
+)
+from f3_data_models.utils import get_session
+from sqlalchemy import event, or_, select
+from sqlalchemy.orm import Session
+
+MAX_REGIONS = int(os.environ.get("HOME_FEED_MAX_REGIONS", "200"))
+MAX_EVENTS = int(os.environ.get("HOME_FEED_MAX_EVENTS", "1500"))
+TTL_SECONDS = float(os.environ.get("HOME_FEED_TTL_SECONDS", "60"))
+
+Q_ATTENDANCE_TYPE_IDS = (2, 3)  # Q and Co-Q
+_TRACKED_CLASSES = (Attendance, Attendance_x_AttendanceType, EventInstance, EventType_x_EventInstance)
+_SESSION_KEY = "calendar_feed_writes"
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    """Everything the calendar home renders for one event instance, minus the viewer-specific flags."""
+
+    id: int
+    org_id: int
+    org_name: str
+    org_parent_id: Optional[int]
+    location_id: Optional[int]
+    start_date: datetime.date
+    start_time: Optional[str]
+    name: Optional[str]
+    highlight: bool
+    has_preblast: bool
+    series_exception: Optional[Series_Exception]
+    series_name: Optional[str]
+    event_types: Tuple[Tuple[int, str], ...]
+    planned_qs: Optional[str] = None
+    attendee_ids: FrozenSet[int] = frozenset()
+    q_user_ids: FrozenSet[int] = frozenset()
+    attendance_ids: FrozenSet[int] = frozenset()
+
+    @property
+    def event_type_names(self) -> List[str]:
+        return [name for _, name in self.event_types]
+
+    @classmethod
+    def from_home_query(cls, row, user_id: int) -> "FeedEvent":
+        """Adapts a ``CalendarHomeQuery`` row (the uncached path) to the same shape."""
+        return cls(
+            id=row.event.id,
+            org_id=row.org.id,
+            org_name=row.org.name,
+            org_parent_id=row.org.parent_id,
+            location_id=row.event.location_id,
+            start_date=row.event.start_date,
+            start_time=row.event.start_time,
+            name=row.event.name,
+            highlight=bool(row.event.highlight),
+            has_preblast=bool(row.event.preblast_rich),
+            series_exception=row.event.series_exception,
+            series_name=row.series.name if row.series else None,
+            event_types=tuple((t.id, t.name) for t in row.event_types),
+            planned_qs=row.planned_qs,
+            attendee_ids=frozenset([user_id] if row.user_attending else []),
+            q_user_ids=frozenset([user_id] if row.user_q else []),
+        )
+
+
+@dataclass
+class CalendarFeed:
+    """Upcoming events for one region, starting at ``start_date``, in calendar home order."""
+
+    region_org_id: int
+    start_date: datetime.date
+    org_ids: FrozenSet[int]
+    events: List[FeedEvent]
+    truncated: bool
+    expires: float = 0.0
+    attendance_ids: Set[int] = field(default_factory=set)
+    event_ids: Set[int] = field(default_factory=set)
+
+    def __post_init__(self):
+        for feed_event in self.events:
+            self.event_ids.add(feed_event.id)
+            self.attendance_ids.update(feed_event.attendance_ids)
+
+    def select(
+        self,
+        user_id: int,
+        start_date: datetime.date,
+        org_ids: Optional[Iterable[int]] = None,
+        location_ids: Optional[Iterable[int]] = None,
+        event_type_ids: Optional[Iterable[int]] = None,
+        open_q_only: bool = False,
+        only_users_events: bool = False,
+        limit: int = 100,
+        after: Optional[Tuple[datetime.date, int]] = None,
+    ) -> Optional[List[FeedEvent]]:
+        """Filters the feed like ``home_schedule_query`` would, including its ``(start_date, id)`` cursor.
+
+        Returns None when the feed can't answer on its own: the start date is before the feed's, or the
+        feed was capped at ``MAX_EVENTS`` and ran out before ``limit`` events matched.
+        """
+        if start_date < self.start_date:
+            return None
+        org_ids = set(org_ids or [])
+        location_ids = set(location_ids or [])
+        event_type_ids = set(event_type_ids or [])
+        matches: List[FeedEvent] = []
+        for feed_event in self.events:
+            if feed_event.start_date < start_date or (after and (feed_event.start_date, feed_event.id) <= after):
+                continue
+            if org_ids and feed_event.org_id not in org_ids and feed_event.org_parent_id not in org_ids:
+                continue
+            if location_ids and feed_event.location_id not in location_ids:
+                continue
+            if event_type_ids and not any(type_id in event_type_ids for type_id, _ in feed_event.event_types):
+                continue
+            if open_q_only and feed_event.planned_qs:
+                continue
+            if only_users_events and user_id not in feed_event.attendee_ids:
+                continue
+            matches.append(feed_event)
+            if len(matches) >= limit:
+                return matches
+        return None if self.truncated else matches
+
+
+def load_calendar_feed(region_org_id: int, start_date: datetime.date, max_events: int = MAX_EVENTS) -> CalendarFeed:
+    """Loads a region's upcoming events with three queries: events, event types, and attendance."""
+    with get_session() as session:
+        org_ids = {region_org_id, *session.scalars(select(Org.id).filter(Org.parent_id == region_org_id)).all()}
+        rows = session.execute(
+            select(EventInstance, Org.name, Org.parent_id, Event.name)
+            .join(Org, Org.id == EventInstance.org_id)
+            .outerjoin(Event, Event.id == EventInstance.series_id)
+            .filter(
+                EventInstance.start_date >= start_date,
+                EventInstance.is_active,
+                or_(EventInstance.org_id == region_org_id, Org.parent_id == region_org_id),
+            )
+            .order_by(EventInstance.start_date, EventInstance.id, Org.name, EventInstance.start_time)
+            .limit(max_events + 1)
+        ).all()
+        truncated = len(rows) > max_events
+        rows = rows[:max_events]
+        event_ids = [row[0].id for row in rows]
+
+        event_types: Dict[int, List[Tuple[int, str]]] = {}
+        attendance: Dict[int, List[tuple]] = {}
+        if event_ids:
+            for event_instance_id, type_id, type_name in session.execute(
+                select(EventType_x_EventInstance.event_instance_id, EventType.id, EventType.name)
+                .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
+                .filter(EventType_x_EventInstance.event_instance_id.in_(event_ids))
+                .order_by(EventType_x_EventInstance.event_instance_id, EventType.id)
+            ).all():
+                event_types.setdefault(event_instance_id, []).append((type_id, type_name))
+            for row in session.execute(
+                select(
+                    Attendance.event_instance_id,
+                    Attendance.id,
+                    Attendance.user_id,
+                    Attendance.is_planned,
+                    Attendance_x_AttendanceType.attendance_type_id,
+                    User.f3_name,
+                )
+                .join(Attendance_x_AttendanceType, Attendance_x_AttendanceType.attendance_id == Attendance.id)
+                .join(User, User.id == Attendance.user_id)
+                .filter(Attendance.event_instance_id.in_(event_ids))
+                .order_by(Attendance.event_instance_id, Attendance.id)
+            ).all():
+                attendance.setdefault(row[0], []).append(row[1:])
+
+        events = []
+        for event_instance, org_name, org_parent_id, series_name in rows:
+            types = event_types.get(event_instance.id)
+            if not types:
+                continue  # home_schedule_query inner joins event types, so untyped events never show
+            attendee_ids, q_user_ids, attendance_ids, q_names = set(), set(), set(), []
+            for attendance_id, user_id, is_planned, attendance_type_id, f3_name in attendance.get(
+                event_instance.id, []
+            ):
+                attendee_ids.add(user_id)
+                attendance_ids.add(attendance_id)
+                if attendance_type_id in Q_ATTENDANCE_TYPE_IDS:
+                    q_user_ids.add(user_id)
+                    if is_planned and f3_name:
+                        q_names.append(f3_name)
+            events.append(
+                FeedEvent(
+                    id=event_instance.id,
+                    org_id=event_instance.org_id,
+                    org_name=org_name,
+                    org_parent_id=org_parent_id,
+                    location_id=event_instance.location_id,
+                    start_date=event_instance.start_date,
+                    start_time=event_instance.start_time,
+                    name=event_instance.name,
+                    highlight=bool(event_instance.highlight),
+                    has_preblast=bool(event_instance.preblast_rich),
+                    series_exception=event_instance.series_exception,
+                    series_name=series_name,
+                    event_types=tuple(types),
+                    planned_qs=",".join(dict.fromkeys(q_names)) or None,
+                    attendee_ids=frozenset(attendee_ids),
+                    q_user_ids=frozenset(q_user_ids),
+                    attendance_ids=frozenset(attendance_ids),
+                )
+            )
+    return CalendarFeed(
+        region_org_id=region_org_id,
+        start_date=start_date,
+        org_ids=frozenset(org_ids),
+        events=events,
+        truncated=truncated,
+    )
+
+
+class CalendarFeedCache:
+    """Bounded LRU of ``CalendarFeed`` objects keyed by region org id.
+
+    Feeds are dropped when a committed write touches one of their event instances, attendance rows or orgs
+    (see ``track_writes``), when ``EventInstanceService`` writes through the API (``invalidate_writes`` is its
+    ``on_write`` hook), when the CST date rolls over, or ``ttl_seconds`` after loading, which bounds staleness
+    from writes made by other instances.
+    """
+
+    def __init__(
+        self,
+        max_regions: int = MAX_REGIONS,
+        ttl_seconds: float = TTL_SECONDS,
+        loader: Callable[[int, datetime.date], CalendarFeed] = load_calendar_feed,
+    ):
+        self.max_regions = max(1, max_regions)
+        self.ttl_seconds = ttl_seconds
+        self.loader = loader
+        self._feeds: "OrderedDict[int, CalendarFeed]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._feeds)
+
+    def get(self, region_org_id: int, today: datetime.date) -> CalendarFeed:
+        with self._lock:
+            feed = self._feeds.get(region_org_id)
+            if feed and feed.start_date == today and feed.expires > time.monotonic():
+                self._feeds.move_to_end(region_org_id)
+                self.hits += 1
+                return feed
+            self.misses += 1
+        # Load outside the lock so one slow region doesn't block the others
+        feed = self.loader(region_org_id, today)
+        feed.expires = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._feeds[region_org_id] = feed
+            self._feeds.move_to_end(region_org_id)
+            while len(self._feeds) > self.max_regions:
+                self._feeds.popitem(last=False)
+        return feed
+
+    def invalidate(self, region_org_id: int) -> None:
+        with self._lock:
+            if self._feeds.pop(region_org_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._feeds)
+            self._feeds.clear()
+
+    def invalidate_writes(
+        self,
+        event_instance_ids: Iterable[int] = (),
+        org_ids: Iterable[int] = (),
+        attendance_ids: Iterable[int] = (),
+    ) -> None:
+        """Drops every feed containing one of the written event instances, orgs or attendance rows."""
+        event_instance_ids, org_ids, attendance_ids = set(event_instance_ids), set(org_ids), set(attendance_ids)
+        with self._lock:
+            for region_org_id, feed in list(self._feeds.items()):
+                if (
+                    feed.event_ids & event_instance_ids
+                    or feed.org_ids & org_ids
+                    or feed.attendance_ids & attendance_ids
+                ):
+                    self.invalidate(region_org_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "regions": len(self._feeds),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def track_writes(self) -> None:
+        """Invalidates feeds after any committed session write to attendance or event instances."""
+        event.listen(Session, "after_flush", _collect_flushed_writes)
+        event.listen(Session, "do_orm_execute", _collect_bulk_writes)
+        event.listen(Session, "after_commit", lambda session: self._apply_writes(session.info.pop(_SESSION_KEY, None)))
+        event.listen(Session, "after_rollback", lambda session: session.info.pop(_SESSION_KEY, None))
+
+    def _apply_writes(self, writes: Optional[Dict[str, Set[int]]]) -> None:
+        if not writes:
+            return
+        if writes.get("bulk"):
+            self.clear()
+        else:
+            self.invalidate_writes(writes["event_instance_ids"], writes["org_ids"], writes["attendance_ids"])
+
+
+def _pending_writes(session: Session) -> Dict[str, Set[int]]:
+    return session.info.setdefault(
+        _SESSION_KEY, {"event_instance_ids": set(), "org_ids": set(), "attendance_ids": set(), "bulk": set()}
+    )
+
+
+def _collect_flushed_writes(session: Session, flush_context) -> None:
+    writes = None
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, _TRACKED_CLASSES):
+            continue
+        writes = writes or _pending_writes(session)
+        if isinstance(obj, EventInstance):
+            writes["event_instance_ids"].add(obj.id)
+            writes["org_ids"].add(obj.org_id)
+        elif isinstance(obj, Attendance):
+            writes["event_instance_ids"].add(obj.event_instance_id)
+            writes["attendance_ids"].add(obj.id)
+        elif isinstance(obj, Attendance_x_AttendanceType):
+            writes["attendance_ids"].add(obj.attendance_id)
+        else:
+            writes["event_instance_ids"].add(obj.event_instance_id)
+
+
+def _collect_bulk_writes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _TRACKED_CLASSES):
+        # Bulk statements don't say which rows they touched
+        _pending_writes(orm_execute_state.session)["bulk"].add(1)
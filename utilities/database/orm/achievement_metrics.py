@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from utilities.database.orm.views import Base
+
+
+class AchievementMetric(Base):
+    """
+    ORM mapping for `achievement_metrics`, created by `db-init/achievement_metrics.sql`.
+
+    Running metric per (achievement, user, award_year, award_period) as of the achievement's checkpoint, maintained by
+    `scripts/award_achievements.py` in incremental mode. A lowered threshold is re-evaluated against these rows
+    instead of re-aggregating the year's attendance.
+    """
+
+    __tablename__ = "achievement_metrics"
+
+    achievement_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    award_year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    award_period: Mapped[int] = mapped_column(Integer, primary_key=True)
+    metric: Mapped[int] = mapped_column(Integer)
+    updated: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class AchievementMetricCheckpoint(Base):
+    """
+    ORM mapping for `achievement_metric_checkpoints`, created by `db-init/achievement_metrics.sql`.
+
+    High-water mark of `attendance_expanded` / `event_instance_expanded` updates already folded into
+    `achievement_metrics` for one achievement. `signature` fingerprints the achievement's cadence, threshold type and
+    filters, followed by its threshold; when the fingerprint changes the achievement is rebuilt from scratch.
+    """
+
+    __tablename__ = "achievement_metric_checkpoints"
+
+    achievement_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    signature: Mapped[str] = mapped_column(String)
+    high_water: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    award_year: Mapped[int] = mapped_column(Integer)
+    rebuilt: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, List
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 from f3_data_models.models import (
     Attendance,
@@ -22,8 +23,9 @@ from f3_data_models.models import (
     User,
 )
 from f3_data_models.utils import _joinedloads, get_session
-from sqlalchemy import and_, case, func, or_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, case, func, not_, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import contains_eager, joinedload
 
 from utilities.constants import ALL_PERMISSIONS, PERMISSIONS
 
@@ -39,169 +41,139 @@ class CalendarHomeQuery:
     series: Event = None
 
 
-def home_schedule_query(
-    user_id: int, filters: list, limit: int = 45, open_q_only: bool = False, only_users_events: bool = False
-) -> list[CalendarHomeQuery]:
-    session = get_session()
+Q_ATTENDANCE_TYPE_IDS = [2, 3]  # Q and Co-Q
 
-    # LOGIC CHECK:
-    # If we are filtering BY attendance data (open_q or user_events),
-    # we cannot optimize using "Limit-First" because the Limit depends on the aggregation.
-    # We only use the optimization for the standard schedule view.
-    use_optimization = not (open_q_only or only_users_events)
 
-    if use_optimization:
-        # --- OPTIMIZED PATH (Limit First) ---
+def home_schedule_statement(
+    user_id: int,
+    filters: list,
+    limit: int = 45,
+    open_q_only: bool = False,
+    only_users_events: bool = False,
+    after: Tuple[date, int] | None = None,
+):
+    """Builds one page of the calendar home schedule, ordered by ``(start_date, id)``.
 
-        # 1. The Scout: Find the IDs of the 45 events we want to show FIRST.
-        # We apply all Event/Org filters here.
-        candidate_ids_stmt = (
-            select(EventInstance.id)
-            .join(Org, Org.id == EventInstance.org_id)
-            # Add other necessary joins for filtering/sorting if they are in *filters
-            # Assuming 'filters' might reference EventType or others, ensure those joins exist:
-            .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
-            .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
-            .filter(*filters)
-            .order_by(EventInstance.start_date, EventInstance.id, Org.name, EventInstance.start_time)
-            .limit(limit)
+    ``after`` is the ``(start_date, id)`` of the last event on the previous page (keyset pagination), so
+    later pages cost the same as the first. The open-Q and my-events filters are EXISTS / NOT EXISTS checks
+    on the candidate events, which keeps every variant limit-first: attendance is only aggregated for the
+    ``limit`` events that end up on the page.
+    """
+    # 1. The Scout: find the ids of the events on this page first, applying all Event/Org filters here.
+    q_attendance = (
+        select(Attendance.id)
+        .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
+        .where(
+            Attendance.event_instance_id == EventInstance.id,
+            Attendance.is_planned,
+            Attendance_x_AttendanceType.attendance_type_id.in_(Q_ATTENDANCE_TYPE_IDS),
         )
-
-        # Turn this statement into a Common Table Expression (CTE)
-        # This tells Postgres: "Run this small query first and hold the results."
-        matches_cte = candidate_ids_stmt.cte("matches_cte")
-
-        # 2. The Subquery: Calculate attendance ONLY for the IDs in the CTE.
-        # Notice we do NOT apply *filters here. We only join on the CTE.
-        subquery = (
-            select(
-                Attendance.event_instance_id,
-                func.string_agg(
-                    case(
-                        (
-                            and_(Attendance.is_planned, Attendance_x_AttendanceType.attendance_type_id.in_([2, 3])),
-                            User.f3_name,
+    )
+    user_attendance = (
+        select(Attendance.id)
+        .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
+        .where(Attendance.event_instance_id == EventInstance.id, Attendance.user_id == user_id)
+    )
+    page_filters = list(filters)
+    if open_q_only:
+        page_filters.append(~q_attendance.exists())  # anti-join
+    if only_users_events:
+        page_filters.append(user_attendance.exists())  # semi-join
+    if after:
+        page_filters.append(tuple_(EventInstance.start_date, EventInstance.id) > tuple_(*after))
+
+    candidate_ids_stmt = (
+        select(EventInstance.id, EventInstance.start_date)
+        .join(Org, Org.id == EventInstance.org_id)
+        # 'filters' may reference EventType, so keep the type joins (and DISTINCT away their fan-out)
+        .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
+        .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
+        .filter(*page_filters)
+        .distinct()
+        .order_by(EventInstance.start_date, EventInstance.id)
+        .limit(limit)
+    )
+
+    # Turn this statement into a Common Table Expression (CTE)
+    # This tells Postgres: "Run this small query first and hold the results."
+    matches_cte = candidate_ids_stmt.cte("matches_cte")
+
+    # 2. The Subquery: Calculate attendance ONLY for the IDs in the CTE.
+    # Notice we do NOT apply *filters here. We only join on the CTE.
+    subquery = (
+        select(
+            Attendance.event_instance_id,
+            func.string_agg(
+                case(
+                    (
+                        and_(
+                            Attendance.is_planned,
+                            Attendance_x_AttendanceType.attendance_type_id.in_(Q_ATTENDANCE_TYPE_IDS),
                         ),
-                        else_=None,
+                        User.f3_name,
                     ),
-                    ",",
-                ).label("planned_qs"),
-                func.max(case((Attendance.user_id == user_id, 1), else_=0)).label("user_attending"),
-                func.max(
-                    case(
-                        (
-                            and_(
-                                Attendance.user_id == user_id,
-                                Attendance_x_AttendanceType.attendance_type_id.in_([2, 3]),
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("user_q"),
-            )
-            .select_from(Attendance)
-            .join(User, User.id == Attendance.user_id)
-            .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
-            # CRITICAL OPTIMIZATION: Inner join to the CTE.
-            # This forces the DB to only look at attendance for our 45 "winner" events.
-            .join(matches_cte, matches_cte.c.id == Attendance.event_instance_id)
-            .group_by(Attendance.event_instance_id)
-            .alias()
-        )
-
-        # 3. Main Query: Select the details, joining the CTE to ensure we keep our Limit/Sort
-        query = (
-            select(
-                EventInstance,
-                Org,
-                EventType,
-                subquery.c.planned_qs,
-                subquery.c.user_attending,
-                subquery.c.user_q,
-                Event,
-            )
-            .select_from(matches_cte)  # Start from our list of 45 IDs
-            .join(EventInstance, EventInstance.id == matches_cte.c.id)  # Get the full Event object
-            .join(Org, Org.id == EventInstance.org_id)
-            .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
-            .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
-            .outerjoin(subquery, subquery.c.event_instance_id == EventInstance.id)
-            .outerjoin(Event, Event.id == EventInstance.series_id)
-            # We must re-apply the order_by to ensure final output order
-            .order_by(EventInstance.start_date, EventInstance.id, Org.name, EventInstance.start_time)
-        )
-
-    else:
-        # --- LEGACY PATH (For Open Q / User Events) ---
-        # This is your original logic, kept for when we need to filter BY the calculated fields.
-
-        subquery = (
-            select(
-                Attendance.event_instance_id,
-                func.string_agg(
-                    case(
-                        (
-                            and_(Attendance.is_planned, Attendance_x_AttendanceType.attendance_type_id.in_([2, 3])),
-                            User.f3_name,
+                    else_=None,
+                ),
+                ",",
+            ).label("planned_qs"),
+            func.max(case((Attendance.user_id == user_id, 1), else_=0)).label("user_attending"),
+            func.max(
+                case(
+                    (
+                        and_(
+                            Attendance.user_id == user_id,
+                            Attendance_x_AttendanceType.attendance_type_id.in_(Q_ATTENDANCE_TYPE_IDS),
                         ),
-                        else_=None,
+                        1,
                     ),
-                    ",",
-                ).label("planned_qs"),
-                func.max(case((Attendance.user_id == user_id, 1), else_=0)).label("user_attending"),
-                func.max(
-                    case(
-                        (
-                            and_(
-                                Attendance.user_id == user_id,
-                                Attendance_x_AttendanceType.attendance_type_id.in_([2, 3]),
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("user_q"),
-            )
-            .select_from(Attendance)
-            .join(User, User.id == Attendance.user_id)
-            .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
-            .join(EventInstance, EventInstance.id == Attendance.event_instance_id)
-            # We still keep these joins to ensure the subquery filters correctly
-            .join(Org, Org.id == EventInstance.org_id)
-            .filter(*filters)  # Original heavy filtering
-            .group_by(Attendance.event_instance_id)
-            .alias()
+                    else_=0,
+                )
+            ).label("user_q"),
         )
-
-        # Apply the specific dynamic filters to the alias columns
-        final_filters = list(filters)  # Copy to avoid modifying the input list
-        if open_q_only:
-            final_filters.append(subquery.c.planned_qs.is_(None))
-        if only_users_events:
-            final_filters.append(subquery.c.user_attending == 1)
-
-        query = (
-            select(
-                EventInstance,
-                Org,
-                EventType,
-                subquery.c.planned_qs,
-                subquery.c.user_attending,
-                subquery.c.user_q,
-                Event,
-            )
-            .join(Org, Org.id == EventInstance.org_id)
-            .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
-            .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
-            .outerjoin(subquery, subquery.c.event_instance_id == EventInstance.id)
-            .outerjoin(Event, Event.id == EventInstance.series_id)
-            .filter(*final_filters)
-            .order_by(EventInstance.start_date, EventInstance.id, Org.name, EventInstance.start_time)
-            .limit(limit)
+        .select_from(Attendance)
+        .join(User, User.id == Attendance.user_id)
+        .join(Attendance_x_AttendanceType, Attendance.id == Attendance_x_AttendanceType.attendance_id)
+        # CRITICAL OPTIMIZATION: Inner join to the CTE.
+        # This forces the DB to only look at attendance for this page's events.
+        .join(matches_cte, matches_cte.c.id == Attendance.event_instance_id)
+        .group_by(Attendance.event_instance_id)
+        .alias()
+    )
+
+    # 3. Main Query: Select the details, joining the CTE to ensure we keep our Limit/Sort
+    query = (
+        select(
+            EventInstance,
+            Org,
+            EventType,
+            subquery.c.planned_qs,
+            subquery.c.user_attending,
+            subquery.c.user_q,
+            Event,
         )
+        .select_from(matches_cte)  # Start from this page's ids
+        .join(EventInstance, EventInstance.id == matches_cte.c.id)  # Get the full Event object
+        .join(Org, Org.id == EventInstance.org_id)
+        .join(EventType_x_EventInstance, EventType_x_EventInstance.event_instance_id == EventInstance.id)
+        .join(EventType, EventType.id == EventType_x_EventInstance.event_type_id)
+        .outerjoin(subquery, subquery.c.event_instance_id == EventInstance.id)
+        .outerjoin(Event, Event.id == EventInstance.series_id)
+        # We must re-apply the order_by to ensure final output order
+        .order_by(EventInstance.start_date, EventInstance.id)
+    )
+    return query
 
-    # --- EXECUTION ---
+
+def home_schedule_query(
+    user_id: int,
+    filters: list,
+    limit: int = 45,
+    open_q_only: bool = False,
+    only_users_events: bool = False,
+    after: Tuple[date, int] | None = None,
+) -> list[CalendarHomeQuery]:
+    session = get_session()
+    query = home_schedule_statement(user_id, filters, limit, open_q_only, only_users_events, after)
     results = session.execute(query).all()
 
     # Turn EventType into a list of EventType objects for each Event.id
@@ -212,7 +184,11 @@ def home_schedule_query(
     # Turn the results into a list of CalendarHomeQuery objects
     output = []
 
+    seen = set()
     for r in results:
+        if r[0].id in seen:
+            continue
+        seen.add(r[0].id)
         output.append(
             CalendarHomeQuery(
                 event=r[0],
@@ -264,6 +240,38 @@ def event_attendance_query(attendance_filter: List[Any] = None, event_filter: Li
         return event_records
 
 
+def highlighted_events_in_box(
+    start_date: date,
+    end_date: date,
+    exclude_region_org_id: int,
+    lat_range: Tuple[float, float],
+    lon_range: Tuple[float, float] | None,
+) -> List[EventInstance]:
+    """
+    Returns active highlighted AO events between the dates, outside the given region, whose location lies inside the
+    lat/lon box, with ``org`` and ``location`` loaded. ``lon_range`` of None leaves longitude unbounded.
+    """
+    with get_session() as session:
+        query = (
+            select(EventInstance)
+            .join(Org, Org.id == EventInstance.org_id)
+            .join(Location, Location.id == EventInstance.location_id)
+            .options(contains_eager(EventInstance.org), contains_eager(EventInstance.location))
+            .filter(
+                EventInstance.highlight,
+                EventInstance.is_active,
+                EventInstance.start_date >= start_date,
+                EventInstance.start_date <= end_date,
+                Org.parent_id.is_not(None),
+                Org.parent_id != exclude_region_org_id,
+                Location.latitude.between(*lat_range),
+            )
+        )
+        if lon_range is not None:
+            query = query.filter(Location.longitude.between(*lon_range))
+        return session.scalars(query).unique().all()
+
+
 def event_instances_without_attendance_types(
     *,
     excluded_attendance_type_ids: list[int],
@@ -422,6 +430,119 @@ def make_user_admin(org_id: int, user_id: int) -> None:
         session.commit()
 
 
+def _insert_slack_user_rows(
+    session, profiles: List[dict], team_id: Optional[str] = None
+) -> Tuple[Dict[str, SlackUser], Dict[str, int], int]:
+    """Upserts ``users`` and inserts missing ``slack_users`` for a batch of Slack profiles.
+
+    ``users`` are upserted on email with one multi-row ``INSERT ... ON CONFLICT ... RETURNING id``. ``users.email`` is
+    CITEXT, so rows are deduped on the lower-cased email first; two spellings of one address would otherwise make the
+    statement touch the same row twice. ``slack_users`` has no unique key on ``slack_id``, so existing rows are read in
+    one query (only this workspace's when ``team_id`` is given) and only the new ones are inserted.
+
+    Returns (``SlackUser`` by slack id, user id by lower-cased email, number of ``SlackUser`` rows inserted).
+    """
+    user_rows = {
+        p["email"].lower(): {
+            "email": p["email"],
+            "f3_name": p["user_name"],
+            "avatar_url": p["avatar_url"],
+            "home_region_id": p["home_region_id"],
+        }
+        for p in profiles
+    }
+    user_stmt = insert(User).values(list(user_rows.values()))
+    # The no-op update makes RETURNING include ids of users that already existed
+    user_stmt = user_stmt.on_conflict_do_update(
+        index_elements=[User.email], set_={"email": user_stmt.excluded.email}
+    ).returning(User.id, User.email)
+    user_ids = {row.email.lower(): row.id for row in session.execute(user_stmt)}
+
+    query = select(SlackUser).filter(SlackUser.slack_id.in_([p["slack_id"] for p in profiles]))
+    if team_id is not None:
+        query = query.filter(SlackUser.slack_team_id == team_id)
+    slack_users = {su.slack_id: su for su in session.scalars(query).all()}
+    new_rows = [
+        {
+            "slack_id": p["slack_id"],
+            "user_id": user_ids.get(p["email"].lower()),
+            "email": p["email"],
+            "user_name": p["user_name"],
+            "avatar_url": p["avatar_url"],
+            "is_admin": p["is_admin"],
+            "is_owner": p["is_owner"],
+            "is_bot": p["is_bot"],
+            "slack_updated": p["slack_updated"],
+            "slack_team_id": team_id if team_id is not None else p["slack_team_id"],
+        }
+        for p in {p["slack_id"]: p for p in profiles}.values()
+        if p["slack_id"] not in slack_users
+    ]
+    if new_rows:
+        for su in session.scalars(insert(SlackUser).values(new_rows).returning(SlackUser)).all():
+            slack_users[su.slack_id] = su
+    return slack_users, user_ids, len(new_rows)
+
+
+def upsert_slack_users(profiles: List[dict]) -> List[SlackUser]:
+    """Creates or links ``User`` and ``SlackUser`` rows for a batch of Slack profiles in one transaction.
+
+    Each profile dict carries ``email``, ``user_name``, ``home_region_id`` and the ``SlackUser`` columns, including
+    ``slack_team_id``. Returns the ``SlackUser`` records in profile order, detached from the session.
+    """
+    if not profiles:
+        return []
+    with get_session() as session:
+        slack_users, user_ids, _ = _insert_slack_user_rows(session, profiles)
+        for p in profiles:
+            slack_user = slack_users[p["slack_id"]]
+            if not slack_user.user_id:
+                slack_user.user_id = user_ids.get(p["email"].lower())
+
+        session.flush()
+        session.expunge_all()
+        session.commit()
+        return [slack_users[p["slack_id"]] for p in profiles]
+
+
+def insert_workspace_members(team_id: str, members: List[dict]) -> int:
+    """Creates the ``User`` and ``SlackUser`` rows for one page of a workspace's members, in one transaction.
+
+    Each member dict carries the same fields as an ``upsert_slack_users`` profile, minus ``slack_team_id``. Existing
+    users are left as they are, and ``SlackUser`` rows are inserted only for members this workspace doesn't have yet.
+    Returns the number of ``SlackUser`` rows inserted.
+    """
+    if not members:
+        return 0
+    with get_session() as session:
+        _, _, inserted = _insert_slack_user_rows(session, members, team_id=team_id)
+        session.commit()
+        return inserted
+
+
+def update_slack_users_by_id(rows: List[dict]) -> int:
+    """Applies per-row ``SlackUser`` column changes in one executemany ``UPDATE``, keyed on each row's ``id``."""
+    if not rows:
+        return 0
+    with get_session() as session:
+        session.execute(update(SlackUser), rows)
+        session.commit()
+    return len(rows)
+
+
+def replace_actual_attendance(event_instance_id: int, attendance_records: List[Attendance]) -> None:
+    """Swaps an event's non-planned attendance for ``attendance_records`` in a single transaction."""
+    with get_session() as session:
+        existing = session.scalars(
+            select(Attendance).filter(Attendance.event_instance_id == event_instance_id, not_(Attendance.is_planned))
+        ).all()
+        for record in existing:
+            session.delete(record)  # ORM delete so the attendance type links cascade
+        session.flush()
+        session.add_all(attendance_records)
+        session.commit()
+
+
 @dataclass
 class MissingBackblastQuery:
     event: EventInstance
@@ -0,0 +1,184 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from typing import NamedTuple, Optional
+
+from flask import Request
+
+from utilities import instrumentation
+from utilities.constants import LOCAL_DEVELOPMENT, SOCKET_MODE
+
+# Pub/Sub topic (``projects/<project>/topics/<topic>``) for routes flagged lazy in ``utilities.routing``. Its push
+# subscription delivers each message to the ``/slack-lazy`` endpoint, which runs the handler in a request of its own.
+# Unset, lazy routes run before the response like any other route.
+LAZY_ROUTE_TOPIC = os.environ.get("LAZY_ROUTE_TOPIC", "")
+# Deliveries queued longer than this are dropped instead of run; a view's response_url only lives for 30 minutes
+LAZY_ROUTE_MAX_AGE_SECONDS = float(os.environ.get("LAZY_ROUTE_MAX_AGE_SECONDS", "1800"))
+LAZY_ROUTE_PUBLISH_TIMEOUT_SECONDS = 2
+PUBSUB_SCOPE = "https://www.googleapis.com/auth/pubsub"
+SIGNATURE_ATTRIBUTE = "signature"
+
+_session = None
+
+
+class LazyDelivery(NamedTuple):
+    """A lazy route read back from a push delivery."""
+
+    request_type: str
+    request_id: str
+    body: dict
+    queued_ms: float
+    message_id: Optional[str]
+
+
+def lazy_dispatch_enabled() -> bool:
+    return bool(LAZY_ROUTE_TOPIC and _signing_secret()) and not (LOCAL_DEVELOPMENT or SOCKET_MODE)
+
+
+def publish_lazy_route(request_type: str, request_id: str, body: dict) -> str:
+    """Publishes an acked route to ``LAZY_ROUTE_TOPIC`` and returns the Pub/Sub message id.
+
+    The payload is signed with the Slack signing secret so ``/slack-lazy`` only runs messages this app published.
+    Uses the Pub/Sub REST API through google-auth's application default credentials.
+    """
+    payload = json.dumps(
+        {"request_type": request_type, "request_id": request_id, "enqueued_at": time.time(), "body": body}
+    ).encode()
+    message = {
+        "data": base64.b64encode(payload).decode(),
+        "attributes": {SIGNATURE_ATTRIBUTE: _sign(payload)},
+    }
+    resp = _get_session().post(
+        f"https://pubsub.googleapis.com/v1/{LAZY_ROUTE_TOPIC}:publish",
+        json={"messages": [message]},
+        timeout=LAZY_ROUTE_PUBLISH_TIMEOUT_SECONDS,
+    )
+    resp.raise_for_status()
+    return resp.json()["messageIds"][0]
+
+
+def read_lazy_route(request: Request) -> Optional[LazyDelivery]:
+    """Reads a Pub/Sub push delivery from ``publish_lazy_route``; ``None`` if it is malformed or not signed by us."""
+    try:
+        message = json.loads(request.data.decode())["message"]
+        payload = base64.b64decode(message["data"])
+        signature = (message.get("attributes") or {}).get(SIGNATURE_ATTRIBUTE, "")
+        if not hmac.compare_digest(_sign(payload), signature):
+            return None
+        data = json.loads(payload)
+        return LazyDelivery(
+            request_type=data["request_type"],
+            request_id=data["request_id"],
+            body=data["body"],
+            queued_ms=max(time.time() - data["enqueued_at"], 0) * 1000,
+            message_id=message.get("messageId"),
+        )
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _signing_secret() -> str:
+    return os.environ.get("SLACK_SIGNING_SECRET", "")
+
+
+def _sign(payload: bytes) -> str:
+    return hmac.new(_signing_secret().encode(), payload, hashlib.sha256).hexdigest()
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        import google.auth
+        from google.auth.transport.requests import AuthorizedSession
+
+        credentials, _ = google.auth.default(scopes=[PUBSUB_SCOPE])
+        _session = AuthorizedSession(credentials)
+    return _session
+
+
+class RouteTimer:
+    """End-to-end timing for one routed request: received -> acked -> handler finished.
+
+    Between ``begin()`` and ``finish()`` the DB, Slack and F3 API calls made in this context are counted (see
+    ``utilities.instrumentation``) and the route may be sampled by cProfile.
+    """
+
+    def __init__(self, request_type: str, request_id: str, lazy: bool = False):
+        self.request_type = request_type
+        self.request_id = request_id
+        self.lazy = lazy
+        self.queued_ms: Optional[float] = None
+        self.received_at = time.perf_counter()
+        self.acked_at: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.calls = instrumentation.CallStats()
+        self._token = None
+        self._profiler = None
+
+    @property
+    def route(self) -> str:
+        return f"{self.request_type}:{self.request_id}"
+
+    def begin(self):
+        self.calls, self._token = instrumentation.start_collecting()
+        self._profiler = instrumentation.start_profile()
+
+    def ack(self):
+        if self.acked_at is None:
+            self.acked_at = time.perf_counter()
+
+    def start(self):
+        self.started_at = time.perf_counter()
+
+    def queued(self, logger: logging.Logger, handler_name: str, message_id: str):
+        """Logs the request side of a lazy route; the ``/slack-lazy`` delivery logs the handler with ``finish()``."""
+        logger.info(
+            f"Route {self.route} ({handler_name}, lazy=True) acked in {self._ms(self.acked_at):.0f} ms, "
+            f"queued as message {message_id} after {self._ms(time.perf_counter()):.0f} ms",
+            extra={"json_fields": {"route": self.route, "handler": handler_name, "message_id": message_id}},
+        )
+
+    def finish(self, logger: logging.Logger, handler_name: str):
+        self.finished_at = time.perf_counter()
+        total_ms = self._ms(self.finished_at)
+        if self._profiler is not None:
+            instrumentation.stop_profile(self._profiler, self.route, handler_name, total_ms)
+            self._profiler = None
+        if self._token is not None:
+            instrumentation.stop_collecting(self._token)
+            self._token = None
+
+        handler_ms = (self.finished_at - (self.started_at or self.received_at)) * 1000
+        fields = {
+            "route": self.route,
+            "handler": handler_name,
+            "lazy": self.lazy,
+            "queued_ms": round(self.queued_ms, 1) if self.queued_ms is not None else None,
+            "ack_ms": round(self._ms(self.acked_at), 1) if self.acked_at is not None else None,
+            "handler_ms": round(handler_ms, 1),
+            "total_ms": round(total_ms, 1),
+            **self.calls.as_fields(),
+        }
+        calls = ", ".join(
+            f"{kind} {self.calls.counts[kind]}x/{self.calls.seconds[kind] * 1000:.0f} ms"
+            for kind in instrumentation.CALL_KINDS
+        )
+        waited = (
+            f"queued {self.queued_ms:.0f} ms"
+            if self.queued_ms is not None
+            else f"acked in {self._ms(self.acked_at):.0f} ms"
+        )
+        logger.info(
+            f"Route {self.route} ({handler_name}, lazy={self.lazy}) {waited}, "
+            f"handler ran {handler_ms:.0f} ms, total {total_ms:.0f} ms; {calls}",
+            extra={"json_fields": fields},
+        )
+        instrumentation.observe(self.route, handler_name, total_ms, self.calls)
+
+    def _ms(self, at: Optional[float]) -> float:
+        return (at - self.received_at) * 1000 if at is not None else float("nan")
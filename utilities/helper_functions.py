@@ -3,6 +3,7 @@ import dataclasses
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
 from logging import Logger
@@ -27,12 +28,33 @@ from slack_sdk.oauth.installation_store import FileInstallationStore
 from slack_sdk.oauth.state_store import FileOAuthStateStore
 from slack_sdk.web import SlackResponse, WebClient
 
+from application.ao.service import AoService
+from application.event_tag.service import EventTagService
+from application.event_type.service import EventTypeService
+from application.location.service import LocationService
+from application.reference_data import RegionReferenceData
+from application.reference_data.service import RegionReferenceService
+from infrastructure.api_client import (
+    get_api_ao_repository,
+    get_api_event_tag_repository,
+    get_api_event_type_repository,
+    get_api_location_repository,
+    get_f3_api_client,
+)
 from utilities import constants
+from utilities.calendar_feed_cache import CalendarFeedCache
 from utilities.constants import LOCAL_DEVELOPMENT
 from utilities.database.orm import SlackSettings
+from utilities.database.special_queries import insert_workspace_members, upsert_slack_users
+from utilities.region_cache import RegionSettingsCache
+from utilities.slack_user_cache import SlackUserCache
 
 REGION_RECORDS: Dict[str, SlackSettings] = {}
-SLACK_USERS: Dict[str, SlackUser] = {}
+REGION_CACHE = RegionSettingsCache(REGION_RECORDS)
+SLACK_USER_CACHE = SlackUserCache()
+CALENDAR_FEED_CACHE = CalendarFeedCache()
+CALENDAR_FEED_CACHE.track_writes()
+SLACK_PROFILE_FETCH_WORKERS = int(os.environ.get("SLACK_PROFILE_FETCH_WORKERS", "8"))
 
 
 def get_location_display_name(location: Location) -> str:
@@ -210,12 +232,15 @@ def get_user_names(
     logger,
     client: WebClient,
     return_urls=False,
+    region_record: SlackSettings = None,
 ):
     names = []
     urls = []
+    team_id = safe_get(region_record, "team_id")
+    users = _lookup_slack_users(team_id, array_of_user_ids) if team_id else {}
 
     for user_id in array_of_user_ids:
-        user: SlackUser = safe_get(SLACK_USERS, user_id)
+        user: SlackUser = users.get(user_id)
         if user:
             names.append(user.user_name)
             urls.append(user.avatar_url)
@@ -229,24 +254,81 @@ def get_user_names(
         return names
 
 
-def get_user(slack_user_id: str, region_record: SlackSettings, client: WebClient, logger: Logger) -> SlackUser:
-    if not SLACK_USERS:
-        update_local_slack_users()
+def _lookup_slack_users(team_id: str, slack_user_ids: List[str]) -> Dict[str, SlackUser]:
+    """Returns the known users for ``slack_user_ids``, filling cache misses with a single ``IN`` query."""
+    found, missing = SLACK_USER_CACHE.get_many(team_id, [u for u in slack_user_ids if u])
+    if missing:
+        records: List[SlackUser] = DbManager.find_records(SlackUser, filters=[SlackUser.slack_id.in_(missing)])
+        # Slack ids are unique per workspace; prefer this workspace's row if the id shows up more than once
+        for record in sorted(records, key=lambda r: r.slack_team_id == team_id):
+            found[record.slack_id] = record
+        for slack_id in missing:
+            if slack_id in found:
+                SLACK_USER_CACHE.put(found[slack_id], team_id=team_id)
+    return found
+
+
+def fetch_slack_profiles(slack_user_ids: List[str], client: WebClient) -> Dict[str, dict]:
+    """Fetches ``users_info`` for several users concurrently, at most ``SLACK_PROFILE_FETCH_WORKERS`` at a time."""
+    slack_user_ids = list(dict.fromkeys(slack_user_ids))
+    if not slack_user_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(SLACK_PROFILE_FETCH_WORKERS, len(slack_user_ids))) as executor:
+        profiles = executor.map(lambda slack_user_id: client.users_info(user=slack_user_id)["user"], slack_user_ids)
+        return dict(zip(slack_user_ids, profiles, strict=True))
 
-    user: SlackUser | None = safe_get(SLACK_USERS, slack_user_id)
-    if not user:
-        try:
-            # check to see if this user's email is already in the db
-            user_info = client.users_info(user=slack_user_id)
-            slack_user_record = create_user(user_info["user"], region_record.org_id)
 
-            # Update SLACK_USERS with the new id
-            SLACK_USERS[slack_user_id] = slack_user_record
-            return slack_user_record
-        except Exception as e:
-            raise e
-    else:
-        return user
+def slack_profile_row(slack_user_info: dict, home_region_id: int | None = None) -> dict:
+    """Flattens a Slack ``users_info`` / ``users_list`` member into the fields ``upsert_slack_users`` expects."""
+    email = safe_get(slack_user_info, "profile", "email") or safe_get(slack_user_info, "id")  # no email means a bot
+    return {
+        "slack_id": slack_user_info.get("id"),
+        "email": email.lower(),
+        "user_name": safe_get(slack_user_info, "profile", "display_name")
+        or safe_get(slack_user_info, "profile", "real_name"),
+        "avatar_url": safe_get(slack_user_info, "profile", "image_192"),
+        "home_region_id": home_region_id,
+        "is_admin": safe_get(slack_user_info, "is_admin") or False,
+        "is_owner": safe_get(slack_user_info, "is_owner") or False,
+        "is_bot": safe_get(slack_user_info, "is_bot") or False,
+        "slack_updated": safe_convert(slack_user_info.get("updated"), int),
+        "slack_team_id": safe_get(slack_user_info, "team_id") or "NOT FOUND",
+    }
+
+
+def get_users_bulk(
+    slack_user_ids: List[str], region_record: SlackSettings, client: WebClient, logger: Logger
+) -> List[SlackUser]:
+    """Resolves Slack user ids to ``SlackUser`` records, in input order.
+
+    Cached users are returned directly and the rest are loaded with one DB query. Ids that are not in the DB at
+    all have their Slack profiles fetched concurrently, then their users are created in a single batched upsert.
+    """
+    users = _lookup_slack_users(region_record.team_id, slack_user_ids)
+    missing = [u for u in dict.fromkeys(slack_user_ids) if u not in users]
+    if missing:
+        profiles = fetch_slack_profiles(missing, client)
+        for slack_user in upsert_slack_users([slack_profile_row(profiles[u], region_record.org_id) for u in missing]):
+            users[slack_user.slack_id] = slack_user
+            SLACK_USER_CACHE.put(slack_user, team_id=region_record.team_id)
+    logger.debug(f"Slack user cache: {SLACK_USER_CACHE.stats()}")
+    return [users[slack_user_id] for slack_user_id in slack_user_ids]
+
+
+def get_slack_users_for_user_ids(team_id: str, user_ids: List[int]) -> List[SlackUser]:
+    """Loads this workspace's ``SlackUser`` rows for the given F3 user ids, caching them for later lookups."""
+    if not user_ids:
+        return []
+    records: List[SlackUser] = DbManager.find_records(
+        SlackUser, filters=[SlackUser.slack_team_id == team_id, SlackUser.user_id.in_(set(user_ids))]
+    )
+    for record in records:
+        SLACK_USER_CACHE.put(record, team_id=team_id)
+    return records
+
+
+def get_user(slack_user_id: str, region_record: SlackSettings, client: WebClient, logger: Logger) -> SlackUser:
+    return get_users_bulk([slack_user_id], region_record, client, logger)[0]
 
 
 def _parse_view_private_metadata(body: dict) -> dict:
@@ -316,29 +398,21 @@ def create_user(slack_user_info: dict, home_region_id: int | None = None) -> Sla
         DbManager.update_record(SlackUser, slack_user_record.id, {SlackUser.user_id: safe_get(user_record, "id")})
         slack_user_record.user_id = safe_get(user_record, "id")
 
-    # Update SLACK_USERS with the new id
-    SLACK_USERS[slack_user_info.get("id")] = slack_user_record
+    SLACK_USER_CACHE.put(slack_user_record)
     return slack_user_record
 
 
 def update_local_slack_users(slack_user: SlackUser = None) -> None:
-    print("Updating local slack users...")
-    global SLACK_USERS
-
+    """Stores ``slack_user`` in the cache, or clears the cache so users are reloaded lazily on next use."""
     if slack_user:
-        SLACK_USERS[slack_user.slack_id] = slack_user
+        SLACK_USER_CACHE.put(slack_user)
         return
-    slack_users: List[SlackUser] = DbManager.find_records(SlackUser, filters=[True])
-
-    SLACK_USERS.clear()
-    SLACK_USERS.update({slack_user.slack_id: slack_user for slack_user in slack_users})
+    print("Clearing local slack user cache...")
+    SLACK_USER_CACHE.clear()
 
 
 def get_region_record(team_id: str, body, context, client, logger) -> SlackSettings:
-    if not REGION_RECORDS:
-        update_local_region_records()
-
-    region_record: SlackSettings | None = safe_get(REGION_RECORDS, team_id)
+    region_record: SlackSettings | None = REGION_CACHE.get(team_id)
     team_domain = safe_get(body, "team", "domain")
 
     if not region_record:
@@ -401,7 +475,7 @@ def get_region_record(team_id: str, body, context, client, logger) -> SlackSetti
                 )
             )
 
-        REGION_RECORDS[team_id] = region_record
+        REGION_CACHE.put(region_record)
 
         org_id = org_record.id if org_record else None
         populate_users(client, team_id, org_id)
@@ -415,44 +489,41 @@ def get_region_record(team_id: str, body, context, client, logger) -> SlackSetti
                 safe_get(DbManager.find_first_record(SlackSpace, filters=[SlackSpace.team_id == team_id]), "id"),
                 {SlackSpace.settings: region_record.__dict__, SlackSpace.bot_token: context["bot_token"]},
             )
-            REGION_RECORDS[team_id] = region_record
+            region_record = invalidate_region_record(team_id) or region_record
 
     return region_record
 
 
-def populate_users(client: WebClient, team_id: str, org_id: int = None) -> None:
-    users = client.users_list().get("members")
-    user_list = [
-        User(
-            f3_name=u["profile"]["display_name"] or u["profile"]["real_name"],
-            email=u["profile"].get("email") or u["id"],
-            avatar_url=u["profile"].get("image_192"),
-            home_region_id=org_id,
-        )
-        for u in users
-    ]
-    DbManager.create_or_ignore(User, user_list)
-
-    users_all: List[User] = DbManager.find_records(User, filters=[True])
-    users_dict = {u.email: u.id for u in users_all}
-
-    slack_user_list = [
-        SlackUser(
-            slack_id=u["id"],
-            user_id=users_dict.get(u["profile"].get("email") or u["id"]),
-            user_name=u["profile"]["display_name"] or u["profile"]["real_name"],
-            email=u["profile"].get("email") or u["id"],
-            avatar_url=u["profile"]["image_192"],
-            slack_team_id=team_id or "NOT FOUND",
-            is_admin=u.get("is_admin") or False,
-            is_owner=u.get("is_owner") or False,
-            is_bot=u.get("is_bot") or False,
-            slack_updated=safe_convert(safe_get(u, "user", "updated"), int),
-        )
-        for u in users
-    ]
-    DbManager.create_or_ignore(SlackUser, slack_user_list)
-    update_local_slack_users()
+def populate_users(client: WebClient, team_id: str, org_id: int = None) -> int:
+    """Creates users for every member of a newly connected workspace, one ``users_list`` page at a time.
+
+    Each page is written with ``insert_workspace_members``, so memory and queries scale with the workspace rather
+    than with the nation's user table. Returns the number of ``SlackUser`` rows created.
+    """
+    created = 0
+    cursor = None
+    while True:
+        response = client.users_list(limit=200, cursor=cursor)
+        members = [
+            {
+                "slack_id": u["id"],
+                "email": u["profile"].get("email") or u["id"],
+                "user_name": u["profile"]["display_name"] or u["profile"]["real_name"],
+                "avatar_url": u["profile"].get("image_192"),
+                "home_region_id": org_id,
+                "is_admin": u.get("is_admin") or False,
+                "is_owner": u.get("is_owner") or False,
+                "is_bot": u.get("is_bot") or False,
+                "slack_updated": safe_convert(u.get("updated"), int),
+            }
+            for u in response.get("members") or []
+        ]
+        created += insert_workspace_members(team_id or "NOT FOUND", members)
+        cursor = safe_get(response, "response_metadata", "next_cursor")
+        if not cursor:
+            break
+    SLACK_USER_CACHE.invalidate_team(team_id)
+    return created
 
 
 def get_request_type(body: dict) -> Tuple[str]:
@@ -481,13 +552,32 @@ def get_request_type(body: dict) -> Tuple[str]:
         return ("unknown", "unknown")
 
 
-def update_local_region_records() -> None:
-    print("Updating local region records...")
-    slack_space_records: List[SlackSpace] = DbManager.find_records(SlackSpace, filters=[True])
-    region_records = [SlackSettings(**s.settings) for s in slack_space_records]
-    global REGION_RECORDS
-    REGION_RECORDS.clear()
-    REGION_RECORDS.update({region.team_id: region for region in region_records})
+def update_local_region_records(full: bool = False) -> None:
+    """Brings REGION_RECORDS up to date. Only the first call (or ``full=True``) reloads every workspace;
+    later calls pull just the SlackSpace rows updated since the last refresh."""
+    if full:
+        REGION_CACHE.load_all()
+    else:
+        REGION_CACHE.sync(force=True)
+
+
+def invalidate_region_record(team_id: str) -> SlackSettings | None:
+    """Reloads one workspace's settings after a SlackSpace write and notifies other instances."""
+    return REGION_CACHE.invalidate(team_id)
+
+
+def get_region_reference_data(region_org_id: int) -> RegionReferenceData:
+    """Returns the region's AOs, locations, event types and event tags from the shared reference data cache,
+    fetching all four concurrently on a miss. The snapshot is shared between requests, so copy a list before
+    sorting or changing it."""
+    service = RegionReferenceService(
+        ao_service=AoService(repository=get_api_ao_repository()),
+        location_service=LocationService(repository=get_api_location_repository()),
+        event_type_service=EventTypeService(repository=get_api_event_type_repository()),
+        event_tag_service=EventTagService(repository=get_api_event_tag_repository()),
+        gather=get_f3_api_client().gather,
+    )
+    return service.get_snapshot(region_org_id)
 
 
 def parse_rich_block(
@@ -574,7 +664,7 @@ def replace_user_channel_ids(
     text = text.replace("{}", "")
 
     slack_user_ids = re.findall(USER_PATTERN, text or "")
-    slack_user_names = get_user_names(slack_user_ids, logger, client, return_urls=False)
+    slack_user_names = get_user_names(slack_user_ids, logger, client, return_urls=False, region_record=region_record)
     text = re.sub(USER_PATTERN, "{}", text)
     text = text.format(*slack_user_names)
 
@@ -613,7 +703,9 @@ def replace_rich_text_user_channel(
         if element["type"] in ["rich_text_section", "rich_text_preformatted", "rich_text_quote"]:
             for text in element["elements"]:
                 if text["type"] == "user":
-                    user_name = get_user_names([text["user_id"]], logger, client, return_urls=False)[0]
+                    user_name = get_user_names(
+                        [text["user_id"]], logger, client, return_urls=False, region_record=region_record
+                    )[0]
                     text["text"] = f"@{user_name}"
                     text["type"] = "text"
                     del text["user_id"]
@@ -0,0 +1,292 @@
+"""Per-route instrumentation: DB statements, Slack Web API calls and F3 API calls made while a route runs.
+
+``install()`` hooks SQLAlchemy engine events and registers an F3 API request observer once per process. F3 API GETs
+answered from the client's response cache count as ``f3_api_cached``, apart from requests that went out. Slack calls
+are counted by ``InstrumentedWebClient``, which ``main_response`` wraps around each request's client. Each hook adds
+its duration to the ``CallStats`` of the route running in the current context (see
+``utilities.dispatch.RouteTimer``), so calls made outside a route cost one ContextVar lookup. ``observe()`` keeps a
+bounded window of recent timings per route and logs a percentile summary every ``ROUTE_STATS_SUMMARY_SECONDS``.
+
+With ``ROUTE_PROFILE_SAMPLE_RATE`` set, that fraction of routes also runs under cProfile. The slowest sampled
+handlers are kept and dumped as ``.prof`` files to ``ROUTE_PROFILE_DIR`` with their top functions logged. On Python
+3.12+ cProfile is built on ``sys.monitoring`` and sees every thread, so a route is only sampled while no other route
+is running, and a sample another route overlapped is discarded.
+"""
+
+import cProfile
+import io
+import logging
+import math
+import os
+import pstats
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+from slack_sdk.web import WebClient
+
+CALL_KINDS = ("db", "slack", "f3_api", "f3_api_cached")
+
+ROUTE_STATS_WINDOW = int(os.environ.get("ROUTE_STATS_WINDOW", "500"))
+ROUTE_STATS_SUMMARY_SECONDS = float(os.environ.get("ROUTE_STATS_SUMMARY_SECONDS", "300"))
+ROUTE_PROFILE_SAMPLE_RATE = float(os.environ.get("ROUTE_PROFILE_SAMPLE_RATE", "0"))
+ROUTE_PROFILE_KEEP = int(os.environ.get("ROUTE_PROFILE_KEEP", "5"))
+ROUTE_PROFILE_DIR = os.environ.get("ROUTE_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "f3-route-profiles"))
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["CallStats"]] = ContextVar("route_call_stats", default=None)
+
+
+class CallStats:
+    """Count and total duration of each kind of outbound call made by one route.
+
+    F3 API ``gather`` calls run on worker threads with a copy of the route's context, so updates are locked.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = dict.fromkeys(CALL_KINDS, 0)
+        self.seconds: Dict[str, float] = dict.fromkeys(CALL_KINDS, 0.0)
+
+    def add(self, kind: str, seconds: float):
+        with self._lock:
+            self.counts[kind] += 1
+            self.seconds[kind] += seconds
+
+    def as_fields(self) -> Dict[str, float]:
+        fields = {}
+        for kind in CALL_KINDS:
+            fields[f"{kind}_calls"] = self.counts[kind]
+            fields[f"{kind}_ms"] = round(self.seconds[kind] * 1000, 1)
+        return fields
+
+
+def record_call(kind: str, seconds: float):
+    stats = _current.get()
+    if stats is not None:
+        stats.add(kind, seconds)
+
+
+# Routes collecting right now; cProfile samples (below) are only taken while a single route runs
+_active_lock = threading.Lock()
+_active_routes = 0
+_profile_lock = threading.Lock()  # held while a sample is being taken
+_profile_overlapped = False
+
+
+def start_collecting() -> Tuple[CallStats, Token]:
+    global _active_routes, _profile_overlapped
+    with _active_lock:
+        _active_routes += 1
+        if _profile_lock.locked():
+            _profile_overlapped = True
+    stats = CallStats()
+    return stats, _current.set(stats)
+
+
+def stop_collecting(token: Token):
+    global _active_routes
+    with _active_lock:
+        _active_routes -= 1
+    _current.reset(token)
+
+
+# ----------------------------------------------------------------------
+# Hooks
+# ----------------------------------------------------------------------
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+class InstrumentedWebClient(WebClient):
+    """``WebClient`` that adds every Web API call to the running route's ``CallStats``."""
+
+    def api_call(self, *args, **kwargs):
+        if _current.get() is None:
+            return super().api_call(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().api_call(*args, **kwargs)
+        finally:
+            record_call("slack", time.perf_counter() - start)
+
+    @classmethod
+    def wrap(cls, client: WebClient) -> "InstrumentedWebClient":
+        """A copy of ``client`` (Bolt builds a fresh one per request) that counts its calls."""
+        return cls(
+            token=client.token,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            ssl=client.ssl,
+            proxy=client.proxy,
+            headers=client.headers,
+            logger=client.logger,
+            retry_handlers=client.retry_handlers.copy() if client.retry_handlers is not None else None,
+        )
+
+
+def _record_f3_api_call(seconds: float, cached: bool):
+    record_call("f3_api_cached" if cached else "f3_api", seconds)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("route_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("route_query_start")
+    if starts:
+        record_call("db", time.perf_counter() - starts.pop())
+
+
+def install():
+    """Hooks SQLAlchemy and the F3 API client. Safe to call more than once."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        from infrastructure.api_client.client import set_request_observer
+
+        # Listening on the Engine class covers the f3_data_models engine without creating it at startup
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        set_request_observer(_record_f3_api_call)
+        _installed = True
+
+
+# ----------------------------------------------------------------------
+# cProfile sampling
+# ----------------------------------------------------------------------
+
+_slowest_profiles: List[Tuple[float, str]] = []
+
+
+def start_profile() -> Optional[cProfile.Profile]:
+    """Starts a sample for the route that just began collecting, unless another route is running alongside it."""
+    global _profile_overlapped
+    if ROUTE_PROFILE_SAMPLE_RATE <= 0 or random.random() >= ROUTE_PROFILE_SAMPLE_RATE:
+        return None
+    with _active_lock:
+        if _active_routes > 1 or not _profile_lock.acquire(blocking=False):
+            return None
+        _profile_overlapped = False
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # another profiler (e.g. a debugger) is active
+        _profile_lock.release()
+        return None
+    return profiler
+
+
+def stop_profile(profiler: cProfile.Profile, route: str, handler_name: str, total_ms: float):
+    """Stops a sample and keeps it if it is among the ``ROUTE_PROFILE_KEEP`` slowest seen so far."""
+    profiler.disable()
+    with _active_lock:
+        overlapped = _profile_overlapped
+        _profile_lock.release()
+    if overlapped:
+        logger.debug(f"Discarded profile of {route}: another route ran during it")
+        return
+    if len(_slowest_profiles) >= ROUTE_PROFILE_KEEP and total_ms <= _slowest_profiles[-1][0]:
+        return
+
+    os.makedirs(ROUTE_PROFILE_DIR, exist_ok=True)
+    path = os.path.join(ROUTE_PROFILE_DIR, f"{int(total_ms)}ms-{handler_name}-{int(time.time())}.prof")
+    profiler.dump_stats(path)
+    _slowest_profiles.append((total_ms, path))
+    _slowest_profiles.sort(reverse=True)
+    for _, dropped in _slowest_profiles[ROUTE_PROFILE_KEEP:]:
+        try:
+            os.remove(dropped)
+        except OSError:
+            pass
+    del _slowest_profiles[ROUTE_PROFILE_KEEP:]
+
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(15)
+    logger.info(f"Profiled {route} ({handler_name}) at {total_ms:.0f} ms, saved to {path}\n{out.getvalue()}")
+
+
+# ----------------------------------------------------------------------
+# Percentile summary
+# ----------------------------------------------------------------------
+
+_window_lock = threading.Lock()
+_windows: Dict[str, deque] = defaultdict(lambda: deque(maxlen=ROUTE_STATS_WINDOW))
+_handlers: Dict[str, str] = {}
+_last_summary = time.monotonic()
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def observe(route: str, handler_name: str, total_ms: float, calls: CallStats):
+    """Adds one finished route to its window and logs the summary when it is due."""
+    global _last_summary
+    with _window_lock:
+        _windows[route].append((total_ms, sum(calls.counts.values()), calls.counts["db"]))
+        _handlers[route] = handler_name
+        due = time.monotonic() - _last_summary >= ROUTE_STATS_SUMMARY_SECONDS
+        if due:
+            _last_summary = time.monotonic()
+    if due:
+        log_summary()
+
+
+def summary() -> List[dict]:
+    """Latency percentiles and mean call counts per route, the routes with the most total time first."""
+    with _window_lock:
+        windows = {route: list(samples) for route, samples in _windows.items() if samples}
+        handlers = dict(_handlers)
+    rows = []
+    for route, samples in windows.items():
+        ordered = sorted(s[0] for s in samples)
+        rows.append(
+            {
+                "route": route,
+                "handler": handlers[route],
+                "count": len(samples),
+                "p50_ms": round(_percentile(ordered, 50), 1),
+                "p90_ms": round(_percentile(ordered, 90), 1),
+                "p99_ms": round(_percentile(ordered, 99), 1),
+                "max_ms": round(ordered[-1], 1),
+                "total_ms": round(sum(ordered), 1),
+                "mean_calls": round(sum(s[1] for s in samples) / len(samples), 1),
+                "mean_db_calls": round(sum(s[2] for s in samples) / len(samples), 1),
+            }
+        )
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def log_summary():
+    rows = summary()
+    if not rows:
+        return
+    lines = [
+        f"{r['route']} ({r['handler']}): n={r['count']} p50={r['p50_ms']:.0f} p90={r['p90_ms']:.0f} "
+        f"p99={r['p99_ms']:.0f} max={r['max_ms']:.0f} ms, {r['mean_db_calls']:.1f} db / {r['mean_calls']:.1f} calls"
+        for r in rows
+    ]
+    logger.info("Route latency summary:\n" + "\n".join(lines), extra={"json_fields": {"route_summary": rows}})
+
+
+def reset():
+    """Clears windows and kept profiles (tests)."""
+    global _last_summary
+    with _window_lock:
+        _windows.clear()
+        _handlers.clear()
+        _last_summary = time.monotonic()
+    _slowest_profiles.clear()
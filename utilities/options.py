@@ -6,9 +6,6 @@ from f3_data_models.utils import DbManager
 from slack_sdk import WebClient
 from sqlalchemy import and_
 
-from features import connect as connect_form
-from features import paxminer_mapping
-from features import user as user_form
 from utilities.database.orm import SlackSettings
 from utilities.helper_functions import safe_get
 from utilities.slack import actions
@@ -87,12 +84,12 @@ def handle_request(
 
     if action_id == actions.USER_OPTION_LOAD:
         return _search_users(value)
-    elif action_id == user_form.USER_FORM_BROUGHT_BY:
+    elif action_id == actions.USER_FORM_BROUGHT_BY:
         return _search_users(value)
     elif action_id in [
-        user_form.USER_FORM_HOME_REGION,
-        connect_form.SELECT_REGION,
-        paxminer_mapping.PAXMINER_REGION,
+        actions.USER_FORM_HOME_REGION,
+        actions.SELECT_REGION,
+        actions.PAXMINER_REGION,
         actions.DOWNRANGE_REGION_SELECT,
     ]:
         # Handle the home region selection
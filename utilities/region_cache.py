@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set
+
+from f3_data_models.models import SlackSpace
+from f3_data_models.utils import get_engine, session_scope
+from sqlalchemy import func, select, update
+
+from utilities.database.orm import SlackSettings
+
+NOTIFY_CHANNEL = "slack_space_settings"
+POLL_SECONDS = float(os.environ.get("REGION_CACHE_POLL_SECONDS", "30"))
+LISTEN_ENABLED = os.environ.get("REGION_CACHE_LISTEN", "false").lower() == "true"
+# ``updated`` is the writer's transaction-start now(), so a row can commit with a timestamp older than the
+# high-water mark; each refresh re-reads this far back and skips rows whose version is unchanged.
+OVERLAP_SECONDS = float(os.environ.get("REGION_CACHE_OVERLAP_SECONDS", "300"))
+
+
+class _SettingsListener:
+    """Non-blocking Postgres LISTEN on a dedicated psycopg2 connection.
+
+    Notifications are drained whenever the cache is read, so no background thread is needed. Any failure
+    disables the listener and the cache falls back to polling ``SlackSpace.updated``.
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.connection = None
+        self._pooled = None
+
+    def connect(self) -> bool:
+        try:
+            # Hold on to the pool proxy so the connection (and its LISTEN) is never handed back to the pool
+            self._pooled = get_engine().raw_connection()
+            self.connection = self._pooled.driver_connection
+            self.connection.autocommit = True
+            with self.connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel};")
+            return True
+        except Exception as e:
+            print(f"Region cache: LISTEN unavailable, falling back to polling ({e})")
+            self.connection = None
+            return False
+
+    def drain(self) -> list[str]:
+        if self.connection is None:
+            return []
+        try:
+            self.connection.poll()
+            payloads = [n.payload for n in self.connection.notifies]
+            self.connection.notifies.clear()
+            return payloads
+        except Exception as e:
+            print(f"Region cache: LISTEN connection lost, falling back to polling ({e})")
+            self.connection = None
+            return []
+
+
+class RegionSettingsCache:
+    """Versioned cache of ``SlackSettings`` keyed by Slack ``team_id``.
+
+    The first read loads every ``SlackSpace`` row; after that the cache only pulls rows whose ``updated``
+    timestamp is past the highest version it has seen less ``overlap_seconds`` (at most once per
+    ``poll_seconds``), applying only rows whose version changed. Writers call
+    ``invalidate(team_id)``, which bumps that row's ``updated`` column, reloads it, and sends a NOTIFY so
+    other instances listening on ``NOTIFY_CHANNEL`` reload just that team.
+    """
+
+    def __init__(
+        self,
+        records: Optional[Dict[str, SlackSettings]] = None,
+        poll_seconds: float = POLL_SECONDS,
+        listen: bool = LISTEN_ENABLED,
+        overlap_seconds: float = OVERLAP_SECONDS,
+    ):
+        # ``records`` is shared with helper_functions.REGION_RECORDS so existing readers stay valid
+        self.records: Dict[str, SlackSettings] = records if records is not None else {}
+        self.versions: Dict[str, datetime] = {}
+        self.high_water: Optional[datetime] = None
+        self.loaded = False
+        self.poll_seconds = poll_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.listen = listen
+        self._stale: Set[str] = set()
+        self._last_sync = 0.0
+        self._listener: Optional[_SettingsListener] = None
+        self._lock = threading.RLock()
+
+    def get(self, team_id: str) -> Optional[SlackSettings]:
+        with self._lock:
+            self.sync()
+            if team_id in self._stale or team_id not in self.records:
+                self._load_one(team_id)
+            return self.records.get(team_id)
+
+    def put(self, region_record: SlackSettings) -> None:
+        with self._lock:
+            self.records[region_record.team_id] = region_record
+
+    def sync(self, force: bool = False) -> None:
+        with self._lock:
+            if not self.loaded:
+                self.load_all()
+                return
+            self._drain_notifications()
+            if force or time.monotonic() - self._last_sync >= self.poll_seconds:
+                self.refresh()
+
+    def load_all(self) -> None:
+        print("Updating local region records...")
+        with self._lock, session_scope() as session:
+            rows = session.execute(select(SlackSpace.team_id, SlackSpace.settings, SlackSpace.updated)).all()
+            self.records.clear()
+            self.versions.clear()
+            self.high_water = None
+            for row in rows:
+                self._apply(row.team_id, row.settings, row.updated)
+            self._stale.clear()
+            self.loaded = True
+            self._last_sync = time.monotonic()
+            if self.listen and self._listener is None:
+                listener = _SettingsListener(NOTIFY_CHANNEL)
+                if listener.connect():
+                    self._listener = listener
+
+    def refresh(self) -> int:
+        """Pulls rows changed since the last seen version. Returns the number of entries refreshed."""
+        with self._lock, session_scope() as session:
+            query = select(SlackSpace.team_id, SlackSpace.settings, SlackSpace.updated)
+            if self.high_water is not None:
+                query = query.where(SlackSpace.updated > self.high_water - self.overlap)
+            rows = session.execute(query).all()
+            changed = [r for r in rows if r.updated is None or self.versions.get(r.team_id) != r.updated]
+            for row in changed:
+                self._apply(row.team_id, row.settings, row.updated)
+            self._last_sync = time.monotonic()
+            return len(changed)
+
+    def invalidate(self, team_id: str) -> Optional[SlackSettings]:
+        """Reloads one team after a write and tells other instances to do the same."""
+        if not team_id:
+            return None
+        with self._lock, session_scope() as session:
+            row = session.execute(
+                update(SlackSpace)
+                .where(SlackSpace.team_id == team_id)
+                .values(updated=func.timezone("utc", func.now()))
+                .returning(SlackSpace.team_id, SlackSpace.settings, SlackSpace.updated)
+            ).first()
+            if row is None:
+                self.records.pop(team_id, None)
+                self.versions.pop(team_id, None)
+                return None
+            payload = json.dumps({"team_id": team_id, "updated": row.updated.isoformat()})
+            session.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+            # Don't advance the high-water mark here: rows other instances changed before this one must
+            # still be picked up by the next incremental refresh.
+            self._apply(row.team_id, row.settings, row.updated, advance=False)
+            return self.records.get(team_id)
+
+    def _load_one(self, team_id: str) -> None:
+        self._stale.discard(team_id)
+        with session_scope() as session:
+            row = session.execute(
+                select(SlackSpace.team_id, SlackSpace.settings, SlackSpace.updated).where(SlackSpace.team_id == team_id)
+            ).first()
+            if row is not None:
+                self._apply(row.team_id, row.settings, row.updated, advance=False)
+
+    def _drain_notifications(self) -> None:
+        if self._listener is None:
+            return
+        for payload in self._listener.drain():
+            try:
+                message = json.loads(payload)
+                team_id = message["team_id"]
+                version = datetime.fromisoformat(message["updated"])
+            except (ValueError, KeyError, TypeError):
+                continue
+            current = self.versions.get(team_id)
+            if current is None or version > current:
+                self._stale.add(team_id)
+        if self._listener.connection is None:
+            self._listener = None
+
+    def _apply(self, team_id: str, settings: Optional[dict], updated: Optional[datetime], advance: bool = True):
+        if not team_id or settings is None:
+            return
+        try:
+            self.records[team_id] = SlackSettings(**settings)
+        except TypeError as e:
+            print(f"Region cache: skipping settings for {team_id}: {e}")
+            return
+        if updated is not None:
+            self.versions[team_id] = updated
+            if advance and (self.high_water is None or updated > self.high_water):
+                self.high_water = updated
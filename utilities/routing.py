@@ -1,43 +1,95 @@
-from features import (
-    achievements,
-    backblast,
-    canvas,
-    config,
-    connect,
-    custom_fields,
-    db_admin,
-    downrange,
-    emergency,
-    help,
-    paxminer_mapping,
-    positions,
-    region,
-    reporting,
-    special_events,
-    strava,
-    user,
-    weaselbot,
-    welcome,
-)
-from features.calendar import (
-    ao,
-    event_instance,
-    event_preblast,
-    event_tag,
-    event_type,
-    home,
-    location,
-    nearby_events,
-    series,
-)
-from features.calendar import config as calendar_config
-from scripts.backblast_reminders import handle_backblast_reminder_dismiss
-from scripts.home_region_nudge import handle_home_region_dismiss, handle_home_region_opt_out, handle_home_region_switch
-from scripts.monthly_reporting import run_reporting_single_org
-from scripts.q_lineups import handle_lineup_signup
-from utilities import builders, options
+import importlib
+from typing import Callable, NamedTuple, Optional
+
 from utilities.slack import actions
 
+
+class LazyHandler:
+    """A handler referenced by module path and attribute name.
+
+    The module is imported on the first call and the function memoized, so loading the routing tables does not
+    import every feature (and SQLAlchemy, PIL, ...) before the first Slack request.
+    """
+
+    __slots__ = ("module_path", "name", "_func")
+
+    def __init__(self, module_path: str, name: str):
+        self.module_path = module_path
+        self.name = name
+        self._func: Optional[Callable] = None
+
+    @property
+    def __name__(self) -> str:
+        return self.name
+
+    def resolve(self) -> Callable:
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.module_path), self.name)
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyHandler({self.module_path}.{self.name})"
+
+
+class _LazyModule:
+    """Stands in for a handler module in the tables below; attribute access returns a LazyHandler."""
+
+    def __init__(self, module_path: str):
+        self._module_path = module_path
+
+    def __getattr__(self, name: str) -> LazyHandler:
+        handler = LazyHandler(self._module_path, name)
+        setattr(self, name, handler)
+        return handler
+
+
+class Route(NamedTuple):
+    """A mapper entry. Entries are written as ``(handler, add_loading)`` or ``(handler, add_loading, lazy)``."""
+
+    handler: Callable
+    add_loading: bool
+    lazy: bool = False
+
+
+achievements = _LazyModule("features.achievements")
+backblast = _LazyModule("features.backblast")
+canvas = _LazyModule("features.canvas")
+config = _LazyModule("features.config")
+connect = _LazyModule("features.connect")
+custom_fields = _LazyModule("features.custom_fields")
+db_admin = _LazyModule("features.db_admin")
+downrange = _LazyModule("features.downrange")
+emergency = _LazyModule("features.emergency")
+help = _LazyModule("features.help")
+paxminer_mapping = _LazyModule("features.paxminer_mapping")
+positions = _LazyModule("features.positions")
+region = _LazyModule("features.region")
+reporting = _LazyModule("features.reporting")
+special_events = _LazyModule("features.special_events")
+strava = _LazyModule("features.strava")
+user = _LazyModule("features.user")
+weaselbot = _LazyModule("features.weaselbot")
+welcome = _LazyModule("features.welcome")
+ao = _LazyModule("features.calendar.ao")
+calendar_config = _LazyModule("features.calendar.config")
+event_instance = _LazyModule("features.calendar.event_instance")
+event_preblast = _LazyModule("features.calendar.event_preblast")
+event_tag = _LazyModule("features.calendar.event_tag")
+event_type = _LazyModule("features.calendar.event_type")
+home = _LazyModule("features.calendar.home")
+location = _LazyModule("features.calendar.location")
+nearby_events = _LazyModule("features.calendar.nearby_events")
+series = _LazyModule("features.calendar.series")
+backblast_reminders = _LazyModule("scripts.backblast_reminders")
+home_region_nudge = _LazyModule("scripts.home_region_nudge")
+monthly_reporting = _LazyModule("scripts.monthly_reporting")
+q_lineups = _LazyModule("scripts.q_lineups")
+builders = _LazyModule("utilities.builders")
+options = _LazyModule("utilities.options")
+
 # Required arguments for handler functions:
 #     body: dict
 #     client: WebClient
@@ -46,6 +98,9 @@ from utilities.slack import actions
 
 # The mappers define the function to be called for each event
 # The boolean value indicates whether a loading modal should be triggered before running the function
+# An optional third value marks the route lazy: it is acked straight away (after any loading modal) and the handler runs
+# from the LAZY_ROUTE_TOPIC push delivery to /slack-lazy, see utilities.dispatch. Use it for slow handlers that post
+# to Slack or fan out DB work, never for block_suggestion routes (their ack carries the handler's result)
 
 COMMAND_MAPPER = {
     "/backblast": (backblast.backblast_middleware, True),
@@ -57,8 +112,8 @@ COMMAND_MAPPER = {
 }
 
 VIEW_MAPPER = {
-    actions.BACKBLAST_CALLBACK_ID: (backblast.handle_backblast_post, False),
-    actions.BACKBLAST_EDIT_CALLBACK_ID: (backblast.handle_backblast_post, False),
+    actions.BACKBLAST_CALLBACK_ID: (backblast.handle_backblast_post, False, True),
+    actions.BACKBLAST_EDIT_CALLBACK_ID: (backblast.handle_backblast_post, False, True),
     actions.WELCOME_MESSAGE_CONFIG_CALLBACK_ID: (welcome.handle_welcome_message_config_post, False),
     actions.CONFIG_GENERAL_CALLBACK_ID: (config.handle_config_general_post, False),
     actions.CONFIG_EMAIL_CALLBACK_ID: (config.handle_config_email_post, False),
@@ -70,29 +125,29 @@ VIEW_MAPPER = {
     actions.ACHIEVEMENT_CONFIG_CALLBACK_ID: (achievements.handle_config_form, False),
     actions.ACHIEVEMENT_NEW_CALLBACK_ID: (achievements.handle_new_achievement_form, False),
     actions.WEASELBOT_CONFIG_CALLBACK_ID: (weaselbot.handle_config_form, False),
-    location.ADD_LOCATION_CALLBACK_ID: (location.handle_location_add, False),
+    actions.ADD_LOCATION_CALLBACK_ID: (location.handle_location_add, False),
     actions.ADD_AO_CALLBACK_ID: (ao.handle_ao_add, False),
     actions.ADD_SERIES_CALLBACK_ID: (series.handle_series_add, False),
-    actions.EVENT_PREBLAST_CALLBACK_ID: (event_preblast.handle_event_preblast_edit, False),
-    event_type.CALENDAR_ADD_EVENT_TYPE_CALLBACK_ID: (event_type.handle_event_type_add, False),
-    actions.EVENT_PREBLAST_POST_CALLBACK_ID: (event_preblast.handle_event_preblast_edit, False),
+    actions.EVENT_PREBLAST_CALLBACK_ID: (event_preblast.handle_event_preblast_edit, False, True),
+    actions.CALENDAR_ADD_EVENT_TYPE_CALLBACK_ID: (event_type.handle_event_type_add, False),
+    actions.EVENT_PREBLAST_POST_CALLBACK_ID: (event_preblast.handle_event_preblast_edit, False, True),
     actions.REGION_CALLBACK_ID: (region.handle_region_edit, False),
     actions.SPECIAL_EVENTS_CALLBACK_ID: (special_events.handle_special_settings_edit, False),
     actions.CONFIG_SLT_CALLBACK_ID: (positions.handle_config_slt_post, False),
     actions.NEW_POSITION_CALLBACK_ID: (positions.handle_new_position_post, False),
     actions.EDIT_POSITION_CALLBACK_ID: (positions.handle_edit_position_post, False),
-    connect.CONNECT_EXISTING_REGION_CALLBACK_ID: (connect.handle_existing_region_selection, False),
-    connect.CREATE_NEW_REGION_CALLBACK_ID: (connect.handle_new_region_creation, False),
+    actions.CONNECT_EXISTING_REGION_CALLBACK_ID: (connect.handle_existing_region_selection, False),
+    actions.CREATE_NEW_REGION_CALLBACK_ID: (connect.handle_new_region_creation, False),
     actions.CALENDAR_CONFIG_GENERAL_CALLBACK_ID: (calendar_config.handle_calendar_config_general, False),
-    user.USER_FORM_ID: (user.handle_user_form, False),
-    event_instance.ADD_EVENT_INSTANCE_CALLBACK_ID: (event_instance.handle_event_instance_add, False),
-    event_tag.CALENDAR_ADD_EVENT_TAG_CALLBACK_ID: (event_tag.handle_event_tag_add, False),
+    actions.USER_FORM_ID: (user.handle_user_form, False),
+    actions.ADD_EVENT_INSTANCE_CALLBACK_ID: (event_instance.handle_event_instance_add, False),
+    actions.CALENDAR_ADD_EVENT_TAG_CALLBACK_ID: (event_tag.handle_event_tag_add, False),
     actions.HOME_ASSIGN_Q_CALLBACK_ID: (home.handle_assign_q_form, False),
     actions.DB_ADMIN_CALLBACK_ID: (db_admin.handle_send_admin_announcement, False),
-    reporting.REPORTING_CALLBACK_ID: (reporting.handle_reporting_edit, False),
+    actions.REPORTING_CALLBACK_ID: (reporting.handle_reporting_edit, False, True),
     actions.DB_ADMIN_LONG_RUN_CALLBACK_ID: (db_admin.handle_long_run_task, False),
-    paxminer_mapping.PAXMINER_MAPPING_ID: (paxminer_mapping.handle_paxminer_mapping_post, False),
-    event_instance.EVENT_CLOSE_CALLBACK_ID: (event_instance.handle_event_instance_close, False),
+    actions.PAXMINER_MAPPING_ID: (paxminer_mapping.handle_paxminer_mapping_post, False),
+    actions.EVENT_CLOSE_CALLBACK_ID: (event_instance.handle_event_instance_close, False),
     actions.EVENT_CLOSE_HOME_CALLBACK_ID: (home.handle_event_instance_close, False),
     actions.DOWNRANGE_CALLBACK_ID: (downrange.handle_downrange_settings, False),
 }
@@ -121,20 +176,22 @@ ACTION_MAPPER = {
     actions.CONFIG_CALENDAR: (calendar_config.build_calendar_config_form, False),
     actions.CALENDAR_ADD_SERIES_AO: (series.build_series_add_form, False),
     actions.SERIES_EDIT_DELETE: (series.handle_series_edit_delete, False),
-    location.LOCATION_EDIT_DELETE: (location.handle_location_edit_delete, False),
+    actions.LOCATION_EDIT_DELETE: (location.handle_location_edit_delete, False),
     actions.AO_EDIT_DELETE: (ao.handle_ao_edit_delete, False),
     actions.CALENDAR_ADD_EVENT_AO: (series.build_series_add_form, False),
-    location.CALENDAR_MANAGE_LOCATIONS: (location.manage_locations, False),
+    actions.CALENDAR_MANAGE_LOCATIONS: (location.manage_locations, False),
     actions.CALENDAR_MANAGE_AOS: (ao.manage_aos, False),
     actions.CALENDAR_MANAGE_SERIES: (series.manage_series, False),
     actions.CALENDAR_MANAGE_EVENTS: (series.manage_series, False),
-    event_type.CALENDAR_MANAGE_EVENT_TYPES: (event_type.manage_event_types, False),
-    location.CALENDAR_ADD_AO_NEW_LOCATION: (location.build_location_add_form, False),
+    actions.CALENDAR_MANAGE_EVENT_TYPES: (event_type.manage_event_types, False),
+    actions.CALENDAR_ADD_AO_NEW_LOCATION: (location.build_location_add_form, False),
     actions.CALENDAR_HOME_EVENT: (home.handle_home_event, False),
     actions.CALENDAR_HOME_AO_FILTER: (home.build_home_form, False),
     actions.CALENDAR_HOME_Q_FILTER: (home.build_home_form, False),
     actions.CALENDAR_HOME_DATE_FILTER: (home.build_home_form, False),
     actions.CALENDAR_HOME_EVENT_TYPE_FILTER: (home.build_home_form, False),
+    actions.CALENDAR_HOME_NEXT_PAGE: (home.build_home_form, False),
+    actions.CALENDAR_HOME_PREV_PAGE: (home.build_home_form, False),
     actions.EVENT_PREBLAST_HC: (event_preblast.handle_event_preblast_action, False),
     actions.EVENT_PREBLAST_UN_HC: (event_preblast.handle_event_preblast_action, False),
     actions.EVENT_PREBLAST_TAKE_Q: (event_preblast.handle_event_preblast_action, False),
@@ -146,7 +203,7 @@ ACTION_MAPPER = {
     actions.OPEN_CALENDAR_BUTTON: (home.handle_event_preblast_select_button, True),
     actions.MSG_EVENT_PREBLAST_BUTTON: (event_preblast.handle_event_preblast_action, False),
     actions.MSG_EVENT_BACKBLAST_BUTTON: (backblast.backblast_middleware, True),
-    actions.MSG_EVENT_BACKBLAST_ALREADY_BUTTON: (handle_backblast_reminder_dismiss, False),
+    actions.MSG_EVENT_BACKBLAST_ALREADY_BUTTON: (backblast_reminders.handle_backblast_reminder_dismiss, False),
     actions.BACKBLAST_FILL_SELECT: (backblast.build_backblast_form, True),
     actions.BACKBLAST_NEW_BLANK_BUTTON: (backblast.build_backblast_form, True),
     actions.REGION_INFO_BUTTON: (region.build_region_form, False),
@@ -160,42 +217,44 @@ ACTION_MAPPER = {
     actions.CONFIG_EDIT_POSITIONS: (positions.build_position_list_form, False),
     actions.POSITION_EDIT_DELETE: (positions.handle_position_edit_delete, False),
     actions.CONFIG_CONNECT: (connect.build_connect_options_form, False),
-    connect.CONNECT_EXISTING_REGION: (connect.build_existing_region_form, False),
-    connect.CREATE_NEW_REGION: (connect.build_new_region_form, False),
+    actions.CONNECT_EXISTING_REGION: (connect.build_existing_region_form, False),
+    actions.CREATE_NEW_REGION: (connect.build_new_region_form, False),
     actions.SECRET_MENU_UPDATE_CANVAS: (canvas.update_canvas, False),
     actions.SECRET_MENU_MAKE_ADMIN: (db_admin.handle_make_admin, False),
     actions.SECRET_MENU_MAKE_ORG: (db_admin.handle_make_org, False),
     actions.CALENDAR_CONFIG_GENERAL: (calendar_config.build_calendar_general_config_form, False),
     actions.SECRET_MENU_AO_LINEUPS: (db_admin.handle_ao_lineups, False),
     actions.OPEN_CALENDAR_MSG_BUTTON: (home.build_home_form, True),
-    actions.SECRET_MENU_PREBLAST_REMINDERS: (db_admin.handle_preblast_reminders, False),
+    actions.SECRET_MENU_PREBLAST_REMINDERS: (db_admin.handle_preblast_reminders, False, True),
     actions.SECRET_MENU_BACKBLAST_REMINDERS: (db_admin.handle_backblast_reminders, False),
-    actions.LINEUP_SIGNUP_BUTTON: (handle_lineup_signup, False),
+    actions.LINEUP_SIGNUP_BUTTON: (q_lineups.handle_lineup_signup, False),
     actions.SECRET_MENU_TRIGGER_MAP_REVALIDATION: (db_admin.handle_trigger_map_revalidation, False),
     actions.CONFIG_USER_SETTINGS: (user.build_user_form, True),
-    event_instance.CALENDAR_MANAGE_EVENT_INSTANCE: (event_instance.manage_event_instances, False),
+    actions.CALENDAR_MANAGE_EVENT_INSTANCE: (event_instance.manage_event_instances, False),
     actions.EVENT_INSTANCE_EDIT_DELETE: (event_instance.handle_event_instance_edit_delete, False),
-    event_instance.CALENDAR_ADD_EVENT_INSTANCE_AO: (event_instance.build_event_instance_add_form, False),
-    event_instance.CALENDAR_MANAGE_EVENT_INSTANCE_AO: (event_instance.build_event_instance_list_form, False),
-    event_instance.CALENDAR_MANAGE_EVENT_INSTANCE_DATE: (event_instance.build_event_instance_list_form, False),
-    event_type.EVENT_TYPE_EDIT_DELETE: (event_type.handle_event_type_edit_delete, False),
+    actions.CALENDAR_ADD_EVENT_INSTANCE_AO: (event_instance.build_event_instance_add_form, False),
+    actions.CALENDAR_MANAGE_EVENT_INSTANCE_AO: (event_instance.build_event_instance_list_form, False),
+    actions.CALENDAR_MANAGE_EVENT_INSTANCE_DATE: (event_instance.build_event_instance_list_form, False),
+    actions.CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE: (event_instance.build_event_instance_list_form, False),
+    actions.CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE: (event_instance.build_event_instance_list_form, False),
+    actions.EVENT_TYPE_EDIT_DELETE: (event_type.handle_event_type_edit_delete, False),
     actions.OPEN_CALENDAR_IMAGE_BUTTON: (home.build_calendar_image_form, False),
-    event_tag.EVENT_TAG_EDIT_DELETE: (event_tag.handle_event_tag_edit_delete, False),
-    event_tag.CALENDAR_MANAGE_EVENT_TAGS: (event_tag.manage_event_tags, False),
+    actions.EVENT_TAG_EDIT_DELETE: (event_tag.handle_event_tag_edit_delete, False),
+    actions.CALENDAR_MANAGE_EVENT_TAGS: (event_tag.manage_event_tags, False),
     actions.SECRET_MENU_REFRESH_SLACK_USERS: (db_admin.handle_slack_user_refresh, False),
     actions.SECRET_MENU_UPDATE_BOT_TOKEN: (db_admin.handle_update_bot_token, False),
-    connect.DENY_CONNECTION: (connect.handle_deny_connection, False),
-    connect.APPROVE_CONNECTION: (connect.handle_approve_connection, False),
-    user.IGNORE_EVENT: (builders.ignore_event, False),
+    actions.DENY_CONNECTION: (connect.handle_deny_connection, False),
+    actions.APPROVE_CONNECTION: (connect.handle_approve_connection, False),
+    actions.IGNORE_EVENT: (builders.ignore_event, False),
     actions.CONFIG_REPORTING: (reporting.build_reporting_form, False),
-    reporting.RUN_MONTHLY_REPORTS_NOW: (run_reporting_single_org, False),
+    actions.RUN_MONTHLY_REPORTS_NOW: (monthly_reporting.run_reporting_single_org, False, True),
     actions.CONFIG_HELP_MENU: (help.build_help_menu, False),
     actions.CALENDAR_MANAGE_SERIES_AO: (series.build_series_list_form, False),
     actions.SETTINGS_BUTTON: (config.build_config_form, True),
     actions.SECRET_MENU_LONG_RUN: (db_admin.build_long_run_task_form, False),
     actions.PAXMINER_MAPPING: (paxminer_mapping.build_paxminer_mapping_form, False),
-    paxminer_mapping.PAXMINER_ORIGINATING_CHANNEL: (paxminer_mapping.build_paxminer_mapping_form, False),
-    paxminer_mapping.PAXMINER_REGION: (paxminer_mapping.build_paxminer_mapping_form, False),
+    actions.PAXMINER_ORIGINATING_CHANNEL: (paxminer_mapping.build_paxminer_mapping_form, False),
+    actions.PAXMINER_REGION: (paxminer_mapping.build_paxminer_mapping_form, False),
     actions.PREBLAST_FILL_BACKBLAST_BUTTON: (backblast.backblast_middleware, True),
     actions.NEW_PREBLAST_BUTTON: (event_preblast.preblast_middleware, True),
     actions.BACKBLAST_NOQ_SELECT: (backblast.build_backblast_form, True),
@@ -203,7 +262,7 @@ ACTION_MAPPER = {
     actions.EVENT_PREBLAST_FILL_BUTTON: (event_preblast.handle_event_preblast_select, False),
     actions.EVENT_PREBLAST_NOQ_SELECT: (event_preblast.handle_event_preblast_select, False),
     actions.PREBLAST_OVERFLOW_ACTION: (event_preblast.route_preblast_overflow_action, False),
-    actions.SECRET_MENU_SEND_AUTO_PREBLASTS: (db_admin.handle_auto_preblast_send, False),
+    actions.SECRET_MENU_SEND_AUTO_PREBLASTS: (db_admin.handle_auto_preblast_send, False, True),
     actions.SECRET_MENU_REFRESH_CACHE: (db_admin.handle_refresh_cache, False),
     actions.CONFIG_EMERGENCY_INFO: (emergency.build_emergency_search_form, True),
     actions.EMERGENCY_LOCAL_USER_SELECT: (emergency.handle_local_user_select, False),
@@ -215,9 +274,9 @@ ACTION_MAPPER = {
     actions.DOWNRANGE_INVITE_DENY_BUTTON: (downrange.handle_invite_deny, False),
     actions.DOWNRANGE_INVITE_LINK_BROKEN_BUTTON: (downrange.handle_invite_link_broken, False),
     actions.DOWNRANGE_INVITE_MARK_DONE_BUTTON: (downrange.handle_invite_mark_done, False),
-    actions.HOME_REGION_NUDGE_SWITCH_BUTTON: (handle_home_region_switch, False),
-    actions.HOME_REGION_NUDGE_DISMISS_BUTTON: (handle_home_region_dismiss, False),
-    actions.HOME_REGION_NUDGE_OPT_OUT_BUTTON: (handle_home_region_opt_out, False),
+    actions.HOME_REGION_NUDGE_SWITCH_BUTTON: (home_region_nudge.handle_home_region_switch, False),
+    actions.HOME_REGION_NUDGE_DISMISS_BUTTON: (home_region_nudge.handle_home_region_dismiss, False),
+    actions.HOME_REGION_NUDGE_OPT_OUT_BUTTON: (home_region_nudge.handle_home_region_opt_out, False),
     actions.NEARBY_EVENTS_OPEN: (nearby_events.build_nearby_events_modal, False),
     actions.NEARBY_EVENTS_DISTANCE: (nearby_events.build_nearby_events_modal, False),
     actions.NEARBY_EVENTS_SORT: (nearby_events.build_nearby_events_modal, False),
@@ -231,14 +290,14 @@ ACTION_MAPPER = {
 ACTION_PREFIXES = [
     actions.STRAVA_ACTIVITY_BUTTON,
     actions.SERIES_EDIT_DELETE,
-    location.LOCATION_EDIT_DELETE,
+    actions.LOCATION_EDIT_DELETE,
     actions.AO_EDIT_DELETE,
     actions.CALENDAR_HOME_EVENT,
     actions.BACKBLAST_FILL_SELECT,
     actions.LINEUP_SIGNUP_BUTTON,
     actions.EVENT_INSTANCE_EDIT_DELETE,
-    event_type.EVENT_TYPE_EDIT_DELETE,
-    event_tag.EVENT_TAG_EDIT_DELETE,
+    actions.EVENT_TYPE_EDIT_DELETE,
+    actions.EVENT_TAG_EDIT_DELETE,
     actions.BACKBLAST_FILL_BUTTON,
     actions.EVENT_PREBLAST_FILL_BUTTON,
     actions.POSITION_EDIT_DELETE,
@@ -258,10 +317,10 @@ EVENT_MAPPER = {
 
 OPTIONS_MAPPER = {
     actions.USER_OPTION_LOAD: (options.handle_request, False),
-    user.USER_FORM_HOME_REGION: (options.handle_request, False),
-    user.USER_FORM_BROUGHT_BY: (options.handle_request, False),
-    paxminer_mapping.PAXMINER_REGION: (options.handle_request, False),
-    connect.SELECT_REGION: (options.handle_request, False),
+    actions.USER_FORM_HOME_REGION: (options.handle_request, False),
+    actions.USER_FORM_BROUGHT_BY: (options.handle_request, False),
+    actions.PAXMINER_REGION: (options.handle_request, False),
+    actions.SELECT_REGION: (options.handle_request, False),
     actions.EMERGENCY_DR_USER_SELECT: (options.handle_request, False),
     actions.DOWNRANGE_REGION_SELECT: (options.handle_request, False),
 }
@@ -280,6 +280,8 @@ CALENDAR_HOME_EVENT_TYPE_FILTER = "calendar-home-type-filter"
 CALENDAR_HOME_Q_FILTER = "calendar-home-q-filter"
 CALENDAR_ADD_EVENT_AO = "calendar-add-event-ao"
 CALENDAR_HOME_DATE_FILTER = "calendar-home-date-filter"
+CALENDAR_HOME_NEXT_PAGE = "calendar-home-next-page"
+CALENDAR_HOME_PREV_PAGE = "calendar-home-prev-page"
 CALENDAR_MANAGE_LOCATIONS = "calendar-manage-locations"
 CALENDAR_MANAGE_AOS = "calendar-manage-aos"
 CALENDAR_MANAGE_SERIES = "calendar-manage-series"
@@ -384,3 +386,40 @@ NEARBY_EVENTS_SORT = "nearby-events-sort"
 NEARBY_EVENTS_HC = "nearby-events-hc"
 NEARBY_EVENTS_UN_HC = "nearby-events-un-hc"
 NEARBY_EVENTS_CALLBACK_ID = "nearby-events-callback"
+
+CONNECT_EXISTING_REGION = "connect_existing_region"
+CREATE_NEW_REGION = "create_new_region"
+CONNECT_EXISTING_REGION_CALLBACK_ID = "connect_existing_region"
+CREATE_NEW_REGION_CALLBACK_ID = "create_new_region"
+SELECT_REGION = "select_region"
+APPROVE_CONNECTION = "approve_connection"
+DENY_CONNECTION = "deny_connection"
+
+CALENDAR_ADD_EVENT_INSTANCE_AO = "calendar_add_event_instance_ao"
+ADD_EVENT_INSTANCE_CALLBACK_ID = "add_event_instance_callback_id"
+CALENDAR_MANAGE_EVENT_INSTANCE = "calendar_manage_event_instance"
+CALENDAR_MANAGE_EVENT_INSTANCE_AO = "calendar_manage_event_instance_ao"
+CALENDAR_MANAGE_EVENT_INSTANCE_DATE = "calendar_manage_event_instance_date"
+CALENDAR_MANAGE_EVENT_INSTANCE_NEXT_PAGE = "calendar_manage_event_instance_next_page"
+CALENDAR_MANAGE_EVENT_INSTANCE_PREV_PAGE = "calendar_manage_event_instance_prev_page"
+EVENT_CLOSE_CALLBACK_ID = "event_close_callback_id"
+
+CALENDAR_MANAGE_EVENT_TAGS = "calendar-manage-event-tags"
+EVENT_TAG_EDIT_DELETE = "event-tag-edit-delete"
+CALENDAR_ADD_EVENT_TAG_CALLBACK_ID = "calendar-add-event-tag-id"
+
+CALENDAR_MANAGE_EVENT_TYPES = "calendar-manage-event-types"
+CALENDAR_ADD_EVENT_TYPE_CALLBACK_ID = "calendar-add-event-type-id"
+EVENT_TYPE_EDIT_DELETE = "event-type-edit-delete"
+
+PAXMINER_ORIGINATING_CHANNEL = "paxminer-originating-channel"
+PAXMINER_MAPPING_ID = "paxminer-mapping-id"
+PAXMINER_REGION = "paxminer-assign-region"
+
+REPORTING_CALLBACK_ID = "reporting_settings"
+RUN_MONTHLY_REPORTS_NOW = "run_monthly_reports_now"
+
+USER_FORM_HOME_REGION = "user_home_region"
+USER_FORM_ID = "user_form_id"
+IGNORE_EVENT = "user_ignore_event"
+USER_FORM_BROUGHT_BY = "user_brought_by"
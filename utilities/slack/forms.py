@@ -1,34 +1,36 @@
 from utilities import constants
 from utilities.slack import actions, orm
 
-UNSCHEDULED_BACKBLAST_BLOCKS = [
-    orm.InputBlock(
-        label="Workout Date",
-        action=actions.BACKBLAST_DATE,
-        optional=False,
-        element=orm.DatepickerElement(placeholder="Select the date..."),
-    ),
-    orm.InputBlock(
-        label="Event Type",
-        action=actions.BACKBLAST_EVENT_TYPE,
-        optional=False,
-        element=orm.StaticSelectElement(placeholder="Select the event type..."),
-    ),
-    orm.InputBlock(
-        label="Location",
-        action=actions.BACKBLAST_LOCATION,
-        optional=True,
-        element=orm.StaticSelectElement(placeholder="Select the location..."),
-    ),
-    orm.InputBlock(
-        label="The AO",
-        action=actions.BACKBLAST_AO,
-        optional=False,
-        element=orm.StaticSelectElement(placeholder="Select the AO..."),
-    ),
-]
+UNSCHEDULED_BACKBLAST_BLOCKS = orm.FrozenBlockView(
+    blocks=[
+        orm.InputBlock(
+            label="Workout Date",
+            action=actions.BACKBLAST_DATE,
+            optional=False,
+            element=orm.DatepickerElement(placeholder="Select the date..."),
+        ),
+        orm.InputBlock(
+            label="Event Type",
+            action=actions.BACKBLAST_EVENT_TYPE,
+            optional=False,
+            element=orm.StaticSelectElement(placeholder="Select the event type..."),
+        ),
+        orm.InputBlock(
+            label="Location",
+            action=actions.BACKBLAST_LOCATION,
+            optional=True,
+            element=orm.StaticSelectElement(placeholder="Select the location..."),
+        ),
+        orm.InputBlock(
+            label="The AO",
+            action=actions.BACKBLAST_AO,
+            optional=False,
+            element=orm.StaticSelectElement(placeholder="Select the AO..."),
+        ),
+    ]
+)
 
-BACKBLAST_FORM = orm.BlockView(
+BACKBLAST_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Title",
@@ -156,7 +158,7 @@ BACKBLAST_FORM = orm.BlockView(
     ]
 )
 
-PREBLAST_FORM = orm.BlockView(
+PREBLAST_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Title",
@@ -214,7 +216,7 @@ PREBLAST_FORM = orm.BlockView(
     ]
 )
 
-CONFIG_FORM = orm.BlockView(
+CONFIG_FORM = orm.FrozenBlockView(
     [
         orm.ActionsBlock(
             elements=[
@@ -284,7 +286,7 @@ ACHIEVEMENT_BUTTON = orm.ButtonElement(
     action=actions.CONFIG_ACHIEVEMENTS,
 )
 
-CONFIG_NO_ORG_FORM = orm.BlockView(
+CONFIG_NO_ORG_FORM = orm.FrozenBlockView(
     [
         orm.ActionsBlock(
             elements=[
@@ -317,7 +319,7 @@ CONFIG_NO_ORG_FORM = orm.BlockView(
     ]
 )
 
-CONFIG_EMAIL_FORM = orm.BlockView(
+CONFIG_EMAIL_FORM = orm.FrozenBlockView(
     [
         orm.InputBlock(
             label="Backblast Email",
@@ -383,7 +385,7 @@ CONFIG_EMAIL_FORM = orm.BlockView(
     ]
 )
 
-CONFIG_GENERAL_FORM = orm.BlockView(
+CONFIG_GENERAL_FORM = orm.FrozenBlockView(
     [
         orm.InputBlock(
             label="Enable Strava Integration?",
@@ -553,7 +555,7 @@ CONFIG_GENERAL_FORM = orm.BlockView(
     ]
 )
 
-WELCOME_MESSAGE_CONFIG_FORM = orm.BlockView(
+WELCOME_MESSAGE_CONFIG_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Enable Welcomebot welcome DMs?",
@@ -597,7 +599,7 @@ WELCOME_MESSAGE_CONFIG_FORM = orm.BlockView(
     ]
 )
 
-STRAVA_ACTIVITY_MODIFY_FORM = orm.BlockView(
+STRAVA_ACTIVITY_MODIFY_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Activity Title",
@@ -629,7 +631,7 @@ CUSTOM_FIELD_TYPE_MAP = {
     "Number": orm.NumberInputElement(),
 }
 
-CUSTOM_FIELD_ADD_EDIT_FORM = orm.BlockView(
+CUSTOM_FIELD_ADD_EDIT_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             element=orm.PlainTextInputElement(
@@ -669,7 +671,7 @@ CUSTOM_FIELD_ADD_EDIT_FORM = orm.BlockView(
     ]
 )
 
-LOADING_FORM = orm.BlockView(
+LOADING_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(label=":hourglass: Loading, do not close...", action=actions.LOADING),
         orm.ContextBlock(
@@ -681,7 +683,7 @@ LOADING_FORM = orm.BlockView(
     ]
 )
 
-DEBUG_FORM = orm.BlockView(
+DEBUG_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(label=":beetle: Debug Mode", action=actions.DEBUG),
         orm.ContextBlock(
@@ -693,13 +695,13 @@ DEBUG_FORM = orm.BlockView(
     ]
 )
 
-ERROR_FORM = orm.BlockView(
+ERROR_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(label=":warning: the following error occurred:", action=actions.ERROR_FORM_MESSAGE),
     ]
 )
 
-ACHIEVEMENT_FORM = orm.BlockView(
+ACHIEVEMENT_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Achievement",
@@ -724,7 +726,7 @@ ACHIEVEMENT_FORM = orm.BlockView(
     ]
 )
 
-WEASELBOT_CONFIG_FORM = orm.BlockView(
+WEASELBOT_CONFIG_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Which Weaselbot features should be enabled?",
@@ -783,7 +785,7 @@ WEASELBOT_CONFIG_FORM = orm.BlockView(
 )
 
 
-NO_WEASELBOT_CONFIG_FORM = orm.BlockView(
+NO_WEASELBOT_CONFIG_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(
             label="Weaselbot and / or PAXMiner doesn't appear to be configured for this Slack workspace. Please follow <https://github.com/F3Nation-Community/weaselbot|these instructions> to get started!",  # noqa: E501
@@ -791,7 +793,7 @@ NO_WEASELBOT_CONFIG_FORM = orm.BlockView(
     ]
 )
 
-CONFIG_NO_PERMISSIONS_FORM = orm.BlockView(
+CONFIG_NO_PERMISSIONS_FORM = orm.FrozenBlockView(
     blocks=[
         orm.ActionsBlock(
             elements=[
@@ -819,7 +821,7 @@ CONFIG_NO_PERMISSIONS_FORM = orm.BlockView(
     ]
 )
 
-CONFIG_NEW_POSITION_FORM = orm.BlockView(
+CONFIG_NEW_POSITION_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Position Name",
@@ -836,7 +838,7 @@ CONFIG_NEW_POSITION_FORM = orm.BlockView(
     ]
 )
 
-BACKBLAST_LEGACY_FORM = orm.BlockView(
+BACKBLAST_LEGACY_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Title",
@@ -950,7 +952,7 @@ BACKBLAST_LEGACY_FORM = orm.BlockView(
     ]
 )
 
-PREBLAST_LEGACY_FORM = orm.BlockView(
+PREBLAST_LEGACY_FORM = orm.FrozenBlockView(
     blocks=[
         orm.InputBlock(
             label="Title",
@@ -1008,7 +1010,7 @@ PREBLAST_LEGACY_FORM = orm.BlockView(
     ]
 )
 
-ALREADY_POSTED_FORM = orm.BlockView(
+ALREADY_POSTED_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(
             label="This backblast has already been posted! If you want to edit it, please use the "
@@ -1023,7 +1025,7 @@ ALREADY_POSTED_FORM = orm.BlockView(
     ]
 )
 
-SUBMIT_FORM = orm.BlockView(
+SUBMIT_FORM = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(
             label=":hourglass_flowing_sand: Your form has been submitted! Saving data and posting to Slack...",
@@ -1038,7 +1040,7 @@ SUBMIT_FORM = orm.BlockView(
     ]
 )
 
-SUBMIT_FORM_SUCCESS = orm.BlockView(
+SUBMIT_FORM_SUCCESS = orm.FrozenBlockView(
     blocks=[
         orm.SectionBlock(
             label=":white_check_mark: Your form has been submitted successfully! You can close this form now.",
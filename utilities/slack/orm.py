@@ -1,7 +1,8 @@
+import copy
 import json
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from slack_sdk.web import WebClient
 
@@ -835,6 +836,23 @@ class ActionsBlock(BaseBlock):
         return j
 
 
+# Blocks owned by a FrozenBlockView, keyed by id(), with their pre-rendered JSON. Templates live at module level,
+# so the ids stay valid for the life of the process.
+_FROZEN_BLOCKS: Dict[int, Tuple[BaseBlock, Optional[str]]] = {}
+
+
+def _frozen_entry(block: BaseBlock) -> Optional[Tuple[BaseBlock, Optional[str]]]:
+    entry = _FROZEN_BLOCKS.get(id(block))
+    return entry if entry is not None and entry[0] is block else None
+
+
+def _render_block(block: BaseBlock) -> dict:
+    entry = _frozen_entry(block)
+    if entry is not None and entry[1] is not None:
+        return json.loads(entry[1])
+    return block.as_form_field()
+
+
 @dataclass
 class BlockView:
     blocks: List[BaseBlock]
@@ -845,27 +863,46 @@ class BlockView:
     def add_block(self, block: BaseBlock):
         self.blocks.append(block)
 
+    def _own_block(self, index: int, deep: bool = False) -> BaseBlock:
+        """Returns the block at ``index``, first swapping a shared template block for a private copy."""
+        block = self.blocks[index]
+        if _frozen_entry(block) is None:
+            return block
+        if deep:
+            block = copy.deepcopy(block)
+        else:
+            block = copy.copy(block)
+            if isinstance(getattr(block, "element", None), BaseElement):
+                block.element = copy.copy(block.element)
+        self.blocks[index] = block
+        return block
+
+    def editable_block(self, action: str) -> Optional[BaseBlock]:
+        """Returns the block for ``action`` as a private copy that is safe to modify in place."""
+        index = next((i for i, b in enumerate(self.blocks) if b.action == action), None)
+        return None if index is None else self._own_block(index, deep=True)
+
     def set_initial_values(self, values: dict):
-        for block in self.blocks:
+        for i, block in enumerate(self.blocks):
             if block.action in values and isinstance(block, InputBlock):
-                block.element.initial_value = values[block.action]
+                self._own_block(i).element.initial_value = values[block.action]
             elif block.action in values and isinstance(block, SectionBlock):
-                block.label = values[block.action]
+                self._own_block(i).label = values[block.action]
             elif block.action in values and isinstance(block, ImageBlock):
-                block.image_url = values[block.action]
+                self._own_block(i).image_url = values[block.action]
 
     def set_options(self, options: Dict[str, List[SelectorOption]]):
-        for block in self.blocks:
+        for i, block in enumerate(self.blocks):
             if block.action in options:
                 option_list = options[block.action]
                 for option in option_list:
                     option.name = option.name[:75]
                     if option.description:
                         option.description = option.description[:75]
-                block.element.options = option_list
+                self._own_block(i).element.options = option_list
 
     def as_form_field(self) -> List[dict]:
-        return [b.as_form_field() for b in self.blocks]
+        return [_render_block(b) for b in self.blocks]
 
     def get_selected_values(self, body) -> dict:
         values = body["view"]["state"]["values"]
@@ -960,6 +997,35 @@ class BlockView:
         return res
 
 
+class FrozenBlockView(BlockView):
+    """A module-level form template that is never modified.
+
+    Each block's JSON is rendered once when the template is built. ``copy()`` returns a ``BlockView`` that shares
+    the template's blocks: ``set_options``, ``set_initial_values`` and ``editable_block`` swap in a private copy of
+    just the blocks they touch, and every other block is served from the pre-rendered JSON.
+    """
+
+    def __init__(self, blocks: List[BaseBlock]):
+        self.blocks = tuple(blocks)
+        for block in self.blocks:
+            try:
+                rendered = json.dumps(block.as_form_field())
+            except Exception:
+                rendered = None  # needs request data to render; shared read-only but rendered per request
+            _FROZEN_BLOCKS[id(block)] = (block, rendered)
+
+    def copy(self) -> BlockView:
+        return BlockView(blocks=list(self.blocks))
+
+    def __deepcopy__(self, memo) -> BlockView:
+        return BlockView(blocks=copy.deepcopy(list(self.blocks), memo))
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("FrozenBlockView is a shared template; modify a .copy() of it instead")
+
+    delete_block = add_block = editable_block = set_initial_values = set_options = _frozen
+
+
 def parse_welcome_template(template: str, user_id: str) -> List[BaseBlock]:
     blocks = []
 
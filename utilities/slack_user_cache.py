@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from f3_data_models.models import SlackUser
+
+MAX_ENTRIES = int(os.environ.get("SLACK_USER_CACHE_MAX_ENTRIES", "5000"))
+TTL_SECONDS = float(os.environ.get("SLACK_USER_CACHE_TTL_SECONDS", "900"))
+
+CacheKey = Tuple[str, str]
+
+
+class SlackUserCache:
+    """Bounded LRU cache of ``SlackUser`` records keyed by ``(slack_team_id, slack_id)``.
+
+    Entries expire ``ttl_seconds`` after they were stored, so profile changes picked up by the hourly user
+    sync reach long-lived instances without a restart. Hit/miss/eviction counters are kept for logging.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: float = TTL_SECONDS):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[SlackUser, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, team_id: str, slack_id: str) -> Optional[SlackUser]:
+        found, _ = self.get_many(team_id, [slack_id])
+        return found.get(slack_id)
+
+    def get_many(self, team_id: str, slack_ids: Iterable[str]) -> Tuple[Dict[str, SlackUser], List[str]]:
+        """Returns ``(found, missing)``: cached users by slack id, and the ids that need loading."""
+        found: Dict[str, SlackUser] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for slack_id in dict.fromkeys(slack_ids):
+                key = (team_id, slack_id)
+                entry = self._entries.get(key)
+                if entry and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    found[slack_id] = entry[0]
+                    self.hits += 1
+                else:
+                    if entry:
+                        del self._entries[key]
+                    missing.append(slack_id)
+                    self.misses += 1
+        return found, missing
+
+    def put(self, slack_user: SlackUser, team_id: Optional[str] = None) -> None:
+        team_id = team_id or slack_user.slack_team_id
+        if not team_id or not slack_user.slack_id:
+            return
+        key = (team_id, slack_user.slack_id)
+        with self._lock:
+            self._entries[key] = (slack_user, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_team(self, team_id: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == team_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }